@@ -13,6 +13,9 @@ Usage:
     # Add questions from YAML draft
     python scripts/add_questions.py --draft questions/drafts/new_animals.yaml
 
+    # Add every draft in a directory (or glob), across categories
+    python scripts/add_questions.py --drafts questions/drafts/batch/
+
     # Create new category
     python scripts/add_questions.py --new-category "Marine Biology" --name-zh "海洋生物学"
 
@@ -26,17 +29,19 @@ Usage:
 import argparse
 import json
 import sys
-import yaml
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple, Union
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from question_builder_v3 import QuestionBuilderV3 as QuestionBuilder, QuestionDraft
-from utils.id_manager import IDManager
-from utils.validation import ValidationRunner
-from utils.master_list import MasterListUpdater
+# Heavier dependencies (yaml, question_builder_v3 -> openai, validation,
+# master list) are imported inside the code paths that use them so that
+# --update-master-list, --help and pre-commit invocations start fast.
+# See benchmarks/startup.py for the startup budget.
+
+# Concurrent DeepSeek requests for --drafts
+DEFAULT_TRANSLATION_WORKERS = 8
 
 
 def main():
@@ -48,6 +53,9 @@ Examples:
   # Add questions from draft
   python scripts/add_questions.py --draft questions/drafts/animals.yaml
 
+  # Bulk import: all drafts in a directory or matching a glob
+  python scripts/add_questions.py --drafts 'questions/drafts/batch/*.yaml'
+
   # Create new category
   python scripts/add_questions.py --new-category "Marine Biology" --name-zh "海洋生物学"
 
@@ -64,6 +72,19 @@ For more info: docs/AUTOMATION_GUIDE.md
         type=str
     )
 
+    parser.add_argument(
+        '--drafts',
+        help='Directory or glob of YAML drafts (any categories) to import in one pass',
+        type=str
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_TRANSLATION_WORKERS,
+        help=f'Concurrent translations for --drafts (default: {DEFAULT_TRANSLATION_WORKERS})'
+    )
+
     parser.add_argument(
         '--new-category',
         help='Create a new category',
@@ -94,6 +115,12 @@ For more info: docs/AUTOMATION_GUIDE.md
         help='Skip validation (not recommended)'
     )
 
+    parser.add_argument(
+        '--allow-duplicates',
+        action='store_true',
+        help='Add drafts even if they look like existing questions'
+    )
+
     parser.add_argument(
         '--update-master-list',
         action='store_true',
@@ -110,7 +137,17 @@ For more info: docs/AUTOMATION_GUIDE.md
             args.draft,
             dry_run=args.dry_run,
             use_ai=not args.no_ai,
-            skip_validation=args.skip_validation
+            skip_validation=args.skip_validation,
+            allow_duplicates=args.allow_duplicates
+        )
+    elif args.drafts:
+        add_questions_from_drafts(
+            args.drafts,
+            dry_run=args.dry_run,
+            use_ai=not args.no_ai,
+            skip_validation=args.skip_validation,
+            allow_duplicates=args.allow_duplicates,
+            workers=args.workers
         )
     elif args.new_category:
         create_category(args.new_category, args.name_zh, args.dry_run)
@@ -123,27 +160,51 @@ def add_questions_from_draft(
     draft_file: str,
     dry_run: bool = False,
     use_ai: bool = True,
-    skip_validation: bool = False
-):
-    """Add questions from YAML draft file"""
+    skip_validation: bool = False,
+    update_master_list: bool = True,
+    corpus=None,
+    allow_duplicates: bool = False
+) -> Tuple[str, List[Dict]]:
+    """
+    Add questions from YAML draft file
+
+    Drafts are checked before any translation call, the completed questions
+    are validated in memory, and only then are the category file and master
+    list written, together (utils/transaction.py). A failure at any step
+    leaves every file unchanged.
+
+    Args:
+        draft_file: YAML draft path
+        dry_run: Preview without writing files
+        use_ai: Translate missing Chinese content with DeepSeek
+        skip_validation: Don't fact-check the drafts and new questions
+        update_master_list: Append the new questions to the master list
+        corpus: Shared utils.corpus.Corpus to write through, if any
+        allow_duplicates: Add drafts even if they look like existing questions
+
+    Returns:
+        (category, completed question dicts)
+    """
+
+    from question_builder_v3 import QuestionBuilderV3 as QuestionBuilder
+    from utils.corpus import load_category
+    from utils.id_manager import IDManager
+    from utils.transaction import FileTransaction
 
     print(f"\n📖 Reading draft: {draft_file}")
     print("=" * 60)
 
     # Load draft file
     try:
-        with open(draft_file, 'r', encoding='utf-8') as f:
-            draft_data = yaml.safe_load(f)
+        draft_data = load_draft(draft_file)
+    except ValueError as e:
+        print(f"❌ {e}")
+        print("   See questions/drafts/template.yaml for example")
+        sys.exit(1)
     except Exception as e:
         print(f"❌ Error reading draft file: {e}")
         sys.exit(1)
 
-    # Validate draft structure
-    if 'category' not in draft_data or 'questions' not in draft_data:
-        print("❌ Invalid draft format. Must have 'category' and 'questions' fields.")
-        print("   See questions/drafts/template.yaml for example")
-        sys.exit(1)
-
     category = draft_data['category']
     question_drafts = draft_data['questions']
 
@@ -155,9 +216,7 @@ def add_questions_from_draft(
         # New workflow: DeepSeek for translation only
         # Fact-checking done by Claude Code in conversation
         builder = QuestionBuilder(use_deepseek=use_ai)
-        id_manager = IDManager()
-        validator = ValidationRunner()
-        master_list = MasterListUpdater()
+        id_manager = IDManager(corpus.questions_dir if corpus else None)
     except Exception as e:
         print(f"❌ Initialization error: {e}")
         if "DEEPSEEK_API_KEY" in str(e):
@@ -177,6 +236,12 @@ def add_questions_from_draft(
     print(f"🔢 Current questions: {cat_info['question_count']}")
     print(f"🆔 Next ID: {cat_info['next_id']}")
 
+    # Near-duplicate check (before spending any translation calls)
+    check_duplicates(question_drafts, corpus, dry_run=dry_run, allow=allow_duplicates)
+
+    # Everything checkable in English, also before any translation call
+    drafts = preflight_drafts(question_drafts, category, builder, skip_validation=skip_validation)
+
     # Build complete questions
     print(f"\n🔨 Building questions...")
     print("-" * 60)
@@ -184,11 +249,8 @@ def add_questions_from_draft(
     completed_questions = []
     question_ids = id_manager.get_next_n_ids(category, len(question_drafts))
 
-    for i, (draft_dict, q_id) in enumerate(zip(question_drafts, question_ids), 1):
+    for i, (draft, draft_dict, q_id) in enumerate(zip(drafts, question_drafts, question_ids), 1):
         try:
-            # Create draft object
-            draft = QuestionDraft(**draft_dict)
-
             print(f"\n[{i}/{len(question_drafts)}] {draft.question_en}")
             print(f"    ID: {q_id} | Difficulty: {draft.difficulty}")
 
@@ -214,6 +276,25 @@ def add_questions_from_draft(
             print(f"    ❌ Error: {e}")
             sys.exit(1)
 
+    # Validate the new questions in memory, before anything is written
+    filepath = Path(cat_info['filepath'])
+    data = corpus.load(filepath) if corpus else load_category(filepath)
+    existing_ids = {q.get('id') for q in data.get('questions', [])}
+    collisions = [q['id'] for q in completed_questions if q['id'] in existing_ids]
+    if collisions:
+        print(f"\n❌ IDs already used in {cat_info['filename']}: {', '.join(collisions)}")
+        sys.exit(1)
+
+    if not skip_validation:
+        print(f"\n✅ Validating {len(completed_questions)} new questions...")
+        print("-" * 60)
+        if not validate_new_questions(completed_questions, data.get('category_en') or category):
+            print("\n❌ Validation failed! Nothing was written.")
+            print("   Fix issues and try again, or use --skip-validation (not recommended)")
+            sys.exit(1)
+    else:
+        print("\n⚠️  Skipping validation (--skip-validation flag)")
+
     # Preview
     if dry_run:
         print("\n" + "=" * 60)
@@ -225,47 +306,434 @@ def add_questions_from_draft(
             print(f"  Difficulty: {q['difficulty']}")
             print(f"  Correct: {q['correct_answer']}")
         print("\n💡 Remove --dry-run flag to actually add these questions")
-        return
+        return category, completed_questions
+
+    # Write the category file and master list together
+    print(f"\n💾 Writing {cat_info['filename']}"
+          f"{' and master list' if update_master_list else ''}...")
+    data.setdefault('questions', []).extend(completed_questions)
+    txn = FileTransaction()
+    txn.stage_category(filepath, data, corpus=corpus)
+
+    master_list_staged = False
+    if update_master_list:
+        try:
+            from utils.master_list import MasterListUpdater
+
+            master_list = MasterListUpdater()
+            txn.stage(master_list.master_list_path, master_list.render_added(category, completed_questions))
+            master_list_staged = True
+        except Exception as e:
+            print(f"⚠️  Warning: Could not update master list: {e}")
+            print("   You may need to update it manually")
+
+    try:
+        txn.commit()
+    except OSError as e:
+        print(f"❌ Error writing files (nothing was changed): {e}")
+        sys.exit(1)
+    print(f"✅ Added {len(completed_questions)} questions to {cat_info['filename']}")
+    if master_list_staged:
+        print(f"✅ Added {len(completed_questions)} questions to master list")
+
+    # Success summary
+    print("\n" + "=" * 60)
+    print(f"✨ Success! Added {len(completed_questions)} questions to {category}")
+    print("=" * 60)
+    print("\n📌 Next steps:")
+    print(f"   1. Review: src/data/questions/{cat_info['filename']}")
+    print(f"   2. Commit: git add . && git commit -m 'Add {len(completed_questions)} {category} questions'")
+    print(f"   3. Push: git push origin feature/peng/add-more-questions2")
+
+    return category, completed_questions
+
+
+def add_questions_from_drafts(
+    pattern: str,
+    dry_run: bool = False,
+    use_ai: bool = True,
+    skip_validation: bool = False,
+    update_master_list: bool = True,
+    corpus=None,
+    allow_duplicates: bool = False,
+    workers: int = DEFAULT_TRANSLATION_WORKERS
+) -> List[Tuple[str, List[Dict]]]:
+    """
+    Add questions from many YAML drafts, across categories, in one pass
+
+    Same checks as add_questions_from_draft, run once over the whole batch:
+    one near-duplicate pass, one preflight, bulk ID allocation per category
+    and translations through a shared thread pool. Then every affected
+    category file is written once and the master list rendered once, all in
+    a single transaction.
+
+    Args:
+        pattern: Directory of drafts (*.yaml / *.yml) or a glob
+        workers: Concurrent translation requests
+        (others as for add_questions_from_draft)
+
+    Returns:
+        (category, completed question dicts) per affected category
+    """
+    from question_builder_v3 import QuestionBuilderV3 as QuestionBuilder
+    from utils.corpus import load_category
+    from utils.id_manager import IDManager
+    from utils.transaction import FileTransaction
+
+    draft_files = find_draft_files(pattern)
+    print(f"\n📖 Reading {len(draft_files)} draft files: {pattern}")
+    print("=" * 60)
+    if not draft_files:
+        print("❌ No drafts found (expected *.yaml / *.yml files)")
+        sys.exit(1)
+
+    # Load every draft, grouped by category (in order of first appearance)
+    grouped: Dict[str, List[Tuple[str, Dict]]] = {}
+    failed = False
+    for draft_file in draft_files:
+        try:
+            draft_data = load_draft(draft_file)
+        except Exception as e:
+            print(f"❌ {draft_file.name}: {e}")
+            failed = True
+            continue
+        entries = grouped.setdefault(draft_data['category'], [])
+        for i, draft_dict in enumerate(draft_data['questions'] or [], 1):
+            entries.append((f"{draft_file.name} #{i}", draft_dict))
+    if failed:
+        print("   See questions/drafts/template.yaml for example")
+        sys.exit(1)
 
-    # Update JSON file
-    print(f"\n💾 Updating JSON file...")
+    # Initialize tools
     try:
-        update_category_file(category, completed_questions)
-        print(f"✅ Added {len(completed_questions)} questions to {cat_info['filename']}")
+        builder = QuestionBuilder(use_deepseek=use_ai)
+        id_manager = IDManager(corpus.questions_dir if corpus else None)
     except Exception as e:
-        print(f"❌ Error updating file: {e}")
+        print(f"❌ Initialization error: {e}")
         sys.exit(1)
 
-    # Run validation
-    if not skip_validation:
-        print(f"\n✅ Running validation pipeline...")
-        print("-" * 60)
-        passed, results = validator.run_all_validations(verbose=True)
+    unknown = [category for category in grouped if not id_manager.validate_category(category)]
+    if unknown:
+        print(f"❌ Unknown categories: {', '.join(unknown)}")
+        print(f"   Valid categories: {', '.join(id_manager.get_all_categories())}")
+        sys.exit(1)
 
-        if not passed:
-            print("\n❌ Validation failed! Please review errors above.")
+    print(f"\n{'Category':20} {'File':24} {'Current':>8} {'Adding':>7}  Next ID")
+    print("-" * 70)
+    cat_infos = {}
+    for category, entries in grouped.items():
+        info = cat_infos[category] = id_manager.get_category_info(category)
+        print(f"{category:20} {info['filename']:24} {info['question_count']:8,} "
+              f"{len(entries):7,}  {info['next_id']}")
+
+    # One flat batch for the checks that compare drafts with each other
+    labels = [label for entries in grouped.values() for label, _ in entries]
+    question_drafts = [d for entries in grouped.values() for _, d in entries]
+    categories = [category for category, entries in grouped.items() for _ in entries]
+    print(f"\n📊 Questions to add: {len(question_drafts)} in {len(grouped)} categories")
+
+    check_duplicates(question_drafts, corpus, dry_run=dry_run, allow=allow_duplicates, labels=labels)
+    drafts = preflight_drafts(question_drafts, categories, builder,
+                              skip_validation=skip_validation, labels=labels)
+
+    # Bulk ID allocation, one range per category
+    question_ids = []
+    for category, entries in grouped.items():
+        question_ids.extend(id_manager.get_next_n_ids(category, len(entries)))
+
+    # Translate everything through one pool
+    print(f"\n🔨 Building {len(drafts)} questions...")
+    print("-" * 60)
+    completed = translate_drafts(builder, drafts, categories, labels, workers=workers)
+    for question, q_id in zip(completed, question_ids):
+        question['id'] = q_id
+
+    additions: List[Tuple[str, List[Dict]]] = []
+    start = 0
+    for category, entries in grouped.items():
+        additions.append((category, completed[start:start + len(entries)]))
+        start += len(entries)
+
+    # Validate in memory, per category, before anything is written
+    datas = {}
+    for category, questions in additions:
+        filepath = Path(cat_infos[category]['filepath'])
+        data = datas[category] = corpus.load(filepath) if corpus else load_category(filepath)
+        existing_ids = {q.get('id') for q in data.get('questions', [])}
+        collisions = [q['id'] for q in questions if q['id'] in existing_ids]
+        if collisions:
+            print(f"\n❌ IDs already used in {cat_infos[category]['filename']}: {', '.join(collisions)}")
+            sys.exit(1)
+
+    if not skip_validation:
+        all_passed = True
+        for category, questions in additions:
+            print(f"\n✅ Validating {len(questions)} new {category} questions...")
+            print("-" * 60)
+            all_passed &= validate_new_questions(questions, datas[category].get('category_en') or category,
+                                                 show_info=False)
+        if not all_passed:
+            print("\n❌ Validation failed! Nothing was written.")
             print("   Fix issues and try again, or use --skip-validation (not recommended)")
             sys.exit(1)
     else:
         print("\n⚠️  Skipping validation (--skip-validation flag)")
 
-    # Update master list
-    print(f"\n📋 Updating master list...")
+    if dry_run:
+        print("\n" + "=" * 60)
+        print("🔍 DRY RUN - Would add:")
+        print("=" * 60)
+        for category, questions in additions:
+            print(f"  {cat_infos[category]['filename']:24} {len(questions):5,} "
+                  f"({questions[0]['id']} .. {questions[-1]['id']})")
+        print("\n💡 Remove --dry-run flag to actually add these questions")
+        return additions
+
+    # One write per category file and one master list render, together
+    print(f"\n💾 Writing {len(additions)} category files"
+          f"{' and master list' if update_master_list else ''}...")
+    txn = FileTransaction()
+    for category, questions in additions:
+        data = datas[category]
+        data.setdefault('questions', []).extend(questions)
+        txn.stage_category(cat_infos[category]['filepath'], data, corpus=corpus)
+
+    master_list_staged = False
+    if update_master_list:
+        try:
+            from utils.master_list import MasterListUpdater
+
+            master_list = MasterListUpdater()
+            txn.stage(master_list.master_list_path, master_list.render_additions(additions))
+            master_list_staged = True
+        except Exception as e:
+            print(f"⚠️  Warning: Could not update master list: {e}")
+            print("   You may need to update it manually")
+
     try:
-        master_list.add_questions(category, completed_questions)
-        master_list.update_totals()
-    except Exception as e:
-        print(f"⚠️  Warning: Could not update master list: {e}")
-        print("   You may need to update it manually")
+        txn.commit()
+    except OSError as e:
+        print(f"❌ Error writing files (nothing was changed): {e}")
+        sys.exit(1)
+    for category, questions in additions:
+        print(f"✅ Added {len(questions)} questions to {cat_infos[category]['filename']}")
+    if master_list_staged:
+        print(f"✅ Added {len(completed)} questions to master list")
 
-    # Success summary
     print("\n" + "=" * 60)
-    print(f"✨ Success! Added {len(completed_questions)} questions to {category}")
+    print(f"✨ Success! Added {len(completed)} questions to {len(additions)} categories")
     print("=" * 60)
-    print("\n📌 Next steps:")
-    print(f"   1. Review: src/data/questions/{cat_info['filename']}")
-    print(f"   2. Commit: git add . && git commit -m 'Add {len(completed_questions)} {category} questions'")
-    print(f"   3. Push: git push origin feature/peng/add-more-questions2")
+
+    return additions
+
+
+def load_draft(draft_file: Union[str, Path]) -> Dict:
+    """
+    Read a YAML draft (with libyaml's C loader when PyYAML was built with it)
+
+    Only the file's own fields are checked against the draft schema here;
+    problems in individual questions are reported per draft by
+    preflight_drafts.
+
+    Raises:
+        ValueError: If the draft lacks 'category' or 'questions', or they
+                    do not match schemas/question_draft.schema.json
+    """
+    import yaml
+
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(draft_file, 'r', encoding='utf-8') as f:
+        draft_data = yaml.load(f, Loader=loader)
+
+    if not isinstance(draft_data, dict) or 'category' not in draft_data or 'questions' not in draft_data:
+        raise ValueError("Invalid draft format. Must have 'category' and 'questions' fields.")
+
+    from utils.schema import load_validator
+
+    errors = [e for e in load_validator('question_draft')(draft_data)
+              if not e.path.startswith('questions[')]
+    if errors:
+        raise ValueError("Invalid draft format:\n" + "\n".join(f"  - {e}" for e in errors))
+    return draft_data
+
+
+def find_draft_files(pattern: str) -> List[Path]:
+    """Draft files in a directory (*.yaml, *.yml), or matching a glob, sorted"""
+    import glob
+
+    path = Path(pattern)
+    if path.is_dir():
+        files = [p for p in path.iterdir() if p.suffix in ('.yaml', '.yml')]
+    else:
+        files = [Path(p) for p in glob.glob(pattern, recursive=True)]
+    return sorted(p for p in files if p.is_file() and not p.name.startswith('template'))
+
+
+def translate_drafts(builder, drafts: List, categories: List[str], labels: List[str],
+                     workers: int = DEFAULT_TRANSLATION_WORKERS) -> List[Dict]:
+    """
+    Complete drafts concurrently (translation is network-bound)
+
+    Exits listing every failure once all drafts have been tried.
+
+    Returns:
+        Completed question dicts, in draft order
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    total = len(drafts)
+    pending = sum(1 for d in drafts if not d.question_zh or not d.choices_zh or not d.explanations_zh)
+    if pending and builder.use_deepseek:
+        builder.deepseek_client  # Create the shared client before the threads race for it
+        print(f"🤖 Translating {pending} drafts with DeepSeek ({workers} at a time)...")
+
+    completed: List[Optional[Dict]] = [None] * total
+    errors = {}
+    step = max(1, total // 10)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(builder.complete_question, draft, category, False): i
+            for i, (draft, category) in enumerate(zip(drafts, categories))
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            try:
+                completed[i] = future.result()
+            except Exception as e:
+                errors[i] = e
+            if done % step == 0 or done == total:
+                print(f"    [{done}/{total}] built, {len(errors)} failed")
+
+    if errors:
+        for i, e in sorted(errors.items()):
+            print(f"\n❌ {labels[i]}: {drafts[i].question_en}")
+            print(f"    - {e}")
+        print(f"\n❌ {len(errors)} draft(s) could not be built. Nothing was written.")
+        sys.exit(1)
+    return completed
+
+
+def check_duplicates(question_drafts: List[Dict], corpus=None, dry_run: bool = False, allow: bool = False,
+                     labels: Optional[List[str]] = None):
+    """
+    Compare drafts with the whole bank (all categories) via MinHash/LSH
+
+    Exits unless allow or dry_run is set when a draft looks like a
+    near-duplicate of an existing question or of another draft.
+
+    Args:
+        labels: How to refer to each draft in the report (default "Draft #N")
+    """
+    if not question_drafts:
+        return
+
+    from utils.dedup import check_drafts
+
+    print(f"\n🔎 Checking for near-duplicates...")
+    duplicates = check_drafts(question_drafts, corpus)
+    if not duplicates:
+        print("✅ No near-duplicates found")
+        return
+
+    for i, matches in sorted(duplicates.items()):
+        label = labels[i] if labels else f"Draft #{i + 1}"
+        print(f"\n⚠️  {label}: {question_drafts[i].get('question_en', '')}")
+        for match in matches[:3]:
+            print(f"    ~{match.score:.0%} {match.id} ({match.file}): {match.question_en}")
+
+    if allow or dry_run:
+        print(f"\n⚠️  {len(duplicates)} draft(s) look like existing questions"
+              f"{' (continuing: --allow-duplicates)' if allow else ''}")
+        return
+
+    print(f"\n❌ {len(duplicates)} draft(s) look like existing questions.")
+    print("   Reword or drop them, or use --allow-duplicates if they are genuinely different")
+    sys.exit(1)
+
+
+def preflight_drafts(question_drafts: List[Dict], category: Union[str, List[str]], builder,
+                     skip_validation: bool = False, labels: Optional[List[str]] = None) -> List:
+    """
+    Check every draft's English content before anything is translated
+
+    Covers what QuestionBuilderV3.complete_question would reject and, unless
+    skip_validation, the fact checker's critical issues. Exits listing all
+    problems at once, so a bad batch costs no API calls.
+
+    Args:
+        question_drafts: Draft dicts as read from YAML
+        category: Category of all drafts, or one per draft
+        builder: QuestionBuilderV3 (no translation is done here)
+        skip_validation: Only check what the builder itself requires
+        labels: How to refer to each draft in the report (default "Draft #N")
+
+    Returns:
+        QuestionDraft objects, in draft order
+    """
+    from dataclasses import asdict
+    from question_builder_v3 import QuestionDraft
+
+    print(f"\n🧪 Checking {len(question_drafts)} drafts...")
+    checker = None
+    if not skip_validation:
+        from validate_facts import FactChecker
+        checker = FactChecker(retain=False)
+
+    categories = [category] * len(question_drafts) if isinstance(category, str) else category
+    drafts, problems = [], {}
+    for i, draft_dict in enumerate(question_drafts):
+        try:
+            draft = QuestionDraft(**draft_dict)
+        except TypeError as e:
+            problems[i] = [f"Invalid draft fields: {e}"]
+            continue
+        drafts.append(draft)
+
+        errors = builder.draft_errors(draft)
+        if not errors and checker is not None:
+            english = {k: v for k, v in asdict(draft).items() if v is not None}
+            result = checker.validate_question(english, categories[i], english_only=True)
+            errors = [issue.message for issue in result.issues if issue.severity == 'critical']
+        if errors:
+            problems[i] = errors
+
+    if not problems:
+        print("✅ All drafts can be built")
+        return drafts
+
+    for i, errors in sorted(problems.items()):
+        label = labels[i] if labels else f"Draft #{i + 1}"
+        question_en = question_drafts[i].get('question_en', '') if isinstance(question_drafts[i], dict) else ''
+        print(f"\n❌ {label}: {question_en}")
+        for error in errors:
+            print(f"    - {error}")
+    print(f"\n❌ {len(problems)} draft(s) need fixing. Nothing was translated or written.")
+    sys.exit(1)
+
+
+def validate_new_questions(questions: List[Dict], category: str, show_info: bool = True) -> bool:
+    """
+    Fact-check only the questions being added
+
+    Args:
+        show_info: Also print questions whose only issues are informational
+
+    Returns:
+        True if none has a critical issue
+    """
+    from validate_facts import FactChecker
+
+    checker = FactChecker(retain=False)
+    for q in questions:
+        result = checker.validate_question(q, category)
+        checker.record(result)
+        if any(show_info or issue.severity != 'info' for issue in result.issues):
+            checker.print_result(result)
+
+    counts = checker.severity_counts
+    print(f"\n{len(questions)} checked: {counts['critical']} critical, "
+          f"{counts['warning']} warnings, {counts['info']} info")
+    return counts['critical'] == 0
 
 
 def create_category(name_en: str, name_zh: str, dry_run: bool = False):
@@ -318,17 +786,19 @@ def create_category(name_en: str, name_zh: str, dry_run: bool = False):
         sys.exit(1)
 
 
-def update_category_file(category: str, new_questions: List[Dict]):
+def update_category_file(category: str, new_questions: List[Dict], corpus=None):
     """Add questions to existing category JSON file"""
 
+    from utils.corpus import load_category, save_category
+    from utils.id_manager import IDManager
+
     # Get file path
-    id_manager = IDManager()
+    id_manager = IDManager(corpus.questions_dir if corpus else None)
     cat_info = id_manager.get_category_info(category)
     filepath = Path(cat_info['filepath'])
 
     # Read existing data
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = corpus.load(filepath) if corpus else load_category(filepath)
 
     # Add new questions
     if 'questions' not in data:
@@ -336,15 +806,18 @@ def update_category_file(category: str, new_questions: List[Dict]):
 
     data['questions'].extend(new_questions)
 
-    # Write back
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write('\n')  # Add final newline
+    # Write back (also refreshes the binary snapshot)
+    if corpus:
+        corpus.save(filepath, data)
+    else:
+        save_category(filepath, data)
 
 
 def update_master_list_only(dry_run: bool = False):
     """Update master list totals without adding questions"""
 
+    from utils.master_list import MasterListUpdater
+
     print("\n📋 Updating master list totals...")
 
     try:
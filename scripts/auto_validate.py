@@ -19,6 +19,9 @@ Usage:
     # Watch mode (auto-validate on file changes)
     python3 auto_validate.py --watch
 
+    # Pre-commit: validate the staged version of changed questions only
+    python3 auto_validate.py --staged
+
 Features:
     - Runs all validation layers automatically
     - Blocks if critical issues found
@@ -31,15 +34,13 @@ import sys
 import os
 import time
 from pathlib import Path
-from typing import Dict, List, Tuple
-import subprocess
+from typing import Dict, List, Optional, Tuple
+
+from utils.corpus import find_questions_dir
+from utils.schema import format_errors, load_validator
 
-# Import our validators
-try:
-    from validate_facts import FactChecker
-except ImportError:
-    print("Warning: validate_facts.py not found in same directory")
-    FactChecker = None
+# Our validators (validate_facts) are imported when Layer 2 runs, keeping
+# --help and structure-only paths fast.
 
 class AutoValidator:
     """Orchestrates all validation layers"""
@@ -48,10 +49,16 @@ class AutoValidator:
         self.strict_mode = strict_mode  # Block on critical issues
         self.validation_results = []
 
-    def validate_file(self, filepath: str, run_ai_check: bool = False) -> Tuple[bool, Dict]:
+    def validate_file(self, filepath: str, run_ai_check: bool = False,
+                      data: Optional[Dict] = None) -> Tuple[bool, Dict]:
         """
         Run complete validation on a file
 
+        Args:
+            filepath: Category JSON file
+            run_ai_check: Also prepare AI fact-check prompts (Layer 3)
+            data: Already-loaded contents of filepath, so no layer re-reads it
+
         Returns:
             (passed: bool, results: Dict)
         """
@@ -71,13 +78,14 @@ class AutoValidator:
         # Layer 1: Structure & Format Validation
         print("📋 Layer 1: Structure & Format Validation")
         print("─" * 70)
-        layer1_passed, layer1_results = self._run_structure_validation(filepath)
+        layer1_passed, layer1_results = self._run_structure_validation(filepath, data)
         results['layers']['structure'] = layer1_results
 
         if not layer1_passed:
             print("❌ FAILED Layer 1: Critical structure issues found!\n")
             if self.strict_mode:
                 print("🚫 BLOCKING: Fix critical issues before proceeding.\n")
+                results['critical_issues'] = len(layer1_results['issues'])
                 return False, results
         else:
             print("✅ PASSED Layer 1: Structure is valid\n")
@@ -85,7 +93,7 @@ class AutoValidator:
         # Layer 2: Automated Fact Checker
         print("🤖 Layer 2: Automated Validation (Logic & Red Flags)")
         print("─" * 70)
-        layer2_passed, layer2_results = self._run_automated_validation(filepath)
+        layer2_passed, layer2_results = self._run_automated_validation(filepath, data)
         results['layers']['automated'] = layer2_results
 
         if not layer2_passed:
@@ -97,7 +105,7 @@ class AutoValidator:
         if run_ai_check:
             print("🧠 Layer 3: AI Fact-Check Preparation")
             print("─" * 70)
-            layer3_prompts = self._prepare_ai_fact_check(filepath)
+            layer3_prompts = self._prepare_ai_fact_check(filepath, data)
             results['layers']['ai_check'] = layer3_prompts
             results['requires_ai_check'] = layer3_prompts
 
@@ -115,7 +123,7 @@ class AutoValidator:
 
         return results['overall_passed'], results
 
-    def _run_structure_validation(self, filepath: str) -> Tuple[bool, Dict]:
+    def _run_structure_validation(self, filepath: str, data: Optional[Dict] = None) -> Tuple[bool, Dict]:
         """Layer 1: Basic structure validation"""
         results = {
             'passed': False,
@@ -123,8 +131,9 @@ class AutoValidator:
         }
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if data is None:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
         except json.JSONDecodeError as e:
             results['issues'].append({
                 'severity': 'critical',
@@ -141,21 +150,16 @@ class AutoValidator:
             print(f"❌ File not found: {filepath}")
             return False, results
 
-        # Check required top-level fields
-        if 'category_en' not in data or 'category_zh' not in data:
-            results['issues'].append({
-                'severity': 'critical',
-                'message': 'Missing category_en or category_zh'
-            })
-            print("❌ Missing category fields")
-            return False, results
-
-        if 'questions' not in data or not isinstance(data['questions'], list):
-            results['issues'].append({
-                'severity': 'critical',
-                'message': 'Missing or invalid questions array'
-            })
-            print("❌ Missing or invalid questions array")
+        # Whole file against schemas/question_category.schema.json
+        errors = load_validator('question_category')(data)
+        if errors:
+            for error in errors:
+                results['issues'].append({
+                    'severity': 'critical',
+                    'message': str(error)
+                })
+            for line in format_errors(errors):
+                print(f"❌ {line}")
             return False, results
 
         if len(data['questions']) == 0:
@@ -172,14 +176,17 @@ class AutoValidator:
         results['passed'] = True
         return True, results
 
-    def _run_automated_validation(self, filepath: str) -> Tuple[bool, Dict]:
+    def _run_automated_validation(self, filepath: str, data: Optional[Dict] = None) -> Tuple[bool, Dict]:
         """Layer 2: Run validate_facts.py"""
-        if FactChecker is None:
+        try:
+            from validate_facts import FactChecker
+        except ImportError:
+            print("Warning: validate_facts.py not found in same directory")
             print("⚠️  FactChecker not available, skipping automated validation")
             return True, {'skipped': True}
 
         checker = FactChecker(verbose=False)
-        file_results = checker.validate_file(filepath)
+        file_results = checker.validate_file(filepath, data=data)
 
         # Count issues
         critical_count = 0
@@ -201,13 +208,14 @@ class AutoValidator:
 
         return critical_count == 0, results
 
-    def _prepare_ai_fact_check(self, filepath: str) -> List[Dict]:
+    def _prepare_ai_fact_check(self, filepath: str, data: Optional[Dict] = None) -> List[Dict]:
         """Layer 3: Prepare AI fact-check prompts"""
         prompts = []
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if data is None:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
         except:
             return prompts
 
@@ -225,6 +233,85 @@ class AutoValidator:
 
         return prompts
 
+    def validate_staged(self, root: str) -> List[Dict]:
+        """
+        Validate the staged version of changed question files
+
+        Runs Layer 1 on each staged file and Layer 2 only on questions that
+        were added or modified relative to HEAD (see utils/staged.py).
+
+        Args:
+            root: Git repository root
+
+        Returns:
+            Per-file results, in the shape print_summary() expects
+        """
+        from utils import staged
+        from validate_facts import FactChecker
+
+        files = staged.staged_question_files(root)
+        if not files:
+            print("✓ No question files staged, skipping validation")
+            return []
+
+        cache = staged.DigestCache(root)
+        before = staged.head_digests(root, files, cache)
+        contents = staged.read_staged(root, files)
+        checker = FactChecker(verbose=False, retain=False)
+        all_results = []
+
+        for f in files:
+            results = {'file': f.path, 'overall_passed': False, 'critical_issues': 0, 'warnings': 0}
+            all_results.append(results)
+
+            print(f"\n{'='*70}")
+            print(f"🔍 STAGED: {os.path.basename(f.path)}")
+            print(f"{'='*70}\n")
+
+            # Layer 1 on the whole staged file (unchanged questions are HEAD's text)
+            try:
+                staged_category = staged.diff_category(contents[f.path], before[f.path])
+            except (ValueError, UnicodeDecodeError) as e:
+                print(f"❌ Invalid JSON: {e}")
+                results['critical_issues'] = 1
+                continue
+            header = staged_category.header
+            errors = load_validator('question_category')(dict(header, questions=[]))
+            if errors:
+                for line in format_errors(errors):
+                    print(f"❌ {line}")
+                results['critical_issues'] = len(errors)
+                continue
+            if staged_category.count is None:
+                print("❌ Missing or invalid questions array")
+                results['critical_issues'] = 1
+                continue
+            print(f"✓ Valid JSON structure")
+            print(f"✓ Category: {header.get('category_en')}")
+            print(f"✓ Questions: {staged_category.count}")
+
+            # Layer 2 on changed questions only
+            added, modified = staged_category.added, staged_category.modified
+            print(f"✓ Changed: {len(added)} added, {len(modified)} modified\n")
+
+            category = header.get('category_en') or 'Unknown'
+            counts = dict(checker.severity_counts)
+            for q in added + modified:
+                result = checker.validate_question(q, category)
+                checker.record(result)
+                if result.issues:
+                    checker.print_result(result)
+
+            results['critical_issues'] = checker.severity_counts['critical'] - counts['critical']
+            results['warnings'] = checker.severity_counts['warning'] - counts['warning']
+            results['overall_passed'] = results['critical_issues'] == 0
+            if results['overall_passed']:
+                # This blob is the next commit's HEAD
+                cache.put(f.staged_sha, staged_category.digests)
+
+        cache.save()
+        return all_results
+
     def print_summary(self, all_results: List[Dict]):
         """Print validation summary for all files"""
         print(f"\n{'='*70}")
@@ -310,6 +397,9 @@ Examples:
 
   # Watch mode (auto-validate on changes)
   python3 auto_validate.py --watch
+
+  # Validate staged changes, question by question (pre-commit hook)
+  python3 auto_validate.py --staged
         """
     )
 
@@ -318,21 +408,13 @@ Examples:
     parser.add_argument('--ai-check', action='store_true', help='Generate AI fact-check prompts')
     parser.add_argument('--watch', action='store_true', help='Watch for file changes and auto-validate')
     parser.add_argument('--no-strict', action='store_true', help='Continue even with critical issues')
+    parser.add_argument('--staged', action='store_true',
+                        help='Validate staged question files, only questions changed since HEAD')
 
     args = parser.parse_args()
 
-    # Determine script directory and questions directory
-    script_dir = Path(__file__).parent
-
-    # Try to find questions directory (support different project structures)
-    # Option 1: src/data/questions (Next.js optimized structure)
-    questions_dir = script_dir.parent / 'src' / 'data' / 'questions'
-    if not questions_dir.exists():
-        # Option 2: data/questions (fallback)
-        questions_dir = script_dir.parent / 'data' / 'questions'
-        if not questions_dir.exists():
-            # Option 3: Same directory as script (legacy)
-            questions_dir = script_dir
+    # Determine questions directory
+    questions_dir = find_questions_dir(Path(__file__).parent)
 
     # Watch mode
     if args.watch:
@@ -343,7 +425,18 @@ Examples:
     validator = AutoValidator(strict_mode=not args.no_strict)
     all_results = []
 
-    if args.all:
+    if args.staged:
+        from utils.staged import git_root
+        try:
+            root = git_root()
+        except Exception:
+            print("❌ --staged must be run inside a git repository")
+            return 1
+        all_results = validator.validate_staged(root)
+        if not all_results:
+            return 0
+
+    elif args.all:
         # Validate all JSON files in questions directory
         json_files = sorted(questions_dir.glob('*.json'))
         if not json_files:
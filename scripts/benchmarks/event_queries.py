@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Event Query Benchmark - Group-by latency over the columnar event store
+
+Writes a synthetic store of N answer events straight into column files
+(skipping JSON ingestion), then times the dashboard-grade aggregations:
+per-question accuracy, per-category accuracy over the last 7 days and the
+session summary.
+
+Usage:
+    python3 scripts/benchmarks/event_queries.py                  # 10M events
+    python3 scripts/benchmarks/event_queries.py --events 1000000 --json events.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.event_store import COLUMNS, CORRECT_FILE, META_FILE, STORE_VERSION, EventStore, load_numpy
+
+DAY_MS = 86_400_000
+
+
+def write_synthetic_store(path: Path, n: int, questions: int = 300, sessions: int = 200_000,
+                          days: int = 90, seed: int = 42):
+    """Write n random events as a store directory"""
+    np = load_numpy()
+    now_ms = int(time.time() * 1000)
+    cardinality = {'session': sessions, 'question': questions, 'category': 19,
+                   'difficulty': 3, 'language': 2}
+
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        columns = {name: rng.integers(0, size, n, dtype=np.dtype(COLUMNS[name][1]))
+                   for name, size in cardinality.items()}
+        columns['timestamp'] = rng.integers(now_ms - days * DAY_MS, now_ms, n, dtype=np.int64)
+        correct = np.packbits(rng.random(n) < 0.6, bitorder='little')
+    else:
+        rand = random.Random(seed)
+        columns = {name: array(COLUMNS[name][1], (rand.randrange(size) for _ in range(n)))
+                   for name, size in cardinality.items()}
+        columns['timestamp'] = array('q', (rand.randrange(now_ms - days * DAY_MS, now_ms)
+                                           for _ in range(n)))
+        correct = bytes(rand.getrandbits(8) for _ in range((n + 7) // 8))
+
+    for name, (filename, _) in COLUMNS.items():
+        with open(path / filename, 'wb') as f:
+            f.write(memoryview(columns[name]).cast('B'))
+    with open(path / CORRECT_FILE, 'wb') as f:
+        f.write(memoryview(correct).cast('B'))
+
+    meta = {
+        'version': STORE_VERSION,
+        'count': n,
+        'cursor': None,
+        'dictionaries': {
+            'session': [f"s{i}" for i in range(sessions)],
+            'question': [f"q_{i:03d}" for i in range(questions)],
+            'category': [f"category_{i}" for i in range(19)],
+            'difficulty': ['easy', 'medium', 'hard'],
+            'language': ['en', 'zh'],
+        },
+    }
+    with open(path / META_FILE, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+
+def timed(fn, runs: int) -> float:
+    """Best-of-runs wall time in ms"""
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark columnar event store queries')
+    parser.add_argument('--events', type=int, default=10_000_000, help='Synthetic events (default: 10M)')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per query (best is reported)')
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    backend = 'numpy' if load_numpy() is not None else 'pure-python'
+    print(f"Backend: {backend}, {args.events:,} events\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        write_synthetic_store(Path(tmp), args.events)
+        print(f"Generated store in {time.perf_counter() - start:.1f}s\n")
+
+        store = EventStore(Path(tmp))
+        week_ago = int(time.time() * 1000) - 7 * DAY_MS
+        queries = {
+            'accuracy-by-question': lambda: store.group_accuracy('question'),
+            'accuracy-by-category-7d': lambda: store.group_accuracy('category', since=week_ago),
+            'session-summary': lambda: store.session_counts(),
+        }
+
+        results = {'backend': backend, 'events': args.events, 'queries': {}}
+        for name, query in queries.items():
+            ms = timed(query, args.runs)
+            results['queries'][name] = round(ms, 2)
+            print(f"{name:28} {ms:9.1f}ms")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
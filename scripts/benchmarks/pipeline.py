@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark - Wall time, peak RSS and per-stage breakdown at scale
+
+Generates (or reuses) synthetic banks with benchmarks/synthetic_corpus.py
+and runs each pipeline stage in a fresh interpreter, so every stage gets
+its own peak RSS:
+
+    ids          IDManager next-ID allocation (cold snapshots, then warm)
+    validate     Per-file load + streaming FactChecker over every question
+    master-list  MasterListUpdater add/re-tag/totals on a copy of the list
+    web-verify   web_fact_check against a local Wikipedia stand-in
+    search       Search index build, one-file refresh, then ranked queries
+    related      Related-question table build, then a one-question update
+    select       Selection engine build from the answer log, then next/answer pairs
+    analytics    Log stats (full, then incremental) + difficulty calibration
+
+Generated banks are cached under data/cache/bench/. Results are printed
+and, with --json, written as one JSON document for trend tracking.
+
+Usage:
+    python3 scripts/benchmarks/pipeline.py                         # 1k and 10k
+    python3 scripts/benchmarks/pipeline.py --sizes 1k,10k,100k,1M --json bench.json
+    python3 scripts/benchmarks/pipeline.py --stages validate,ids --sizes 100k
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+BENCH_DIR = PROJECT_ROOT / 'data' / 'cache' / 'bench'
+STAGES = ['ids', 'validate', 'master-list', 'web-verify', 'search', 'related', 'select', 'analytics']
+DEFAULT_SIZES = '1k,10k'
+
+# Answer events generated per question, capped for the larger banks
+EVENTS_PER_QUESTION = 10
+MAX_EVENTS = 2_000_000
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+class Timer:
+    """Accumulates named sub-stage timings"""
+
+    def __init__(self):
+        self.breakdown: Dict[str, float] = {}
+
+    @contextlib.contextmanager
+    def __call__(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.breakdown[name] = self.breakdown.get(name, 0.0) + _ms(time.perf_counter() - start)
+
+
+# ---------------------------------------------------------------------------
+# Stages (run inside the child process)
+# ---------------------------------------------------------------------------
+
+def stage_ids(bank: Path, work: Path, opts, timer: Timer) -> Dict:
+    from utils import corpus
+    from utils.id_manager import IDManager
+
+    shutil.rmtree(corpus.SNAPSHOT_DIR, ignore_errors=True)
+    manager = IDManager(bank / 'questions')
+    categories = list(IDManager.CATEGORY_PREFIXES)
+    for phase in ('cold', 'warm'):
+        with timer(phase):
+            for category in categories:
+                manager.get_next_n_ids(category, 10)
+    return {'items': 2 * len(categories)}
+
+
+def stage_validate(bank: Path, work: Path, opts, timer: Timer) -> Dict:
+    from utils.corpus import Corpus
+    from validate_facts import FactChecker
+
+    # Stream one file at a time, the way validate_facts.py runs, so peak RSS
+    # reflects the largest category rather than the whole bank
+    corpus = Corpus(bank / 'questions')
+    checker = FactChecker(retain=False)
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        for path in corpus.files():
+            with timer('load'):
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            with timer('check'):
+                checker.validate_file(str(path), data=data)
+            del data
+            output.seek(0)
+            output.truncate()
+
+    return {'items': sum(checker.confidence_counts.values()),
+            'failed': checker.confidence_counts['low'],
+            'issues': sum(checker.severity_counts.values())}
+
+
+def stage_master_list(bank: Path, work: Path, opts, timer: Timer) -> Dict:
+    from utils.corpus import Corpus
+    from utils.master_list import MasterListUpdater
+
+    master = work / 'ALL_QUESTIONS_MASTER_LIST.md'
+    shutil.copy(bank / 'ALL_QUESTIONS_MASTER_LIST.md', master)
+    updater = MasterListUpdater(master)
+    corpus = Corpus(bank / 'questions')
+    samples = []
+    for path in corpus.files():
+        category = corpus.open(path)
+        samples.append((category.category_en, [category.question(i) for i in range(min(5, len(category)))]))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        with timer('add'):
+            for category, questions in samples:
+                updater.add_questions(category, [{**q, 'question_en': q['question_en'] + ' (new)'}
+                                                 for q in questions])
+        with timer('retag'):
+            updater.update_difficulties({(category, i): (q['question_en'], 'hard')
+                                         for category, qs in samples for i, q in enumerate(qs)})
+        with timer('totals'):
+            updater.update_totals()
+    return {'items': sum(len(qs) for _, qs in samples)}
+
+
+def stage_web_verify(bank: Path, work: Path, opts, timer: Timer) -> Dict:
+    import web_fact_check
+    from utils.corpus import Corpus
+    from utils.key_terms import KeyTermIndex
+    from wiki_stub import WikiStub
+
+    corpus = Corpus(bank / 'questions')
+    files = corpus.files()
+    per_file = max(1, opts.web_sample // len(files))
+    samples = []
+    for path in files:
+        category = corpus.open(path)
+        questions = [category.question(i) for i in range(min(per_file, len(category)))]
+        samples.append((path, {'category_en': category.category_en, 'questions': questions}))
+
+    with timer('key-terms-index'):
+        index = KeyTermIndex.open(bank / 'questions', path=work / 'key-terms.json')
+    with timer('key-terms'):
+        for _, data in samples:
+            for q in data['questions']:
+                web_fact_check.extract_key_terms(q['question_en'], q['explanations_en'][q['correct_answer']],
+                                                 index)
+
+    with WikiStub(latency_ms=opts.stub_latency_ms) as stub:
+        web_fact_check.WIKIPEDIA_URL = stub.url
+        with timer('verify'):
+            web_fact_check.verify_files([str(path) for path, _ in samples], verbose=False,
+                                        datas=[data for _, data in samples], delay=0, index=index)
+        requests = stub.state.requests
+
+    return {'items': sum(len(data['questions']) for _, data in samples), 'http_requests': requests,
+            'stub_latency_ms': opts.stub_latency_ms}
+
+
+def stage_search(bank: Path, work: Path, opts, timer: Timer) -> Dict:
+    from utils.corpus import Corpus
+    from utils.search import SearchIndex
+
+    # A copy of the bank, so one file can be touched to time a refresh
+    questions = work / 'questions'
+    shutil.copytree(bank / 'questions', questions)
+    corpus = Corpus(questions)
+    files = corpus.files()
+    queries = []
+    for path in files:
+        question = corpus.open(path).question(0)
+        words = question['question_en'].split()
+        queries += [words[-1].strip('?'), ' '.join(words[1:3]), question['question_zh'][2:5],
+                    question['question_zh'][3]]
+
+    with SearchIndex(corpus, path=work / 'search.sqlite3') as index:
+        with timer('build'):
+            index.refresh()
+        os.utime(files[0])
+        with timer('refresh-one-file'):
+            index.refresh()
+        with timer('query'):
+            for query in queries:
+                index.search(query)
+    return {'items': len(queries), 'query_ms': round(timer.breakdown['query'] / len(queries), 2)}
+
+
+def stage_related(bank: Path, work: Path, opts, timer: Timer) -> Dict:
+    from utils.corpus import Corpus
+    from utils.related import RelatedIndex
+
+    # A copy of the bank, so one question can be edited to time an update
+    questions = work / 'questions'
+    shutil.copytree(bank / 'questions', questions)
+    corpus = Corpus(questions)
+    path = corpus.files()[0]
+
+    with RelatedIndex(corpus, path=work / 'related.sqlite3') as index:
+        with timer('build'):
+            index.refresh()
+        # Give the first question the second one's text
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        first, second = data['questions'][:2]
+        first.update({key: second[key] for key in ('question_en', 'question_zh', 'choices_en', 'choices_zh')
+                      if key in second})
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        with timer('update-one-question'):
+            recomputed = index.refresh()
+        items = len(index)
+        linked = sum(1 for neighbors in index.table().values() if neighbors)
+    return {'items': items, 'linked': linked, 'recomputed': recomputed}
+
+
+def stage_select(bank: Path, work: Path, opts, timer: Timer) -> Dict:
+    from utils.corpus import Corpus
+    from utils.log_analytics import ANSWERS_LOG
+    from utils.selection import SelectionEngine
+
+    with timer('build'):
+        engine = SelectionEngine.from_history(Corpus(bank / 'questions'), bank / 'logs' / ANSWERS_LOG, seed=42)
+
+    # 1,000 sessions answering 20 questions each
+    picks = 0
+    with timer('next+answer'):
+        for turn in range(20):
+            for session in range(1000):
+                pick = engine.next(f"s{session}")
+                engine.answer(f"s{session}", pick.question_id, correct=(session + turn) % 3 != 0)
+                picks += 1
+    return {'items': picks, 'pick_us': round(timer.breakdown['next+answer'] * 1000 / picks, 1)}
+
+
+def stage_analytics(bank: Path, work: Path, opts, timer: Timer) -> Dict:
+    from utils.calibration import calibrate, tally_answers
+    from utils.corpus import Corpus
+    from utils.log_analytics import ANSWERS_LOG, update_stats
+
+    logs = work / 'logs'
+    shutil.copytree(bank / 'logs', logs)
+    checkpoint = work / 'checkpoint.json'
+
+    with timer('stats-full'):
+        stats, _, _ = update_stats(logs, checkpoint, full=True)
+
+    # Append ~1% new answers, then update from the checkpoint
+    answers = logs / ANSWERS_LOG
+    with open(answers, 'rb') as f:
+        head = [line for _, line in zip(range(max(1, stats['total'] // 100)), f)]
+    with open(answers, 'ab') as f:
+        f.writelines(head)
+    with timer('stats-incremental'):
+        update_stats(logs, checkpoint)
+
+    with timer('calibration'):
+        tallies, _ = tally_answers(answers)
+        calibrate(tallies, Corpus(bank / 'questions'))
+
+    return {'items': stats['total'] + len(head)}
+
+
+STAGE_FUNCS: Dict[str, Callable] = {
+    'ids': stage_ids,
+    'validate': stage_validate,
+    'master-list': stage_master_list,
+    'web-verify': stage_web_verify,
+    'search': stage_search,
+    'related': stage_related,
+    'select': stage_select,
+    'analytics': stage_analytics,
+}
+
+
+def run_stage(args) -> int:
+    """Child process: run one stage and write its measurements as JSON"""
+    from utils import corpus
+
+    # Keep synthetic snapshots out of the real data/cache/questions
+    corpus.SNAPSHOT_DIR = args.bank / 'snapshots'
+    baseline = _peak_rss_mb()
+
+    timer = Timer()
+    start = time.perf_counter()
+    extra = STAGE_FUNCS[args.run_stage](args.bank, args.work, args, timer)
+    result = {
+        'wall_ms': _ms(time.perf_counter() - start),
+        'peak_rss_mb': _peak_rss_mb(),
+        'baseline_rss_mb': baseline,
+        'breakdown_ms': timer.breakdown,
+        **extra,
+    }
+    with open(args.result, 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Harness (parent process)
+# ---------------------------------------------------------------------------
+
+def ensure_bank(size: int, seed: int, events: int, fresh: bool) -> Tuple[Path, float]:
+    """Generated bank for size (reused from data/cache/bench/ if present)"""
+    from synthetic_corpus import generate
+
+    bank = BENCH_DIR / f"bank-{size}-s{seed}-e{events}"
+    manifest = bank / 'manifest.json'
+    if manifest.exists() and not fresh:
+        return bank, 0.0
+
+    shutil.rmtree(bank, ignore_errors=True)
+    start = time.perf_counter()
+    generate(bank, size, seed=seed, events=events)
+    return bank, time.perf_counter() - start
+
+
+def spawn_stage(stage: str, bank: Path, args) -> Dict:
+    """Run one stage in a fresh interpreter and collect its result"""
+    with tempfile.TemporaryDirectory() as tmp:
+        result_path = Path(tmp) / 'result.json'
+        work = Path(tmp) / 'work'
+        work.mkdir()
+        cmd = [sys.executable, str(Path(__file__).resolve()), '--run-stage', stage,
+               '--bank', str(bank), '--work', str(work), '--result', str(result_path),
+               '--web-sample', str(args.web_sample), '--stub-latency-ms', str(args.stub_latency_ms)]
+        start = time.perf_counter()
+        proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        process_ms = _ms(time.perf_counter() - start)
+        if proc.returncode != 0 or not result_path.exists():
+            return {'error': proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'failed',
+                    'process_ms': process_ms}
+        with open(result_path, 'r', encoding='utf-8') as f:
+            result = json.load(f)
+    result['process_ms'] = process_ms
+    return result
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ''
+
+
+def main():
+    from synthetic_corpus import parse_size
+
+    parser = argparse.ArgumentParser(description='Benchmark the pipeline on synthetic banks')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help=f'Bank sizes (default: {DEFAULT_SIZES})')
+    parser.add_argument('--stages', default=','.join(STAGES), help=f"Stages to run (default: {','.join(STAGES)})")
+    parser.add_argument('--seed', type=int, default=42, help='Generator seed')
+    parser.add_argument('--events', type=parse_size,
+                        help=f'Answer events per bank (default: {EVENTS_PER_QUESTION}/question, max {MAX_EVENTS:,})')
+    parser.add_argument('--web-sample', type=int, default=95, help='Questions to web-verify per bank')
+    parser.add_argument('--stub-latency-ms', type=float, default=20.0,
+                        help='Emulated Wikipedia latency per request (default: 20)')
+    parser.add_argument('--fresh', action='store_true', help='Regenerate banks even if cached')
+    parser.add_argument('--json', type=Path, help='Write results to this JSON file')
+    # Internal: child process mode
+    parser.add_argument('--run-stage', choices=STAGES, help=argparse.SUPPRESS)
+    parser.add_argument('--bank', type=Path, help=argparse.SUPPRESS)
+    parser.add_argument('--work', type=Path, help=argparse.SUPPRESS)
+    parser.add_argument('--result', type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_stage:
+        return run_stage(args)
+
+    sizes = [parse_size(s) for s in args.sizes.split(',')]
+    stages = [s.strip() for s in args.stages.split(',')]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"Unknown stages: {', '.join(sorted(unknown))} (choose from {', '.join(STAGES)})")
+
+    report = {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'seed': args.seed,
+        'results': [],
+    }
+
+    print(f"\n⏱️  Pipeline benchmark (commit {report['commit'] or '?'}, Python {report['python']})")
+    print("=" * 78)
+    for size in sizes:
+        events = args.events if args.events is not None else min(size * EVENTS_PER_QUESTION, MAX_EVENTS)
+        bank, generated = ensure_bank(size, args.seed, events, args.fresh)
+        print(f"\n📦 {size:,} questions, {events:,} events"
+              + (f" (generated in {generated:.1f}s)" if generated else " (cached)"))
+        print(f"  {'stage':12} {'wall':>10} {'peak RSS':>10}  breakdown")
+
+        for stage in stages:
+            result = spawn_stage(stage, bank, args)
+            report['results'].append({'size': size, 'events': events, 'stage': stage, **result})
+            if 'error' in result:
+                print(f"  {stage:12} ❌ {result['error']}")
+                continue
+            breakdown = ', '.join(f"{name} {ms:,.0f}ms" for name, ms in result['breakdown_ms'].items())
+            print(f"  {stage:12} {result['wall_ms']:>8,.0f}ms {result['peak_rss_mb']:>8,.1f}MB  {breakdown}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+    return 1 if any('error' in r for r in report['results']) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Selection Load Test - Requests per second against the selection server
+
+Starts scripts/selection_server.py on a bank (or targets --url), then runs
+client processes that each keep one HTTP/1.1 connection open and play quiz
+sessions as fast as they can: GET /next, then POST /answer with a 60%
+chance of a correct answer. Reports throughput and per-endpoint latency
+percentiles.
+
+Usage:
+    python3 scripts/benchmarks/selection_load.py                          # Repo bank, 4 clients, 10s
+    python3 scripts/benchmarks/selection_load.py --bank data/cache/bench/bank-100000-s42-e1000000
+    python3 scripts/benchmarks/selection_load.py --url http://127.0.0.1:8770 --clients 8 --json load.json
+"""
+
+import argparse
+import http.client
+import json
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.parse
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+# Seconds to wait for the server to load its bank
+STARTUP_TIMEOUT = 300
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_up(url: str, proc: Optional[subprocess.Popen]):
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    host = urllib.parse.urlsplit(url).netloc
+    while time.monotonic() < deadline:
+        if proc is not None and proc.poll() is not None:
+            raise RuntimeError(f"Selection server exited with code {proc.returncode}")
+        try:
+            conn = http.client.HTTPConnection(host, timeout=1)
+            conn.request('GET', '/health')
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Selection server did not come up at {url}")
+
+
+def play(url: str, seconds: float, sessions: int, seed: int) -> Dict:
+    """Client loop: quiz sessions against url for seconds; returns counts and latencies (ms)"""
+    rand = random.Random(seed)
+    conn = http.client.HTTPConnection(urllib.parse.urlsplit(url).netloc, timeout=10)
+    latencies = {'next': array('d'), 'answer': array('d')}
+    statuses: Dict[int, int] = {}
+    deadline = time.perf_counter() + seconds
+
+    while time.perf_counter() < deadline:
+        session = f"load-{seed}-{rand.randrange(sessions)}"
+        start = time.perf_counter()
+        conn.request('GET', f"/next?session={session}")
+        response = conn.getresponse()
+        body = response.read()
+        latencies['next'].append((time.perf_counter() - start) * 1000)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+        if response.status != 200:
+            continue  # Session has seen everything
+
+        event = {'sessionId': session, 'questionId': json.loads(body)['id'], 'isCorrect': rand.random() < 0.6}
+        start = time.perf_counter()
+        conn.request('POST', '/answer', body=json.dumps(event), headers={'Content-Type': 'application/json'})
+        response = conn.getresponse()
+        response.read()
+        latencies['answer'].append((time.perf_counter() - start) * 1000)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+
+    conn.close()
+    return {'latencies': {name: values.tobytes() for name, values in latencies.items()}, 'statuses': statuses}
+
+
+def _percentile(values: List[float], q: float) -> float:
+    return values[min(len(values) - 1, int(q * len(values)))] if values else 0.0
+
+
+def run_load(url: str, clients: int, seconds: float, sessions: int) -> Dict:
+    """Run clients in parallel processes and merge their results"""
+    with ProcessPoolExecutor(clients) as pool:
+        results = list(pool.map(play, [url] * clients, [seconds] * clients,
+                                [sessions] * clients, range(clients)))
+
+    statuses: Dict[int, int] = {}
+    endpoints = {}
+    for name in ('next', 'answer'):
+        values = array('d')
+        for result in results:
+            values.frombytes(result['latencies'][name])
+        values = sorted(values)
+        endpoints[name] = {
+            'requests': len(values),
+            'p50_ms': round(_percentile(values, 0.50), 3),
+            'p95_ms': round(_percentile(values, 0.95), 3),
+            'p99_ms': round(_percentile(values, 0.99), 3),
+        }
+    for result in results:
+        for status, count in result['statuses'].items():
+            statuses[status] = statuses.get(status, 0) + count
+    total = sum(endpoint['requests'] for endpoint in endpoints.values())
+    return {'clients': clients, 'seconds': seconds, 'requests': total,
+            'requests_per_second': round(total / seconds), 'statuses': statuses, 'endpoints': endpoints}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test the selection server')
+    parser.add_argument('--url', help='Server to test (default: start one on --bank)')
+    parser.add_argument('--bank', type=Path,
+                        help='Directory with questions/ and logs/ (default: the repo bank and logs)')
+    parser.add_argument('--clients', type=int, default=4, help='Client processes (default: 4)')
+    parser.add_argument('--seconds', type=float, default=10, help='Test duration (default: 10)')
+    parser.add_argument('--sessions', type=int, default=1000, help='Quiz sessions per client (default: 1000)')
+    parser.add_argument('--json', type=Path, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    proc = None
+    url = args.url
+    if url is None:
+        port = _free_port()
+        cmd = [sys.executable, str(SCRIPTS_DIR / 'selection_server.py'), '--port', str(port)]
+        if args.bank:
+            cmd += ['--questions-dir', str(args.bank / 'questions'), '--logs-dir', str(args.bank / 'logs')]
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+        url = f"http://127.0.0.1:{port}"
+
+    try:
+        start = time.perf_counter()
+        _wait_until_up(url, proc)
+        print(f"\n🎲 Selection load test: {url} (up in {time.perf_counter() - start:.1f}s), "
+              f"{args.clients} clients for {args.seconds:g}s")
+        print("=" * 60)
+        result = run_load(url, args.clients, args.seconds, args.sessions)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    print(f"  {result['requests']:,} requests, {result['requests_per_second']:,}/s  statuses {result['statuses']}")
+    for name, endpoint in result['endpoints'].items():
+        print(f"  {name:7} {endpoint['requests']:>9,}  p50 {endpoint['p50_ms']:.2f}ms  "
+              f"p95 {endpoint['p95_ms']:.2f}ms  p99 {endpoint['p99_ms']:.2f}ms")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+    return 0 if set(result['statuses']) <= {200, 404} else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
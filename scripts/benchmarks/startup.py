@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark - Import-time budget for the scripts CLI
+
+Runs common lightweight invocations under `python -X importtime`, measures
+wall time and the import time they add on top of a bare interpreter, and
+fails if any scenario exceeds its budget.
+
+Usage:
+    python3 scripts/benchmarks/startup.py
+    python3 scripts/benchmarks/startup.py --runs 10 --top 5
+    python3 scripts/benchmarks/startup.py --json startup.json
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+
+# Scenario name -> (argv after the interpreter, import-time budget in ms)
+SCENARIOS: Dict[str, Tuple[List[str], float]] = {
+    'add-help': (
+        [str(SCRIPTS_DIR / 'add_questions.py'), '--help'], 40.0),
+    'master-list-dry-run': (
+        [str(SCRIPTS_DIR / 'add_questions.py'), '--update-master-list', '--dry-run'], 40.0),
+    'draft-dry-run-no-ai': (
+        [str(SCRIPTS_DIR / 'add_questions.py'), '--draft',
+         str(PROJECT_ROOT / 'questions' / 'drafts' / 'template_v3.yaml'), '--dry-run', '--no-ai'], 100.0),
+    'auto-validate-help': (
+        [str(SCRIPTS_DIR / 'auto_validate.py'), '--help'], 60.0),
+}
+
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse -X importtime output
+
+    Returns:
+        Dict of top-level module -> (self_us, cumulative_us)
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        if len(indent) == 1:  # Top-level import (nested ones are indented further)
+            modules[name] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def run_once(argv: List[str]) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """Run one invocation, returning (wall_ms, top-level import table)"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', *argv],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    return wall_ms, parse_importtime(result.stderr)
+
+
+def measure(argv: List[str], runs: int, baseline: Dict[str, Tuple[int, int]]) -> Dict:
+    """Measure a scenario, reporting medians across runs"""
+    walls, imports = [], []
+    last_table: Dict[str, Tuple[int, int]] = {}
+    for _ in range(runs):
+        wall_ms, table = run_once(argv)
+        walls.append(wall_ms)
+        # Only count what the scenario imports beyond a bare interpreter
+        extra = {name: t for name, t in table.items() if name not in baseline}
+        imports.append(sum(cum for _, cum in extra.values()) / 1000)
+        last_table = extra
+
+    slowest = sorted(last_table.items(), key=lambda item: item[1][1], reverse=True)
+    return {
+        'wall_ms': round(statistics.median(walls), 2),
+        'import_ms': round(statistics.median(imports), 2),
+        'slowest_imports': [
+            {'module': name, 'cumulative_ms': round(cum / 1000, 2)}
+            for name, (_, cum) in slowest
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Startup time budget check for scripts')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per scenario (median is reported)')
+    parser.add_argument('--top', type=int, default=3, help='Show the N slowest imports per scenario')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='Only run this scenario (repeatable)')
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    _, baseline = run_once(['-c', 'pass'])
+    bare_walls = [run_once(['-c', 'pass'])[0] for _ in range(args.runs)]
+    interpreter_ms = statistics.median(bare_walls)
+
+    print(f"Interpreter startup: {interpreter_ms:.1f} ms (median of {args.runs})\n")
+    print(f"{'Scenario':24} {'Wall':>9} {'Imports':>9} {'Budget':>9}")
+    print('-' * 56)
+
+    results = {'interpreter_ms': round(interpreter_ms, 2), 'scenarios': {}}
+    over_budget = []
+
+    for name in args.scenario or list(SCENARIOS):
+        argv, budget_ms = SCENARIOS[name]
+        result = measure(argv, args.runs, baseline)
+        result['budget_ms'] = budget_ms
+        result['slowest_imports'] = result['slowest_imports'][:args.top]
+        results['scenarios'][name] = result
+
+        status = '✅' if result['import_ms'] <= budget_ms else '❌'
+        print(f"{name:24} {result['wall_ms']:7.1f}ms {result['import_ms']:7.1f}ms "
+              f"{budget_ms:7.1f}ms {status}")
+        for entry in result['slowest_imports']:
+            print(f"{'':26}{entry['module']:30} {entry['cumulative_ms']:6.1f}ms")
+
+        if result['import_ms'] > budget_ms:
+            over_budget.append(name)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+
+    if over_budget:
+        print(f"\n❌ Over budget: {', '.join(over_budget)}")
+        return 1
+
+    print("\n✅ All scenarios within budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
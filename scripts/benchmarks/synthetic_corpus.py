@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Synthetic Corpus - Realistic, scalable question banks for benchmarking
+
+Generates the 19 category files (same file names, category names and ID
+prefixes as src/data/questions), a matching ALL_QUESTIONS_MASTER_LIST.md
+and optionally quiz answer/share logs, at any size (1k ... 1M questions).
+
+Text is sampled from the real bank: every field's length is drawn from the
+real length distribution for that field, and filled with words (EN) or
+characters (ZH) from the real vocabulary, so validators see realistic
+inputs. A configurable fraction of questions carries the issues the
+validators look for (over-long fields, missing Correct!/Wrong. prefixes,
+too-short explanations, missing fields, absolute claims).
+
+Usage:
+    python3 scripts/benchmarks/synthetic_corpus.py --questions 10000 --out /tmp/bank
+    python3 scripts/benchmarks/synthetic_corpus.py --questions 1000000 --out /tmp/bank --events 0
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.corpus import DEFAULT_QUESTIONS_DIR, iter_category_files
+from utils.log_analytics import ANSWERS_LOG, SHARES_LOG
+
+# Fraction of questions carrying each issue
+ISSUE_RATES = {
+    'long_text': 0.08,        # question/choice over the mobile limits (warning)
+    'missing_prefix': 0.04,   # explanation without Correct!/Wrong. (warning)
+    'short_explanation': 0.01,  # explanation under 20 chars (critical)
+    'missing_field': 0.005,   # question_zh dropped (critical)
+    'absolute_claim': 0.10,   # "always"/"never"/"proven" (info)
+}
+
+DIFFICULTY_WEIGHTS = {'easy': 0.35, 'medium': 0.4, 'hard': 0.25}
+SHARE_METHODS = ['web_share', 'clipboard', 'wechat', 'twitter']
+
+_EN_WORD = re.compile(r"[A-Za-z][a-z']+")
+_ZH_CHAR = re.compile(r'[一-鿿]')
+
+
+class BankProfile:
+    """Categories, length distributions and vocabulary of the real bank"""
+
+    def __init__(self, questions_dir: Optional[Path] = None):
+        self.categories: List[Dict] = []
+        self.lengths: Dict[str, List[int]] = defaultdict(list)
+        en_words, zh_chars = [], []
+
+        for path in iter_category_files(questions_dir or DEFAULT_QUESTIONS_DIR):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            ids = [q['id'] for q in data['questions'] if '_' in q.get('id', '')]
+            self.categories.append({
+                'file': path.name,
+                'category_en': data['category_en'],
+                'category_zh': data['category_zh'],
+                'prefix': ids[0].rsplit('_', 1)[0] if ids else path.stem[:5],
+                'weight': len(data['questions']),
+            })
+            for q in data['questions']:
+                self.lengths['question_en'].append(len(q['question_en']))
+                self.lengths['question_zh'].append(len(q['question_zh']))
+                self.lengths['choice_en'].extend(map(len, q['choices_en']))
+                self.lengths['choice_zh'].extend(map(len, q['choices_zh']))
+                for i, (en, zh) in enumerate(zip(q['explanations_en'], q['explanations_zh'])):
+                    kind = 'correct' if i == q['correct_answer'] else 'wrong'
+                    self.lengths[f'{kind}_en'].append(len(en))
+                    self.lengths[f'{kind}_zh'].append(len(zh))
+                text = ' '.join([q['question_en'], *q['choices_en'], *q['explanations_en']])
+                en_words.extend(w.lower() for w in _EN_WORD.findall(text))
+                zh_chars.extend(_ZH_CHAR.findall(''.join([q['question_zh'], *q['choices_zh'],
+                                                           *q['explanations_zh']])))
+
+        if not self.categories:
+            raise ValueError(f"No category files found in {questions_dir or DEFAULT_QUESTIONS_DIR}")
+        # Repetition keeps the real word frequencies when sampling
+        self.en_words = en_words
+        self.zh_chars = zh_chars
+
+
+class CorpusGenerator:
+    """Generates synthetic questions following a BankProfile"""
+
+    def __init__(self, profile: BankProfile, seed: int = 42, issue_rates: Optional[Dict[str, float]] = None):
+        self.profile = profile
+        self.rand = random.Random(seed)
+        self.issue_rates = ISSUE_RATES if issue_rates is None else issue_rates
+
+    def _length(self, kind: str) -> int:
+        return self.rand.choice(self.profile.lengths[kind])
+
+    def _en(self, length: int) -> str:
+        words = self.rand.choices(self.profile.en_words, k=max(2, length // 5 + 1))
+        text = ' '.join(words)
+        if len(text) > length:
+            text = text[:length].rsplit(' ', 1)[0] or text[:length]
+        return text
+
+    def _zh(self, length: int) -> str:
+        return ''.join(self.rand.choices(self.profile.zh_chars, k=max(2, length)))
+
+    def _issues(self) -> set:
+        return {name for name, rate in self.issue_rates.items() if self.rand.random() < rate}
+
+    def question(self, question_id: str, created_at: str) -> Dict:
+        """One synthetic question"""
+        rand = self.rand
+        issues = self._issues()
+        correct = rand.randrange(4)
+
+        question_en = 'Why ' + self._en(self._length('question_en') - 5) + '?'
+        question_zh = '为什么' + self._zh(self._length('question_zh') - 4) + '？'
+        choices_en = [self._en(self._length('choice_en')).capitalize() for _ in range(4)]
+        choices_zh = [self._zh(self._length('choice_zh')) for _ in range(4)]
+
+        explanations_en, explanations_zh = [], []
+        for i in range(4):
+            kind = 'correct' if i == correct else 'wrong'
+            prefix_en, prefix_zh = ('Correct! ', '正确！') if i == correct else ('Wrong. ', '错误。')
+            body_en = self._en(self._length(f'{kind}_en') - len(prefix_en))
+            explanations_en.append(prefix_en + body_en[:1].upper() + body_en[1:] + '.')
+            explanations_zh.append(prefix_zh + self._zh(self._length(f'{kind}_zh') - 4) + '。')
+
+        if 'long_text' in issues:
+            if rand.random() < 0.5:
+                question_en = 'Why ' + self._en(rand.randint(46, 70)) + '?'
+            else:
+                choices_en[rand.randrange(4)] = self._en(rand.randint(36, 60)).capitalize()
+        if 'missing_prefix' in issues:
+            i = rand.randrange(4)
+            explanations_en[i] = explanations_en[i].split(' ', 1)[1]
+        if 'short_explanation' in issues:
+            explanations_en[rand.randrange(4)] = 'Wrong. ' + self._en(8)
+        if 'absolute_claim' in issues:
+            i = rand.randrange(4)
+            explanations_en[i] += f" This is {rand.choice(['always', 'never', 'proven'])} the case."
+
+        question = {
+            'question_en': question_en,
+            'question_zh': question_zh,
+            'choices_en': choices_en,
+            'choices_zh': choices_zh,
+            'correct_answer': correct,
+            'explanations_en': explanations_en,
+            'explanations_zh': explanations_zh,
+            'difficulty': rand.choices(list(DIFFICULTY_WEIGHTS), weights=list(DIFFICULTY_WEIGHTS.values()))[0],
+            'created_at': created_at,
+            'last_modified_at': created_at,
+            'id': question_id,
+        }
+        if 'missing_field' in issues:
+            del question['question_zh']
+        return question
+
+    def counts(self, total: int) -> List[int]:
+        """Questions per category, proportional to the real bank"""
+        weights = [c['weight'] for c in self.profile.categories]
+        scale = total / sum(weights)
+        counts = [int(w * scale) for w in weights]
+        for i in range(total - sum(counts)):
+            counts[i % len(counts)] += 1
+        return counts
+
+
+def write_master_list(path: Path, files: List[Dict]):
+    """Master list in the real file's format: ## Category (count) then N. Question [difficulty]"""
+    lines = ['# All Questions Master List\n', '\n',
+             f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n", '\n',
+             f"Total questions: {sum(len(f['questions']) for f in files)}\n", '\n']
+    number = 1
+    for data in sorted(files, key=lambda d: d['category_en']):
+        lines.append(f"## {data['category_en']} ({len(data['questions'])})\n")
+        lines.append('\n')
+        for question in data['questions']:
+            lines.append(f"{number}. {question['question_en']} [{question['difficulty']}]\n")
+            number += 1
+        lines.append('\n')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(lines[:-1])
+
+
+def write_logs(logs_dir: Path, files: List[Dict], events: int, seed: int = 42, days: int = 30):
+    """Synthetic quiz_answers.jsonl / quiz_shares.jsonl (about 1 share per 50 answers)"""
+    rand = random.Random(seed)
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    pool = [(q['id'], data['category_en'], q['difficulty']) for data in files for q in data['questions']]
+    sessions = max(10, events // 12)
+    start = datetime.now(timezone.utc) - timedelta(days=days)
+    step = days * 86400 / max(events, 1)
+
+    with open(logs_dir / ANSWERS_LOG, 'w', encoding='utf-8') as answers, \
+            open(logs_dir / SHARES_LOG, 'w', encoding='utf-8') as shares:
+        for i in range(events):
+            question_id, category, difficulty = rand.choice(pool)
+            event = {
+                'timestamp': (start + timedelta(seconds=i * step)).strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+                'sessionId': f"s{int(rand.paretovariate(1.1) * 7) % sessions}",
+                'questionId': question_id,
+                'category': category,
+                'difficulty': difficulty,
+            }
+            if rand.random() < 0.02:
+                shares.write(json.dumps({**event, 'method': rand.choice(SHARE_METHODS)}) + '\n')
+            event['isCorrect'] = rand.random() < {'easy': 0.8, 'medium': 0.6, 'hard': 0.4}[difficulty]
+            event['language'] = 'zh' if rand.random() < 0.55 else 'en'
+            answers.write(json.dumps(event) + '\n')
+
+
+def generate(out_dir: Path, questions: int, seed: int = 42, events: int = 0,
+             issue_rates: Optional[Dict[str, float]] = None, profile: Optional[BankProfile] = None) -> Dict:
+    """
+    Write a synthetic bank to out_dir
+
+    Layout:
+        out_dir/questions/*.json
+        out_dir/ALL_QUESTIONS_MASTER_LIST.md
+        out_dir/logs/quiz_answers.jsonl, quiz_shares.jsonl (if events)
+
+    Returns:
+        Manifest (also written to out_dir/manifest.json)
+    """
+    out_dir = Path(out_dir)
+    questions_dir = out_dir / 'questions'
+    questions_dir.mkdir(parents=True, exist_ok=True)
+    generator = CorpusGenerator(profile or BankProfile(), seed=seed, issue_rates=issue_rates)
+    created_at = datetime(2025, 11, 20, tzinfo=timezone.utc).isoformat()
+
+    files = []
+    for category, count in zip(generator.profile.categories, generator.counts(questions)):
+        data = {
+            'category_en': category['category_en'],
+            'category_zh': category['category_zh'],
+            'questions': [generator.question(f"{category['prefix']}_{i:03d}", created_at)
+                          for i in range(1, count + 1)],
+        }
+        # Canonical category format, without building snapshots in data/cache
+        with open(questions_dir / category['file'], 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        files.append(data)
+
+    write_master_list(out_dir / 'ALL_QUESTIONS_MASTER_LIST.md', files)
+    if events:
+        write_logs(out_dir / 'logs', files, events, seed=seed)
+
+    manifest = {'questions': questions, 'seed': seed, 'events': events,
+                'issue_rates': generator.issue_rates,
+                'files': {category['file']: count for category, count
+                          in zip(generator.profile.categories, generator.counts(questions))}}
+    with open(out_dir / 'manifest.json', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def parse_size(text: str) -> int:
+    """'10k' -> 10000, '1M' -> 1000000"""
+    text = text.strip().lower().replace('_', '')
+    multiplier = {'k': 1_000, 'm': 1_000_000}.get(text[-1:], 1)
+    return int(float(text.rstrip('km')) * multiplier)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic question bank')
+    parser.add_argument('--questions', type=parse_size, default=1000, help='Bank size, e.g. 1k, 10k, 1M')
+    parser.add_argument('--out', type=Path, required=True, help='Output directory')
+    parser.add_argument('--events', type=parse_size, default=0, help='Answer log events to generate')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest = generate(args.out, args.questions, seed=args.seed, events=args.events)
+    print(f"✅ {manifest['questions']:,} questions in {len(manifest['files'])} files"
+          f"{f', {args.events:,} events' if args.events else ''} → {args.out} "
+          f"({time.perf_counter() - start:.1f}s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
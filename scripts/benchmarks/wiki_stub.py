@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Wikipedia Stand-in - Local server for the endpoints web_fact_check uses
+
+Serves /w/api.php?action=opensearch, the multi-title extracts query
+(/w/api.php?action=query&prop=extracts&titles=A|B|...) and
+/api/rest_v1/page/summary/<title> with deterministic synthetic articles,
+plus an optional per-request delay to emulate network latency. Point web_fact_check at it with
+MILLIONWHYS_WIKIPEDIA_URL (or web_fact_check.WIKIPEDIA_URL in-process) to
+benchmark verification without touching the real Wikipedia.
+
+Usage:
+    python3 scripts/benchmarks/wiki_stub.py --port 8765 --latency-ms 30
+    MILLIONWHYS_WIKIPEDIA_URL=http://127.0.0.1:8765 python3 scripts/web_fact_check.py --file physics.json
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+# The real API's limits for action=query: titles per request, and intro
+# extracts returned per request (further pages come back without one)
+MAX_TITLES = 50
+MAX_EXTRACTS = 20
+
+# Science-flavoured filler so summaries overlap with real explanations
+VOCABULARY = (
+    'energy light water heat temperature pressure molecules atoms gravity surface '
+    'through because causes different larger smaller process called cells blood '
+    'oxygen carbon dioxide animals plants sunlight reflect absorb electrons '
+    'vibrations frequency wavelength chemical reaction protein muscles nerves brain '
+    'signals atmosphere planet orbit earth moon weather clouds particles density '
+    'friction motion speed force magnetic electric current sound waves'
+).split()
+
+
+class StubState:
+    """Shared configuration and request counters"""
+
+    def __init__(self, latency_ms: float = 0.0, results: int = 3):
+        self.latency = latency_ms / 1000
+        self.results = results
+        self.requests = 0
+        self.titles = 0  # Titles asked for through action=query
+        self.lock = threading.Lock()
+
+    def count(self, titles: int = 0):
+        with self.lock:
+            self.requests += 1
+            self.titles += titles
+
+
+def article_extract(title: str, words: int = 60) -> str:
+    """Deterministic pseudo-article text for a title"""
+    rand = random.Random(hashlib.sha1(title.encode('utf-8')).digest())
+    body = ' '.join(rand.choice(VOCABULARY) for _ in range(words))
+    return f"{title} is a topic in science. {body}."
+
+
+def search_titles(query: str, limit: int) -> List[str]:
+    rand = random.Random(hashlib.sha1(query.encode('utf-8')).digest())
+    if rand.random() < 0.1:
+        return []  # Some terms have no article
+    return [query.title()] + [f"{query.title()} ({rand.choice(VOCABULARY)})" for _ in range(limit - 1)]
+
+
+def query_pages(titles: List[str]) -> Dict:
+    """action=query response (formatversion=2) for titles"""
+    normalized, pages = [], []
+    for title in titles:
+        name = title[:1].upper() + title[1:].replace('_', ' ')
+        if name != title:
+            normalized.append({'fromencoded': False, 'from': title, 'to': name})
+        if not search_titles(title, 1):
+            pages.append({'ns': 0, 'title': name, 'missing': True})
+            continue
+        page = {'pageid': int(hashlib.sha1(name.encode('utf-8')).hexdigest()[:8], 16), 'ns': 0, 'title': name,
+                'fullurl': f"https://en.wikipedia.org/wiki/{urllib.parse.quote(name.replace(' ', '_'))}"}
+        if sum(1 for p in pages if 'extract' in p) < MAX_EXTRACTS:
+            page['extract'] = article_extract(name)
+        pages.append(page)
+    query = {'pages': pages}
+    if normalized:
+        query['normalized'] = normalized
+    return {'batchcomplete': True, 'query': query}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    state: StubState = None
+
+    def do_GET(self):
+        state = self.state
+        url = urllib.parse.urlsplit(self.path)
+        params = urllib.parse.parse_qs(url.query)
+        titles = [t for t in params.get('titles', [''])[0].split('|') if t]
+        state.count(len(titles))
+        if state.latency:
+            time.sleep(state.latency)
+
+        if url.path == '/w/api.php' and params.get('action', [''])[0] == 'query':
+            if len(titles) > MAX_TITLES:
+                self._send_json({'error': {'code': 'toomanyvalues',
+                                           'info': f"Too many values supplied for parameter \"titles\". "
+                                                   f"The limit is {MAX_TITLES}."}})
+            else:
+                self._send_json(query_pages(titles))
+        elif url.path == '/w/api.php':
+            query = params.get('search', [''])[0]
+            limit = int(params.get('limit', [state.results])[0])
+            titles = search_titles(query, limit)
+            self._send_json([query, titles, [''] * len(titles), [''] * len(titles)])
+        elif url.path.startswith('/api/rest_v1/page/summary/'):
+            title = urllib.parse.unquote(url.path.rsplit('/', 1)[1]).replace('_', ' ')
+            self._send_json({
+                'title': title,
+                'extract': article_extract(title),
+                'content_urls': {'desktop': {'page': f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"}},
+            })
+        else:
+            self.send_error(404)
+
+    def _send_json(self, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output clean
+
+
+class WikiStub:
+    """Stand-in server on a background thread; use as a context manager"""
+
+    def __init__(self, port: int = 0, latency_ms: float = 0.0):
+        self.state = StubState(latency_ms)
+        handler = type('Handler', (StubHandler,), {'state': self.state})
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+        self.server.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'WikiStub':
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local Wikipedia stand-in for web_fact_check')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Delay added to every request')
+    args = parser.parse_args()
+
+    stub = WikiStub(args.port, args.latency_ms)
+    print(f"📚 Wikipedia stand-in on {stub.url} (latency {args.latency_ms:g}ms), Ctrl+C to stop")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nServed {stub.state.requests} requests")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
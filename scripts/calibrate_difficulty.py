@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Calibrate question difficulty against real answer accuracy
+
+Reads data/logs/quiz_answers.jsonl (with its archived segments) once, computes Bayesian-smoothed
+accuracy per question and flags questions whose assigned difficulty
+(easy/medium/hard) is clearly out of line with how users perform.
+With --apply the suggested difficulties are written back through the
+same category-file writer as add_questions.py, and the master list tags
+are updated to match.
+
+Usage:
+    python3 scripts/calibrate_difficulty.py                  # Report flagged questions
+    python3 scripts/calibrate_difficulty.py --all            # Report every answered question
+    python3 scripts/calibrate_difficulty.py --apply          # Write suggested difficulties
+    python3 scripts/calibrate_difficulty.py --json calibration.json
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+# Add script directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.calibration import (EASY_ABOVE, HARD_BELOW, MIN_ANSWERS, PRIOR_STRENGTH, Calibration,
+                               calibrate, tally_answers)
+from utils.corpus import Corpus
+from utils.log_analytics import ANSWERS_LOG, LOGS_DIR
+
+
+def apply_calibrations(flagged: List[Calibration], corpus: Corpus, dry_run: bool = False) -> int:
+    """
+    Write suggested difficulties into the category files and master list
+
+    Returns:
+        Number of questions updated
+    """
+    from utils.master_list import MasterListUpdater
+
+    by_file = defaultdict(dict)
+    for result in flagged:
+        by_file[result.file][result.question_id] = result.suggested
+
+    now = datetime.now(timezone.utc).isoformat()
+    updated = 0
+    # Master list lines are matched by category section and position, not
+    # text: the same question can be asked in two categories
+    master_list_changes = {}
+    for filename, suggestions in by_file.items():
+        path = corpus.resolve(filename)
+        data = corpus.load(path)
+        for index, question in enumerate(data['questions']):
+            if question['id'] not in suggestions:
+                continue
+            difficulty = suggestions[question['id']]
+            master_list_changes[(data.get('category_en', ''), index)] = (question['question_en'], difficulty)
+            updated += 1
+            # The loaded data is shared with later steps of a chain; a dry
+            # run must leave it as it is on disk
+            if not dry_run:
+                question['difficulty'] = difficulty
+                question['last_modified_at'] = now
+        if not dry_run:
+            corpus.save(path, data)
+            print(f"  ✅ Updated {len(suggestions)} questions in {filename}")
+
+    MasterListUpdater().update_difficulties(master_list_changes, dry_run=dry_run)
+    return updated
+
+
+def print_report(results: List[Calibration], show_all: bool):
+    """Print flagged (or all) calibrations"""
+    rows = results if show_all else [r for r in results if r.flagged]
+    print(f"\n{'ID':14} {'Assigned':9} {'Suggest':8} {'Answers':>8} {'Raw':>7} {'Smoothed':>9}  95% interval")
+    print('-' * 80)
+    for r in rows:
+        marker = '⚠️ ' if r.flagged else '   '
+        print(f"{marker}{r.question_id:11} {r.assigned:9} {r.suggested:8} {r.answers:8,} "
+              f"{r.raw_accuracy * 100:6.1f}% {r.smoothed * 100:8.1f}%  "
+              f"[{r.low * 100:.1f}%, {r.high * 100:.1f}%]")
+    if not rows:
+        print("  (nothing to report)")
+
+
+def run(logs_dir: Path, corpus: Optional[Corpus] = None, apply: bool = False, dry_run: bool = False,
+        show_all: bool = False, json_path: Optional[Path] = None, min_answers: int = MIN_ANSWERS,
+        prior_strength: float = PRIOR_STRENGTH, easy_above: float = EASY_ABOVE,
+        hard_below: float = HARD_BELOW) -> int:
+    """Calibrate, report and optionally apply; returns an exit code"""
+    corpus = corpus or Corpus()
+    log_path = logs_dir / ANSWERS_LOG
+
+    print(f"\n🎯 Calibrating difficulty from {log_path}")
+    print("=" * 80)
+
+    tallies, malformed = tally_answers(log_path)
+    if malformed:
+        print(f"⚠️  {malformed} malformed log lines skipped")
+    results = calibrate(tallies, corpus, prior_strength=prior_strength, min_answers=min_answers,
+                        easy_above=easy_above, hard_below=hard_below)
+    flagged = [r for r in results if r.flagged]
+
+    print(f"Answered questions: {len(results)} (of {sum(t[0] for t in tallies.values()):,} answers)")
+    print(f"Bands: easy ≥ {easy_above:.0%} > medium ≥ {hard_below:.0%} > hard; "
+          f"prior {prior_strength:g} answers, flag after {min_answers}")
+    print(f"Miscalibrated: {len(flagged)}")
+
+    print_report(results, show_all)
+
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump([r.to_dict() for r in results], f, indent=2, ensure_ascii=False)
+        print(f"\nResults saved to {json_path}")
+
+    if apply and flagged:
+        print(f"\n✏️  {'DRY RUN - ' if dry_run else ''}Applying {len(flagged)} suggested difficulties")
+        apply_calibrations(flagged, corpus, dry_run=dry_run)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Calibrate question difficulty from answer logs')
+    parser.add_argument('--logs-dir', type=Path, default=LOGS_DIR, help='Directory with the JSONL logs')
+    parser.add_argument('--apply', action='store_true', help='Write suggested difficulties back')
+    parser.add_argument('--dry-run', action='store_true', help='With --apply: show changes without writing')
+    parser.add_argument('--all', dest='show_all', action='store_true', help='Report every answered question')
+    parser.add_argument('--json', type=Path, help='Write all calibrations to this JSON file')
+    parser.add_argument('--min-answers', type=int, default=MIN_ANSWERS,
+                        help=f'Answers needed before flagging (default: {MIN_ANSWERS})')
+    parser.add_argument('--prior-strength', type=float, default=PRIOR_STRENGTH,
+                        help=f'Prior weight in pseudo-answers (default: {PRIOR_STRENGTH})')
+    parser.add_argument('--easy-above', type=float, default=EASY_ABOVE,
+                        help=f'Accuracy at or above which a question is easy (default: {EASY_ABOVE})')
+    parser.add_argument('--hard-below', type=float, default=HARD_BELOW,
+                        help=f'Accuracy below which a question is hard (default: {HARD_BELOW})')
+    args = parser.parse_args()
+
+    return run(args.logs_dir, apply=args.apply, dry_run=args.dry_run, show_all=args.show_all,
+               json_path=args.json, min_answers=args.min_answers, prior_strength=args.prior_strength,
+               easy_above=args.easy_above, hard_below=args.hard_below)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Check that Chinese fields still match the English, and queue the drifted ones
+
+Compares question/choices/explanations EN vs ZH for every question with
+cheap offline signals (numbers, units, acronyms, Correct/Wrong prefixes,
+choice order, length ratios) and writes a prioritized retranslation queue.
+Feed the queue to retranslate_questions.py to retranslate only what drifted.
+
+Usage:
+    python3 scripts/check_translations.py                    # Report + write queue
+    python3 scripts/check_translations.py --file physics.json
+    python3 scripts/check_translations.py --min-score 40     # Only strong signals
+    python3 scripts/retranslate_questions.py --queue         # Retranslate the queue
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add script directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.consistency import LENGTH_Z, MIN_SCORE, QUEUE_PATH, check_corpus, write_queue
+from utils.corpus import Corpus
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--file', help='Only report questions from this file (e.g., physics.json)')
+    parser.add_argument('--min-score', type=int, default=MIN_SCORE,
+                        help=f'Queue questions scoring at least this (default: {MIN_SCORE})')
+    parser.add_argument('--length-z', type=float, default=LENGTH_Z,
+                        help=f'Robust z-score for length-ratio outliers (default: {LENGTH_Z})')
+    parser.add_argument('--queue', type=Path, default=QUEUE_PATH,
+                        help='Where to write the retranslation queue')
+    parser.add_argument('--no-queue', action='store_true', help='Report only, do not write the queue')
+    parser.add_argument('--strict', action='store_true', help='Exit 1 if anything is queued')
+
+
+def run(args, corpus: Corpus = None) -> int:
+    """Check the bank, print the queue and write it; returns an exit code"""
+    print("\n🈯 EN/ZH translation consistency")
+    print("=" * 60)
+
+    # Length norms come from the whole bank even when reporting one file
+    reports = check_corpus(corpus, length_z=args.length_z)
+    total = len(reports)
+    if args.file:
+        reports = [r for r in reports if r.file == args.file]
+    queued = [r for r in reports if r.score >= args.min_score]
+
+    for report in queued:
+        print(f"\n{report.score:4}  {report.question_id} ({report.file}): {report.question_en}")
+        for kind, detail in report.findings:
+            print(f"        {kind:12} {detail}")
+
+    print(f"\nChecked {len(reports)} of {total} questions; "
+          f"{len(queued)} queued for retranslation (score ≥ {args.min_score})")
+
+    if not args.no_queue:
+        write_queue(queued, args.queue, min_score=args.min_score)
+        print(f"📝 Queue written to {args.queue}")
+        if queued:
+            print(f"   Retranslate with: python3 scripts/retranslate_questions.py --queue {args.queue}")
+    return 1 if queued and args.strict else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check EN/ZH consistency and build a retranslation queue')
+    add_arguments(parser)
+    return run(parser.parse_args())
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -35,7 +35,7 @@ cat > "$HOOK_FILE" << 'EOF'
 #
 
 echo ""
-echo "🔍 Running automatic validation on changed question files..."
+echo "🔍 Running automatic validation on staged question changes..."
 echo ""
 
 QUESTIONS_DIR="src/data/questions"
@@ -47,7 +47,7 @@ if [ ! -d "$QUESTIONS_DIR" ]; then
 fi
 
 # Get list of changed JSON files in questions directory
-CHANGED_FILES=$(git diff --cached --name-only --diff-filter=ACM | grep "^$QUESTIONS_DIR/.*\.json$")
+CHANGED_FILES=$(git diff --cached --name-only --diff-filter=AM | grep "^$QUESTIONS_DIR/.*\.json$")
 
 if [ -z "$CHANGED_FILES" ]; then
     echo "✓ No question files changed, skipping validation"
@@ -58,28 +58,12 @@ echo "Changed question files:"
 echo "$CHANGED_FILES" | sed 's/^/  - /'
 echo ""
 
-# Run validation on each changed file
+# One process validates the staged content of every changed file, and only
+# the questions added or modified since HEAD
 VALIDATION_FAILED=0
-
-for file in $CHANGED_FILES; do
-    # Extract just the filename
-    filename=$(basename "$file")
-
-    echo "Validating: $filename"
-
-    # Run auto_validate.py from scripts directory
-    if python3 "$VALIDATION_SCRIPTS/auto_validate.py" "$QUESTIONS_DIR/$filename" > /dev/null 2>&1; then
-        echo "  ✅ PASSED"
-    else
-        echo "  ❌ FAILED - Critical issues found!"
-        VALIDATION_FAILED=1
-
-        # Show detailed errors
-        echo ""
-        echo "  Running detailed validation:"
-        python3 "$VALIDATION_SCRIPTS/auto_validate.py" "$QUESTIONS_DIR/$filename"
-    fi
-done
+if ! python3 "$VALIDATION_SCRIPTS/auto_validate.py" --staged; then
+    VALIDATION_FAILED=1
+fi
 
 echo ""
 
@@ -111,7 +95,7 @@ echo ""
 echo "✅ Git pre-commit hook installed successfully!"
 echo ""
 echo "📋 What this means:"
-echo "   • Every time you commit, changed .json files will be validated"
+echo "   • Every time you commit, staged question changes will be validated"
 echo "   • Commits will be BLOCKED if critical issues are found"
 echo "   • You'll be prompted to fix issues before committing"
 echo ""
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Columnar answer-event store: refresh from the quiz logs and query it
+
+Appends new lines of data/logs/quiz_answers.jsonl to the columnar store in
+data/cache/events/ and runs vectorized group-bys over it (NumPy when
+installed). Use this for ad-hoc per-question accuracy and session
+analysis over the full answer history.
+
+Usage:
+    python3 scripts/log_events.py                         # Refresh + per-category accuracy
+    python3 scripts/log_events.py --by question --top 20  # Hardest questions first
+    python3 scripts/log_events.py --by language --days 7
+    python3 scripts/log_events.py --sessions
+    python3 scripts/log_events.py --rebuild               # Re-read the whole log
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add script directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.event_store import ENCODED, EVENTS_DIR, EventStore
+from utils.log_analytics import LOGS_DIR
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--logs-dir', type=Path, default=LOGS_DIR, help='Directory with the JSONL logs')
+    parser.add_argument('--store', type=Path, default=EVENTS_DIR, help='Event store directory')
+    parser.add_argument('--rebuild', action='store_true', help='Drop the store and re-read the whole log')
+    parser.add_argument('--no-refresh', action='store_true', help='Query without reading new log lines')
+    parser.add_argument('--by', choices=[name for name in ENCODED if name != 'session'], default='category',
+                        help='Group accuracy by this column (default: category)')
+    parser.add_argument('--days', type=float, help='Only answers from the last N days')
+    parser.add_argument('--top', type=int, help='Only show the N lowest-accuracy groups')
+    parser.add_argument('--sessions', action='store_true', help='Show the session summary instead')
+
+
+def run(args) -> int:
+    """Refresh the store and print the requested aggregation"""
+    store = EventStore(args.store, args.logs_dir)
+
+    if args.rebuild or not args.no_refresh:
+        start = time.perf_counter()
+        result = store.refresh(rebuild=args.rebuild)
+        for note in result['notes']:
+            print(f"  🔄 {note}")
+        print(f"📥 +{result['added']:,} events ({len(store):,} total) "
+              f"in {time.perf_counter() - start:.2f}s")
+
+    since = int((time.time() - args.days * 86400) * 1000) if args.days else None
+    start = time.perf_counter()
+
+    if args.sessions:
+        summary = store.session_counts(since=since)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n👥 Sessions: {summary['sessions']:,}  Answers: {summary['answers']:,}  "
+              f"Mean: {summary['mean']}  Max: {summary['max']:,}")
+    else:
+        groups = store.group_accuracy(args.by, since=since)
+        elapsed = (time.perf_counter() - start) * 1000
+        rows = sorted(groups.items(), key=lambda item: (item[1][1] / item[1][0], item[0]))
+        if args.top:
+            rows = rows[:args.top]
+
+        print(f"\n📊 Accuracy by {args.by}" + (f" (last {args.days:g} days)" if args.days else ''))
+        print("=" * 60)
+        for value, (total, correct) in rows:
+            print(f"  {value[:36]:36} {total:>10,}  {correct / total * 100:5.1f}%")
+        if not rows:
+            print("  (no events)")
+
+    print(f"\n  Query time: {elapsed:.1f}ms")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Columnar answer-event store and queries')
+    add_arguments(parser)
+    return run(parser.parse_args())
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Roll quiz logs up into hourly/daily aggregates and compact the raw logs
+
+Ingests new lines from data/logs/quiz_answers.jsonl and quiz_shares.jsonl
+into data/logs/rollups.sqlite3, then optionally answers a range query from
+the rollups. With --compact the raw logs are rotated, drained (by the
+rollups, the dashboard stats checkpoint and the answer-event store of
+log_events.py) and archived as gzip
+segments under data/logs/archive/, and old hourly rows are pruned.
+
+Usage:
+    python3 scripts/log_rollups.py                          # Ingest new events
+    python3 scripts/log_rollups.py --compact                # Ingest + archive raw logs
+    python3 scripts/log_rollups.py --questions 'chem_*' --days 7
+    python3 scripts/log_rollups.py --days 30 --by category
+    python3 scripts/log_rollups.py --shares --days 7 --by method
+    python3 scripts/log_rollups.py --unique-sessions --days 7 --by day
+    python3 scripts/log_rollups.py --top-sessions 10 --days 30
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+# Add script directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.event_store import EVENTS_DIR, EventStore
+from utils.log_analytics import (CHECKPOINT, LOGS_DIR, STATS_SNAPSHOT, load_checkpoint,
+                                 update_stats, write_stats_snapshot)
+from utils.rollups import (DIMENSIONS, HOURLY_RETENTION_DAYS, RollupStore, archive_segments,
+                           days_ago, rotate_logs)
+
+
+def catch_up(store: RollupStore, logs_dir: Path, events: Optional[EventStore] = None):
+    """Bring the rollups, the dashboard stats and the event store (if given) up to date with the logs"""
+    report = store.ingest()
+    for note in report['notes']:
+        print(f"  🔄 {note}")
+    print(f"  Rollups:   +{report['answers']['events']:,} answers, +{report['shares']['events']:,} shares")
+    skipped = report['answers']['skipped'] + report['shares']['skipped']
+    if skipped:
+        print(f"  ⚠️  {skipped} events without a usable timestamp skipped")
+
+    stats, sources, _ = update_stats(logs_dir)
+    write_stats_snapshot(stats, sources, logs_dir / STATS_SNAPSHOT)
+    print(f"  Dashboard: {stats['total']:,} answers, {stats['shares']['total']:,} shares")
+
+    if events is not None:
+        report = events.refresh()
+        for note in report['notes']:
+            print(f"  🔄 {note}")
+        print(f"  Events:    +{report['added']:,} answers")
+
+
+def compact(store: RollupStore, logs_dir: Path, events_dir: Optional[Path] = None):
+    """Rotate the raw logs, drain them into every consumer and archive them"""
+    # The event store is only drained if it reads these logs; one built from
+    # another logs directory must not be fed this one
+    events = EventStore(events_dir, logs_dir)
+    if not events.follows():
+        events = None
+
+    # Consumers must already follow the live logs, or they would skip the
+    # rotated segments entirely
+    catch_up(store, logs_dir, events)
+
+    segments = rotate_logs(logs_dir)
+    if segments:
+        catch_up(store, logs_dir, events)
+
+    in_use = set()
+    checkpoint = load_checkpoint(logs_dir / CHECKPOINT) or {'cursors': {}}
+    cursors = [*store.cursors().values(), *checkpoint['cursors'].values()]
+    if events is not None and events.meta['cursor']:
+        cursors.append(events.meta['cursor'])
+    for cursor in cursors:
+        in_use.add((cursor['inode'], cursor['dev']))
+
+    for path in archive_segments(logs_dir, in_use):
+        print(f"  📦 Archived {path.relative_to(logs_dir)}")
+    pruned = store.prune_hourly()
+    if pruned:
+        print(f"  🧹 Pruned {pruned:,} hourly rows older than {HOURLY_RETENTION_DAYS} days")
+
+
+def print_session_report(store: RollupStore, args, since):
+    """Unique or most active sessions from the daily sketches"""
+    start = time.perf_counter()
+    scope = f"since {since:%Y-%m-%d} UTC" if since else 'all time'
+
+    if args.top_sessions:
+        rows = store.top_sessions(since=since, until=args.until, n=args.top_sessions)
+        print(f"\n👥 Most active sessions, {scope} (estimated)")
+        print("=" * 60)
+        for row in rows:
+            print(f"  {row['sessionId'][:40]:40} {row['answers']:>10,}")
+    else:
+        for name in ('shares', 'difficulty', 'language', 'method'):
+            if getattr(args, name):
+                raise ValueError(f"--{name} is not available with --unique-sessions")
+        rows = store.unique_sessions(since=since, until=args.until, questions=args.questions,
+                                     category=args.category, by=args.by)
+        print(f"\n👥 Unique sessions for {args.questions or args.category or 'all questions'}, "
+              f"{scope} (estimated)")
+        print("=" * 60)
+        for row in rows:
+            print(f"  {str(row['key'])[:40]:40} {row['sessions']:>10,}")
+
+    if not rows:
+        print("  (no sessions)")
+    print(f"\n  Query time: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+def print_report(store: RollupStore, args):
+    """Answer a range query from the rollups"""
+    kind = 'shares' if args.shares else 'answers'
+    since = days_ago(args.days) if args.days else args.since
+    if args.unique_sessions or args.top_sessions:
+        print_session_report(store, args, since)
+        return
+
+    start = time.perf_counter()
+    rows = store.query(kind, since=since, until=args.until, questions=args.questions, by=args.by,
+                       category=args.category, difficulty=args.difficulty,
+                       language=args.language, method=args.method)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    scope = f"since {since:%Y-%m-%d %H:%M} UTC" if since else 'all time'
+    print(f"\n📈 {kind.title()} for {args.questions or 'all questions'}, {scope}")
+    print("=" * 60)
+    if not rows:
+        print("  (no events)")
+    for row in rows:
+        line = f"  {str(row['key'])[:32]:32} {row['total']:>10,}"
+        if kind == 'answers':
+            line += f"  {row['accuracy']:5.1f}% correct"
+        print(line)
+    print(f"\n  Query time: {elapsed:.1f}ms")
+
+
+def parse_date(value: str) -> datetime:
+    """Parse YYYY-MM-DD[THH[:MM]] as UTC"""
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--logs-dir', type=Path, default=LOGS_DIR, help='Directory with the JSONL logs')
+    parser.add_argument('--db', type=Path, help='Rollup database (default: <logs-dir>/rollups.sqlite3)')
+    parser.add_argument('--compact', action='store_true',
+                        help='Archive ingested raw logs as gzip segments and prune old hourly rows')
+    parser.add_argument('--no-ingest', action='store_true', help='Query without reading new log lines')
+    parser.add_argument('--events-store', type=Path, default=EVENTS_DIR,
+                        help='Event store that --compact drains too, if it reads these logs')
+
+    query = parser.add_argument_group('range query')
+    query.add_argument('--shares', action='store_true', help='Query share events instead of answers')
+    query.add_argument('--questions', help="Question ID glob, e.g. 'chem_*'")
+    query.add_argument('--days', type=float, help='Only the last N days')
+    query.add_argument('--since', type=parse_date, help='Range start (UTC date)')
+    query.add_argument('--until', type=parse_date, help='Range end, exclusive (UTC date)')
+    query.add_argument('--by', choices=[*DIMENSIONS, 'day', 'hour'], help='Group results')
+    query.add_argument('--category', help='Filter by category name')
+    query.add_argument('--difficulty', choices=['easy', 'medium', 'hard'])
+    query.add_argument('--language', help='Filter by language (en/zh)')
+    query.add_argument('--method', help='Filter shares by method')
+    query.add_argument('--unique-sessions', action='store_true',
+                       help='Estimate distinct sessions (whole days; --by day/question/category)')
+    query.add_argument('--top-sessions', type=int, metavar='N', help='Estimate the N most active sessions')
+
+
+def run(args) -> int:
+    """Ingest/compact/query as requested; returns an exit code"""
+    is_query = any(getattr(args, name) for name in
+                   ('shares', 'questions', 'days', 'since', 'until', 'by', 'category',
+                    'difficulty', 'language', 'method', 'unique_sessions', 'top_sessions'))
+    try:
+        with RollupStore(args.db, args.logs_dir) as store:
+            if args.compact:
+                print(f"\n🗜️  Compacting logs in {args.logs_dir}")
+                print("=" * 60)
+                compact(store, args.logs_dir, args.events_store)
+            elif not args.no_ingest:
+                print(f"\n📥 Ingesting logs from {args.logs_dir}")
+                print("=" * 60)
+                catch_up(store, args.logs_dir)
+
+            if is_query:
+                print_report(store, args)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Roll up quiz logs and query time ranges')
+    add_arguments(parser)
+    return run(parser.parse_args())
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Precompute admin dashboard statistics from the quiz logs
+
+Streams data/logs/quiz_answers.jsonl and quiz_shares.jsonl and writes
+data/logs/stats_snapshot.json, which /api/admin/stats serves while it is
+up to date with the logs, or up to 5 minutes behind lines appended since
+(MAX_SNAPSHOT_AGE_MS in the route). Run it from cron at least that often
+(and after deploys) to keep the dashboard cheap regardless of log size.
+
+Runs are incremental: a checkpoint (data/logs/.stats_checkpoint.json)
+remembers how far each log was read, so only new lines are parsed. Log
+rotation and truncation are detected and handled; --full rebuilds from
+scratch (e.g. after editing a log by hand), reading the segments that
+`rollup --compact` archived before the live logs. --sketch-sessions switches
+session tracking to constant-memory sketches (estimated unique sessions
+and topUsers); the choice is remembered in the checkpoint.
+
+Usage:
+    python3 scripts/log_stats.py
+    python3 scripts/log_stats.py --logs-dir /srv/millionwhys/data/logs
+    python3 scripts/log_stats.py --print      # Also print the stats JSON
+    python3 scripts/log_stats.py --full       # Ignore the checkpoint
+    python3 scripts/log_stats.py --sketch-sessions
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+# Add script directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.log_analytics import LOGS_DIR, STATS_SNAPSHOT, update_stats, write_stats_snapshot
+
+
+def run(logs_dir: Path, output: Path, show: bool = False, full: bool = False,
+        sketch_sessions: Optional[bool] = None) -> int:
+    """Compute and write the stats snapshot; returns an exit code"""
+    print(f"\n📊 Computing stats from {logs_dir}{' (full rebuild)' if full else ''}")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    stats, sources, notes = update_stats(logs_dir, full=full, sketch_sessions=sketch_sessions)
+    elapsed = time.perf_counter() - start
+
+    for note in notes:
+        print(f"  🔄 {note}")
+
+    for info in sources.values():
+        print(f"  {info['file']:22} {info['size']:>12,} bytes")
+        if info['malformed']:
+            print(f"  ⚠️  {info['malformed']} malformed lines skipped")
+
+    print(f"\n  Answers:  {stats['total']:,} ({stats['sessions']:,} sessions, {stats['accuracy']}% correct)")
+    print(f"  Shares:   {stats['shares']['total']:,}")
+    print(f"  Time:     {elapsed:.2f}s")
+
+    path = write_stats_snapshot(stats, sources, output)
+    print(f"\n✅ Wrote {path}")
+
+    if show:
+        print(json.dumps(stats, indent=2, ensure_ascii=False))
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute admin dashboard stats from quiz logs')
+    parser.add_argument('--logs-dir', type=Path, default=LOGS_DIR, help='Directory with the JSONL logs')
+    parser.add_argument('--output', type=Path, help=f'Snapshot path (default: <logs-dir>/{STATS_SNAPSHOT})')
+    parser.add_argument('--print', dest='show', action='store_true', help='Print the computed stats')
+    parser.add_argument('--full', action='store_true', help='Ignore the checkpoint and re-read the logs, archives included')
+    sessions = parser.add_mutually_exclusive_group()
+    sessions.add_argument('--sketch-sessions', dest='sketch_sessions', action='store_true', default=None,
+                          help='Estimate sessions with HyperLogLog/Count-Min sketches (constant memory)')
+    sessions.add_argument('--exact-sessions', dest='sketch_sessions', action='store_false',
+                          help='Track every session exactly (default for a new checkpoint)')
+    args = parser.parse_args()
+
+    return run(args.logs_dir, args.output or args.logs_dir / STATS_SNAPSHOT, args.show, args.full,
+               args.sketch_sessions)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
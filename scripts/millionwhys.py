@@ -0,0 +1,597 @@
+#!/usr/bin/env python3
+"""
+millionwhys - Unified CLI for the question content pipeline
+
+One entry point for add_questions.py, auto_validate.py, web_fact_check.py,
+retranslate_questions.py and the utils CLIs. Subcommands run in a single
+process and share the loaded corpus, snapshot cache and config, so steps
+can be chained with --then without re-reading the bank.
+
+Usage:
+    # Add a draft, validate, then record it in the master list
+    python scripts/millionwhys.py add --draft questions/drafts/new.yaml --then validate --then master-list
+    python scripts/millionwhys.py add --drafts questions/drafts/batch/ --then master-list
+
+    python scripts/millionwhys.py validate [--file chemistry.json]
+    python scripts/millionwhys.py verify --file astronomy.json --summary
+    python scripts/millionwhys.py translate --file animals.json --all
+    python scripts/millionwhys.py ids [Physics] [--count 3]
+    python scripts/millionwhys.py master-list [--dry-run]
+    python scripts/millionwhys.py stats
+    python scripts/millionwhys.py analytics
+    python scripts/millionwhys.py rollup --questions 'chem_*' --days 7
+    python scripts/millionwhys.py events --by question --top 20
+    python scripts/millionwhys.py calibrate [--apply]
+    python scripts/millionwhys.py search ice floats [--file physics.json]
+    python scripts/millionwhys.py related [phys_001] [--rebuild] [--json related.json]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add script directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.corpus import PROJECT_ROOT, Corpus
+
+CHAIN_SEPARATOR = '--then'
+
+# Subcommands whose options are declared by their script; it is only
+# imported when one of these steps is actually in the chain
+SCRIPT_ARGUMENTS = {
+    'consistency': 'check_translations',
+    'rollup': 'log_rollups',
+    'events': 'log_events',
+}
+
+
+class PipelineContext:
+    """State shared by every step of one millionwhys invocation"""
+
+    def __init__(self, questions_dir: Optional[Path] = None):
+        self.corpus = Corpus(questions_dir)
+        self.remaining_steps: List[str] = []
+        # Set by a --dry-run step; every later step runs as a dry run too
+        self.dry_run = False
+        # (category, questions) added earlier in the chain, for master-list
+        self.pending_master_list: List[Tuple[str, List[Dict]]] = []
+        self._config: Optional[Dict] = None
+
+    @property
+    def config(self) -> Dict:
+        """Contents of .automation_config.json (empty if absent)"""
+        if self._config is None:
+            config_path = PROJECT_ROOT / '.automation_config.json'
+            try:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    self._config = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._config = {}
+        return self._config
+
+    def resolve_files(self, name: Optional[str]) -> List[Path]:
+        """One file if name is given, otherwise every category file"""
+        if not name:
+            return self.corpus.files()
+        path = self.corpus.resolve(name)
+        if path is None:
+            raise FileNotFoundError(f"File not found: {name}")
+        return [path]
+
+
+# ---------------------------------------------------------------------------
+# Subcommands
+# ---------------------------------------------------------------------------
+
+def cmd_add(args, ctx: PipelineContext) -> int:
+    """Add questions from one YAML draft or a batch of them"""
+    from add_questions import add_questions_from_draft, add_questions_from_drafts
+
+    # A later step in the chain updates the master list once, in this process.
+    # Validation is not deferred: the new questions are checked in memory
+    # before anything is written.
+    defer_master_list = 'master-list' in ctx.remaining_steps
+
+    options = dict(
+        dry_run=args.dry_run,
+        use_ai=not args.no_ai,
+        skip_validation=args.skip_validation,
+        update_master_list=not defer_master_list,
+        corpus=ctx.corpus,
+        allow_duplicates=args.allow_duplicates,
+    )
+    if args.drafts:
+        additions = add_questions_from_drafts(args.drafts, workers=args.workers, **options)
+    else:
+        additions = [add_questions_from_draft(args.draft, **options)]
+
+    if defer_master_list and not args.dry_run:
+        ctx.pending_master_list.extend(additions)
+    return 0
+
+
+def cmd_validate(args, ctx: PipelineContext) -> int:
+    """Run structure + automated validation"""
+    from auto_validate import AutoValidator
+
+    validator = AutoValidator(strict_mode=not args.no_strict)
+    all_results = []
+
+    for filepath in ctx.resolve_files(args.file):
+        try:
+            data = ctx.corpus.load(filepath)
+        except json.JSONDecodeError:
+            data = None  # Let Layer 1 report the JSON error
+        _, results = validator.validate_file(str(filepath), run_ai_check=args.ai_check, data=data)
+        all_results.append(results)
+
+    validator.print_summary(all_results)
+    return 1 if any(not r['overall_passed'] for r in all_results) else 0
+
+
+def cmd_verify(args, ctx: PipelineContext) -> int:
+    """Web-based fact verification against Wikipedia"""
+    from web_fact_check import print_verification_summary, verify_files
+
+    # Terms of all files are looked up together, in batched requests
+    files = ctx.resolve_files(args.file)
+    all_results = verify_files([str(filepath) for filepath in files], verbose=not args.summary,
+                               datas=[ctx.corpus.load(filepath) for filepath in files])
+
+    print_verification_summary(all_results, output=args.output)
+    return 0
+
+
+def cmd_translate(args, ctx: PipelineContext) -> int:
+    """Retranslate questions to Chinese with DeepSeek"""
+    from retranslate_questions import DEPRECATED_SELECTION, retranslate_file
+
+    if args.queue:
+        from utils.consistency import load_queue
+
+        queue = load_queue(Path(args.queue))
+        for filepath in ctx.resolve_files(args.file):
+            if filepath.name in queue:
+                retranslate_file(str(filepath), corpus=ctx.corpus, ids=queue[filepath.name],
+                                 dry_run=args.dry_run)
+        return 0
+
+    if not args.stale:
+        print(DEPRECATED_SELECTION)
+    timestamp_filter = None if args.all else args.timestamp
+    for filepath in ctx.resolve_files(args.file):
+        retranslate_file(str(filepath), timestamp_filter, corpus=ctx.corpus, stale_only=args.stale,
+                         dry_run=args.dry_run, include_unhashed=args.include_unhashed)
+    return 0
+
+
+def cmd_consistency(args, ctx: PipelineContext) -> int:
+    """Score EN/ZH drift and write a prioritized retranslation queue"""
+    from check_translations import run
+
+    return run(args, ctx.corpus)
+
+
+def cmd_ids(args, ctx: PipelineContext) -> int:
+    """Show next available IDs"""
+    from utils.id_manager import IDManager
+
+    manager = IDManager(ctx.corpus.questions_dir)
+
+    if not args.category:
+        print("All Categories:")
+        for cat in manager.get_all_categories():
+            info = manager.get_category_info(cat)
+            print(f"  {cat:20} → {info['next_id']:12} ({info['question_count']} questions)")
+        return 0
+
+    try:
+        info = manager.get_category_info(args.category)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    print(f"Category: {info['category']}")
+    print(f"Prefix: {info['prefix']}")
+    print(f"File: {info['filename']}")
+    print(f"Questions: {info['question_count']}")
+    print(f"Next ID: {info['next_id']}")
+
+    if args.count:
+        print(f"\nNext {args.count} IDs:")
+        for i, qid in enumerate(manager.get_next_n_ids(args.category, args.count), 1):
+            print(f"  {i}. {qid}")
+    return 0
+
+
+def cmd_master_list(args, ctx: PipelineContext) -> int:
+    """Record questions added earlier in the chain and update totals"""
+    from utils.master_list import MasterListUpdater
+
+    print("\n📋 Updating master list...")
+    try:
+        updater = MasterListUpdater()
+        if ctx.pending_master_list and not args.dry_run:
+            # Every category added earlier in the chain, in one write
+            from utils.transaction import FileTransaction
+
+            txn = FileTransaction()
+            txn.stage(updater.master_list_path, updater.render_additions(ctx.pending_master_list))
+            txn.commit()
+            added = sum(len(questions) for _, questions in ctx.pending_master_list)
+            print(f"✅ Added {added} questions to master list")
+        else:
+            for category, questions in ctx.pending_master_list:
+                updater.add_questions(category, questions, dry_run=args.dry_run)
+            updater.update_totals(dry_run=args.dry_run)
+        ctx.pending_master_list = []
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return 1
+    return 0
+
+
+def cmd_stats(args, ctx: PipelineContext) -> int:
+    """Question counts per category and difficulty"""
+    totals: Dict[str, int] = {}
+    total_questions = 0
+
+    print(f"{'File':26} {'Category':24} {'Total':>6} {'Easy':>6} {'Medium':>7} {'Hard':>6}")
+    print('-' * 80)
+
+    for filepath in ctx.resolve_files(args.file):
+        category = ctx.corpus.open(filepath)
+        counts = category.difficulty_counts()
+        for difficulty, count in counts.items():
+            totals[difficulty] = totals.get(difficulty, 0) + count
+        total_questions += len(category)
+        print(f"{filepath.name:26} {category.category_en[:24]:24} {len(category):6} "
+              f"{counts.get('easy', 0):6} {counts.get('medium', 0):7} {counts.get('hard', 0):6}")
+
+    print('-' * 80)
+    print(f"{'Total':51} {total_questions:6} {totals.get('easy', 0):6} "
+          f"{totals.get('medium', 0):7} {totals.get('hard', 0):6}")
+    if totals.get('unknown'):
+        print(f"\n⚠️  {totals['unknown']} questions have no recognised difficulty")
+    return 0
+
+
+def cmd_analytics(args, ctx: PipelineContext) -> int:
+    """Precompute dashboard stats from the quiz logs"""
+    from log_stats import run
+    from utils.log_analytics import LOGS_DIR, STATS_SNAPSHOT
+
+    logs_dir = args.logs_dir or LOGS_DIR
+    return run(logs_dir, args.output or logs_dir / STATS_SNAPSHOT, args.show, args.full, args.sketch_sessions)
+
+
+def cmd_rollup(args, ctx: PipelineContext) -> int:
+    """Roll quiz logs up into hourly/daily aggregates, compact, query"""
+    from log_rollups import run
+
+    return run(args)
+
+
+def cmd_events(args, ctx: PipelineContext) -> int:
+    """Refresh the columnar answer-event store and run a group-by"""
+    from log_events import run
+
+    return run(args)
+
+
+def cmd_calibrate(args, ctx: PipelineContext) -> int:
+    """Compare assigned difficulty with answer accuracy; optionally apply"""
+    from calibrate_difficulty import run
+    from utils.log_analytics import LOGS_DIR
+
+    return run(args.logs_dir or LOGS_DIR, ctx.corpus, apply=args.apply, dry_run=args.dry_run,
+               show_all=args.show_all, json_path=args.json, min_answers=args.min_answers)
+
+
+def cmd_dedup(args, ctx: PipelineContext) -> int:
+    """List near-duplicate questions across all categories"""
+    from utils.dedup import DedupIndex
+
+    with DedupIndex(ctx.corpus) as index:
+        reindexed = index.refresh()
+        print(f"\n🔎 Near-duplicate scan ({len(index)} questions, {reindexed} re-indexed)")
+        print("=" * 60)
+        if args.question:
+            matches = index.find({'question_en': args.question}, threshold=args.threshold)
+            for match in matches:
+                print(f"  ~{match.score:.0%} {match.id} ({match.file}): {match.question_en}")
+            if not matches:
+                print("  No similar questions")
+            return 0
+
+        pairs = index.duplicate_pairs(threshold=args.threshold)
+        for a, b in pairs:
+            print(f"\n  ~{b.score:.0%} {a.id} ↔ {b.id}")
+            print(f"     {a.question_en}")
+            print(f"     {b.question_en}")
+        print(f"\n{len(pairs)} near-duplicate pair(s)")
+    return 1 if pairs and args.strict else 0
+
+
+def cmd_search(args, ctx: PipelineContext) -> int:
+    """Ranked full-text search over every question, English and Chinese"""
+    import time
+    from utils.search import SearchIndex
+
+    file = ctx.resolve_files(args.file)[0].name if args.file else None
+    query = ' '.join(args.query)
+    with SearchIndex(ctx.corpus) as index:
+        reindexed = index.refresh()
+        start = time.perf_counter()
+        hits = index.search(query, limit=args.limit, file=file, any_term=args.any)
+        elapsed = time.perf_counter() - start
+        print(f"\n🔍 \"{query}\": {len(hits)} result(s) in {elapsed * 1000:.1f} ms "
+              f"({len(index)} questions, {reindexed} re-indexed)")
+    print("=" * 60)
+    for rank, hit in enumerate(hits, 1):
+        print(f"  {rank:2d}. {hit.id} [{hit.category}, {hit.difficulty}] {hit.score:.2f}")
+        print(f"      {hit.question_en}")
+        print(f"      {hit.question_zh}")
+    if not hits:
+        print("  No matching questions" + ("" if args.any else " (try --any)"))
+    return 0
+
+
+def cmd_related(args, ctx: PipelineContext) -> int:
+    """Related questions of one question, or the related-question table's coverage"""
+    import time
+    from collections import Counter
+    from utils.related import RelatedIndex
+
+    with RelatedIndex(ctx.corpus) as index:
+        start = time.perf_counter()
+        recomputed = index.refresh(full=args.rebuild)
+        elapsed = time.perf_counter() - start
+        questions = index.questions()
+        table = index.table()
+    print(f"\n🔗 Related questions: {len(table)} questions, {recomputed} recomputed in {elapsed:.2f}s")
+    print("=" * 60)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({qid: [[other, round(score, 4)] for other, score in neighbors]
+                       for qid, neighbors in table.items()}, f, ensure_ascii=False)
+        print(f"  Wrote {args.json}")
+
+    if args.question:
+        if args.question not in table:
+            print(f"❌ Unknown question ID: {args.question}")
+            return 1
+        file, question_en = questions[args.question]
+        print(f"  {args.question} [{file}] {question_en}")
+        for other, score in table[args.question][:args.limit]:
+            print(f"    {score:.2f}  {other} [{questions[other][0]}] {questions[other][1]}")
+        if not table[args.question]:
+            print("    No related questions")
+        return 0
+
+    isolated = Counter(questions[qid][0] for qid, neighbors in table.items() if not neighbors)
+    links = Counter(tuple(sorted((questions[qid][0], questions[other][0])))
+                    for qid, neighbors in table.items() for other, _ in neighbors)
+    cross = sum(count for (a, b), count in links.items() if a != b)
+    total = sum(links.values())
+    print(f"  Links: {total} ({cross} across categories)")
+    print(f"  Questions without related questions: {sum(isolated.values())}")
+    for file, count in isolated.most_common(args.limit):
+        print(f"    {file}: {count}")
+    print("  Most linked category pairs:")
+    for (a, b), count in [(pair, count) for pair, count in links.most_common() if pair[0] != pair[1]][:args.limit]:
+        print(f"    {a} ↔ {b}: {count}")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Argument parsing and chaining
+# ---------------------------------------------------------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='millionwhys',
+        description='Unified CLI for the millionwhys question pipeline',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Chain steps with --then; they share one process and one loaded corpus:
+  python scripts/millionwhys.py add --draft new.yaml --then validate --then master-list
+
+When add is followed by master-list, it leaves the master list to that step.
+        '''
+    )
+    parser.add_argument('--questions-dir', type=Path,
+                        help='Questions directory (default: auto-discovered)')
+
+    sub = parser.add_subparsers(dest='command', metavar='COMMAND')
+    sub.required = True
+
+    p = sub.add_parser('add', help='Add questions from YAML drafts')
+    source = p.add_mutually_exclusive_group(required=True)
+    source.add_argument('--draft', help='YAML file with question drafts')
+    source.add_argument('--drafts', help='Directory or glob of YAML drafts, any categories')
+    p.add_argument('--workers', type=int, default=8, help='Concurrent translations for --drafts')
+    p.add_argument('--dry-run', action='store_true', help='Preview without writing files')
+    p.add_argument('--no-ai', action='store_true', help='Skip AI generation (manual content only)')
+    p.add_argument('--skip-validation', action='store_true', help='Skip validation (not recommended)')
+    p.add_argument('--allow-duplicates', action='store_true',
+                   help='Add drafts even if they look like existing questions')
+    p.set_defaults(func=cmd_add)
+
+    p = sub.add_parser('validate', help='Structure and automated fact validation')
+    p.add_argument('--file', help='Validate one file (default: all)')
+    p.add_argument('--ai-check', action='store_true', help='Generate AI fact-check prompts')
+    p.add_argument('--no-strict', action='store_true', help='Continue even with critical issues')
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser('verify', help='Web-based fact verification (Wikipedia)')
+    p.add_argument('--file', help='Verify one file (default: all)')
+    p.add_argument('--summary', action='store_true', help='Show summary only')
+    p.add_argument('--output', help='Save results to JSON file')
+    p.set_defaults(func=cmd_verify)
+
+    p = sub.add_parser('translate', help='Retranslate questions with DeepSeek')
+    p.add_argument('--file', help='Translate one file (default: all)')
+    p.add_argument('--timestamp', default='2025-11-20T00:07',
+                   help='Deprecated (use --stale): only translate questions with this created_at prefix')
+    p.add_argument('--all', action='store_true',
+                   help='Deprecated (use --stale): translate ALL questions regardless of timestamp')
+    p.add_argument('--queue', nargs='?', const=str(PROJECT_ROOT / 'data' / 'cache' / 'retranslation_queue.json'),
+                   metavar='PATH', help='Only translate questions in a consistency queue')
+    p.add_argument('--stale', action='store_true',
+                   help='Only translate questions whose English changed since their last translation')
+    p.add_argument('--include-unhashed', action='store_true',
+                   help='With --stale, also translate never-hashed questions (may overwrite hand-written Chinese)')
+    p.add_argument('--dry-run', action='store_true', help='List selected questions without translating')
+    p.set_defaults(func=cmd_translate)
+
+    # Options of consistency, rollup and events: see parse_step
+    p = sub.add_parser('consistency', help='Check EN/ZH fields still match; write a retranslation queue',
+                       add_help=False)
+    p.set_defaults(func=cmd_consistency)
+
+    p = sub.add_parser('ids', help='Show next available question IDs')
+    p.add_argument('category', nargs='?', help='Category name (e.g. "Physics")')
+    p.add_argument('--count', type=int, default=0, help='List the next N IDs')
+    p.set_defaults(func=cmd_ids)
+
+    p = sub.add_parser('master-list', help='Update ALL_QUESTIONS_MASTER_LIST.md')
+    p.add_argument('--dry-run', action='store_true', help='Preview without writing')
+    p.set_defaults(func=cmd_master_list)
+
+    p = sub.add_parser('stats', help='Question counts per category and difficulty')
+    p.add_argument('--file', help='One file (default: all)')
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser('analytics', help='Precompute admin dashboard stats from quiz logs')
+    p.add_argument('--logs-dir', type=Path, help='Directory with the JSONL logs (default: data/logs)')
+    p.add_argument('--output', type=Path, help='Snapshot path (default: <logs-dir>/stats_snapshot.json)')
+    p.add_argument('--print', dest='show', action='store_true', help='Print the computed stats')
+    p.add_argument('--full', action='store_true', help='Ignore the checkpoint and re-read the logs, archives included')
+    sessions = p.add_mutually_exclusive_group()
+    sessions.add_argument('--sketch-sessions', dest='sketch_sessions', action='store_true', default=None,
+                          help='Estimate sessions with HyperLogLog/Count-Min sketches (constant memory)')
+    sessions.add_argument('--exact-sessions', dest='sketch_sessions', action='store_false',
+                          help='Track every session exactly')
+    p.set_defaults(func=cmd_analytics)
+
+    p = sub.add_parser('calibrate', help='Flag questions whose difficulty does not match answer accuracy')
+    p.add_argument('--logs-dir', type=Path, help='Directory with the JSONL logs (default: data/logs)')
+    p.add_argument('--apply', action='store_true', help='Write suggested difficulties back')
+    p.add_argument('--dry-run', action='store_true', help='With --apply: show changes without writing')
+    p.add_argument('--all', dest='show_all', action='store_true', help='Report every answered question')
+    p.add_argument('--json', type=Path, help='Write all calibrations to this JSON file')
+    p.add_argument('--min-answers', type=int, default=30, help='Answers needed before flagging')
+    p.set_defaults(func=cmd_calibrate)
+
+    p = sub.add_parser('dedup', help='Find near-duplicate questions (MinHash/LSH)')
+    p.add_argument('question', nargs='?', help='Show questions similar to this text instead')
+    p.add_argument('--threshold', type=float, default=0.5, help='Minimum similarity (default: 0.5)')
+    p.add_argument('--strict', action='store_true', help='Exit 1 if any pair is found')
+    p.set_defaults(func=cmd_dedup)
+
+    p = sub.add_parser('search', help='Find existing questions (English or Chinese, ranked)')
+    p.add_argument('query', nargs='+', help='Words to look for; end a word with * to match prefixes')
+    p.add_argument('--file', help='Only search this category file')
+    p.add_argument('--limit', type=int, default=10, help='Results to show (default: 10)')
+    p.add_argument('--any', action='store_true', help='Match questions with any of the words, not all')
+    p.set_defaults(func=cmd_search)
+
+    p = sub.add_parser('related', help='Related-question table (TF-IDF nearest neighbours)')
+    p.add_argument('question', nargs='?', help='Show the questions related to this question ID')
+    p.add_argument('--rebuild', action='store_true', help='Recompute every question, not only changed ones')
+    p.add_argument('--limit', type=int, default=10, help='Rows to show per list (default: 10)')
+    p.add_argument('--json', type=Path, help='Write the whole table ({id: [[id, score], ...]}) to this file')
+    p.set_defaults(func=cmd_related)
+
+    p = sub.add_parser('rollup', help='Roll up quiz logs, archive raw logs, query time ranges', add_help=False)
+    p.set_defaults(func=cmd_rollup)
+
+    p = sub.add_parser('events', help='Columnar answer-event store with vectorized group-bys', add_help=False)
+    p.set_defaults(func=cmd_events)
+
+    return parser
+
+
+def split_chain(argv: List[str]) -> List[List[str]]:
+    """Split argv into steps at each --then"""
+    steps: List[List[str]] = [[]]
+    for token in argv:
+        if token == CHAIN_SEPARATOR:
+            steps.append([])
+        else:
+            steps[-1].append(token)
+    return steps
+
+
+def parse_step(parser: argparse.ArgumentParser, segment: List[str]) -> argparse.Namespace:
+    """
+    Parse one step of the chain
+
+    Options of the subcommands in SCRIPT_ARGUMENTS are parsed by their
+    script's add_arguments, so building the parser imports none of them.
+    """
+    args, extras = parser.parse_known_args(segment)
+    module = SCRIPT_ARGUMENTS.get(args.command)
+    if module is None:
+        if extras:
+            parser.error(f"unrecognized arguments: {' '.join(extras)}")
+        return args
+
+    step_parser = argparse.ArgumentParser(prog=f'{parser.prog} {args.command}')
+    __import__(module).add_arguments(step_parser)
+    return step_parser.parse_args(extras, namespace=args)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    segments = split_chain(sys.argv[1:] if argv is None else argv)
+
+    if any(not segment for segment in segments):
+        parser.error(f"empty step around '{CHAIN_SEPARATOR}'")
+
+    # Parse every step up front so a typo late in the chain fails before any work
+    steps = [parse_step(parser, segment) for segment in segments]
+    # One corpus serves the whole chain
+    if any(args.questions_dir is not None for args in steps[1:]):
+        parser.error(f"--questions-dir applies to the whole chain; give it before the first step, "
+                     f"not after '{CHAIN_SEPARATOR}'")
+    ctx = PipelineContext(steps[0].questions_dir)
+
+    for i, args in enumerate(steps):
+        ctx.remaining_steps = [s.command for s in steps[i + 1:]]
+        if len(steps) > 1:
+            print(f"\n▶️  Step {i + 1}/{len(steps)}: {args.command}")
+        if getattr(args, 'dry_run', False):
+            ctx.dry_run = True
+        elif ctx.dry_run and hasattr(args, 'dry_run'):
+            print("   (dry run: an earlier step was --dry-run)")
+            args.dry_run = True
+        try:
+            code = args.func(args, ctx)
+        except FileNotFoundError as e:
+            print(f"❌ {e}")
+            code = 1
+        except SystemExit as e:
+            # Underlying scripts exit on failure; stop the chain there.
+            # sys.exit() with no code is a success, like it is for the shell
+            code = 0 if e.code is None else e.code if isinstance(e.code, int) else 1
+        if code:
+            if len(steps) > 1 and i < len(steps) - 1:
+                print(f"\n🚫 Step '{args.command}' failed; skipping remaining steps")
+            return code
+
+    return 0
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interrupted by user")
+        sys.exit(130)
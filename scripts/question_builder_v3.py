@@ -11,14 +11,15 @@ New Workflow:
 
 import os
 import json
+from importlib.util import find_spec
 from typing import Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 
-try:
-    from openai import OpenAI
-except ImportError:
-    OpenAI = None
+# The openai package is only imported when a translation actually needs the
+# DeepSeek client (see QuestionBuilderV3.deepseek_client); importing it costs
+# far more than the rest of the scripts' startup combined. The utils modules
+# below it are imported where they are used, keeping --dry-run --no-ai fast.
 
 
 @dataclass
@@ -37,7 +38,7 @@ class QuestionDraft:
 class QuestionBuilderV3:
     """Builds complete questions using DeepSeek for translation only"""
 
-    # Character limits
+    # Character limits (the English ones are enforced by the draft schema)
     LIMITS = {
         'question_en': 45,
         'question_zh': 35,  # Relaxed for clearer phrasing
@@ -57,30 +58,51 @@ class QuestionBuilderV3:
         """
         self.use_deepseek = use_deepseek
 
-        # Initialize DeepSeek client (for Chinese translation only)
+        # DeepSeek client (for Chinese translation only) is created on first use
+        self._deepseek_client = None
+        self._deepseek_key = None
+
+        # Identical translation requests from concurrent drafts (see
+        # add_questions.translate_drafts) share one API call; only needed
+        # once there is a client to call
+        self._in_flight = None
+
         if use_deepseek:
-            if OpenAI is None:
+            if find_spec('openai') is None:
                 print("⚠️  Warning: openai package not installed. Install with: pip install openai")
-                self.deepseek_client = None
             else:
                 deepseek_key = os.getenv('DEEPSEEK_API_KEY')
                 if deepseek_key:
-                    try:
-                        self.deepseek_client = OpenAI(
-                            api_key=deepseek_key,
-                            base_url="https://api.deepseek.com"
-                        )
-                        print("✅ DeepSeek API available for Chinese translation")
-                    except Exception as e:
-                        print(f"⚠️  Warning: Could not initialize DeepSeek client: {e}")
-                        self.deepseek_client = None
+                    from utils.singleflight import SingleFlight
+
+                    self._deepseek_key = deepseek_key
+                    self._in_flight = SingleFlight()
+                    print("✅ DeepSeek API available for Chinese translation")
                 else:
                     print("⚠️  Warning: DEEPSEEK_API_KEY not found - Chinese translation will be skipped")
-                    self.deepseek_client = None
-        else:
-            self.deepseek_client = None
 
-    def complete_question(self, draft: QuestionDraft, category: str) -> Dict:
+    @property
+    def deepseek_client(self):
+        """DeepSeek client, constructed on first access (None if unavailable)"""
+        if self._deepseek_client is None and self._deepseek_key:
+            deepseek_key, self._deepseek_key = self._deepseek_key, None
+            try:
+                from openai import OpenAI
+
+                self._deepseek_client = OpenAI(
+                    api_key=deepseek_key,
+                    base_url="https://api.deepseek.com"
+                )
+            except Exception as e:
+                print(f"⚠️  Warning: Could not initialize DeepSeek client: {e}")
+        return self._deepseek_client
+
+    def _chat(self, **request):
+        """DeepSeek chat completion, shared with concurrent identical requests"""
+        key = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return self._in_flight.do(key, self.deepseek_client.chat.completions.create, **request)
+
+    def complete_question(self, draft: QuestionDraft, category: str, verbose: bool = True) -> Dict:
         """
         Complete a question draft:
         1. Validate English content (should be fact-checked by Claude Code already)
@@ -90,34 +112,35 @@ class QuestionBuilderV3:
         Args:
             draft: QuestionDraft with fact-checked English content
             category: Category name for context
+            verbose: Print progress (bulk imports report per batch instead)
 
         Returns:
             Complete question dict with timestamps
         """
-        print(f"\n🔨 Processing: {draft.question_en}")
-
-        # Step 1: Validate English content
-        self._validate_draft(draft)
+        if verbose:
+            print(f"\n🔨 Processing: {draft.question_en}")
 
-        # Step 2: Ensure we have explanations (fact-checked by Claude Code)
-        if not draft.explanations_en or len(draft.explanations_en) != 4:
-            raise ValueError(
-                "English explanations required (4 explanations). "
-                "These should be fact-checked by Claude Code before running this script."
-            )
+        # Step 1: Validate English content, including the 4 explanations
+        # (fact-checked by Claude Code before running this script)
+        errors = self.draft_errors(draft)
+        if errors:
+            raise ValueError("Invalid draft:\n" + "\n".join(errors))
 
-        # Step 3: Translate to Chinese (using DeepSeek with full context)
+        # Step 2: Translate to Chinese (using DeepSeek with full context)
+        translated = False
         if not draft.question_zh or not draft.choices_zh or not draft.explanations_zh:
-            print("  🇨🇳 Translating to Chinese (with full context)...")
+            if verbose:
+                print("  🇨🇳 Translating to Chinese (with full context)...")
             translation = self._translate_question_with_context(draft)
             draft.question_zh = translation['question']
             draft.choices_zh = translation['choices']
             draft.explanations_zh = translation['explanations']
+            translated = True
 
-        # Step 4: Validate character limits
+        # Step 3: Validate Chinese character limits
         self._validate_lengths(draft)
 
-        # Step 5: Add timestamps
+        # Step 4: Add timestamps
         now = datetime.now(timezone.utc).isoformat()
 
         # Convert to dict with timestamps
@@ -133,8 +156,16 @@ class QuestionBuilderV3:
             'created_at': now,
             'last_modified_at': now
         }
+        # Lets retranslate_questions.py --stale spot later English edits.
+        # Hand-written Chinese was not produced from this English; leave it
+        # unhashed (--stale skips such questions unless --include-unhashed)
+        if translated:
+            from utils.corpus import source_hash
 
-        print("  ✅ Question completed successfully")
+            question['translation_source_hash'] = source_hash(question)
+
+        if verbose:
+            print("  ✅ Question completed successfully")
         return question
 
     def _translate_question_with_context(self, draft: QuestionDraft) -> Dict:
@@ -190,7 +221,7 @@ class QuestionBuilderV3:
 """
 
         try:
-            response = self.deepseek_client.chat.completions.create(
+            response = self._chat(
                 model="deepseek-chat",
                 messages=[
                     {
@@ -236,7 +267,7 @@ class QuestionBuilderV3:
                 prompt += f" (max {max_chars} characters)"
             prompt += f":\n\n{text}\n\nProvide ONLY the Chinese translation, nothing else."
 
-            response = self.deepseek_client.chat.completions.create(
+            response = self._chat(
                 model="deepseek-chat",
                 messages=[
                     {"role": "system", "content": "You are a translator. Provide only the translation, no explanations."},
@@ -257,33 +288,27 @@ class QuestionBuilderV3:
         except Exception as e:
             raise RuntimeError(f"Translation failed for '{text[:50]}...': {e}")
 
-    def _validate_draft(self, draft: QuestionDraft):
-        """Validate basic draft structure"""
-        if len(draft.choices_en) != 4:
-            raise ValueError(f"Must have exactly 4 choices (got {len(draft.choices_en)})")
+    def draft_errors(self, draft: QuestionDraft) -> List[str]:
+        """
+        Everything complete_question would reject in the English draft
+
+        Checks the draft against schemas/question_draft.schema.json (structure,
+        fact-checked explanations, English character limits). Runs no
+        translation, so a batch can be screened before any API call.
 
-        if draft.correct_answer not in [0, 1, 2, 3]:
-            raise ValueError(f"correct_answer must be 0-3 (got {draft.correct_answer})")
+        Returns:
+            Error messages (empty if the draft is buildable)
+        """
+        from utils.schema import load_validator
 
-        if draft.difficulty not in ['easy', 'medium', 'hard']:
-            raise ValueError(f"difficulty must be easy/medium/hard (got {draft.difficulty})")
+        # Draft questions are checked against the same schema as draft files
+        fields = {k: v for k, v in asdict(draft).items() if v is not None}
+        return [str(e) for e in load_validator('question_draft', '#/definitions/question')(fields)]
 
     def _validate_lengths(self, draft: QuestionDraft):
-        """Validate character limits"""
+        """Validate Chinese character limits (English is checked with the draft)"""
         errors = []
 
-        # Check English
-        if len(draft.question_en) > self.LIMITS['question_en']:
-            errors.append(
-                f"question_en too long: {len(draft.question_en)} > {self.LIMITS['question_en']} chars"
-            )
-
-        for i, choice in enumerate(draft.choices_en):
-            if len(choice) > self.LIMITS['choice_en']:
-                errors.append(
-                    f"choices_en[{i}] too long: {len(choice)} > {self.LIMITS['choice_en']} chars"
-                )
-
         # Check Chinese (only if translated)
         if draft.question_zh:
             if len(draft.question_zh) > self.LIMITS['question_zh']:
@@ -2,18 +2,36 @@
 """Retranslate all questions to Chinese using DeepSeek API with full context."""
 
 import json
-import glob
 import os
+import sys
 import time
-from openai import OpenAI
+from pathlib import Path
 
-# Initialize DeepSeek client
-DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
-if not DEEPSEEK_API_KEY:
-    print("Error: DEEPSEEK_API_KEY not set")
-    exit(1)
+from utils.consistency import QUEUE_PATH, load_queue
+from utils.corpus import (find_questions_dir, load_category, save_category, source_hash,
+                          translation_is_stale)
 
-client = OpenAI(api_key=DEEPSEEK_API_KEY, base_url="https://api.deepseek.com")
+# DeepSeek client, created on first translation (see get_client)
+_client = None
+
+
+def get_client():
+    """Return the shared DeepSeek client, creating it on first use."""
+    global _client
+    if _client is None:
+        deepseek_api_key = os.getenv("DEEPSEEK_API_KEY")
+        if not deepseek_api_key:
+            print("Error: DEEPSEEK_API_KEY not set")
+            sys.exit(1)
+
+        from openai import OpenAI
+        _client = OpenAI(api_key=deepseek_api_key, base_url="https://api.deepseek.com")
+    return _client
+
+
+# Printed when questions are selected by created_at prefix or --all
+DEPRECATED_SELECTION = ("⚠️  --timestamp and --all are deprecated and will be removed; "
+                        "use --stale (after a one-time --stamp) or --queue")
 
 # Character limits (relaxed for clarity)
 LIMITS = {
@@ -71,7 +89,7 @@ def translate_question_with_context(question: dict) -> dict:
 """
 
     try:
-        response = client.chat.completions.create(
+        response = get_client().chat.completions.create(
             model="deepseek-chat",
             messages=[
                 {
@@ -100,16 +118,33 @@ def translate_question_with_context(question: dict) -> dict:
         print(f"  ⚠️  Error: {e}")
         return None
 
-def retranslate_file(filepath: str, timestamp_filter: str = None):
-    """Retranslate all questions in a file."""
-    with open(filepath) as f:
-        data = json.load(f)
+def retranslate_file(filepath: str, timestamp_filter: str = None, corpus=None, ids=None,
+                     stale_only: bool = False, dry_run: bool = False, include_unhashed: bool = False):
+    """Retranslate all questions in a file.
+
+    Args:
+        filepath: Category JSON file
+        timestamp_filter: Only translate questions whose created_at starts with this
+        corpus: Shared utils.corpus.Corpus to read from and write through, if any
+        ids: Only translate these question IDs (e.g. from a retranslation queue)
+        stale_only: Only translate questions whose English changed since their
+            last translation (translation_source_hash mismatch)
+        dry_run: List the selected questions without translating
+        include_unhashed: With stale_only, also translate questions that were
+            never hashed (their Chinese may be hand-written; see stamp_file)
+    """
+    data = corpus.load(filepath) if corpus else load_category(filepath)
 
     filename = os.path.basename(filepath)
     questions = data.get('questions', [])
 
-    # Filter questions by timestamp if specified
-    if timestamp_filter:
+    # Filter questions by ID, source hash or timestamp if specified
+    if stale_only:
+        questions_to_translate = [q for q in questions if translation_is_stale(q)
+                                  and (include_unhashed or 'translation_source_hash' in q)]
+    elif ids is not None:
+        questions_to_translate = [q for q in questions if q.get('id') in ids]
+    elif timestamp_filter:
         questions_to_translate = [q for q in questions if q.get('created_at', '').startswith(timestamp_filter)]
     else:
         questions_to_translate = questions
@@ -122,6 +157,14 @@ def retranslate_file(filepath: str, timestamp_filter: str = None):
     print(f"Processing: {filename} ({len(questions_to_translate)} questions)")
     print('='*60)
 
+    if dry_run:
+        for q in questions_to_translate:
+            reason = ''
+            if stale_only:
+                reason = ' (never hashed)' if 'translation_source_hash' not in q else ' (English changed)'
+            print(f"  {q.get('id')}: {q['question_en'][:50]}{reason}")
+        return
+
     for i, q in enumerate(questions_to_translate):
         qid = q.get('id', f'#{i}')
         print(f"\n[{i+1}/{len(questions_to_translate)}] {qid}: {q['question_en'][:40]}...")
@@ -134,6 +177,7 @@ def retranslate_file(filepath: str, timestamp_filter: str = None):
             q['question_zh'] = translation['question']
             q['choices_zh'] = translation['choices']
             q['explanations_zh'] = translation['explanations']
+            q['translation_source_hash'] = source_hash(q)
             print(f"  ✅ Done")
         else:
             print(f"  ❌ Failed - keeping old translation")
@@ -141,19 +185,70 @@ def retranslate_file(filepath: str, timestamp_filter: str = None):
         time.sleep(0.5)  # Rate limit delay
 
     # Save updated file
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if corpus:
+        corpus.save(filepath, data)
+    else:
+        save_category(filepath, data)
 
     print(f"\n✅ Saved {filename}")
 
+def stamp_file(filepath: str, corpus=None) -> int:
+    """Record source hashes for questions that have none, without translating.
+
+    Use once to accept the current Chinese text as the baseline, so that
+    --stale only picks up English edits made from now on.
+
+    Returns:
+        Number of questions stamped
+    """
+    data = corpus.load(filepath) if corpus else load_category(filepath)
+    stamped = 0
+    for q in data.get('questions', []):
+        if 'translation_source_hash' not in q:
+            q['translation_source_hash'] = source_hash(q)
+            stamped += 1
+
+    if stamped:
+        if corpus:
+            corpus.save(filepath, data)
+        else:
+            save_category(filepath, data)
+    print(f"{os.path.basename(filepath)}: stamped {stamped} questions")
+    return stamped
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description='Retranslate questions using DeepSeek with contextual translation')
     parser.add_argument('--file', help='Specific file to translate (e.g., animals.json)')
-    parser.add_argument('--timestamp', default='2025-11-20T00:07', help='Only translate questions with this timestamp prefix')
-    parser.add_argument('--all', action='store_true', help='Translate ALL questions regardless of timestamp')
+    parser.add_argument('--timestamp', default='2025-11-20T00:07',
+                        help='Deprecated (use --stale): only translate questions with this created_at prefix')
+    parser.add_argument('--all', action='store_true',
+                        help='Deprecated (use --stale): translate ALL questions regardless of timestamp')
+    parser.add_argument('--queue', nargs='?', const=str(QUEUE_PATH), metavar='PATH',
+                        help='Only translate questions in a check_translations.py queue')
+    parser.add_argument('--stale', action='store_true',
+                        help='Only translate questions whose English changed since their last translation')
+    parser.add_argument('--include-unhashed', action='store_true',
+                        help='With --stale, also translate never-hashed questions (may overwrite hand-written Chinese)')
+    parser.add_argument('--stamp', action='store_true',
+                        help='Record source hashes for unhashed questions without translating (baseline)')
+    parser.add_argument('--dry-run', action='store_true', help='List selected questions without translating')
     args = parser.parse_args()
 
+    questions_dir = find_questions_dir(Path(__file__).parent)
+    if args.file:
+        files = [questions_dir / args.file]
+        if not files[0].exists():
+            print(f"File not found: {files[0]}")
+            return
+    else:
+        files = sorted(questions_dir.glob('*.json'))
+
+    if args.stamp:
+        total = sum(stamp_file(str(filepath)) for filepath in files)
+        print(f"\n✅ Stamped {total} questions")
+        return
+
     print("\n" + "="*60)
     print("🚀 Contextual Translation Mode")
     print("="*60)
@@ -163,16 +258,23 @@ def main():
     print("  ✓ Relaxed limits (question: 30字, choices: 20字)")
     print("="*60)
 
-    if args.file:
-        filepath = f"src/data/questions/{args.file}"
-        if not os.path.exists(filepath):
-            print(f"File not found: {filepath}")
-            return
-        retranslate_file(filepath, None if args.all else args.timestamp)
+    if args.queue:
+        queue = load_queue(Path(args.queue))
+        print(f"Queue: {sum(map(len, queue.values()))} questions from {args.queue}")
+        for filename, ids in sorted(queue.items()):
+            if args.file and filename != args.file:
+                continue
+            retranslate_file(str(questions_dir / filename), ids=ids, dry_run=args.dry_run)
     else:
-        files = sorted(glob.glob('src/data/questions/*.json'))
+        if not args.stale:
+            print(DEPRECATED_SELECTION)
         for filepath in files:
-            retranslate_file(filepath, None if args.all else args.timestamp)
+            retranslate_file(str(filepath), None if args.all else args.timestamp,
+                             stale_only=args.stale, dry_run=args.dry_run,
+                             include_unhashed=args.include_unhashed)
+
+    if args.dry_run:
+        return
 
     print("\n" + "="*60)
     print("✅ All translations complete!")
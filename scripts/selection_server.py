@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Serve adaptive next-question picks over local HTTP
+
+Loads the bank and data/logs/quiz_answers.jsonl once into the selection
+engine (utils/selection.py), then answers:
+
+    GET  /next?session=S[&category=physics][&difficulty=hard]
+         -> {"id", "category", "difficulty", "target"}
+            404 once the session has seen every matching question
+    POST /answer  {"sessionId", "questionId", "isCorrect"}
+         -> {"target"}: the session's next target difficulty
+    GET  /health  -> question, session and served counts
+
+Connections are kept alive (HTTP/1.1), one thread per connection.
+
+Usage:
+    python3 scripts/selection_server.py                       # http://127.0.0.1:8770
+    python3 scripts/selection_server.py --port 9000 --logs-dir /var/log/millionwhys
+    curl 'http://127.0.0.1:8770/next?session=abc&category=physics'
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+# Add script directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.corpus import Corpus
+from utils.log_analytics import ANSWERS_LOG, LOGS_DIR
+from utils.selection import SelectionEngine
+
+DEFAULT_PORT = 8770
+
+# Largest /answer body accepted
+MAX_BODY = 4096
+
+
+class SelectionHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; don't let the body wait for an ACK
+    disable_nagle_algorithm = True
+    engine: SelectionEngine = None
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        if url.path == '/next':
+            params = urllib.parse.parse_qs(url.query)
+            session = params.get('session', [''])[0]
+            if not session:
+                return self._send_json(400, {'error': 'session is required'})
+            try:
+                pick = self.engine.next(session, category=params.get('category', [None])[0],
+                                        difficulty=params.get('difficulty', [None])[0])
+            except ValueError as e:
+                return self._send_json(400, {'error': str(e)})
+            if pick is None:
+                return self._send_json(404, {'error': 'Session has seen every matching question'})
+            self._send_json(200, pick.to_dict())
+        elif url.path == '/health':
+            self._send_json(200, self.engine.stats())
+        else:
+            self._send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        if urllib.parse.urlsplit(self.path).path != '/answer':
+            return self._send_json(404, {'error': 'Not found'})
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY:
+            self.close_connection = True
+            return self._send_json(413, {'error': 'Body too large'})
+        try:
+            event = json.loads(self.rfile.read(length) or b'{}')
+            session, question_id = event['sessionId'], event['questionId']
+            if not isinstance(session, str) or not isinstance(question_id, str):
+                raise TypeError
+        except (ValueError, KeyError, TypeError):
+            return self._send_json(400, {'error': 'Expected {"sessionId", "questionId", "isCorrect"}'})
+        target = self.engine.answer(session, question_id, bool(event.get('isCorrect')))
+        self._send_json(200, {'target': target})
+
+    def _send_json(self, status: int, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # One line per request would dominate the cost of serving it
+
+
+class SelectionServer:
+    """Selection service on a background thread; use as a context manager"""
+
+    def __init__(self, engine: SelectionEngine, port: int = 0, host: str = '127.0.0.1'):
+        self.engine = engine
+        handler = type('Handler', (SelectionHandler,), {'engine': engine})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'SelectionServer':
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve adaptive next-question picks over HTTP')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port to listen on (default: {DEFAULT_PORT})')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1)')
+    parser.add_argument('--logs-dir', type=Path, default=LOGS_DIR, help='Directory with the JSONL logs')
+    parser.add_argument('--questions-dir', type=Path, help='Questions directory (default: auto-discovered)')
+    parser.add_argument('--seed', type=int, help='Random seed, for reproducible picks')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    engine = SelectionEngine.from_history(Corpus(args.questions_dir), args.logs_dir / ANSWERS_LOG, seed=args.seed)
+    stats = engine.stats()
+    server = SelectionServer(engine, args.port, args.host)
+    print(f"🎲 Selection engine: {stats['questions']} questions in {stats['categories']} categories "
+          f"{stats['by_difficulty']}, built in {time.perf_counter() - start:.2f}s")
+    print(f"   Serving on {server.url}, Ctrl+C to stop")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nServed {engine.stats()['served']} questions to {engine.stats()['sessions']} sessions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
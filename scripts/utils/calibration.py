@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Difficulty Calibration - Compare assigned difficulty with how users perform
+
+Tallies answers per question from quiz_answers.jsonl (and its archived
+segments) in one streaming pass, then smooths each question's accuracy
+with a Beta prior centred on the pooled accuracy of questions carrying
+the same assigned difficulty (empirical Bayes). Questions with few answers stay close to their label's
+typical accuracy; questions with many answers follow their own data.
+
+A question is flagged as miscalibrated when it has enough answers and the
+credible interval of its smoothed accuracy lies entirely outside the band
+of its assigned difficulty.
+"""
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .corpus import Corpus
+    from .log_analytics import ANSWERS_LOG, LOGS_DIR, JsonlReader, history_files
+except ImportError:  # Run directly as a script
+    from corpus import Corpus
+    from log_analytics import ANSWERS_LOG, LOGS_DIR, JsonlReader, history_files
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+# Accuracy bands: easy >= EASY_ABOVE > medium >= HARD_BELOW > hard
+EASY_ABOVE = 0.75
+HARD_BELOW = 0.45
+
+# Weight of the prior, in pseudo-answers
+PRIOR_STRENGTH = 20
+
+# Minimum answers before a question can be flagged
+MIN_ANSWERS = 30
+
+# Two-sided 95% interval
+Z_SCORE = 1.96
+
+
+@dataclass
+class Calibration:
+    """Calibration result for one question"""
+    question_id: str
+    file: str
+    question_en: str
+    assigned: str
+    answers: int
+    correct: int
+    smoothed: float
+    low: float
+    high: float
+    suggested: str
+    flagged: bool
+
+    @property
+    def raw_accuracy(self) -> float:
+        return self.correct / self.answers if self.answers else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.question_id,
+            'file': self.file,
+            'assigned': self.assigned,
+            'suggested': self.suggested,
+            'answers': self.answers,
+            'correct': self.correct,
+            'accuracy': round(self.raw_accuracy, 4),
+            'smoothed': round(self.smoothed, 4),
+            'interval': [round(self.low, 4), round(self.high, 4)],
+            'flagged': self.flagged,
+        }
+
+
+def tally_answers(log_path: Optional[Path] = None) -> Tuple[Dict[str, List[int]], int]:
+    """
+    Count answers per question in a single pass over the answer log
+
+    Segments that compaction archived (log_analytics.history_files) are
+    read before the live log, so tallies cover the whole history.
+
+    Returns:
+        ({questionId: [answers, correct]}, malformed line count)
+    """
+    log_path = Path(log_path) if log_path else LOGS_DIR / ANSWERS_LOG
+    tallies: Dict[str, List[int]] = {}
+    paths = history_files(log_path.parent, log_path.name)
+    if log_path.exists():
+        paths.append(log_path)
+
+    malformed = 0
+    for path in paths:
+        reader = JsonlReader(path)
+        for event in reader:
+            question_id = event.get('questionId')
+            if not isinstance(question_id, str):
+                continue
+            tally = tallies.get(question_id)
+            if tally is None:
+                tally = tallies[question_id] = [0, 0]
+            tally[0] += 1
+            tally[1] += bool(event.get('isCorrect'))
+        malformed += reader.malformed
+    return tallies, malformed
+
+
+def band(accuracy: float, easy_above: float = EASY_ABOVE, hard_below: float = HARD_BELOW) -> str:
+    """Difficulty whose accuracy band contains accuracy"""
+    if accuracy >= easy_above:
+        return 'easy'
+    if accuracy < hard_below:
+        return 'hard'
+    return 'medium'
+
+
+def _outside_band(low: float, high: float, difficulty: str,
+                  easy_above: float, hard_below: float) -> bool:
+    """True if the whole interval [low, high] misses the band of difficulty"""
+    if difficulty == 'easy':
+        return high < easy_above
+    if difficulty == 'hard':
+        return low >= hard_below
+    return high < hard_below or low >= easy_above
+
+
+def calibrate(tallies: Dict[str, List[int]], corpus: Optional[Corpus] = None,
+              prior_strength: float = PRIOR_STRENGTH, min_answers: int = MIN_ANSWERS,
+              easy_above: float = EASY_ABOVE, hard_below: float = HARD_BELOW) -> List[Calibration]:
+    """
+    Calibrate every answered question in the bank
+
+    Args:
+        tallies: Output of tally_answers()
+        corpus: Question bank (default: auto-discovered)
+        prior_strength: Pseudo-answers given to the prior
+        min_answers: Answers required before a question can be flagged
+        easy_above, hard_below: Accuracy band edges
+
+    Returns:
+        Calibrations for questions with at least one answer, flagged first
+    """
+    corpus = corpus or Corpus()
+
+    questions = []
+    for path in corpus.files():
+        for question in corpus.open(path).iter_questions():
+            if question['id'] in tallies:
+                questions.append((path.name, question))
+
+    # Empirical Bayes prior: pooled accuracy per assigned difficulty
+    pooled = {difficulty: [0, 0] for difficulty in DIFFICULTIES}
+    overall = [0, 0]
+    for _, question in questions:
+        answers, correct = tallies[question['id']]
+        overall[0] += answers
+        overall[1] += correct
+        if question.get('difficulty') in pooled:
+            pooled[question['difficulty']][0] += answers
+            pooled[question['difficulty']][1] += correct
+    overall_mean = overall[1] / overall[0] if overall[0] else 0.5
+    prior_means = {difficulty: (correct / answers if answers else overall_mean)
+                   for difficulty, (answers, correct) in pooled.items()}
+
+    results = []
+    for filename, question in questions:
+        answers, correct = tallies[question['id']]
+        assigned = question.get('difficulty', 'medium')
+        prior = prior_means.get(assigned, overall_mean)
+
+        # Posterior mean of Beta(prior * k + correct, (1 - prior) * k + wrong)
+        weight = answers + prior_strength
+        smoothed = (correct + prior * prior_strength) / weight
+        spread = Z_SCORE * math.sqrt(smoothed * (1 - smoothed) / (weight + 1))
+        low, high = max(0.0, smoothed - spread), min(1.0, smoothed + spread)
+
+        suggested = band(smoothed, easy_above, hard_below)
+        flagged = (answers >= min_answers and suggested != assigned
+                   and _outside_band(low, high, assigned, easy_above, hard_below))
+        results.append(Calibration(
+            question_id=question['id'],
+            file=filename,
+            question_en=question.get('question_en', ''),
+            assigned=assigned,
+            answers=answers,
+            correct=correct,
+            smoothed=smoothed,
+            low=low,
+            high=high,
+            suggested=suggested,
+            flagged=flagged,
+        ))
+
+    results.sort(key=lambda c: (not c.flagged, c.file, c.question_id))
+    return results
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import sys
+
+    tallies, _ = tally_answers(Path(sys.argv[1]) if len(sys.argv) > 1 else None)
+    for result in calibrate(tallies)[:10]:
+        print(result.to_dict())
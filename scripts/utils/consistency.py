@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Translation Consistency - Cheap alignment signals between EN and ZH fields
+
+Nothing else notices when an English question, choice or explanation is
+edited and its Chinese counterpart is not. This module compares every
+question's EN and ZH fields offline (no API calls) and scores how likely
+the translation has drifted:
+
+- structure:  missing/empty ZH fields, choice or explanation count mismatch
+- source:     English edited since the last translation (translation_source_hash)
+- verdict:    "Correct!/Wrong." vs "正确/错误/对啦/错啦..." per explanation,
+              and both against correct_answer
+- order:      choices whose numbers/Latin tokens match a different ZH choice
+- untranslated: ZH text with no Chinese characters
+- numbers:    values (with thousand/million/万/亿 multipliers) present on
+              one side only; imperial measurements are allowed to change
+- units:      unit families (%, temperature, length, ...) present in EN only
+- entities:   Latin-script names/acronyms (DNA, GPS) in ZH but not in EN
+- length:     ZH/EN length ratio far from the corpus norm for that field
+
+Signals are extracted per field, then the length ratios are scored in one
+pass over the whole corpus (median/MAD per field kind), so the queue
+reflects what is unusual for this bank rather than fixed thresholds.
+"""
+
+import json
+import math
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    from .corpus import PROJECT_ROOT, Corpus, source_hash
+except ImportError:  # Run directly as a script
+    from corpus import PROJECT_ROOT, Corpus, source_hash
+
+QUEUE_PATH = PROJECT_ROOT / 'data' / 'cache' / 'retranslation_queue.json'
+
+# Priority weights per finding
+WEIGHTS = {
+    'structure': 100,
+    'source': 60,
+    'verdict': 50,
+    'order': 40,
+    'untranslated': 40,
+    'numbers': 15,
+    'units': 10,
+    'entities': 8,
+    'length': 5,
+}
+
+# Robust z-score above which a length ratio is an outlier
+LENGTH_Z = 3.5
+
+# Findings with at least this score go in the queue by default
+MIN_SCORE = 10
+
+EN_CORRECT = ('correct', 'right', 'yes', 'exactly')
+EN_WRONG = ('wrong', 'incorrect', 'not quite', 'nope', 'no.', 'no,', 'no!')
+# Negatives first: "不正确" must not match "正确"
+ZH_WRONG = ('错', '不对', '不正确', '不是', '并非', '并不', '答错', '可惜')
+# A bare 对 would also match ordinary openings like 对于/对比: only as a verdict
+ZH_CORRECT = ('正确', '对啦', '对头', '对！', '对，', '对。', '对!', '对,', '答对', '没错', '完全正确', '回答正确',
+              '太棒', '恭喜', '是的')
+
+_CJK = re.compile(r'[一-鿿]')
+_EN_NUMBER = re.compile(
+    r'(?<![A-Za-z0-9.])(\d+(?:,\d{3})*(?:\.\d+)?)(?:\s*(thousand|million|billion|trillion)\b)?', re.I)
+_ZH_NUMBER = re.compile(r'(?<![A-Za-z0-9.])(\d+(?:,\d{3})*(?:\.\d+)?)\s*(千万|百万|万亿|万|亿|千)?(?![\d月])')
+_EN_MULTIPLIERS = {'thousand': 1e3, 'million': 1e6, 'billion': 1e9, 'trillion': 1e12}
+_ZH_MULTIPLIERS = {'千': 1e3, '万': 1e4, '百万': 1e6, '千万': 1e7, '亿': 1e8, '万亿': 1e12}
+
+# Numbers directly followed by these may legitimately change in translation
+_IMPERIAL = re.compile(
+    r'\s*(?:-|\s)?(?:°\s*F|degrees?\s+f(?:ahrenheit)?\b|fahrenheit|miles?\b|mph\b|feet\b|foot\b|ft\b|'
+    r'inch(?:es)?\b|pounds?\b|lbs?\b|ounces?\b|oz\b|gallons?\b|yards?\b|quarts?\b|pints?\b)', re.I)
+
+# Unit families: (EN pattern, ZH pattern); conversions stay within a family.
+# Matching is case-insensitive except for (?-i:...) symbols like g or W.
+UNIT_FAMILIES = {
+    'percent': (r'%|\bpercent\b', r'%|％|百分之'),
+    'temperature': (r'°\s*[CF]\b|\bdegrees? (?:celsius|fahrenheit|c|f)\b|\bcelsius\b|\bfahrenheit\b',
+                    r'°\s*[CF]|℃|℉|摄氏|华氏|\d\s*度'),
+    'length': (r'\d\s*(?-i:km|m|cm|mm|nm)\b|\b(?:kilomet|centimet|millimet|nanomet)\w*|\bmiles?\b|'
+               r'\d\s*(?:feet|foot|inch(?:es)?)\b|\blight[- ]years?\b',
+               r'(?-i:km|cm|mm|nm)(?![A-Za-z])|\d\s*(?-i:m)(?![A-Za-z])|公里|千米|厘米|毫米|纳米|英里|英尺|英寸|光年|\d\s*米'),
+    'mass': (r'\d\s*(?:(?-i:kg|g|mg)|lbs?|pounds?|tons?|tonnes?|ounces?)\b|\bkilograms?\b|\bgrams?\b',
+             r'(?-i:kg|mg)(?![A-Za-z])|\d\s*(?-i:g)(?![A-Za-z])|公斤|千克|克|磅|吨|盎司'),
+    'speed': (r'\bmph\b|\bkm/h\b|\bkph\b|\bm/s\b|miles per hour|per second',
+              r'mph|km/h|m/s|/小时|/秒|每小时|每秒|时速|秒速'),
+    'frequency': (r'\b\d+\s*(?:hz|khz|mhz|ghz)\b|\bhertz\b', r'hz|khz|mhz|ghz|赫兹'),
+    'decibel': (r'\bdecibels?\b|\b\d+\s*db\b', r'分贝|db'),
+    'energy': (r'\bcalories?\b|\bkcal\b|\bjoules?\b', r'卡路里|千卡|大卡|焦耳|热量|卡'),
+    'electric': (r'\bvolts?\b|\bwatts?\b|\bamps?\b|\d\s*(?-i:[VW])\b', r'伏特|瓦特|安培|\d\s*(?-i:[VW])(?![A-Za-z])'),
+}
+_UNIT_PATTERNS = {name: (re.compile(en, re.I), re.compile(zh, re.I))
+                  for name, (en, zh) in UNIT_FAMILIES.items()}
+
+# Acronyms and formulas: DNA, CO2, H2O, Wi-Fi, pH, UV
+_LATIN_TOKEN = re.compile(r'(?<![A-Za-z])([A-Z][A-Za-z]*\d+[A-Za-z\d]*|[A-Z]{2,}s?|pH|Wi-Fi)(?![A-Za-z])')
+_ZH_LATIN = re.compile(r'[A-Za-z][A-Za-z\d\-]*')
+
+FIELD_KINDS = ('question', 'choice', 'explanation')
+
+
+@dataclass
+class ConsistencyReport:
+    """Drift findings for one question"""
+    question_id: str
+    file: str
+    question_en: str
+    findings: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def score(self) -> int:
+        return sum(WEIGHTS[kind] for kind, _ in self.findings)
+
+    def add(self, kind: str, detail: str):
+        self.findings.append((kind, detail))
+
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.question_id,
+            'file': self.file,
+            'score': self.score,
+            'question_en': self.question_en,
+            'findings': [{'signal': kind, 'detail': detail} for kind, detail in self.findings],
+        }
+
+
+def en_verdict(text: str) -> Optional[bool]:
+    """True for "Correct!", False for "Wrong.", None if unmarked"""
+    head = text.lstrip().lower()[:12]
+    if head.startswith(EN_WRONG):
+        return False
+    if head.startswith(EN_CORRECT):
+        return True
+    return None
+
+
+def zh_verdict(text: str) -> Optional[bool]:
+    """True for 正确/对啦..., False for 错误/错啦/不对..., None if unmarked"""
+    head = text.lstrip()[:6]
+    if head.startswith(ZH_WRONG):
+        return False
+    if head.startswith(ZH_CORRECT):
+        return True
+    return None
+
+
+def _value(number: str, multiplier: float) -> float:
+    return round(float(number.replace(',', '')) * multiplier, 6)
+
+
+def en_numbers(text: str) -> Tuple[Set[float], bool]:
+    """
+    Numeric values in English text
+
+    Returns:
+        (values, has_imperial) - values attached to imperial units are left
+        out, since translations usually convert them to metric
+    """
+    values = set()
+    imperial = False
+    for match in _EN_NUMBER.finditer(text):
+        if _IMPERIAL.match(text, match.end()):
+            imperial = True
+            continue
+        values.add(_value(match.group(1), _EN_MULTIPLIERS.get((match.group(2) or '').lower(), 1)))
+    return values, imperial
+
+
+def zh_numbers(text: str) -> Set[float]:
+    """Numeric values in Chinese text (1.5亿 -> 150000000)"""
+    return {_value(match.group(1), _ZH_MULTIPLIERS.get(match.group(2) or '', 1))
+            for match in _ZH_NUMBER.finditer(text)}
+
+
+def unit_families(text: str, side: int) -> Set[str]:
+    """Unit families mentioned in text (side 0 = EN patterns, 1 = ZH)"""
+    return {name for name, patterns in _UNIT_PATTERNS.items() if patterns[side].search(text)}
+
+
+def en_entities(text: str) -> Set[str]:
+    return {token.rstrip('s') if token.isupper() or token[:-1].isupper() else token
+            for token in _LATIN_TOKEN.findall(text)}
+
+
+def zh_latin(text: str) -> Set[str]:
+    return set(_ZH_LATIN.findall(text))
+
+
+def _fold(text: str) -> str:
+    """Lowercase alphanumerics only (Wi-Fi == WiFi)"""
+    return re.sub(r'[^a-z0-9]', '', text.lower())
+
+
+def _tokens(text_en: str, text_zh: str) -> Tuple[Set, Set]:
+    """Language-neutral tokens (numbers + Latin tokens) on each side"""
+    return (en_numbers(text_en)[0] | {t.lower() for t in en_entities(text_en)},
+            zh_numbers(text_zh) | {t.lower() for t in zh_latin(text_zh)})
+
+
+def _is_small(value: float) -> bool:
+    # Small integers are routinely written as words (两, three) on one side
+    return value <= 10 and value == int(value)
+
+
+def _fields(question: Dict) -> List[Tuple[str, str, str, str]]:
+    """(kind, label, en, zh) for every translated field"""
+    rows = [('question', 'question', question.get('question_en', ''), question.get('question_zh', ''))]
+    for kind, key in (('choice', 'choices'), ('explanation', 'explanations')):
+        for i, (en, zh) in enumerate(zip(question.get(f'{key}_en') or [], question.get(f'{key}_zh') or [])):
+            rows.append((kind, f'{kind} {i + 1}', en, zh))
+    return rows
+
+
+def _text_length(text: str) -> int:
+    return len(re.sub(r'\s+', '', text))
+
+
+def check_question(question: Dict, filename: str = '') -> Tuple[ConsistencyReport, List[Tuple[str, str, float]]]:
+    """
+    Field-level signals for one question
+
+    Returns:
+        (report without length findings, [(kind, label, log length ratio)])
+    """
+    report = ConsistencyReport(question.get('id', '?'), filename, question.get('question_en', ''))
+
+    # Structure
+    for key in ('question_zh', 'choices_zh', 'explanations_zh'):
+        value = question.get(key)
+        if not value or (isinstance(value, list) and not all(isinstance(v, str) and v.strip() for v in value)):
+            report.add('structure', f"{key} missing or empty")
+    for key in ('choices', 'explanations'):
+        en, zh = question.get(f'{key}_en') or [], question.get(f'{key}_zh') or []
+        if len(en) != len(zh):
+            report.add('structure', f"{len(en)} {key}_en vs {len(zh)} {key}_zh")
+
+    stored = question.get('translation_source_hash')
+    if stored and stored != source_hash(question):
+        report.add('source', "English changed since the last translation")
+
+    # Verdicts: EN vs ZH, and ZH vs correct_answer
+    correct = question.get('correct_answer')
+    for i, (en, zh) in enumerate(zip(question.get('explanations_en') or [],
+                                     question.get('explanations_zh') or [])):
+        verdict_en, verdict_zh = en_verdict(en), zh_verdict(zh)
+        if verdict_zh is None:
+            continue
+        if verdict_en is not None and verdict_en != verdict_zh:
+            report.add('verdict', f"explanation {i + 1}: EN says {'correct' if verdict_en else 'wrong'}, "
+                                  f"ZH says {'correct' if verdict_zh else 'wrong'}")
+        elif isinstance(correct, int) and verdict_zh != (i == correct):
+            report.add('verdict', f"explanation {i + 1}: ZH says {'correct' if verdict_zh else 'wrong'} "
+                                  f"but correct_answer is {correct + 1}")
+
+    # Choice order: a choice's distinguishing tokens match a different ZH choice
+    choices = list(zip(question.get('choices_en') or [], question.get('choices_zh') or []))
+    tokens = [_tokens(en, zh) for en, zh in choices]
+    for i, (en_tokens, zh_tokens) in enumerate(tokens):
+        if not en_tokens or en_tokens & zh_tokens:
+            continue
+        for j, (_, other_zh) in enumerate(tokens):
+            if j != i and en_tokens & other_zh:
+                report.add('order', f"choice {i + 1} matches ZH choice {j + 1}")
+                break
+
+    ratios = []
+    for kind, label, en, zh in _fields(question):
+        if not en or not zh:
+            continue
+        if not _CJK.search(zh):
+            report.add('untranslated', f"{label} has no Chinese text")
+            continue
+
+        values_en, imperial = en_numbers(en)
+        values_zh = zh_numbers(zh)
+        missing = sorted(v for v in values_en - values_zh if not _is_small(v))
+        extra = [] if imperial else sorted(v for v in values_zh - values_en if not _is_small(v))
+        if missing or extra:
+            parts = []
+            if missing:
+                parts.append(f"EN only {', '.join(f'{v:,.10g}' for v in missing)}")
+            if extra:
+                parts.append(f"ZH only {', '.join(f'{v:,.10g}' for v in extra)}")
+            report.add('numbers', f"{label}: {'; '.join(parts)}")
+
+        units = unit_families(en, 0) - unit_families(zh, 1)
+        if units:
+            report.add('units', f"{label}: {', '.join(sorted(units))} not in ZH")
+
+        # Latin tokens in ZH (DNA, GPS, Wi-Fi) come from the English text, so one
+        # missing from EN suggests the EN was edited; the reverse is normal
+        # (CO2 -> 二氧化碳, UV -> 紫外线)
+        en_folded = _fold(en)
+        stale_entities = sorted(t for t in zh_latin(zh) if len(t) > 1 and _fold(t) not in en_folded)
+        if stale_entities:
+            report.add('entities', f"{label}: ZH only {', '.join(stale_entities)}")
+
+        ratios.append((kind, label, math.log(_text_length(zh) / max(_text_length(en), 1))))
+
+    return report, ratios
+
+
+def check_corpus(corpus: Optional[Corpus] = None, length_z: float = LENGTH_Z) -> List[ConsistencyReport]:
+    """
+    Check every question in the bank
+
+    Returns:
+        Reports for all questions, highest score first
+    """
+    corpus = corpus or Corpus()
+    reports: List[ConsistencyReport] = []
+    columns: Dict[str, List[Tuple[int, str, float]]] = {kind: [] for kind in FIELD_KINDS}
+
+    for path in corpus.files():
+        for question in corpus.open(path).iter_questions():
+            report, ratios = check_question(question, path.name)
+            for kind, label, ratio in ratios:
+                columns[kind].append((len(reports), label, ratio))
+            reports.append(report)
+
+    # Length ratios: robust z-score against the corpus norm per field kind
+    for kind, rows in columns.items():
+        if len(rows) < 10:
+            continue
+        values = [ratio for _, _, ratio in rows]
+        center = median(values)
+        spread = median(abs(v - center) for v in values) * 1.4826 or 1e-9
+        for index, label, ratio in rows:
+            z = (ratio - center) / spread
+            if abs(z) > length_z:
+                report = reports[index]
+                report.add('length', f"{label}: ZH is {math.exp(ratio - center):.1f}x the usual length")
+
+    reports.sort(key=lambda r: (-r.score, r.file, r.question_id))
+    return reports
+
+
+def write_queue(reports: List[ConsistencyReport], path: Optional[Path] = None,
+                min_score: int = MIN_SCORE) -> List[Dict]:
+    """
+    Write the retranslation queue (questions at or above min_score)
+
+    Returns:
+        Queue entries, highest priority first
+    """
+    path = Path(path) if path else QUEUE_PATH
+    queue = [report.to_dict() for report in reports if report.score >= min_score]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'min_score': min_score, 'questions': queue}, f, indent=2, ensure_ascii=False)
+    tmp.replace(path)
+    return queue
+
+
+def load_queue(path: Optional[Path] = None) -> Dict[str, Set[str]]:
+    """
+    Read a retranslation queue
+
+    Returns:
+        {filename: {question ids}}
+    """
+    path = Path(path) if path else QUEUE_PATH
+    with open(path, 'r', encoding='utf-8') as f:
+        queue = json.load(f)
+    by_file: Dict[str, Set[str]] = {}
+    for entry in queue['questions']:
+        by_file.setdefault(entry['file'], set()).add(entry['id'])
+    return by_file
+
+
+# CLI for testing
+if __name__ == '__main__':
+    for report in check_corpus()[:15]:
+        print(f"{report.score:4}  {report.question_id}: {report.question_en}")
+        for kind, detail in report.findings:
+            print(f"        {kind:12} {detail}")
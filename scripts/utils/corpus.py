@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Corpus Loader - Shared access to the question category files
+
+Every script reads src/data/questions/*.json. This module gives them one
+place to find that directory, read category files (through the binary
+snapshot in utils/snapshot.py when available) and write them back.
+
+Snapshots live under data/cache/questions/ and are rebuilt automatically
+whenever a source JSON changes. Set MILLIONWHYS_SNAPSHOTS=0 to bypass them.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    from .snapshot import QuestionSnapshot, build_snapshot
+except ImportError:  # Run directly as a script
+    from snapshot import QuestionSnapshot, build_snapshot
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_QUESTIONS_DIR = PROJECT_ROOT / 'src' / 'data' / 'questions'
+SNAPSHOT_DIR = PROJECT_ROOT / 'data' / 'cache' / 'questions'
+
+# English fields a Chinese translation is made from (see source_hash)
+TRANSLATION_SOURCE_FIELDS = ('question_en', 'choices_en', 'explanations_en', 'correct_answer')
+
+# Open snapshots, reused while their source file is unchanged
+_snapshots: Dict[Path, QuestionSnapshot] = {}
+
+
+def snapshots_enabled() -> bool:
+    """Whether category reads should go through binary snapshots"""
+    return os.getenv('MILLIONWHYS_SNAPSHOTS', '1') != '0'
+
+
+def find_questions_dir(scripts_dir: Optional[Path] = None) -> Path:
+    """
+    Locate the questions directory
+
+    Supports different project structures:
+    1. src/data/questions (Next.js optimized structure)
+    2. data/questions (fallback)
+    3. The scripts directory itself (legacy)
+    """
+    if scripts_dir is None:
+        scripts_dir = Path(__file__).resolve().parent.parent
+
+    questions_dir = scripts_dir.parent / 'src' / 'data' / 'questions'
+    if not questions_dir.exists():
+        questions_dir = scripts_dir.parent / 'data' / 'questions'
+        if not questions_dir.exists():
+            questions_dir = scripts_dir
+    return questions_dir
+
+
+def snapshot_path_for(json_path: Union[str, Path]) -> Path:
+    """Cache location of the snapshot mirroring json_path"""
+    json_path = Path(json_path).resolve()
+    # Directory hash keeps files with the same name in different trees apart
+    dir_key = hashlib.sha1(str(json_path.parent).encode('utf-8')).hexdigest()[:8]
+    return SNAPSHOT_DIR / f"{json_path.stem}-{dir_key}.mwq"
+
+
+def open_snapshot(json_path: Union[str, Path], data: Optional[Dict] = None) -> Optional[QuestionSnapshot]:
+    """
+    Get an up-to-date snapshot for a category file, rebuilding it if stale
+
+    Args:
+        json_path: Category JSON file
+        data: Parsed contents of json_path, if already in memory
+
+    Returns:
+        Open snapshot, or None if snapshots are disabled or unusable here
+        (e.g. read-only checkout)
+
+    Raises:
+        json.JSONDecodeError: If the source file is not valid JSON
+    """
+    if not snapshots_enabled():
+        return None
+
+    json_path = Path(json_path).resolve()
+    cached = _snapshots.get(json_path)
+    if cached is not None:
+        if cached.is_fresh_for(json_path):
+            return cached
+        cached.close()
+        del _snapshots[json_path]
+
+    snap_path = snapshot_path_for(json_path)
+    try:
+        if snap_path.exists():
+            try:
+                snap = QuestionSnapshot(snap_path)
+                if snap.is_fresh_for(json_path):
+                    _snapshots[json_path] = snap
+                    return snap
+                snap.close()
+            except ValueError:
+                pass  # Old format or partial write - rebuild below
+
+        build_snapshot(json_path, snap_path, data=data)
+        snap = QuestionSnapshot(snap_path)
+    except json.JSONDecodeError:
+        raise
+    except (OSError, ValueError):
+        return None
+
+    _snapshots[json_path] = snap
+    return snap
+
+
+class JsonCategory:
+    """Fallback category reader backed by a parsed JSON dict"""
+
+    def __init__(self, data: Dict):
+        self.data = data
+        self.category_en = data.get('category_en', '')
+        self.category_zh = data.get('category_zh', '')
+        self._questions = data.get('questions', []) or []
+
+    def __len__(self) -> int:
+        return len(self._questions)
+
+    def ids(self) -> List[str]:
+        return [str(q.get('id', '')) for q in self._questions]
+
+    def question(self, index: int) -> Dict:
+        return self._questions[index]
+
+    def iter_questions(self) -> Iterator[Dict]:
+        return iter(self._questions)
+
+    def difficulty_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for q in self._questions:
+            difficulty = q.get('difficulty') or 'unknown'
+            counts[difficulty] = counts.get(difficulty, 0) + 1
+        return counts
+
+    def to_dict(self) -> Dict:
+        return self.data
+
+
+def open_category(json_path: Union[str, Path]) -> Union[QuestionSnapshot, JsonCategory]:
+    """
+    Open a category file for reading
+
+    Both return types expose category_en, category_zh, len(), ids(),
+    question(i) and iter_questions().
+
+    Raises:
+        FileNotFoundError: If json_path does not exist
+        json.JSONDecodeError: If json_path is not valid JSON
+    """
+    json_path = Path(json_path)
+    if not json_path.exists():
+        raise FileNotFoundError(f"Category file not found: {json_path}")
+
+    snap = open_snapshot(json_path)
+    if snap is not None:
+        return snap
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return JsonCategory(json.load(f))
+
+
+def load_category(json_path: Union[str, Path]) -> Dict:
+    """Load a category file as a dict, equivalent to json.load()"""
+    return open_category(json_path).to_dict()
+
+
+def dump_category(data: Dict) -> str:
+    """A category dict in the repo's canonical file format"""
+    return json.dumps(data, indent=2, ensure_ascii=False) + '\n'  # Add final newline
+
+
+def save_category(json_path: Union[str, Path], data: Dict):
+    """
+    Write a category file in the repo's canonical format and refresh its snapshot
+
+    The JSON is written to a temporary file and renamed into place, so a
+    failure never leaves a half-written category file behind.
+    """
+    json_path = Path(json_path)
+    tmp_path = json_path.with_name(f".{json_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(dump_category(data))
+        os.replace(tmp_path, json_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    open_snapshot(json_path, data=data)
+
+
+def source_hash(question: Dict) -> str:
+    """
+    Short hash of a question's English source fields
+
+    Stored as translation_source_hash whenever the Chinese fields are
+    (re)translated, so edits to the English can be detected later.
+    correct_answer is included because it decides the 对啦/错啦 prefixes.
+    """
+    payload = json.dumps([question.get(field) for field in TRANSLATION_SOURCE_FIELDS],
+                         ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def translation_is_stale(question: Dict) -> bool:
+    """True if the English changed since the last translation (or was never hashed)"""
+    return question.get('translation_source_hash') != source_hash(question)
+
+
+def iter_category_files(questions_dir: Optional[Path] = None) -> List[Path]:
+    """All category JSON files, sorted by name"""
+    if questions_dir is None:
+        questions_dir = find_questions_dir()
+    return [p for p in sorted(Path(questions_dir).glob('*.json')) if p.name != 'package.json']
+
+
+class Corpus:
+    """
+    Category files loaded once and shared by every step in a process
+
+    Parsed category dicts are cached by path and reused until the file
+    changes on disk; writes made through save() update the cache directly.
+    """
+
+    def __init__(self, questions_dir: Optional[Path] = None):
+        """
+        Initialize corpus
+
+        Args:
+            questions_dir: Path to questions directory. If None, discovered
+                           with find_questions_dir().
+        """
+        self.questions_dir = Path(questions_dir) if questions_dir else find_questions_dir()
+        self._cache: Dict[Path, Tuple[int, int, Dict]] = {}
+
+    def files(self) -> List[Path]:
+        """All category JSON files, sorted by name"""
+        return iter_category_files(self.questions_dir)
+
+    def resolve(self, name: Union[str, Path]) -> Optional[Path]:
+        """
+        Resolve a file argument the way the scripts always have
+
+        Tries the path as given (absolute or relative to CWD), then just the
+        filename inside the questions directory.
+        """
+        path = Path(name)
+        if path.exists():
+            return path
+        candidate = self.questions_dir / path.name
+        return candidate if candidate.exists() else None
+
+    def open(self, path: Union[str, Path]) -> Union[QuestionSnapshot, JsonCategory]:
+        """Open a category for lazy reading (see open_category)"""
+        return open_category(path)
+
+    def load(self, path: Union[str, Path]) -> Dict:
+        """
+        Full category dict, parsed at most once per on-disk version
+
+        Raises:
+            FileNotFoundError: If path does not exist
+            json.JSONDecodeError: If path is not valid JSON
+        """
+        key = Path(path).resolve()
+        stat = key.stat()
+        cached = self._cache.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        data = load_category(key)
+        self._cache[key] = (stat.st_mtime_ns, stat.st_size, data)
+        return data
+
+    def save(self, path: Union[str, Path], data: Dict):
+        """Write a category file (see save_category) and keep it cached"""
+        key = Path(path).resolve()
+        save_category(key, data)
+        self.remember(key, data)
+
+    def remember(self, path: Union[str, Path], data: Dict):
+        """Cache data as the current contents of path, after it was written elsewhere"""
+        key = Path(path).resolve()
+        stat = key.stat()
+        self._cache[key] = (stat.st_mtime_ns, stat.st_size, data)
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import sys
+    import time
+
+    questions_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else find_questions_dir()
+    start = time.perf_counter()
+    total = 0
+    for path in iter_category_files(questions_dir):
+        category = open_category(path)
+        total += len(category)
+        print(f"  {path.name:28} {len(category):6} questions  ({type(category).__name__})")
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\nTotal: {total} questions in {elapsed:.1f} ms")
@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Detection - MinHash signatures with an LSH index
+
+Each question gets two MinHash signatures:
+- question: unigrams and bigrams of question_en's content words, so
+  "Why do cats purr?" and "Why do cats purr when happy?" collide
+- content: word 3-grams of choices_en + explanations_en, for rewordings
+  that keep the same answers
+
+Signatures are split into LSH bands stored in SQLite
+(data/cache/dedup-*.sqlite3), so a lookup touches only the questions that
+share a band instead of comparing against the whole bank. The index is
+refreshed per category file when the file's mtime/size change.
+"""
+
+import hashlib
+import random
+import re
+import sqlite3
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+try:
+    from .corpus import PROJECT_ROOT, Corpus
+except ImportError:  # Run directly as a script
+    from corpus import PROJECT_ROOT, Corpus
+
+CACHE_DIR = PROJECT_ROOT / 'data' / 'cache'
+SCHEMA_VERSION = 1
+
+# 32 bands of 4 rows: pairs at Jaccard 0.5 share a band with ~87% probability,
+# at 0.6 with ~99%, while pairs below ~0.3 rarely become candidates
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+
+# Estimated Jaccard similarity at or above which two questions are reported
+THRESHOLD = 0.5
+
+# Draft batches at least this large are hashed and compared with NumPy
+BULK_DRAFTS = 64
+
+_MASK64 = (1 << 64) - 1
+_EMPTY = 0xFFFFFFFF  # Signature of an empty shingle set (all slots)
+_rng = random.Random(0x6D77)
+_A = [_rng.randrange(1 << 64) | 1 for _ in range(NUM_PERM)]  # Odd multipliers
+_B = [_rng.randrange(1 << 64) for _ in range(NUM_PERM)]
+
+# NumPy module once bulk hashing is enabled, False if unavailable
+_np = None
+
+_WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+STOPWORDS = frozenset(
+    'a an the do does did is are was were be been why how what when which who '
+    'of in on at to for from by with and or it its this that these those some '
+    'we you us they i my our your their them can so than then there'.split()
+)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS questions (
+    id TEXT PRIMARY KEY,
+    file TEXT NOT NULL,
+    question_en TEXT NOT NULL,
+    question_sig BLOB NOT NULL,
+    content_sig BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS bands (
+    kind TEXT NOT NULL,
+    band INTEGER NOT NULL,
+    hash INTEGER NOT NULL,
+    id TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS bands_lookup ON bands (kind, band, hash);
+CREATE INDEX IF NOT EXISTS questions_file ON questions (file);
+'''
+
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def question_shingles(question_en: str) -> Set[str]:
+    """Unigrams and bigrams of a question's content words (stopwords dropped)"""
+    words = [word for word in _words(question_en) if word not in STOPWORDS]
+    shingles = set(words)
+    shingles.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return shingles
+
+
+def content_shingles(question: Dict) -> Set[str]:
+    """Word 3-grams of the English choices and explanations"""
+    shingles = set()
+    for text in [*question.get('choices_en', []), *question.get('explanations_en', [])]:
+        words = _words(text)
+        if len(words) < 3:
+            if words:
+                shingles.add(' '.join(words))
+            continue
+        shingles.update(' '.join(words[i:i + 3]) for i in range(len(words) - 2))
+    return shingles
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'little')
+
+
+def minhash(shingles: Iterable[str]) -> Tuple[int, ...]:
+    """
+    MinHash signature: for NUM_PERM multiply-shift hashes
+    ((a*h + b) mod 2^64) >> 32, the minimum over the shingle hashes h
+    """
+    hashes = [_shingle_hash(s) for s in shingles]
+    if not hashes:
+        return (_EMPTY,) * NUM_PERM
+
+    np = _np
+    if not np:
+        return tuple(min(((a * h + b) & _MASK64) >> 32 for h in hashes) for a, b in zip(_A, _B))
+
+    # uint64 array arithmetic wraps mod 2^64, matching the masked version above
+    h = np.array(hashes, dtype=np.uint64)
+    a = np.array(_A, dtype=np.uint64)[:, None]
+    b = np.array(_B, dtype=np.uint64)[:, None]
+    return tuple(int(x) for x in ((a * h + b) >> np.uint64(32)).min(axis=1))
+
+
+def _enable_numpy():
+    """
+    Vectorize minhash() with NumPy for bulk (re-)indexing
+
+    Checking a handful of drafts stays pure Python: importing NumPy costs
+    more than hashing them.
+    """
+    global _np
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = False
+
+
+def _is_empty(signature: Sequence[int]) -> bool:
+    return signature[0] == _EMPTY and signature[-1] == _EMPTY
+
+
+def similarity(sig_a: Sequence[int], sig_b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    if _is_empty(sig_a) or _is_empty(sig_b):
+        return 0.0  # Empty shingle sets are never duplicates
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM
+
+
+def question_signatures(question: Dict) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """(question text signature, choices + explanations signature)"""
+    return minhash(question_shingles(question.get('question_en', ''))), minhash(content_shingles(question))
+
+
+def band_hashes(signature: Sequence[int]) -> List[int]:
+    """One signed 64-bit hash per LSH band (SQLite INTEGER range)"""
+    hashes = []
+    for band in range(BANDS):
+        chunk = array('I', signature[band * ROWS:(band + 1) * ROWS]).tobytes()
+        hashes.append(int.from_bytes(hashlib.blake2b(chunk, digest_size=8).digest(), 'little', signed=True))
+    return hashes
+
+
+@dataclass
+class DuplicateMatch:
+    """An indexed question similar to the one being checked"""
+    id: str
+    file: str
+    question_en: str
+    question_similarity: float
+    content_similarity: float
+
+    @property
+    def score(self) -> float:
+        return max(self.question_similarity, self.content_similarity)
+
+
+class DedupIndex:
+    """
+    Persistent MinHash/LSH index over the question bank
+
+    Usage:
+        index = DedupIndex()
+        index.refresh()                 # Re-index changed category files
+        index.find(draft_dict)          # -> [DuplicateMatch, ...]
+    """
+
+    def __init__(self, corpus: Optional[Corpus] = None, path: Optional[Path] = None):
+        """
+        Args:
+            corpus: Question bank (default: auto-discovered)
+            path: Index database (default: data/cache/dedup-<dir hash>.sqlite3)
+        """
+        self.corpus = corpus or Corpus()
+        if path is None:
+            # Directory hash keeps indexes of different question trees apart
+            dir_key = hashlib.sha1(str(self.corpus.questions_dir.resolve()).encode('utf-8')).hexdigest()[:8]
+            path = CACHE_DIR / f"dedup-{dir_key}.sqlite3"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            # Signature scheme changed; the index is a cache, so rebuild it
+            self.conn.executescript('DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS questions; '
+                                    'DROP TABLE IF EXISTS bands;')
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM questions').fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> int:
+        """
+        Re-index category files that changed since the last refresh
+
+        Returns:
+            Number of questions (re-)indexed
+        """
+        indexed = {name: (mtime_ns, size) for name, mtime_ns, size in
+                   self.conn.execute('SELECT name, mtime_ns, size FROM files')}
+        current = {}
+        for path in self.corpus.files():
+            st = path.stat()
+            current[path.name] = (path, st.st_mtime_ns, st.st_size)
+
+        updated = 0
+        with self.conn:
+            for name in set(indexed) - set(current):
+                self._drop_file(name)
+            for name, (path, mtime_ns, size) in current.items():
+                if indexed.get(name) == (mtime_ns, size):
+                    continue
+                _enable_numpy()
+                self._drop_file(name)
+                for question in self.corpus.open(path).iter_questions():
+                    self._insert(question, name)
+                    updated += 1
+                self.conn.execute('INSERT OR REPLACE INTO files (name, mtime_ns, size) VALUES (?, ?, ?)',
+                                  (name, mtime_ns, size))
+        return updated
+
+    def _drop_file(self, name: str):
+        self.conn.execute('DELETE FROM bands WHERE id IN (SELECT id FROM questions WHERE file = ?)', (name,))
+        self.conn.execute('DELETE FROM questions WHERE file = ?', (name,))
+        self.conn.execute('DELETE FROM files WHERE name = ?', (name,))
+
+    def _insert(self, question: Dict, filename: str):
+        question_sig, content_sig = question_signatures(question)
+        self.conn.execute(
+            'INSERT OR REPLACE INTO questions (id, file, question_en, question_sig, content_sig) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (question['id'], filename, question.get('question_en', ''),
+             array('I', question_sig).tobytes(), array('I', content_sig).tobytes()))
+        self.conn.execute('DELETE FROM bands WHERE id = ?', (question['id'],))
+        rows = []
+        for kind, signature in (('q', question_sig), ('c', content_sig)):
+            if _is_empty(signature):
+                continue
+            rows.extend((kind, band, value, question['id'])
+                        for band, value in enumerate(band_hashes(signature)))
+        self.conn.executemany('INSERT INTO bands (kind, band, hash, id) VALUES (?, ?, ?, ?)', rows)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def _candidates(self, kind: str, signature: Sequence[int]) -> Set[str]:
+        if _is_empty(signature):
+            return set()
+        ids = set()
+        for band, value in enumerate(band_hashes(signature)):
+            ids.update(row[0] for row in self.conn.execute(
+                'SELECT id FROM bands WHERE kind = ? AND band = ? AND hash = ?', (kind, band, value)))
+        return ids
+
+    def _signatures(self, question_id: str) -> Optional[Tuple]:
+        row = self.conn.execute(
+            'SELECT file, question_en, question_sig, content_sig FROM questions WHERE id = ?',
+            (question_id,)).fetchone()
+        if row is None:
+            return None
+        file, question_en, question_sig, content_sig = row
+        return file, question_en, array('I', question_sig), array('I', content_sig)
+
+    def find(self, question: Dict, threshold: float = THRESHOLD,
+             signatures: Optional[Tuple[Sequence[int], Sequence[int]]] = None) -> List[DuplicateMatch]:
+        """
+        Indexed questions similar to question (a draft or question dict)
+
+        Args:
+            signatures: question_signatures(question), if already computed
+
+        Returns:
+            Matches at or above threshold, most similar first
+        """
+        question_sig, content_sig = signatures or question_signatures(question)
+
+        candidates = self._candidates('q', question_sig) | self._candidates('c', content_sig)
+        candidates.discard(question.get('id'))
+
+        matches = []
+        for candidate in candidates:
+            indexed = self._signatures(candidate)
+            if indexed is None:
+                continue
+            file, question_en, other_question_sig, other_content_sig = indexed
+            match = DuplicateMatch(
+                id=candidate,
+                file=file,
+                question_en=question_en,
+                question_similarity=similarity(question_sig, other_question_sig),
+                content_similarity=similarity(content_sig, other_content_sig),
+            )
+            if match.score >= threshold:
+                matches.append(match)
+
+        matches.sort(key=lambda m: (-m.score, m.id))
+        return matches
+
+    def duplicate_pairs(self, threshold: float = THRESHOLD) -> List[Tuple[DuplicateMatch, DuplicateMatch]]:
+        """
+        All near-duplicate pairs within the bank (via shared LSH buckets)
+
+        Returns:
+            (a, b) pairs with b's similarity to a, most similar first
+        """
+        candidate_pairs = set()
+        bucket_rows = self.conn.execute(
+            'SELECT kind, band, hash, group_concat(id, char(31)) FROM bands '
+            'GROUP BY kind, band, hash HAVING COUNT(*) > 1')
+        for _, _, _, ids in bucket_rows:
+            members = sorted(set(ids.split('\x1f')))
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    candidate_pairs.add((a, b))
+
+        pairs = []
+        for a, b in candidate_pairs:
+            sig_a, sig_b = self._signatures(a), self._signatures(b)
+            if sig_a is None or sig_b is None:
+                continue
+            match = DuplicateMatch(
+                id=b,
+                file=sig_b[0],
+                question_en=sig_b[1],
+                question_similarity=similarity(sig_a[2], sig_b[2]),
+                content_similarity=similarity(sig_a[3], sig_b[3]),
+            )
+            if match.score >= threshold:
+                pairs.append((DuplicateMatch(a, sig_a[0], sig_a[1], 1.0, 1.0), match))
+
+        pairs.sort(key=lambda pair: (-pair[1].score, pair[0].id, pair[1].id))
+        return pairs
+
+
+def check_drafts(drafts: List[Dict], corpus: Optional[Corpus] = None,
+                 threshold: float = THRESHOLD) -> Dict[int, List[DuplicateMatch]]:
+    """
+    Check draft questions against the bank and against each other
+
+    Args:
+        drafts: Draft question dicts (question_en, choices_en, explanations_en)
+        corpus: Question bank (default: auto-discovered)
+        threshold: Minimum estimated Jaccard similarity to report
+
+    Returns:
+        {draft index: matches} for drafts with at least one match
+    """
+    if len(drafts) >= BULK_DRAFTS:
+        _enable_numpy()
+    signatures = [question_signatures(d) for d in drafts]
+
+    results: Dict[int, List[DuplicateMatch]] = {}
+    with DedupIndex(corpus) as index:
+        index.refresh()
+        for i, draft in enumerate(drafts):
+            matches = index.find(draft, threshold, signatures[i])
+            if matches:
+                results[i] = matches
+
+    # Within the batch: every pair, exactly (no LSH misses)
+    for i, j, question_similarity, content_similarity in _similar_pairs(signatures, threshold):
+        results.setdefault(i, []).append(DuplicateMatch(
+            id=f"draft #{j + 1}",
+            file='this draft',
+            question_en=drafts[j].get('question_en', ''),
+            question_similarity=question_similarity,
+            content_similarity=content_similarity,
+        ))
+    return results
+
+
+def _similar_pairs(signatures: List[Tuple[Sequence[int], Sequence[int]]],
+                   threshold: float) -> Iterator[Tuple[int, int, float, float]]:
+    """(i, j, question similarity, content similarity) for j < i at or above threshold, by i then j"""
+    np = _np
+    if not np or len(signatures) < 2:
+        for i in range(len(signatures)):
+            for j in range(i):
+                question_similarity = similarity(signatures[i][0], signatures[j][0])
+                content_similarity = similarity(signatures[i][1], signatures[j][1])
+                if max(question_similarity, content_similarity) >= threshold:
+                    yield i, j, question_similarity, content_similarity
+        return
+
+    # Slot-equality counts against all earlier drafts at once; empty
+    # signatures never match (see similarity())
+    kinds = []
+    for k in (0, 1):
+        sigs = np.array([sig[k] for sig in signatures], dtype=np.uint32)
+        empty = (sigs[:, 0] == _EMPTY) & (sigs[:, -1] == _EMPTY)
+        kinds.append((sigs, empty))
+    for i in range(1, len(signatures)):
+        scores = []
+        for sigs, empty in kinds:
+            score = (sigs[:i] == sigs[i]).sum(axis=1) / NUM_PERM
+            score[empty[:i]] = 0.0
+            if empty[i]:
+                score[:] = 0.0
+            scores.append(score)
+        for j in np.nonzero(np.maximum(scores[0], scores[1]) >= threshold)[0]:
+            yield i, int(j), float(scores[0][j]), float(scores[1][j])
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import sys
+
+    with DedupIndex() as index:
+        print(f"Indexed {index.refresh()} questions ({len(index)} total)")
+        if len(sys.argv) > 1:
+            for match in index.find({'question_en': ' '.join(sys.argv[1:])}):
+                print(f"  {match.score:.2f}  {match.id}: {match.question_en}")
+        else:
+            for a, b in index.duplicate_pairs():
+                print(f"  {b.score:.2f}  {a.id} ~ {b.id}: {a.question_en} | {b.question_en}")
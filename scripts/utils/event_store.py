@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Event Store - Columnar copy of the quiz answer log
+
+Converts data/logs/quiz_answers.jsonl into fixed-width column files under
+data/cache/events/ so aggregations never materialize per-event dicts:
+
+    timestamp.i64   int64 milliseconds since the epoch (NO_TIMESTAMP if missing)
+    session.u32     dictionary codes for sessionId
+    question.u32    dictionary codes for questionId
+    category.u16    dictionary codes for category
+    difficulty.u16  dictionary codes for difficulty
+    language.u16    dictionary codes for language
+    correct.bits    isCorrect, bit-packed (LSB first)
+
+meta.json holds the event count, the dictionaries (code -> value), the
+log cursor and the logs directory it reads, and is replaced last on every
+refresh, so a crashed refresh leaves the previous state readable.
+Refreshes append only the new lines.
+
+Group-bys use NumPy (np.bincount over memory-mapped columns) when it is
+installed, and fall back to C-level Counter passes otherwise.
+"""
+
+import json
+import mmap
+import os
+import sys
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+from itertools import chain, compress
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .corpus import PROJECT_ROOT
+    from .log_analytics import ANSWERS_LOG, LOGS_DIR, JsonlReader, consume_log, event_key, history_files
+except ImportError:  # Run directly as a script
+    from corpus import PROJECT_ROOT
+    from log_analytics import ANSWERS_LOG, LOGS_DIR, JsonlReader, consume_log, event_key, history_files
+
+EVENTS_DIR = PROJECT_ROOT / 'data' / 'cache' / 'events'
+META_FILE = 'meta.json'
+STORE_VERSION = 2  # 2: naive timestamps are UTC, not local time
+
+NO_TIMESTAMP = -(2 ** 63)
+
+# Column name -> (file name, array typecode)
+COLUMNS = {
+    'timestamp': ('timestamp.i64', 'q'),
+    'session': ('session.u32', 'I'),
+    'question': ('question.u32', 'I'),
+    'category': ('category.u16', 'H'),
+    'difficulty': ('difficulty.u16', 'H'),
+    'language': ('language.u16', 'H'),
+}
+CORRECT_FILE = 'correct.bits'
+
+# Dictionary-encoded column -> event field
+ENCODED = {
+    'session': 'sessionId',
+    'question': 'questionId',
+    'category': 'category',
+    'difficulty': 'difficulty',
+    'language': 'language',
+}
+
+# Byte -> its 8 bits, LSB first (pure-Python unpacking)
+_BITS = [tuple((byte >> i) & 1 for i in range(8)) for byte in range(256)]
+
+if sys.byteorder != 'little':
+    raise ImportError('event_store columns are little-endian; big-endian hosts are not supported')
+
+_np = False  # Not looked up yet
+
+
+def load_numpy():
+    """NumPy module if installed, else None (imported on first query)"""
+    global _np
+    if _np is False:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+    return _np
+
+
+def parse_timestamp(value) -> int:
+    """
+    ISO 8601 timestamp -> epoch milliseconds (NO_TIMESTAMP if unparseable)
+
+    A trailing 'Z' (what Date.toISOString() writes) is accepted, and a
+    timestamp without an offset is taken as UTC, like rollups.event_buckets.
+    """
+    if not isinstance(value, str):
+        return NO_TIMESTAMP
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return NO_TIMESTAMP
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+class _Appender:
+    """Encodes events into in-memory column chunks (the consume_log aggregate)"""
+
+    def __init__(self, dictionaries: Dict[str, List[str]]):
+        self.columns = {name: array(typecode) for name, (_, typecode) in COLUMNS.items()}
+        self.correct: List[bool] = []
+        self.dictionaries = dictionaries
+        self.codes = {name: {value: code for code, value in enumerate(values)}
+                      for name, values in dictionaries.items()}
+
+    def add(self, event: Dict):
+        self.columns['timestamp'].append(parse_timestamp(event.get('timestamp')))
+        for name, field in ENCODED.items():
+            value = event_key(event, field)
+            codes = self.codes[name]
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(codes)
+                self.dictionaries[name].append(value)
+            self.columns[name].append(code)
+        self.correct.append(bool(event.get('isCorrect')))
+
+
+class EventStore:
+    """
+    Columnar, append-only store of answer events
+
+    Usage:
+        store = EventStore()
+        store.refresh()                       # Append new log lines
+        store.group_accuracy('question')      # {questionId: (total, correct)}
+    """
+
+    def __init__(self, path: Optional[Path] = None, logs_dir: Optional[Path] = None):
+        """
+        Args:
+            path: Store directory (default: data/cache/events)
+            logs_dir: Directory with quiz_answers.jsonl (default: data/logs)
+        """
+        self.path = Path(path) if path else EVENTS_DIR
+        self.logs_dir = Path(logs_dir) if logs_dir else LOGS_DIR
+        self.meta = self._load_meta()
+
+    def _load_meta(self) -> Dict:
+        try:
+            with open(self.path / META_FILE, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('version') == STORE_VERSION:
+                return meta
+        except (OSError, ValueError):
+            pass
+        return {'version': STORE_VERSION, 'count': 0, 'cursor': None,
+                'dictionaries': {name: [] for name in ENCODED}}
+
+    def __len__(self) -> int:
+        return self.meta['count']
+
+    def follows(self, logs_dir: Optional[Path] = None) -> bool:
+        """Whether the store was last refreshed from logs_dir (default: its own)"""
+        logs_dir = Path(logs_dir) if logs_dir else self.logs_dir
+        return self.meta.get('logs_dir') == str(logs_dir.resolve())
+
+    def dictionary(self, column: str) -> List[str]:
+        """Code -> value list for a dictionary-encoded column"""
+        return self.meta['dictionaries'][column]
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def refresh(self, rebuild: bool = False) -> Dict:
+        """
+        Append events logged since the last refresh
+
+        A store that has read nothing yet (new, or rebuilt) starts with the
+        segments compaction moved out of the log, then reads the live log.
+
+        Args:
+            rebuild: Drop the store and re-read the whole log
+
+        Returns:
+            Dict with 'added' and rotation/truncation 'notes'
+        """
+        if rebuild:
+            self.meta = self._load_meta()
+            self.meta.update(count=0, cursor=None, dictionaries={name: [] for name in ENCODED})
+
+        notes: list = []
+        count = self.meta['count']
+        appender = _Appender(self.meta['dictionaries'])
+        malformed = 0
+        # No cursor but events stored means the store drained a rotated log
+        # and no new one exists yet; only an empty store reads the history
+        if self.meta['cursor'] is None and count == 0:
+            history = history_files(self.logs_dir, ANSWERS_LOG)
+            for path in history:
+                reader = JsonlReader(path)
+                for event in reader:
+                    appender.add(event)
+                malformed += reader.malformed
+            if history:
+                notes.append(f"{ANSWERS_LOG}: read {len(history)} archived segment(s)")
+        cursor = consume_log(self.logs_dir / ANSWERS_LOG, self.meta['cursor'], appender, notes)
+        if cursor is not None:
+            # Carried in the cursor, like lines drained from a rotated file
+            cursor['malformed'] += malformed
+        added = len(appender.correct)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        for name, (filename, typecode) in COLUMNS.items():
+            chunk = appender.columns[name]
+            with open(self.path / filename, 'ab') as f:
+                # Drop anything a crashed refresh appended past the committed count
+                f.truncate(count * chunk.itemsize)
+                chunk.tofile(f)
+        self._append_bits(count, appender.correct)
+
+        self.meta['count'] = count + added
+        self.meta['cursor'] = cursor
+        self.meta['logs_dir'] = str(self.logs_dir.resolve())
+        tmp_path = self.path / f".{META_FILE}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.meta, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, self.path / META_FILE)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        return {'added': added, 'notes': notes}
+
+    def _append_bits(self, count: int, values: List[bool]):
+        """Pack values onto correct.bits, continuing a partially used last byte"""
+        path = self.path / CORRECT_FILE
+        mode = 'r+b' if path.exists() else 'w+b'
+        with open(path, mode) as f:
+            f.truncate((count + 7) // 8)
+            shift = count % 8
+            current = 0
+            if shift:
+                f.seek(count // 8)
+                current = f.read(1)[0]
+                f.seek(count // 8)
+            packed = bytearray()
+            for value in values:
+                current |= value << shift
+                shift += 1
+                if shift == 8:
+                    packed.append(current)
+                    current, shift = 0, 0
+            if shift:
+                packed.append(current)
+            f.write(packed)
+
+    # ------------------------------------------------------------------
+    # Column access
+    # ------------------------------------------------------------------
+
+    def _map(self, filename: str, nbytes: int):
+        """Read-only buffer over the first nbytes of a column file"""
+        if nbytes == 0:
+            return b''
+        with open(self.path / filename, 'rb') as f:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))[:nbytes]
+
+    def column(self, name: str):
+        """Column as a NumPy array if available, else a typed memoryview"""
+        filename, typecode = COLUMNS[name]
+        n = self.meta['count']
+        buf = self._map(filename, n * array(typecode).itemsize)
+        np = load_numpy()
+        if np is not None:
+            return np.frombuffer(buf, dtype=np.dtype(typecode), count=n)
+        return memoryview(buf).cast(typecode) if n else memoryview(array(typecode))
+
+    def correct(self):
+        """isCorrect per event (NumPy bool array, or an iterator of 0/1)"""
+        n = self.meta['count']
+        buf = self._map(CORRECT_FILE, (n + 7) // 8)
+        np = load_numpy()
+        if np is not None:
+            packed = np.frombuffer(buf, dtype=np.uint8)
+            return np.unpackbits(packed, bitorder='little', count=n).astype(bool)
+        bits = chain.from_iterable(map(_BITS.__getitem__, bytes(buf)))
+        return (bit for _, bit in zip(range(n), bits))
+
+    def _time_mask(self, since: Optional[int], until: Optional[int]):
+        """Row selector for a millisecond time range, or None for all rows"""
+        if since is None and until is None:
+            return None
+        lo = NO_TIMESTAMP + 1 if since is None else since
+        hi = 2 ** 63 - 1 if until is None else until
+        timestamps = self.column('timestamp')
+        np = load_numpy()
+        if np is not None:
+            return (timestamps >= lo) & (timestamps < hi)
+        return [lo <= t < hi for t in timestamps]
+
+    # ------------------------------------------------------------------
+    # Aggregations
+    # ------------------------------------------------------------------
+
+    def group_accuracy(self, by: str = 'question', since: Optional[int] = None,
+                       until: Optional[int] = None) -> Dict[str, Tuple[int, int]]:
+        """
+        Answers and correct answers per value of a column
+
+        Args:
+            by: Dictionary-encoded column (session/question/category/difficulty/language)
+            since, until: Optional epoch-millisecond range [since, until)
+
+        Returns:
+            {value: (total, correct)} for values with at least one answer
+        """
+        if by not in ENCODED:
+            raise ValueError(f"Cannot group by {by}; choose from {', '.join(ENCODED)}")
+        values = self.dictionary(by)
+        codes = self.column(by)
+        correct = self.correct()
+        mask = self._time_mask(since, until)
+
+        np = load_numpy()
+        if np is not None:
+            if mask is not None:
+                codes, correct = codes[mask], correct[mask]
+            totals = np.bincount(codes, minlength=len(values))
+            hits = np.bincount(codes[correct], minlength=len(values))
+            return {values[code]: (int(totals[code]), int(hits[code])) for code in np.flatnonzero(totals)}
+
+        correct = list(correct)
+        if mask is not None:
+            codes = list(compress(codes, mask))
+            correct = list(compress(correct, mask))
+        totals = Counter(codes)
+        hits = Counter(compress(codes, correct))
+        return {values[code]: (total, hits.get(code, 0)) for code, total in totals.items()}
+
+    def session_counts(self, since: Optional[int] = None, until: Optional[int] = None) -> Dict:
+        """
+        Session summary: distinct sessions and the answers-per-session spread
+
+        Returns:
+            {'sessions', 'answers', 'mean', 'max'}
+        """
+        codes = self.column('session')
+        mask = self._time_mask(since, until)
+
+        np = load_numpy()
+        if np is not None:
+            if mask is not None:
+                codes = codes[mask]
+            per_session = np.bincount(codes)
+            per_session = per_session[per_session > 0]
+            sessions, answers = len(per_session), int(per_session.sum())
+            largest = int(per_session.max()) if sessions else 0
+        else:
+            if mask is not None:
+                codes = compress(codes, mask)
+            per_session = Counter(codes)
+            sessions, answers = len(per_session), sum(per_session.values())
+            largest = max(per_session.values(), default=0)
+
+        return {
+            'sessions': sessions,
+            'answers': answers,
+            'mean': round(answers / sessions, 2) if sessions else 0,
+            'max': largest,
+        }
+
+
+# CLI for testing
+if __name__ == '__main__':
+    store = EventStore(logs_dir=Path(sys.argv[1]) if len(sys.argv) > 1 else None)
+    print(store.refresh())
+    print(f"{len(store):,} events")
+    for value, (total, correct) in sorted(store.group_accuracy('category').items()):
+        print(f"  {value:30} {total:>8,} {correct / total * 100:5.1f}%")
+    print(store.session_counts())
@@ -6,10 +6,14 @@ This utility scans existing JSON files and determines the next available
 ID for each category to prevent conflicts.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, Optional
 
+try:
+    from .corpus import DEFAULT_QUESTIONS_DIR, open_category
+except ImportError:  # Run directly as a script
+    from corpus import DEFAULT_QUESTIONS_DIR, open_category
+
 
 class IDManager:
     """Manages automatic ID assignment for questions"""
@@ -69,7 +73,7 @@ class IDManager:
         """
         if data_dir is None:
             # Default to src/data/questions from project root
-            self.data_dir = Path(__file__).parent.parent.parent / 'src' / 'data' / 'questions'
+            self.data_dir = DEFAULT_QUESTIONS_DIR
         else:
             self.data_dir = Path(data_dir)
 
@@ -99,19 +103,16 @@ class IDManager:
         if not json_file.exists():
             return f"{prefix}_001"
 
-        # Read existing questions
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            questions = data.get('questions', [])
+        # Read existing IDs (from the snapshot, without decoding questions)
+        question_ids = open_category(json_file).ids()
 
         # If no questions, start with 001
-        if not questions:
+        if not question_ids:
             return f"{prefix}_001"
 
         # Find highest number
         max_num = 0
-        for q in questions:
-            q_id = q.get('id', '')
+        for q_id in question_ids:
             if q_id.startswith(prefix):
                 try:
                     num = int(q_id.split('_')[1])
@@ -174,9 +175,7 @@ class IDManager:
         # Count existing questions
         question_count = 0
         if filepath.exists():
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                question_count = len(data.get('questions', []))
+            question_count = len(open_category(filepath))
 
         return {
             'category': category,
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Key Terms - TF-IDF term selection for web verification
+
+web_fact_check looks each question's key terms up on Wikipedia. Picking the
+most frequent words of a question wastes those lookups on words that occur
+all over the bank ("water", "body", "light"), so terms are ranked by TF-IDF
+against the whole bank instead:
+
+- Candidates are content words and runs of two or three consecutive content
+  words ("crystal structure", "surface tension") from question_en and the
+  correct explanation. Without a tagger, a run only counts as a phrase when
+  it repeats (say, in the question and again in the explanation) or occurs
+  in at least two questions.
+- Document frequencies come from one pass over every question. Term counts
+  are kept as a sparse (CSR) matrix and scored with NumPy when available.
+- Terms present in more than GENERIC_DF of all questions are never looked up,
+  nor are terms scoring far below the question's best one, so a question
+  may get fewer than MAX_TERMS terms.
+
+The table and every question's terms are cached in
+data/cache/key-terms-<dir hash>.json, keyed by the question text's hash; the
+cache is rebuilt when a category file's mtime/size change.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .corpus import PROJECT_ROOT, Corpus
+except ImportError:  # Run directly as a script
+    from corpus import PROJECT_ROOT, Corpus
+
+CACHE_DIR = PROJECT_ROOT / 'data' / 'cache'
+CACHE_VERSION = 1
+
+# Terms looked up per question (verify_with_wikipedia checks at most 3)
+MAX_TERMS = 3
+# A phrase is a collocation, not a chance word sequence, once this many
+# questions contain it
+MIN_PHRASE_DF = 2
+# Terms in more than this share of questions are too generic to look up
+GENERIC_DF = 0.1
+# Phrases are more specific than their words: each extra word adds this much
+# to a term's score
+PHRASE_BOOST = 0.5
+# Terms scoring below this share of a question's best term are not worth a
+# lookup
+MIN_RELATIVE_SCORE = 0.5
+# Question words describe the topic; they count this much more than
+# explanation words
+QUESTION_WEIGHT = 3
+
+# Anything but English letters, apostrophes and hyphens inside words (so
+# punctuation, digits, dashes) ends a clause, and any phrase in it
+_CLAUSE = re.compile(r"[^a-z\s'-]+|\s-\s")
+_WORD = re.compile(r"[a-z][a-z'-]*[a-z]|[a-z]")
+STOPWORDS = frozenset('''
+a about above after again against all almost also although always am among an and another any
+are around as at away back be because been before being below between both but by can cannot
+could did do does doing done down during each either enough even ever every few for from
+further get gets getting give gives go goes going got had has have having he her here hers him
+his how however i if in into is it its itself just keep keeps kind less let like lot lots made
+make makes making many may me might more most much must my near need needs never no nor not
+now of off often on once one only or other others our out over own part per put quite rather
+really same see seem seems she should show shows since so some something sometimes still such
+take takes than that the their them then there these they thing things this those though
+through thus to too toward towards under until up upon us use used uses using usually very
+was way ways we well were what when where whether which while who whom whose why will with
+within without would yes yet you your
+actually allow allows anywhere called cause caused causes contain contains correct different
+especially fact help helps important instead lets means mostly naturally simply stay stays true
+truly wrong
+'''.split())
+
+
+def question_text(question: Dict) -> Tuple[str, str]:
+    """(question_en, correct explanation) - the text terms are drawn from"""
+    explanations = question.get('explanations_en') or []
+    correct = question.get('correct_answer')
+    explanation = explanations[correct] if isinstance(correct, int) and 0 <= correct < len(explanations) else ''
+    return question.get('question_en', ''), explanation
+
+
+def text_hash(question_en: str, explanation: str) -> str:
+    """Cache key for a question's terms"""
+    payload = f"{question_en}\0{explanation}".encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def candidate_terms(question_en: str, explanation: str) -> Dict[str, int]:
+    """Candidate term -> weighted count (question words count QUESTION_WEIGHT times)"""
+    counts: Dict[str, int] = {}
+    get = counts.get
+    for text, weight in ((question_en, QUESTION_WEIGHT), (explanation, 1)):
+        for clause in _CLAUSE.split(text.lower()):
+            run: List[str] = []
+            for word in _WORD.findall(clause) + ['']:
+                if len(word) >= 3 and word not in STOPWORDS and "'" not in word:
+                    run.append(word)
+                    continue
+                # A stopword, contraction or the clause end closes the run
+                if run:
+                    terms = list(run)
+                    if len(run) > 1:
+                        terms += map(' '.join, zip(run, run[1:]))
+                        terms += map(' '.join, zip(run, run[1:], run[2:]))
+                    for term in terms:
+                        counts[term] = get(term, 0) + weight
+                    run = []
+    return counts
+
+
+class KeyTermIndex:
+    """
+    Document frequencies of candidate terms over a question bank
+
+    Usage:
+        index = KeyTermIndex.open(questions_dir)   # Cached, or built once
+        index.terms(question_dict)                 # -> ['crystal structure', 'ice']
+    """
+
+    def __init__(self, documents: int, df: Dict[str, int], terms: Optional[Dict[str, List[str]]] = None):
+        """
+        Args:
+            documents: Questions in the bank
+            df: Term -> number of questions containing it, for terms in more than one
+            terms: Text hash -> selected terms, for questions already ranked
+        """
+        self.documents = documents
+        self.df = df
+        self._terms = terms or {}
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, questions: Iterable[Dict]) -> 'KeyTermIndex':
+        """Count document frequencies and rank every question's terms in one pass"""
+        # CSR rows: one per question, columns numbered in first-seen order
+        row_terms: List[str] = []
+        indptr, weights = array('q', [0]), array('d')
+        hashes = []
+        for question in questions:
+            question_en, explanation = question_text(question)
+            hashes.append(text_hash(question_en, explanation))
+            counts = candidate_terms(question_en, explanation)
+            row_terms += counts
+            weights.extend(counts.values())
+            indptr.append(len(row_terms))
+
+        names = list(dict.fromkeys(row_terms))
+        vocabulary = dict(zip(names, range(len(names))))
+        indices = array('q', map(vocabulary.__getitem__, row_terms))
+        del row_terms
+        df_counts = _bincount(indices, len(names))
+        index = cls(len(hashes), {term: n for term, n in zip(names, df_counts) if n > 1})
+        ranked = index._rank_matrix(names, df_counts, indptr, indices, weights)
+        index._terms = dict(zip(hashes, ranked))
+        return index
+
+    @classmethod
+    def open(cls, questions_dir: Optional[Path] = None, path: Optional[Path] = None) -> 'KeyTermIndex':
+        """
+        Index for a question tree, from cache when its files are unchanged
+
+        Args:
+            questions_dir: Category files (default: auto-discovered)
+            path: Cache file (default: data/cache/key-terms-<dir hash>.json)
+        """
+        corpus = Corpus(questions_dir)
+        if path is None:
+            # Directory hash keeps caches of different question trees apart
+            dir_key = hashlib.sha1(str(corpus.questions_dir.resolve()).encode('utf-8')).hexdigest()[:8]
+            path = CACHE_DIR / f"key-terms-{dir_key}.json"
+        files = {}
+        for file in corpus.files():
+            st = file.stat()
+            files[file.name] = [st.st_mtime_ns, st.st_size]
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('version') == CACHE_VERSION and cached.get('files') == files:
+                return cls(cached['documents'], cached['df'], cached['terms'])
+        except (OSError, ValueError, KeyError):
+            pass  # Missing or unreadable; it is only a cache
+
+        index = cls.build(q for file in corpus.files() for q in corpus.open(file).iter_questions())
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'files': files, 'documents': index.documents,
+                       'df': index.df, 'terms': index._terms}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        return index
+
+    # ------------------------------------------------------------------
+    # Ranking
+    # ------------------------------------------------------------------
+
+    def terms(self, question: Dict) -> List[str]:
+        """Key terms of a question, best first (at most MAX_TERMS)"""
+        return self.terms_for(*question_text(question))
+
+    def terms_for(self, question_en: str, explanation: str) -> List[str]:
+        """Key terms of a question given its text, best first (at most MAX_TERMS)"""
+        key = text_hash(question_en, explanation)
+        cached = self._terms.get(key)
+        if cached is not None:
+            return cached
+
+        # Not in the bank (a draft, or an edit since the index was built):
+        # count it as one more document
+        documents = self.documents + 1
+        scored = []
+        for position, (term, weight) in enumerate(candidate_terms(question_en, explanation).items()):
+            df = self.df.get(term, 0) + 1
+            score = _score(term, weight, df, documents)
+            if score:
+                scored.append((-score, position, term))
+        scored.sort()
+        ranked = self._terms[key] = _select((term, -score) for score, _, term in scored)
+        return ranked
+
+    def _rank_matrix(self, names: List[str], df_counts, indptr, indices, weights) -> List[List[str]]:
+        """Selected terms for every row of a CSR term-count matrix"""
+        np = _load_numpy()
+        if np is None:
+            df_list = list(df_counts)
+            ranked = []
+            for row in range(len(indptr) - 1):
+                scored = []
+                for k in range(indptr[row], indptr[row + 1]):
+                    term_id = indices[k]
+                    score = _score(names[term_id], weights[k], df_list[term_id], self.documents)
+                    if score:
+                        scored.append((-score, term_id))
+                scored.sort()
+                ranked.append(_select((names[term_id], -score) for score, term_id in scored))
+            return ranked
+
+        indptr = np.frombuffer(indptr, dtype=np.int64)
+        indices = np.frombuffer(indices, dtype=np.int64)
+        weights = np.frombuffer(weights, dtype=np.float64)
+        df_counts = np.asarray(df_counts, dtype=np.float64)
+        words = np.fromiter((name.count(' ') + 1 for name in names), dtype=np.float64, count=len(names))
+
+        # Same formula as _score, for all terms at once
+        idf = np.log((self.documents + 1) / (df_counts + 1)) + 1
+        idf[df_counts > GENERIC_DF * self.documents] = 0
+        chance = ((words > 1) & (df_counts < MIN_PHRASE_DF))[indices] & (weights <= QUESTION_WEIGHT)
+        tf = 1 + np.log(weights)
+        scores = np.where(chance, 0.0, tf * (idf * (1 + PHRASE_BOOST * (words - 1)))[indices])
+
+        rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        kept = np.flatnonzero(scores > 0)
+        # Per row, best first; ties go to the term seen first in the bank
+        order = kept[np.lexsort((indices[kept], -scores[kept], rows[kept]))]
+        bounds = np.searchsorted(rows[order], np.arange(len(indptr)))
+        ordered_terms, ordered_scores = indices[order].tolist(), scores[order].tolist()
+        return [_select(zip(map(names.__getitem__, ordered_terms[bounds[row]:bounds[row + 1]]),
+                            ordered_scores[bounds[row]:bounds[row + 1]]))
+                for row in range(len(indptr) - 1)]
+
+
+def _score(term: str, weight: float, df: int, documents: int) -> float:
+    """TF-IDF (sublinear TF) of a candidate, 0 for generic words and chance word sequences"""
+    words = term.count(' ') + 1
+    if (words > 1 and df < MIN_PHRASE_DF and weight <= QUESTION_WEIGHT) or df > GENERIC_DF * documents:
+        return 0.0
+    tf = 1 + math.log(weight)
+    return tf * (math.log((documents + 1) / (df + 1)) + 1) * (1 + PHRASE_BOOST * (words - 1))
+
+
+def _select(ranked: Iterable[Tuple[str, float]]) -> List[str]:
+    """Best MAX_TERMS terms, skipping weak ones and ones that overlap a better term"""
+    chosen: List[str] = []
+    chosen_words: List[str] = []
+    floor = None
+    for term, score in ranked:
+        if floor is None:
+            floor = score * MIN_RELATIVE_SCORE
+        elif score < floor:
+            break
+        words = term.split()
+        if any(_same_word(a, b) for a in words for b in chosen_words):
+            continue
+        chosen.append(term)
+        chosen_words += words
+        if len(chosen) == MAX_TERMS:
+            break
+    return chosen
+
+
+def _same_word(a: str, b: str) -> bool:
+    """Crude inflection match: 'exam'/'exams', 'currency'/'currencies', 'blows'/'blowing'"""
+    a, b = a.rstrip('s') or a, b.rstrip('s') or b
+    if len(a) > len(b):
+        a, b = b, a
+    return b.startswith(a) or a[:6] == b[:6]
+
+
+_np = False  # Not looked up yet
+
+
+def _load_numpy():
+    """NumPy module if installed, else None"""
+    global _np
+    if _np is False:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+    return _np
+
+
+def _bincount(indices: array, size: int) -> List[int]:
+    """Occurrences of each term id (each question lists a term once)"""
+    np = _load_numpy()
+    if np is not None:
+        return np.bincount(np.frombuffer(indices, dtype=np.int64), minlength=size).tolist()
+    counts = [0] * size
+    for i in indices:
+        counts[i] += 1
+    return counts
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import sys
+    import time
+
+    questions_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else None
+    corpus = Corpus(questions_dir)
+
+    start = time.perf_counter()
+    questions = [q for file in corpus.files() for q in corpus.open(file).iter_questions()]
+    index = KeyTermIndex.build(questions)
+    elapsed = time.perf_counter() - start
+    print(f"Indexed {index.documents} questions in {elapsed:.2f}s "
+          f"({len(index.df)} terms in more than one question)")
+
+    for question in questions[:10]:
+        print(f"  {question['question_en'][:45]:45s} -> {', '.join(index.terms(question))}")
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+Log Analytics - Streaming aggregation of quiz answer/share logs
+
+Reads data/logs/quiz_answers.jsonl and quiz_shares.jsonl one line at a
+time (memory does not grow with log length) and computes the same
+statistics as src/app/api/admin/stats/route.ts. The result is written to
+data/logs/stats_snapshot.json, which the stats route serves instead of
+re-reading the raw logs while the snapshot is current.
+
+update_stats() is the incremental variant: it keeps a checkpoint (inode,
+byte offset, head fingerprint and the running aggregates) next to the logs
+and only reads bytes appended since the previous run. Rotation (the log
+path now points at a new inode) drains the rest of the old file if it is
+still in the logs directory, then starts the new file from zero.
+Truncation (copytruncate) restarts from zero while keeping the totals.
+
+Compaction (utils/rollups.py) moves old lines out of the live logs into
+rotated segments and gzipped archives. compute_stats() and update_stats()
+without a checkpoint read those first (history_files()), so totals cover
+the whole history rather than only what was logged since compaction.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    from .corpus import PROJECT_ROOT
+    from .sketches import CountMinSketch, HyperLogLog, TopK
+except ImportError:  # Run directly as a script
+    from corpus import PROJECT_ROOT
+    from sketches import CountMinSketch, HyperLogLog, TopK
+
+LOGS_DIR = PROJECT_ROOT / 'data' / 'logs'
+ANSWERS_LOG = 'quiz_answers.jsonl'
+SHARES_LOG = 'quiz_shares.jsonl'
+STATS_SNAPSHOT = 'stats_snapshot.json'
+CHECKPOINT = '.stats_checkpoint.json'
+
+# Compacted history: <log>.<stamp>.segment next to the live log until it is
+# gzipped into archive/<log>.<stamp>.gz
+ARCHIVE_DIR = 'archive'
+SEGMENT_SUFFIX = '.segment'
+
+SNAPSHOT_VERSION = 1
+CHECKPOINT_VERSION = 1
+
+# Bytes at the start of a log hashed to detect in-place replacement
+FINGERPRINT_BYTES = 4096
+
+# Same limits as the stats route
+RECENT_ANSWERS = 100
+RECENT_SHARES = 50
+TOP_USERS = 10
+
+
+def js_round(value: float) -> int:
+    """Math.round() semantics (halves round up), so numbers match the route"""
+    return int(value + 0.5) if value >= 0 else -int(-value + 0.5)
+
+
+def event_key(event: Dict, field: str) -> str:
+    """Object key the route would produce for event[field] (String() semantics)"""
+    if field not in event:
+        return 'undefined'
+    value = event[field]
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class JsonlReader:
+    """
+    Streaming reader for a JSONL log
+
+    Iterating yields one event dict per well-formed line. While iterating,
+    `offset` is the byte position just past the last complete line consumed
+    and `malformed` counts lines that were not JSON objects.
+
+    A trailing line without a newline is still being written and is left
+    for the next read, so `offset` always sits on a line boundary. Archived
+    logs (.gz) are decompressed; their offsets count uncompressed bytes.
+    """
+
+    def __init__(self, path: Union[str, Path], start: int = 0):
+        """
+        Args:
+            path: Log file
+            start: Byte offset to start from (must be at a line boundary)
+        """
+        self.path = Path(path)
+        self.offset = start
+        self.malformed = 0
+
+    def __iter__(self) -> Iterator[Dict]:
+        opener = gzip.open if self.path.suffix == '.gz' else open
+        with opener(self.path, 'rb') as f:
+            f.seek(self.offset)
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break
+                self.offset += len(raw)
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    event = None
+                if isinstance(event, dict):
+                    yield event
+                else:
+                    self.malformed += 1
+
+
+class AnswerStats:
+    """
+    Running aggregates over quiz_answers.jsonl events
+
+    By default sessions are tracked exactly (a dict entry per sessionId),
+    matching the route. With sketch_sessions=True memory stays constant:
+    unique sessions come from a HyperLogLog and topUsers from a TopK over
+    a Count-Min sketch, so both become estimates.
+    """
+
+    def __init__(self, sketch_sessions: bool = False):
+        self.total = 0
+        self.correct = 0
+        self.by_category: Dict[str, Dict[str, int]] = {}
+        self.by_difficulty: Dict[str, Dict[str, int]] = {}
+        self.recent = deque(maxlen=RECENT_ANSWERS)
+        self.sketch_sessions = sketch_sessions
+        if sketch_sessions:
+            self.sessions = None
+            self.session_hll = HyperLogLog()
+            self.active_sessions = TopK(k=TOP_USERS)
+            self.session_correct = CountMinSketch()
+        else:
+            self.sessions: Dict[str, list] = {}  # sessionId -> [total, correct]
+
+    def add(self, event: Dict):
+        """Fold one answer event into the aggregates"""
+        is_correct = bool(event.get('isCorrect'))
+        self.total += 1
+        self.correct += is_correct
+
+        for table, field in ((self.by_category, 'category'), (self.by_difficulty, 'difficulty')):
+            key = event_key(event, field)
+            bucket = table.get(key)
+            if bucket is None:
+                bucket = table[key] = {'total': 0, 'correct': 0}
+            bucket['total'] += 1
+            bucket['correct'] += is_correct
+
+        session_id = event_key(event, 'sessionId')
+        if self.sketch_sessions:
+            self.session_hll.add(session_id)
+            self.active_sessions.add(session_id)
+            if is_correct:
+                self.session_correct.add(session_id)
+        else:
+            session = self.sessions.get(session_id)
+            if session is None:
+                session = self.sessions[session_id] = [0, 0]
+            session[0] += 1
+            session[1] += is_correct
+
+        self.recent.append(event)
+
+    def to_state(self) -> Dict:
+        """Serializable running state, for checkpoints"""
+        state = {
+            'total': self.total,
+            'correct': self.correct,
+            'byCategory': self.by_category,
+            'byDifficulty': self.by_difficulty,
+            'recent': list(self.recent),
+        }
+        if self.sketch_sessions:
+            state['sessionSketch'] = self.session_hll.to_bytes().hex()
+            state['activeSessions'] = self.active_sessions.to_state()
+            state['correctSketch'] = self.session_correct.to_bytes().hex()
+        else:
+            state['sessions'] = self.sessions
+        return state
+
+    @classmethod
+    def from_state(cls, state: Dict) -> 'AnswerStats':
+        stats = cls(sketch_sessions='sessionSketch' in state)
+        stats.total = state['total']
+        stats.correct = state['correct']
+        stats.by_category = state['byCategory']
+        stats.by_difficulty = state['byDifficulty']
+        if stats.sketch_sessions:
+            stats.session_hll = HyperLogLog.from_bytes(bytes.fromhex(state['sessionSketch']))
+            stats.active_sessions = TopK.from_state(state['activeSessions'])
+            stats.session_correct = CountMinSketch.from_bytes(bytes.fromhex(state['correctSketch']))
+        else:
+            stats.sessions = state['sessions']
+        stats.recent.extend(state['recent'])
+        return stats
+
+    def session_count(self) -> int:
+        """Unique sessions (estimated in sketch mode)"""
+        return self.session_hll.count() if self.sketch_sessions else len(self.sessions)
+
+    def top_users(self, limit: int = TOP_USERS) -> list:
+        """Most active sessions, like the route's topUsers"""
+        if self.sketch_sessions:
+            ranked = [(session_id, (total, min(total, self.session_correct.estimate(session_id))))
+                      for session_id, total in self.active_sessions.top(limit)]
+        else:
+            # Stable sort on insertion order matches Array.prototype.sort
+            ranked = sorted(self.sessions.items(), key=lambda item: item[1][0], reverse=True)
+        return [
+            {
+                'sessionId': session_id,
+                'total': total,
+                'correct': correct,
+                'accuracy': js_round(correct / total * 100),
+            }
+            for session_id, (total, correct) in ranked[:limit]
+        ]
+
+    def to_dict(self) -> Dict:
+        return {
+            'total': self.total,
+            'sessions': self.session_count(),
+            'accuracy': js_round(self.correct / self.total * 100) if self.total else 0,
+            'byCategory': self.by_category,
+            'byDifficulty': self.by_difficulty,
+            'topUsers': self.top_users(),
+            'recentAnswers': list(reversed(self.recent)),
+        }
+
+
+class ShareStats:
+    """Running aggregates over quiz_shares.jsonl events"""
+
+    def __init__(self):
+        self.total = 0
+        self.by_method: Dict[str, int] = {}
+        self.by_category: Dict[str, int] = {}
+        self.by_difficulty: Dict[str, int] = {}
+        self.recent = deque(maxlen=RECENT_SHARES)
+
+    def add(self, event: Dict):
+        """Fold one share event into the aggregates"""
+        self.total += 1
+        for table, field in ((self.by_method, 'method'),
+                             (self.by_category, 'category'),
+                             (self.by_difficulty, 'difficulty')):
+            key = event_key(event, field) if event.get(field) else 'unknown'
+            table[key] = table.get(key, 0) + 1
+        self.recent.append(event)
+
+    def to_state(self) -> Dict:
+        """Serializable running state, for checkpoints"""
+        return {
+            'total': self.total,
+            'byMethod': self.by_method,
+            'byCategory': self.by_category,
+            'byDifficulty': self.by_difficulty,
+            'recent': list(self.recent),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> 'ShareStats':
+        stats = cls()
+        stats.total = state['total']
+        stats.by_method = state['byMethod']
+        stats.by_category = state['byCategory']
+        stats.by_difficulty = state['byDifficulty']
+        stats.recent.extend(state['recent'])
+        return stats
+
+    def to_dict(self) -> Dict:
+        return {
+            'total': self.total,
+            'byMethod': self.by_method,
+            'byCategory': self.by_category,
+            'byDifficulty': self.by_difficulty,
+            'recentShares': list(reversed(self.recent)),
+        }
+
+
+def build_stats(answers: AnswerStats, shares: ShareStats) -> Dict:
+    """Assemble the response body served by /api/admin/stats"""
+    if answers.total == 0 and shares.total == 0:
+        empty = AnswerStats().to_dict()
+        del empty['topUsers']  # The route omits it when there is no data
+        empty['shares'] = ShareStats().to_dict()
+        return empty
+
+    stats = answers.to_dict()
+    stats['shares'] = shares.to_dict()
+    return stats
+
+
+def _source_info(path: Path, offset: int) -> Dict:
+    """What the snapshot covers of one log, for the route's freshness check"""
+    return {'file': path.name, 'size': offset}
+
+
+def history_files(logs_dir: Path, filename: str) -> List[Path]:
+    """
+    Compacted history of one log, oldest first
+
+    Archives (archive/<filename>.<stamp>.gz), then segments rotated aside
+    but not archived yet (<filename>.<stamp>.segment). The stamps sort
+    chronologically; the live log itself is not included.
+    """
+    archived = sorted((logs_dir / ARCHIVE_DIR).glob(f"{filename}.*.gz"))
+    return archived + sorted(logs_dir.glob(f"{filename}.*{SEGMENT_SUFFIX}"))
+
+
+def _read_files(paths: List[Path], aggregate) -> int:
+    """Fold whole log files into aggregate; returns their malformed lines"""
+    malformed = 0
+    for path in paths:
+        reader = JsonlReader(path)
+        for event in reader:
+            aggregate.add(event)
+        malformed += reader.malformed
+    return malformed
+
+
+def compute_stats(logs_dir: Optional[Path] = None) -> Tuple[Dict, Dict]:
+    """
+    Stream both logs, with their compacted history, and compute dashboard statistics
+
+    Returns:
+        (stats, sources) where sources records how many bytes of each live
+        log were consumed and how many lines were malformed
+    """
+    logs_dir = Path(logs_dir) if logs_dir else LOGS_DIR
+    answers, shares = AnswerStats(), ShareStats()
+    sources = {}
+
+    for name, filename, aggregate in (('answers', ANSWERS_LOG, answers),
+                                      ('shares', SHARES_LOG, shares)):
+        path = logs_dir / filename
+        malformed = _read_files(history_files(logs_dir, filename), aggregate)
+        reader = JsonlReader(path)
+        if path.exists():
+            for event in reader:
+                aggregate.add(event)
+        sources[name] = dict(_source_info(path, reader.offset), malformed=malformed + reader.malformed)
+
+    return build_stats(answers, shares), sources
+
+
+def _fingerprint(path: Path, offset: int) -> str:
+    """Hash of the first bytes of a log, up to offset"""
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read(min(offset, FINGERPRINT_BYTES))).hexdigest()
+
+
+def _find_rotated(path: Path, inode: int, dev: int) -> Optional[Path]:
+    """Locate a rotated copy of path (e.g. quiz_answers.jsonl.1) by inode"""
+    for candidate in path.parent.glob(path.name + '*'):
+        if candidate == path:
+            continue
+        try:
+            st = candidate.stat()
+        except OSError:
+            continue
+        if (st.st_ino, st.st_dev) == (inode, dev):
+            return candidate
+    return None
+
+
+def consume_log(path: Path, cursor: Optional[Dict], aggregate, notes: list) -> Optional[Dict]:
+    """
+    Fold everything appended to path since cursor into aggregate
+
+    Returns:
+        The new cursor for path (None if the log does not exist yet)
+    """
+    malformed = cursor['malformed'] if cursor else 0
+    start = 0
+
+    if cursor is not None:
+        try:
+            st = path.stat()
+            same_file = (st.st_ino, st.st_dev) == (cursor['inode'], cursor['dev'])
+        except FileNotFoundError:
+            st, same_file = None, False
+
+        if not same_file:
+            # Rotated: finish the old file first if it is still around
+            rotated = _find_rotated(path, cursor['inode'], cursor['dev'])
+            if rotated is not None:
+                reader = JsonlReader(rotated, cursor['offset'])
+                for event in reader:
+                    aggregate.add(event)
+                malformed += reader.malformed
+                notes.append(f"{path.name}: rotated, drained {rotated.name}")
+            else:
+                notes.append(f"{path.name}: rotated, previous file not found (its unread tail is lost)")
+        elif st.st_size < cursor['offset']:
+            notes.append(f"{path.name}: truncated, reading from start")
+        elif _fingerprint(path, cursor['offset']) != cursor['fingerprint']:
+            notes.append(f"{path.name}: replaced in place, reading from start")
+        else:
+            start = cursor['offset']
+
+    if not path.exists():
+        return None
+
+    reader = JsonlReader(path, start)
+    for event in reader:
+        aggregate.add(event)
+
+    st = path.stat()
+    return {
+        'inode': st.st_ino,
+        'dev': st.st_dev,
+        'offset': reader.offset,
+        'fingerprint': _fingerprint(path, reader.offset),
+        'malformed': malformed + reader.malformed,
+    }
+
+
+def load_checkpoint(path: Path) -> Optional[Dict]:
+    """Read a checkpoint, or None if missing / from another version"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return checkpoint if checkpoint.get('version') == CHECKPOINT_VERSION else None
+
+
+def update_stats(logs_dir: Optional[Path] = None, checkpoint_path: Optional[Path] = None,
+                 full: bool = False, sketch_sessions: Optional[bool] = None) -> Tuple[Dict, Dict, list]:
+    """
+    Incrementally compute dashboard statistics
+
+    Args:
+        logs_dir: Directory with the JSONL logs
+        checkpoint_path: Checkpoint file (default: <logs_dir>/.stats_checkpoint.json)
+        full: Ignore any existing checkpoint and recompute from scratch,
+              archived segments included
+        sketch_sessions: Track sessions with sketches (constant memory) or
+                         exactly; None keeps the checkpoint's mode (exact
+                         for a new checkpoint). Changing mode recomputes.
+
+    Returns:
+        (stats, sources, notes) - notes describe rotation/truncation handling
+    """
+    logs_dir = Path(logs_dir) if logs_dir else LOGS_DIR
+    checkpoint_path = Path(checkpoint_path) if checkpoint_path else logs_dir / CHECKPOINT
+    checkpoint = None if full else load_checkpoint(checkpoint_path)
+    notes: list = []
+
+    if checkpoint:
+        answers = AnswerStats.from_state(checkpoint['state']['answers'])
+        if sketch_sessions is not None and sketch_sessions != answers.sketch_sessions:
+            notes.append(f"session tracking changed to {'sketches' if sketch_sessions else 'exact'}, "
+                         "recomputing from the start")
+            checkpoint = None
+
+    if checkpoint:
+        shares = ShareStats.from_state(checkpoint['state']['shares'])
+        cursors = checkpoint['cursors']
+    else:
+        answers, shares, cursors = AnswerStats(bool(sketch_sessions)), ShareStats(), {}
+
+    sources = {}
+    new_cursors = {}
+    for name, filename, aggregate in (('answers', ANSWERS_LOG, answers),
+                                      ('shares', SHARES_LOG, shares)):
+        path = logs_dir / filename
+        malformed = 0
+        if not checkpoint:
+            # Starting over: first what compaction moved out of the live log
+            history = history_files(logs_dir, filename)
+            if history:
+                malformed = _read_files(history, aggregate)
+                notes.append(f"{filename}: read {len(history)} archived segment(s)")
+        cursor = consume_log(path, cursors.get(name), aggregate, notes)
+        if cursor is not None:
+            # Carried in the cursor, like lines drained from a rotated file
+            cursor['malformed'] += malformed
+            new_cursors[name] = cursor
+        covered = cursor['offset'] if cursor is not None and path.exists() else 0
+        sources[name] = dict(_source_info(path, covered),
+                             malformed=cursor['malformed'] if cursor else 0)
+
+    _write_json_atomic(checkpoint_path, {
+        'version': CHECKPOINT_VERSION,
+        'cursors': new_cursors,
+        'state': {'answers': answers.to_state(), 'shares': shares.to_state()},
+    })
+
+    return build_stats(answers, shares), sources, notes
+
+
+def _write_json_atomic(path: Path, obj: Dict):
+    """Write compact JSON via a temporary file and rename"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def write_stats_snapshot(stats: Dict, sources: Dict, path: Optional[Path] = None) -> Path:
+    """
+    Write the precomputed stats for the dashboard (atomically, compact JSON)
+
+    Returns:
+        Path written
+    """
+    path = Path(path) if path else LOGS_DIR / STATS_SNAPSHOT
+    _write_json_atomic(path, {
+        'version': SNAPSHOT_VERSION,
+        'generatedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'sources': sources,
+        'stats': stats,
+    })
+    return path
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import sys
+
+    logs_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else LOGS_DIR
+    start = time.perf_counter()
+    stats, sources = compute_stats(logs_dir)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"Answers: {stats['total']} ({stats['sessions']} sessions, {stats['accuracy']}% correct)")
+    print(f"Shares: {stats['shares']['total']}")
+    for name, info in sources.items():
+        print(f"  {info['file']}: {info['size']} bytes, {info['malformed']} malformed lines")
+    print(f"Computed in {elapsed:.1f} ms")
@@ -7,7 +7,7 @@ Updates the master list with new questions to maintain single source of truth.
 
 import re
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 
 class MasterListUpdater:
@@ -45,14 +45,68 @@ class MasterListUpdater:
         Raises:
             ValueError: If category not found in master list
         """
-        # Convert JSON category to display name for searching
-        # (e.g., "Animals" -> "Animal Behavior")
-        display_name = self._get_category_display_name(category)
-
         # Read current content
         with open(self.master_list_path, 'r', encoding='utf-8') as f:
             lines = f.readlines()
 
+        lines, new_lines = self._with_questions(lines, category, questions)
+
+        if dry_run:
+            print("DRY RUN - Would add these lines:")
+            for line in new_lines:
+                print(f"  {line.rstrip()}")
+            return len(new_lines)
+
+        # Write back
+        with open(self.master_list_path, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+
+        print(f"✅ Added {len(new_lines)} questions to master list")
+        return len(new_lines)
+
+    def update_totals(self, dry_run: bool = False) -> bool:
+        """
+        Update the total counts in the master list header and summary
+
+        Args:
+            dry_run: If True, don't write changes
+
+        Returns:
+            True if updates were made
+        """
+        # Read current content
+        with open(self.master_list_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        if dry_run:
+            _, total_questions = self._with_totals(content)
+            print(f"DRY RUN - Would update total to: {total_questions}")
+            return False
+
+        content, total_questions = self._with_totals(content)
+
+        # Write back
+        with open(self.master_list_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        print(f"✅ Updated master list totals to {total_questions}")
+        return True
+
+    def _with_questions(self, lines: List[str], category: str,
+                        questions: List[Dict]) -> Tuple[List[str], List[str]]:
+        """
+        Insert question lines into a category section
+
+        Returns:
+            (all lines with the new ones inserted, the new lines)
+
+        Raises:
+            ValueError: If category not found in master list
+        """
+        # Convert JSON category to display name for searching
+        # (e.g., "Animals" -> "Animal Behavior")
+        display_name = self._get_category_display_name(category)
+
         # Find the category section (format: ## Category Name (count))
         category_line_idx = None
 
@@ -120,58 +174,114 @@ class MasterListUpdater:
             new_lines.append(line)
             next_num += 1
 
-        if dry_run:
-            print("DRY RUN - Would add these lines:")
-            for line in new_lines:
-                print(f"  {line.rstrip()}")
-            return len(new_lines)
+        lines = lines[:insert_idx] + new_lines + lines[insert_idx:]
+        return lines, new_lines
 
-        # Insert new lines
-        lines[insert_idx:insert_idx] = new_lines
+    def _with_totals(self, content: str) -> Tuple[str, int]:
+        """Content with the 'Total questions' header recounted, and the count"""
+        # Count total questions (format: "1. Question text [difficulty]")
+        question_pattern = r'^\d+\.\s+.+\s+\[(easy|medium|hard)\]'
+        total_questions = len(re.findall(question_pattern, content, re.MULTILINE))
 
-        # Write back
-        with open(self.master_list_path, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+        # Update total count (format: "Total questions: 300")
+        content = re.sub(
+            r'^Total questions: \d+',
+            f'Total questions: {total_questions}',
+            content,
+            flags=re.MULTILINE
+        )
+        return content, total_questions
 
-        print(f"✅ Added {len(new_lines)} questions to master list")
-        return len(new_lines)
+    def render_added(self, category: str, questions: List[Dict]) -> str:
+        """
+        Master list content with questions added and totals updated, without writing
 
-    def update_totals(self, dry_run: bool = False) -> bool:
+        Raises:
+            ValueError: If category not found in master list
         """
-        Update the total counts in the master list header and summary
+        return self.render_additions([(category, questions)])
+
+    def render_additions(self, additions: List[Tuple[str, List[Dict]]]) -> str:
+        """
+        Like render_added, for several categories in one pass
 
         Args:
-            dry_run: If True, don't write changes
+            additions: (JSON category name, questions) pairs, numbered in order
 
-        Returns:
-            True if updates were made
+        Raises:
+            ValueError: If a category is not found in master list
         """
-        # Read current content
         with open(self.master_list_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+            lines = f.readlines()
+        for category, questions in additions:
+            lines, _ = self._with_questions(lines, category, questions)
+        content, _ = self._with_totals(''.join(lines))
+        return content
 
-        # Count total questions (format: "1. Question text [difficulty]")
-        question_pattern = r'^\d+\.\s+.+\s+\[(easy|medium|hard)\]'
-        total_questions = len(re.findall(question_pattern, content, re.MULTILINE))
+    def update_difficulties(self, changes: Dict[Tuple[str, int], Tuple[str, str]], dry_run: bool = False) -> int:
+        """
+        Re-tag existing questions with a new difficulty
 
-        if dry_run:
-            print(f"DRY RUN - Would update total to: {total_questions}")
-            return False
+        A category's section lists its questions in file order, so each
+        question is found by its section and position there; the same text
+        can appear in several categories. A line whose text no longer
+        matches is left alone and reported.
 
-        # Update total count (format: "Total questions: 300")
-        content = re.sub(
-            r'^Total questions: \d+',
-            f'Total questions: {total_questions}',
-            content,
-            flags=re.MULTILINE
-        )
+        Args:
+            changes: (JSON category name, index in its file) -> (question_en, new difficulty)
+            dry_run: If True, don't write changes
 
-        # Write back
-        with open(self.master_list_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        Returns:
+            Number of lines changed
+        """
+        with open(self.master_list_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
 
-        print(f"✅ Updated master list totals to {total_questions}")
-        return True
+        by_section: Dict[str, Dict[int, Tuple[str, str]]] = {}
+        for (category, index), change in changes.items():
+            by_section.setdefault(self._get_category_display_name(category), {})[index] = change
+
+        # Format: "## Display Name (count)" then "N. Question text [difficulty]"
+        section_pattern = re.compile(r'^## (.+?)(?: \(\d+\))?$')
+        question_pattern = re.compile(r'^(\d+\.\s+)(.+?)(\s+)\[(easy|medium|hard)\]$')
+        section: Dict[int, Tuple[str, str]] = {}
+        position = 0
+        changed = 0
+        for i, line in enumerate(lines):
+            line = line.rstrip('\n')
+            match = section_pattern.match(line)
+            if match:
+                section = by_section.pop(match.group(1), {})
+                position = 0
+                continue
+            match = question_pattern.match(line)
+            if not match:
+                continue
+            change = section.pop(position, None)
+            position += 1
+            if change is None:
+                continue
+            question_en, difficulty = change
+            if match.group(2) != question_en:
+                print(f"⚠️  Master list out of sync, not re-tagged: {question_en}")
+                continue
+            if difficulty == match.group(4):
+                continue
+            lines[i] = f"{match.group(1)}{match.group(2)}{match.group(3)}[{difficulty}]\n"
+            changed += 1
+
+        for display_name in by_section:
+            print(f"⚠️  Category '{display_name}' not found in master list")
+
+        if dry_run:
+            print(f"DRY RUN - Would re-tag {changed} questions in master list")
+            return changed
+
+        if changed:
+            with open(self.master_list_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            print(f"✅ Re-tagged {changed} questions in master list")
+        return changed
 
     def _get_category_filename(self, category: str) -> str:
         """Get the JSON filename for a category"""
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Check Profiler - Per-check timing and issue yield for validators
+
+Records, for every named check, the number of calls, cumulative time and
+the number of issues (or notes) it produced, plus per-file parse /
+validate / report time. Optionally keeps an event trace that can be
+written in speedscope's evented format (https://www.speedscope.app), and
+wraps cProfile for function-level pstats dumps.
+
+Validators only pay for this when a profiler is passed in.
+"""
+
+import contextlib
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+
+class CheckStats:
+    """Cumulative numbers for one check"""
+
+    __slots__ = ('calls', 'ns', 'yielded')
+
+    def __init__(self):
+        self.calls = 0
+        self.ns = 0
+        self.yielded = 0
+
+
+class CheckProfiler:
+    """Collects per-check and per-file timings"""
+
+    def __init__(self, trace: bool = False):
+        """
+        Args:
+            trace: Keep open/close events for a speedscope trace (memory grows
+                   with the number of checks run)
+        """
+        self.checks: Dict[str, CheckStats] = {}
+        self.files: List[Dict] = []
+        self.trace = trace
+        self._frames: Dict[str, int] = {}
+        self._events: List[Dict] = []
+        self._origin = time.perf_counter_ns()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def run(self, name: str, check: Callable, *args) -> list:
+        """Call check(*args), recording its time and how many items it returned"""
+        start = time.perf_counter_ns()
+        if self.trace:
+            self._event('O', name, start)
+        result = check(*args)
+        end = time.perf_counter_ns()
+        if self.trace:
+            self._event('C', name, end)
+
+        stats = self.checks.get(name)
+        if stats is None:
+            stats = self.checks[name] = CheckStats()
+        stats.calls += 1
+        stats.ns += end - start
+        stats.yielded += len(result)
+        return result
+
+    @contextlib.contextmanager
+    def span(self, name: str):
+        """Trace a region (a file, its parse or report phase) without per-check stats"""
+        if self.trace:
+            self._event('O', name, time.perf_counter_ns())
+        try:
+            yield
+        finally:
+            if self.trace:
+                self._event('C', name, time.perf_counter_ns())
+
+    def add_file(self, name: str, questions: int, parse_ns: int, check_ns: int, report_ns: int):
+        self.files.append({'file': name, 'questions': questions, 'parse_ms': parse_ns / 1e6,
+                           'check_ms': check_ns / 1e6, 'report_ms': report_ns / 1e6})
+
+    def _event(self, kind: str, name: str, at: int):
+        frame = self._frames.get(name)
+        if frame is None:
+            frame = self._frames[name] = len(self._frames)
+        self._events.append({'type': kind, 'frame': frame, 'at': at - self._origin})
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict:
+        total = sum(s.ns for s in self.checks.values()) or 1
+        return {
+            'checks': {
+                name: {
+                    'calls': s.calls,
+                    'total_ms': round(s.ns / 1e6, 3),
+                    'mean_us': round(s.ns / s.calls / 1e3, 2) if s.calls else 0,
+                    'share': round(s.ns / total, 4),
+                    'yield': s.yielded,
+                }
+                for name, s in sorted(self.checks.items(), key=lambda item: -item[1].ns)
+            },
+            'files': self.files,
+        }
+
+    def print_report(self):
+        """Tables of per-check and per-file timings"""
+        report = self.to_dict()
+        print(f"\n{'='*70}")
+        print("PROFILE")
+        print(f"{'='*70}")
+        print(f"\n{'Check':26} {'Calls':>8} {'Total':>10} {'Mean':>9} {'Share':>7} {'Yield':>7}")
+        print('-' * 70)
+        for name, s in report['checks'].items():
+            print(f"{name:26} {s['calls']:8,} {s['total_ms']:8.1f}ms {s['mean_us']:7.1f}µs "
+                  f"{s['share'] * 100:6.1f}% {s['yield']:7,}")
+
+        if report['files']:
+            print(f"\n{'File':26} {'Questions':>9} {'Parse':>10} {'Checks':>10} {'Report':>10}")
+            print('-' * 70)
+            for f in report['files']:
+                print(f"{f['file'][:26]:26} {f['questions']:9,} {f['parse_ms']:8.1f}ms "
+                      f"{f['check_ms']:8.1f}ms {f['report_ms']:8.1f}ms")
+            parse = sum(f['parse_ms'] for f in report['files'])
+            check = sum(f['check_ms'] for f in report['files'])
+            output = sum(f['report_ms'] for f in report['files'])
+            print('-' * 70)
+            print(f"{'Total':26} {sum(f['questions'] for f in report['files']):9,} "
+                  f"{parse:8.1f}ms {check:8.1f}ms {output:8.1f}ms")
+
+    def write_json(self, path: Union[str, Path]):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def write_speedscope(self, path: Union[str, Path], name: str = 'validation'):
+        """Write the recorded trace as a speedscope evented profile"""
+        if not self.trace:
+            raise ValueError('Profiler was created without trace=True')
+        end = self._events[-1]['at'] if self._events else 0
+        frames = sorted(self._frames, key=self._frames.get)
+        document = {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': [{'name': frame} for frame in frames]},
+            'profiles': [{
+                'type': 'evented',
+                'name': name,
+                'unit': 'nanoseconds',
+                'startValue': 0,
+                'endValue': end,
+                'events': self._events,
+            }],
+            'name': name,
+            'activeProfileIndex': 0,
+            'exporter': 'millionwhys CheckProfiler',
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(document, f)
+
+
+def run_cprofile(fn: Callable, path: Union[str, Path], top: Optional[int] = 15):
+    """
+    Run fn under cProfile, dump pstats to path and optionally print the top entries
+
+    Returns:
+        fn's return value
+    """
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(fn)
+    finally:
+        profiler.dump_stats(str(path))
+        if top:
+            print(f"\n📈 cProfile (top {top} by cumulative time, full stats in {path})")
+            pstats.Stats(profiler).sort_stats('cumulative').print_stats(top)
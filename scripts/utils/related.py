@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+"""
+Related Questions - Nearest-neighbour graph over TF-IDF question vectors
+
+Links questions about the same thing across categories (say, "why is the
+sky blue" in Physics, Weather and Astronomy) for "next question"
+suggestions and coverage analysis:
+
+- Each question becomes a sparse TF-IDF vector over its question, choices
+  and correct explanation, English and Chinese, tokenized like the search
+  index (utils/search.py). Terms found in one question only, or in more
+  than MAX_DF of all questions, link nothing useful and are dropped; each
+  vector keeps its MAX_TERMS heaviest terms and is L2-normalized.
+- Cosine similarities are the product of the vectors with their transpose
+  (the term postings), computed a block of rows at a time. Each question
+  keeps its NEIGHBORS most similar questions scoring at least
+  MIN_SIMILARITY.
+
+The table (data/cache/related-<dir hash>.sqlite3) is keyed by question ID.
+A refresh re-reads the category files whose mtime/size changed and
+recomputes the questions whose text changed, plus those that listed one of
+them; every other list only takes in changed questions that now rank in
+it. Vectors of changed questions use the term weights of the last full
+build, which is redone once REBUILD_FRACTION of the bank has changed.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import sqlite3
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from .corpus import PROJECT_ROOT, Corpus
+    from .search import weighted_counts
+except ImportError:  # Run directly as a script
+    from corpus import PROJECT_ROOT, Corpus
+    from search import weighted_counts
+
+CACHE_DIR = PROJECT_ROOT / 'data' / 'cache'
+SCHEMA_VERSION = 1
+
+# Neighbours kept per question
+NEIGHBORS = 10
+# Terms kept per question vector
+MAX_TERMS = 32
+# Terms in more than this share of questions are too common to relate them
+MAX_DF = 0.05
+# Cosine similarity below which two questions are not related
+MIN_SIMILARITY = 0.1
+# Share of the bank changed since the last full build that triggers another
+REBUILD_FRACTION = 0.1
+
+# Term-posting products per NumPy block (bounds the block's memory)
+BLOCK_PRODUCTS = 1 << 23
+# Banks at least this large are scored with NumPy
+BULK_QUESTIONS = 2000
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT PRIMARY KEY,
+    id INTEGER NOT NULL,
+    df INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS questions (
+    id TEXT PRIMARY KEY,
+    file TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    question_en TEXT NOT NULL,
+    terms BLOB NOT NULL,
+    weights BLOB NOT NULL,
+    neighbors TEXT NOT NULL,
+    scores BLOB NOT NULL
+);
+'''
+
+
+def related_text(question: Dict) -> Dict:
+    """The fields a question's vector is built from: question, choices and correct explanation"""
+    correct = question.get('correct_answer')
+
+    def correct_only(key: str) -> List[str]:
+        items = question.get(key) or []
+        return [items[correct]] if isinstance(correct, int) and 0 <= correct < len(items) else []
+
+    return {
+        'question_en': question.get('question_en', ''),
+        'question_zh': question.get('question_zh', ''),
+        'choices_en': question.get('choices_en', []),
+        'choices_zh': question.get('choices_zh', []),
+        'explanations_en': correct_only('explanations_en'),
+        'explanations_zh': correct_only('explanations_zh'),
+    }
+
+
+def text_hash(text: Dict) -> str:
+    """Change detection key for a question's related_text"""
+    payload = json.dumps(text, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+class Vectors:
+    """Sparse question vectors, one row per question (CSR in flat arrays)"""
+
+    def __init__(self):
+        self.indptr = array('q', [0])
+        self.indices = array('I')
+        self.data = array('d')
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def append(self, terms: Sequence[int], weights: Sequence[float]):
+        self.indices.extend(terms)
+        self.data.extend(weights)
+        self.indptr.append(len(self.indices))
+
+    def row(self, i: int) -> Tuple[array, array]:
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.data[start:end]
+
+
+def _top_terms(weighted: Iterable[Tuple[float, int]]) -> Tuple[array, array]:
+    """(term ids, weights) of the MAX_TERMS heaviest (weight, term id) pairs, L2-normalized"""
+    top = sorted(heapq.nlargest(MAX_TERMS, weighted), key=lambda pair: pair[1])
+    norm = math.sqrt(sum(weight * weight for weight, _ in top)) or 1.0
+    return array('I', [term for _, term in top]), array('d', [weight / norm for weight, _ in top])
+
+
+def build_vectors(texts: List[Dict]) -> Tuple[Vectors, Dict[str, int], List[int]]:
+    """
+    TF-IDF vectors of related_text dicts
+
+    Returns:
+        (vectors, term -> term id, document frequency per term id)
+    """
+    vocabulary: Dict[str, int] = {}
+    df: List[int] = []
+    counted: List[Tuple[array, array]] = []
+    for text in texts:
+        ids, tfs = array('I'), array('I')
+        for term, tf in weighted_counts(text).items():
+            term_id = vocabulary.get(term)
+            if term_id is None:
+                term_id = vocabulary[term] = len(df)
+                df.append(0)
+            df[term_id] += 1
+            ids.append(term_id)
+            tfs.append(tf)
+        counted.append((ids, tfs))
+
+    documents = len(texts)
+    limit = MAX_DF * documents
+    idf = [math.log(documents / n) if 1 < n <= limit else 0.0 for n in df]
+
+    vectors = Vectors()
+    for ids, tfs in counted:
+        vectors.append(*_top_terms(((1 + math.log(tf)) * idf[term_id], term_id)
+                                   for term_id, tf in zip(ids, tfs) if idf[term_id]))
+    return vectors, vocabulary, df
+
+
+def _similar(vectors: Vectors, rows: Sequence[int],
+             limit: Optional[int] = NEIGHBORS) -> Iterator[Tuple[int, List[int], List[float]]]:
+    """
+    (row, similar rows, cosine similarities) for each of rows
+
+    Similar rows score at least MIN_SIMILARITY, best first (ties by row),
+    at most limit of them (None for all).
+    """
+    np = _load_numpy() if len(vectors) >= BULK_QUESTIONS else None
+    if np is None:
+        return _similar_python(vectors, rows, limit)
+    return _similar_numpy(vectors, rows, limit)
+
+
+def _similar_python(vectors: Vectors, rows: Sequence[int],
+                    limit: Optional[int]) -> Iterator[Tuple[int, List[int], List[float]]]:
+    """Pure-Python _similar_numpy"""
+    postings: Dict[int, List[Tuple[int, float]]] = {}
+    for doc in range(len(vectors)):
+        for term, weight in zip(*vectors.row(doc)):
+            postings.setdefault(term, []).append((doc, weight))
+
+    for row in rows:
+        scores: Dict[int, float] = {}
+        for term, weight in zip(*vectors.row(row)):
+            for doc, doc_weight in postings[term]:
+                scores[doc] = scores.get(doc, 0.0) + weight * doc_weight
+        scores.pop(row, None)
+        ranked = sorted((doc for doc, score in scores.items() if score >= MIN_SIMILARITY),
+                        key=lambda doc: (-scores[doc], doc))[:limit]
+        yield row, ranked, [scores[doc] for doc in ranked]
+
+
+def _ranges(starts, lengths):
+    """Concatenated arange(start, start + length) for each pair"""
+    np = _np
+    ends = np.cumsum(lengths)
+    return np.arange(ends[-1] if len(ends) else 0) + np.repeat(starts - (ends - lengths), lengths)
+
+
+def _similar_numpy(vectors: Vectors, rows: Sequence[int],
+                   limit: Optional[int]) -> Iterator[Tuple[int, List[int], List[float]]]:
+    """
+    Sparse matrix product of the rows with every vector, BLOCK_PRODUCTS
+    term-posting products at a time
+
+    Each row's terms are expanded into the postings of those terms; the
+    products are summed per (row, question) pair with one sort per block.
+    """
+    np = _np
+    n = len(vectors)
+    indptr = np.frombuffer(vectors.indptr, dtype=np.int64)
+    indices = np.frombuffer(vectors.indices, dtype=np.uint32).astype(np.int64)
+    data = np.frombuffer(vectors.data, dtype=np.float64)
+
+    # Term postings: the same entries ordered by term
+    doc_of = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    order = np.argsort(indices, kind='stable')
+    posting_docs, posting_weights = doc_of[order], data[order]
+    df = np.bincount(indices, minlength=1)
+    term_ptr = np.concatenate(([0], np.cumsum(df)))
+
+    # Products each row costs, to cut blocks
+    cost = np.concatenate(([0], np.cumsum(df[indices])))
+    rows = np.asarray(rows, dtype=np.int64)
+    row_costs = np.cumsum(cost[indptr[rows + 1]] - cost[indptr[rows]])
+
+    start = 0
+    while start < len(rows):
+        base = row_costs[start - 1] if start else 0
+        stop = max(start + 1, int(np.searchsorted(row_costs, base + BLOCK_PRODUCTS, side='right')))
+        block = rows[start:stop]
+
+        lengths = indptr[block + 1] - indptr[block]
+        entries = _ranges(indptr[block], lengths)
+        terms = indices[entries]
+        counts = df[terms]
+        postings = _ranges(term_ptr[terms], counts)
+        pair_rows = np.repeat(np.repeat(np.arange(len(block)), lengths), counts)
+        pair_docs = posting_docs[postings]
+        products = np.repeat(data[entries], counts) * posting_weights[postings]
+
+        keys, inverse = np.unique(pair_rows * n + pair_docs, return_inverse=True)
+        scores = np.bincount(inverse, weights=products)
+        local, docs = keys // n, keys % n
+        keep = (scores >= MIN_SIMILARITY) & (docs != block[local])
+        local, docs, scores = local[keep], docs[keep], scores[keep]
+
+        # Best first within each row, then cut to limit
+        order = np.lexsort((docs, -scores, local))
+        local, docs, scores = local[order], docs[order], scores[order]
+        bounds = np.searchsorted(local, np.arange(len(block) + 1))
+        if limit is not None:
+            rank = np.arange(len(local)) - bounds[local]
+            keep = rank < limit
+            local, docs, scores = local[keep], docs[keep], scores[keep]
+            bounds = np.searchsorted(local, np.arange(len(block) + 1))
+
+        docs, scores = docs.tolist(), scores.tolist()
+        for i, row in enumerate(block.tolist()):
+            yield row, docs[bounds[i]:bounds[i + 1]], scores[bounds[i]:bounds[i + 1]]
+        start = stop
+
+
+_np = False  # Not looked up yet
+
+
+def _load_numpy():
+    """NumPy module if installed, else None"""
+    global _np
+    if _np is False:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+    return _np
+
+
+class RelatedIndex:
+    """
+    Persistent related-question table over the question bank
+
+    Usage:
+        index = RelatedIndex()
+        index.refresh()                 # Recompute what changed
+        index.neighbors('phys_001')     # -> [(question ID, similarity), ...]
+    """
+
+    def __init__(self, corpus: Optional[Corpus] = None, path: Optional[Path] = None):
+        """
+        Args:
+            corpus: Question bank (default: auto-discovered)
+            path: Table database (default: data/cache/related-<dir hash>.sqlite3)
+        """
+        self.corpus = corpus or Corpus()
+        if path is None:
+            # Directory hash keeps tables of different question trees apart
+            dir_key = hashlib.sha1(str(self.corpus.questions_dir.resolve()).encode('utf-8')).hexdigest()[:8]
+            path = CACHE_DIR / f"related-{dir_key}.sqlite3"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            # Vector scheme changed; the table is a cache, so rebuild it
+            self.conn.executescript('DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS meta; '
+                                    'DROP TABLE IF EXISTS terms; DROP TABLE IF EXISTS questions;')
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM questions').fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def refresh(self, full: bool = False) -> int:
+        """
+        Bring the table up to date with the category files
+
+        Args:
+            full: Rebuild every vector and neighbour list
+
+        Returns:
+            Number of questions whose neighbour lists were recomputed
+        """
+        indexed = {name: (mtime_ns, size) for name, mtime_ns, size in
+                   self.conn.execute('SELECT name, mtime_ns, size FROM files')}
+        current = {}
+        for path in self.corpus.files():
+            st = path.stat()
+            current[path.name] = (path, st.st_mtime_ns, st.st_size)
+        changed = {name: entry for name, entry in current.items() if indexed.get(name) != entry[1:]}
+        documents = self._meta('documents')
+
+        if full or documents is None:
+            return self._rebuild(current)
+        if not changed and set(indexed) == set(current):
+            return 0
+
+        # Questions of the changed files, and which of them are new or edited
+        stored = {qid: (file, digest) for qid, file, digest in
+                  self.conn.execute('SELECT id, file, hash FROM questions')}
+        fresh: Dict[str, Tuple[str, Dict, str, str]] = {}
+        for name, (path, _, _) in changed.items():
+            for question in self.corpus.open(path).iter_questions():
+                text = related_text(question)
+                fresh[question['id']] = (name, text, text_hash(text), question.get('question_en', ''))
+        stale_files = set(changed) | (set(indexed) - set(current))
+        removed = {qid for qid, (file, _) in stored.items() if file in stale_files and qid not in fresh}
+        edited = {qid for qid, (_, _, digest, _) in fresh.items()
+                  if qid not in stored or stored[qid][1] != digest}
+
+        total = len(stored) - len(removed) + len(set(fresh) - set(stored))
+        if len(edited) + len(removed) > REBUILD_FRACTION * max(total, documents):
+            return self._rebuild(current)
+        return self._update(current, stale_files, fresh, edited, removed)
+
+    def _meta(self, key: str) -> Optional[int]:
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _rebuild(self, current: Dict[str, Tuple[Path, int, int]]) -> int:
+        """Vectors, term table and neighbour lists of the whole bank"""
+        questions: Dict[str, Tuple[str, Dict, str]] = {}
+        for name, (path, _, _) in current.items():
+            for question in self.corpus.open(path).iter_questions():
+                questions[question['id']] = (name, related_text(question), question.get('question_en', ''))
+        ids = sorted(questions)
+        texts = [questions[qid][1] for qid in ids]
+        vectors, vocabulary, df = build_vectors(texts)
+        neighbors = {row: (docs, scores) for row, docs, scores in _similar(vectors, range(len(ids)))}
+
+        used = bytearray(len(df))
+        for term_id in vectors.indices:
+            used[term_id] = 1
+        with self.conn:
+            for table in ('files', 'meta', 'terms', 'questions'):
+                self.conn.execute(f'DELETE FROM {table}')
+            self.conn.executemany('INSERT INTO terms (term, id, df) VALUES (?, ?, ?)',
+                                  ((term, term_id, df[term_id]) for term, term_id in vocabulary.items()
+                                   if used[term_id]))
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('documents', ?)", (len(ids),))
+            self.conn.executemany(
+                'INSERT INTO questions (id, file, hash, question_en, terms, weights, neighbors, scores) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                ((qid, questions[qid][0], text_hash(texts[row]), questions[qid][2],
+                  *(part.tobytes() for part in vectors.row(row)),
+                  ' '.join(ids[doc] for doc in neighbors[row][0]), array('f', neighbors[row][1]).tobytes())
+                 for row, qid in enumerate(ids)))
+            self._write_files(current)
+        return len(ids)
+
+    def _update(self, current, stale_files, fresh, edited, removed) -> int:
+        """Recompute the lists that changed questions can affect"""
+        stored = {row[0]: row[1:] for row in self.conn.execute(
+            'SELECT id, file, terms, weights, neighbors, scores, hash, question_en FROM questions')}
+        ids = sorted((set(stored) - removed) | set(fresh))
+        position = {qid: row for row, qid in enumerate(ids)}
+
+        documents = self._meta('documents')
+        vocabulary = {term: (term_id, df) for term, term_id, df in
+                      self.conn.execute('SELECT term, id, df FROM terms')}
+        vectors = Vectors()
+        for qid in ids:
+            if qid in edited:
+                weighted = []
+                for term, tf in weighted_counts(fresh[qid][1]).items():
+                    entry = vocabulary.get(term)
+                    if entry is not None:
+                        weighted.append(((1 + math.log(tf)) * math.log(documents / entry[1]), entry[0]))
+                vectors.append(*_top_terms(weighted))
+            else:
+                vectors.append(array('I', stored[qid][1]), array('d', stored[qid][2]))
+
+        # Lists to recompute: the changed questions', and any listing one of
+        # them (or a removed question)
+        gone = edited | removed
+        lists: Dict[int, List[Tuple[int, float]]] = {}
+        recompute = sorted({position[qid] for qid in edited} |
+                           {position[qid] for qid in ids if qid not in edited
+                            and not gone.isdisjoint(stored[qid][3].split())})
+        for row, docs, scores in _similar(vectors, recompute):
+            lists[row] = list(zip(docs, scores))
+        recomputed = set(lists)
+
+        # Other lists take in changed questions that now rank in them
+        # (similarity is symmetric)
+        for row, docs, scores in _similar(vectors, sorted(position[qid] for qid in edited), limit=None):
+            for doc, score in zip(docs, scores):
+                if doc in recomputed:
+                    continue
+                if doc in lists:
+                    entries = lists[doc]
+                else:
+                    names, packed = stored[ids[doc]][3:5]
+                    entries = [(position[name], s) for name, s in zip(names.split(), array('f', packed))]
+                if len(entries) == NEIGHBORS and (score, -row) <= (entries[-1][1], -entries[-1][0]):
+                    continue
+                entries = sorted(entries + [(row, score)], key=lambda pair: (-pair[1], pair[0]))[:NEIGHBORS]
+                lists[doc] = entries
+
+        with self.conn:
+            self.conn.executemany('DELETE FROM questions WHERE id = ?', ((qid,) for qid in removed))
+            for qid, (file, _, digest, question_en) in fresh.items():
+                if qid not in edited:
+                    # Unchanged text, but possibly moved to another file
+                    self.conn.execute('UPDATE questions SET file = ? WHERE id = ?', (file, qid))
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO questions (id, file, hash, question_en, terms, weights, neighbors, scores) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (self._row(ids, row, fresh, stored, vectors, entries) for row, entries in lists.items()))
+            self._write_files({name: current[name] for name in stale_files if name in current},
+                              dropped=stale_files - set(current))
+        return len(lists)
+
+    @staticmethod
+    def _row(ids, row, fresh, stored, vectors, entries) -> Tuple:
+        qid = ids[row]
+        if qid in fresh:
+            file, _, digest, question_en = fresh[qid]
+        else:
+            file, digest, question_en = stored[qid][0], stored[qid][5], stored[qid][6]
+        terms, weights = vectors.row(row)
+        names = ' '.join(ids[doc] for doc, _ in entries)
+        scores = array('f', [score for _, score in entries]).tobytes()
+        return qid, file, digest, question_en, terms.tobytes(), weights.tobytes(), names, scores
+
+    def _write_files(self, updated: Dict[str, Tuple[Path, int, int]], dropped: Iterable[str] = ()):
+        self.conn.executemany('DELETE FROM files WHERE name = ?', ((name,) for name in dropped))
+        self.conn.executemany('INSERT OR REPLACE INTO files (name, mtime_ns, size) VALUES (?, ?, ?)',
+                              ((name, mtime_ns, size) for name, (_, mtime_ns, size) in updated.items()))
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def neighbors(self, question_id: str) -> List[Tuple[str, float]]:
+        """(question ID, cosine similarity) of a question's related questions, most similar first"""
+        row = self.conn.execute('SELECT neighbors, scores FROM questions WHERE id = ?', (question_id,)).fetchone()
+        if row is None:
+            return []
+        return list(zip(row[0].split(), array('f', row[1])))
+
+    def table(self) -> Dict[str, List[Tuple[str, float]]]:
+        """Question ID -> neighbors(question ID), for every question"""
+        return {qid: list(zip(names.split(), array('f', scores))) for qid, names, scores in
+                self.conn.execute('SELECT id, neighbors, scores FROM questions ORDER BY id')}
+
+    def questions(self) -> Dict[str, Tuple[str, str]]:
+        """Question ID -> (category file, question_en)"""
+        return {qid: (file, question_en) for qid, file, question_en in
+                self.conn.execute('SELECT id, file, question_en FROM questions')}
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import sys
+    import time
+
+    with RelatedIndex() as index:
+        start = time.perf_counter()
+        recomputed = index.refresh(full='--full' in sys.argv)
+        print(f"Recomputed {recomputed} of {len(index)} questions in {time.perf_counter() - start:.2f}s")
+        texts = index.questions()
+        for qid in [arg for arg in sys.argv[1:] if not arg.startswith('--')] or list(texts)[:3]:
+            print(f"\n{qid}: {texts.get(qid, ('', '?'))[1]}")
+            for other, score in index.neighbors(qid):
+                print(f"  {score:.2f}  {other}: {texts[other][1]}")
@@ -0,0 +1,572 @@
+#!/usr/bin/env python3
+"""
+Log Rollups - Time-bucketed aggregates of quiz answer/share events
+
+Folds data/logs/quiz_answers.jsonl and quiz_shares.jsonl into hourly and
+daily counters per question ID, category, difficulty and language, stored
+in SQLite (data/logs/rollups.sqlite3). Ingestion is incremental (the same
+byte-offset cursors as log_analytics, committed in the same transaction as
+the counters), so range queries like "accuracy for chem_* over the last 7
+days" never touch the raw logs.
+
+Unique sessions are kept as mergeable HyperLogLog sketches per day (overall,
+per category and per question), and the most active sessions per day as a
+Count-Min TopK, so distinct-session counts over any range of days take
+constant memory instead of a set of every sessionId. Databases created
+before sketches existed are upgraded in place; their sketches only cover
+events ingested after the upgrade.
+
+Raw logs can then be compacted: rotate_logs() renames the live logs aside
+(the API routes start fresh files on their next append) and
+archive_segments() gzips the drained segments into data/logs/archive/.
+"""
+
+import gzip
+import json
+import os
+import shutil
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .log_analytics import (ANSWERS_LOG, ARCHIVE_DIR, LOGS_DIR, SEGMENT_SUFFIX, SHARES_LOG, consume_log,
+                                event_key)
+    from .sketches import HyperLogLog, TopK
+except ImportError:  # Run directly as a script
+    from log_analytics import (ANSWERS_LOG, ARCHIVE_DIR, LOGS_DIR, SEGMENT_SUFFIX, SHARES_LOG, consume_log,
+                               event_key)
+    from sketches import HyperLogLog, TopK
+
+ROLLUPS_DB = 'rollups.sqlite3'
+
+SCHEMA_VERSION = 2
+
+# Hourly rows older than this are dropped by prune_hourly(); daily rows are kept
+HOURLY_RETENTION_DAYS = 30
+
+# Flush in-memory counters to SQLite after this many distinct rows
+FLUSH_ROWS = 50_000
+
+# Flush session sketches after this many are held in memory (4 KiB each)
+FLUSH_SKETCHES = 2_000
+
+# Session sketch dimensions (the 'all' dimension has the single key 'all')
+SKETCH_DIMENSIONS = {'all': None, 'category': 'category', 'question': 'questionId'}
+
+TOP_SESSIONS = 10
+
+# Dimensions accepted by query(..., by=...)
+DIMENSIONS = {
+    'question': 'question_id',
+    'category': 'category',
+    'difficulty': 'difficulty',
+    'language': 'language',
+    'method': 'method',  # Shares only
+}
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS answer_rollups (
+    grain TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    language TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    PRIMARY KEY (grain, bucket, question_id, category, difficulty, language)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS share_rollups (
+    grain TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    language TEXT NOT NULL,
+    method TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    PRIMARY KEY (grain, bucket, question_id, category, difficulty, language, method)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS session_sketches (
+    day TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    key TEXT NOT NULL,
+    hll BLOB NOT NULL,
+    PRIMARY KEY (day, dimension, key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS active_sessions (
+    day TEXT PRIMARY KEY,
+    topk TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS cursors (
+    log TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+'''
+
+
+def event_buckets(timestamp) -> Optional[Tuple[str, str]]:
+    """
+    UTC hour and day buckets for an event timestamp
+
+    Returns:
+        ('YYYY-MM-DDTHH', 'YYYY-MM-DD'), or None if unparseable
+    """
+    if not isinstance(timestamp, str):
+        return None
+    # Fast path: the API routes log Date.toISOString() (always UTC, 'Z')
+    if len(timestamp) >= 13 and timestamp[10] == 'T' and timestamp.endswith('Z'):
+        return timestamp[:13], timestamp[:10]
+    try:
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    hour = dt.strftime('%Y-%m-%dT%H')
+    return hour, hour[:10]
+
+
+class _SessionSketches:
+    """Per-day session sketches, merged into SQLite on flush"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.hlls: Dict[Tuple[str, str, str], HyperLogLog] = {}
+        self.active: Dict[str, TopK] = {}
+
+    def add(self, day: str, event: Dict):
+        session_id = event_key(event, 'sessionId')
+        for dimension, field in SKETCH_DIMENSIONS.items():
+            key = (day, dimension, 'all' if field is None else event_key(event, field))
+            hll = self.hlls.get(key)
+            if hll is None:
+                hll = self.hlls[key] = HyperLogLog()
+            hll.add(session_id)
+
+        active = self.active.get(day)
+        if active is None:
+            active = self.active[day] = TopK(k=TOP_SESSIONS)
+        active.add(session_id)
+
+        if len(self.hlls) + len(self.active) >= FLUSH_SKETCHES:
+            self.flush()
+
+    def flush(self):
+        for (day, dimension, key), hll in self.hlls.items():
+            row = self.conn.execute(
+                'SELECT hll FROM session_sketches WHERE day = ? AND dimension = ? AND key = ?',
+                (day, dimension, key)).fetchone()
+            if row is not None:
+                hll.merge(HyperLogLog.from_bytes(row[0]))
+            self.conn.execute(
+                'INSERT OR REPLACE INTO session_sketches (day, dimension, key, hll) VALUES (?, ?, ?, ?)',
+                (day, dimension, key, hll.to_bytes()))
+
+        for day, active in self.active.items():
+            row = self.conn.execute('SELECT topk FROM active_sessions WHERE day = ?', (day,)).fetchone()
+            if row is not None:
+                active.merge(TopK.from_state(json.loads(row[0])))
+            self.conn.execute('INSERT OR REPLACE INTO active_sessions (day, topk) VALUES (?, ?)',
+                              (day, json.dumps(active.to_state())))
+
+        self.hlls.clear()
+        self.active.clear()
+
+
+class _Buckets:
+    """In-memory counters for one log, flushed into SQLite with upserts"""
+
+    def __init__(self, conn: sqlite3.Connection, table: str, dimensions: Tuple[str, ...],
+                 counts_correct: bool, sketches: Optional[_SessionSketches] = None):
+        self.conn = conn
+        self.table = table
+        self.dimensions = dimensions
+        self.counts_correct = counts_correct
+        self.sketches = sketches
+        self.rows: Dict[tuple, list] = {}
+        self.events = 0
+        self.skipped = 0
+
+        key_columns = ('grain', 'bucket', 'question_id', 'category', 'difficulty', 'language',
+                       *(('method',) if 'method' in dimensions else ()))
+        counters = ('total', 'correct') if counts_correct else ('total',)
+        columns = key_columns + counters
+        updates = ', '.join(f"{c} = {c} + excluded.{c}" for c in counters)
+        self.sql = (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT ({', '.join(key_columns)}) DO UPDATE SET {updates}"
+        )
+
+    def add(self, event: Dict):
+        buckets = event_buckets(event.get('timestamp'))
+        if buckets is None:
+            self.skipped += 1
+            return
+        self.events += 1
+        dims = tuple(event_key(event, field) for field in self.dimensions)
+        is_correct = bool(event.get('isCorrect'))
+        for grain, bucket in zip(('hour', 'day'), buckets):
+            counters = self.rows.get((grain, bucket, dims))
+            if counters is None:
+                counters = self.rows[(grain, bucket, dims)] = [0, 0]
+            counters[0] += 1
+            counters[1] += is_correct
+        if self.sketches is not None:
+            self.sketches.add(buckets[1], event)
+        if len(self.rows) >= FLUSH_ROWS:
+            self.flush()
+
+    def flush(self):
+        if self.counts_correct:
+            params = ((grain, bucket, *dims, total, correct)
+                      for (grain, bucket, dims), (total, correct) in self.rows.items())
+        else:
+            params = ((grain, bucket, *dims, total)
+                      for (grain, bucket, dims), (total, _) in self.rows.items())
+        self.conn.executemany(self.sql, params)
+        self.rows.clear()
+        if self.sketches is not None:
+            self.sketches.flush()
+
+
+class RollupStore:
+    """
+    SQLite-backed hourly/daily rollups of the quiz logs
+
+    Usage:
+        with RollupStore() as store:
+            store.ingest()
+            store.query('answers', questions='chem_*', since=days_ago(7))
+    """
+
+    def __init__(self, path: Optional[Path] = None, logs_dir: Optional[Path] = None):
+        """
+        Args:
+            path: Database file (default: <logs_dir>/rollups.sqlite3)
+            logs_dir: Directory with the JSONL logs (default: data/logs)
+        """
+        self.logs_dir = Path(logs_dir) if logs_dir else LOGS_DIR
+        self.path = Path(path) if path else self.logs_dir / ROLLUPS_DB
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, 1, SCHEMA_VERSION):
+            raise ValueError(f"{self.path} has schema version {version}, expected {SCHEMA_VERSION}")
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def cursors(self) -> Dict[str, Dict]:
+        """Current read position per log"""
+        return {log: json.loads(state) for log, state in self.conn.execute('SELECT log, state FROM cursors')}
+
+    def ingest(self) -> Dict:
+        """
+        Fold newly appended log lines into the rollups
+
+        Counters and cursors are committed in one transaction, so an
+        interrupted run never double counts.
+
+        Returns:
+            Dict with events/skipped per log and rotation notes
+        """
+        cursors = self.cursors()
+        notes: list = []
+        report = {'notes': notes}
+
+        with self.conn:
+            for name, filename, table, dimensions, counts_correct in (
+                ('answers', ANSWERS_LOG, 'answer_rollups',
+                 ('questionId', 'category', 'difficulty', 'language'), True),
+                ('shares', SHARES_LOG, 'share_rollups',
+                 ('questionId', 'category', 'difficulty', 'language', 'method'), False),
+            ):
+                sketches = _SessionSketches(self.conn) if name == 'answers' else None
+                buckets = _Buckets(self.conn, table, dimensions, counts_correct, sketches)
+                cursor = consume_log(self.logs_dir / filename, cursors.get(name), buckets, notes)
+                buckets.flush()
+
+                if cursor is None:
+                    self.conn.execute('DELETE FROM cursors WHERE log = ?', (name,))
+                else:
+                    self.conn.execute('INSERT OR REPLACE INTO cursors (log, state) VALUES (?, ?)',
+                                      (name, json.dumps(cursor)))
+                report[name] = {'events': buckets.events, 'skipped': buckets.skipped}
+
+        return report
+
+    def prune_hourly(self, keep_days: int = HOURLY_RETENTION_DAYS) -> int:
+        """Drop hourly rows older than keep_days; returns rows deleted"""
+        cutoff = _hour_bucket(datetime.now(timezone.utc) - timedelta(days=keep_days))
+        deleted = 0
+        with self.conn:
+            for table in ('answer_rollups', 'share_rollups'):
+                deleted += self.conn.execute(
+                    f"DELETE FROM {table} WHERE grain = 'hour' AND bucket < ?", (cutoff,)).rowcount
+        return deleted
+
+    def query(self, kind: str = 'answers', since: Optional[datetime] = None,
+              until: Optional[datetime] = None, questions: Optional[str] = None,
+              by: Optional[str] = None, **filters) -> List[Dict]:
+        """
+        Aggregate rollups over a time range
+
+        Uses hourly rows when the range starts inside the hourly retention
+        window, otherwise daily rows (whole UTC days, so the first day is
+        counted in full).
+
+        Args:
+            kind: 'answers' or 'shares'
+            since: Range start (UTC, inclusive); None for all history
+            until: Range end (UTC, exclusive); None for now
+            questions: Question ID glob, e.g. 'chem_*'
+            by: Group by a dimension (see DIMENSIONS), 'day' or 'hour'
+            **filters: Exact matches on category/difficulty/language/method
+
+        Returns:
+            List of {'key', 'total', ['correct', 'accuracy']} dicts, largest first
+        """
+        if kind not in ('answers', 'shares'):
+            raise ValueError(f"Unknown kind: {kind}")
+        table = 'answer_rollups' if kind == 'answers' else 'share_rollups'
+
+        retention_start = datetime.now(timezone.utc) - timedelta(days=HOURLY_RETENTION_DAYS)
+        hourly = by == 'hour' or (since is not None and _utc(since) >= retention_start)
+        grain = 'hour' if hourly else 'day'
+        fmt = _hour_bucket if hourly else _day_bucket
+
+        where = ['grain = ?']
+        params: list = [grain]
+        if since is not None:
+            where.append('bucket >= ?')
+            params.append(fmt(since))
+        if until is not None:
+            where.append('bucket < ?')
+            params.append(fmt(until))
+        if questions:
+            where.append('question_id GLOB ?')
+            params.append(questions)
+        for name, value in filters.items():
+            if value is None:
+                continue
+            if name not in DIMENSIONS or (name == 'method' and kind == 'answers'):
+                raise ValueError(f"Unknown filter for {kind}: {name}")
+            where.append(f"{DIMENSIONS[name]} = ?")
+            params.append(value)
+
+        if by is None:
+            key = "'all'"
+        elif by == 'day':
+            key = 'substr(bucket, 1, 10)'
+        elif by == 'hour':
+            key = 'bucket'
+        elif by in DIMENSIONS and not (by == 'method' and kind == 'answers'):
+            key = DIMENSIONS[by]
+        else:
+            raise ValueError(f"Cannot group {kind} by {by}")
+
+        correct = 'SUM(correct)' if kind == 'answers' else '0'
+        rows = self.conn.execute(
+            f"SELECT {key}, SUM(total), {correct} FROM {table} "
+            f"WHERE {' AND '.join(where)} GROUP BY 1 ORDER BY 2 DESC, 1",
+            params,
+        ).fetchall()
+
+        results = []
+        for key_value, total, n_correct in rows:
+            row = {'key': key_value, 'total': total}
+            if kind == 'answers':
+                row['correct'] = n_correct
+                row['accuracy'] = round(n_correct / total * 100, 1) if total else 0
+            results.append(row)
+        return results
+
+
+    def _day_range(self, since: Optional[datetime], until: Optional[datetime]) -> Tuple[list, list]:
+        where, params = [], []
+        if since is not None:
+            where.append('day >= ?')
+            params.append(_day_bucket(since))
+        if until is not None:
+            where.append('day < ?')
+            params.append(_day_bucket(until))
+        return where, params
+
+    def unique_sessions(self, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                        questions: Optional[str] = None, category: Optional[str] = None,
+                        by: Optional[str] = None) -> List[Dict]:
+        """
+        Estimated distinct sessions over whole UTC days
+
+        Args:
+            since, until: Day range [since, until); None for unbounded
+            questions: Only sessions that answered questions matching this glob
+            category: Only sessions that answered this category
+            by: Group by 'day', 'question' or 'category'
+
+        Returns:
+            List of {'key', 'sessions'} dicts, largest first
+        """
+        if by not in (None, 'day', 'question', 'category'):
+            raise ValueError(f"Cannot group unique sessions by {by}")
+
+        # Sketches are kept per question or per category, not per pair
+        if questions or by == 'question':
+            if category or by == 'category':
+                raise ValueError('Unique sessions cannot combine question and category filters/grouping')
+            dimension = 'question'
+        elif category or by == 'category':
+            dimension = 'category'
+        else:
+            dimension = 'all'
+
+        where, params = self._day_range(since, until)
+        where.append('dimension = ?')
+        params.append(dimension)
+        if questions:
+            where.append('key GLOB ?')
+            params.append(questions)
+        if category:
+            where.append('key = ?')
+            params.append(category)
+
+        merged: Dict[str, HyperLogLog] = {}
+        for day, key, blob in self.conn.execute(
+                f"SELECT day, key, hll FROM session_sketches WHERE {' AND '.join(where)}", params):
+            group = day if by == 'day' else key if by in ('question', 'category') else 'all'
+            hll = HyperLogLog.from_bytes(blob)
+            if group in merged:
+                merged[group].merge(hll)
+            else:
+                merged[group] = hll
+
+        results = [{'key': group, 'sessions': hll.count()} for group, hll in merged.items()]
+        results.sort(key=lambda row: (-row['sessions'], row['key']))
+        return results
+
+    def top_sessions(self, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                     n: int = TOP_SESSIONS) -> List[Dict]:
+        """
+        Most active sessions over whole UTC days (Count-Min estimates)
+
+        Returns:
+            List of {'sessionId', 'answers'} dicts, most answers first
+        """
+        where, params = self._day_range(since, until)
+        sql = 'SELECT topk FROM active_sessions' + (f" WHERE {' AND '.join(where)}" if where else '')
+
+        merged = None
+        for (state,) in self.conn.execute(sql, params):
+            topk = TopK.from_state(json.loads(state))
+            merged = topk if merged is None else merged.merge(topk)
+        if merged is None:
+            return []
+        return [{'sessionId': session_id, 'answers': answers} for session_id, answers in merged.top(n)]
+
+
+def _utc(dt: datetime) -> datetime:
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+
+def _hour_bucket(dt: datetime) -> str:
+    return _utc(dt).strftime('%Y-%m-%dT%H')
+
+
+def _day_bucket(dt: datetime) -> str:
+    return _utc(dt).strftime('%Y-%m-%d')
+
+
+def days_ago(days: float) -> datetime:
+    """UTC datetime `days` before now, for query(since=...)"""
+    return datetime.now(timezone.utc) - timedelta(days=days)
+
+
+def rotate_logs(logs_dir: Optional[Path] = None) -> List[Path]:
+    """
+    Rename the live logs aside as segments for archiving
+
+    The API routes open the log path on every append, so the next event
+    starts a fresh file. Consumers following the old inode (rollups, the
+    stats checkpoint) drain the segment on their next run.
+
+    Returns:
+        Segment paths created
+    """
+    logs_dir = Path(logs_dir) if logs_dir else LOGS_DIR
+    stamp = time.strftime('%Y%m%dT%H%M%S', time.gmtime())
+    segments = []
+    for filename in (ANSWERS_LOG, SHARES_LOG):
+        path = logs_dir / filename
+        if not path.exists() or path.stat().st_size == 0:
+            continue
+        segment = logs_dir / f"{filename}.{stamp}{SEGMENT_SUFFIX}"
+        os.rename(path, segment)
+        segments.append(segment)
+    return segments
+
+
+def archive_segments(logs_dir: Optional[Path] = None, in_use: Optional[set] = None) -> List[Path]:
+    """
+    Gzip rotated segments into <logs_dir>/archive/ and delete the originals
+
+    Args:
+        logs_dir: Directory with the JSONL logs
+        in_use: (inode, dev) pairs a consumer has not finished reading;
+                those segments are left in place
+
+    Returns:
+        Archive paths written
+    """
+    logs_dir = Path(logs_dir) if logs_dir else LOGS_DIR
+    archive_dir = logs_dir / ARCHIVE_DIR
+    in_use = in_use or set()
+    archived = []
+
+    for segment in sorted(logs_dir.glob(f"*{SEGMENT_SUFFIX}")):
+        st = segment.stat()
+        if (st.st_ino, st.st_dev) in in_use:
+            continue
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        target = archive_dir / (segment.name[:-len(SEGMENT_SUFFIX)] + '.gz')
+        tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        try:
+            with open(segment, 'rb') as src, gzip.open(tmp_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(tmp_path, target)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        segment.unlink()
+        archived.append(target)
+
+    return archived
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import sys
+
+    logs_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else LOGS_DIR
+    with RollupStore(logs_dir=logs_dir) as store:
+        print(store.ingest())
+        for row in store.query('answers', by='category'):
+            print(row)
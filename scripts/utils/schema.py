@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Schema Compiler - JSON Schemas in scripts/schemas/ compiled to Python code
+
+Drafts, category files and single questions are all checked against the
+schemas in scripts/schemas/. Rather than walking a schema for every value,
+each schema is translated once into Python source (one pair of functions
+per definition) and compiled with exec:
+
+- ok_N(value) -> bool       short-circuits on the first problem, no paths
+- errors_N(value, path, errors)
+                            collects every problem with its path,
+                            e.g. "questions[3].choices_en[1]: too long: ..."
+
+A Validator runs the fast function first and only builds error paths for
+values that fail, so valid data (the common case) costs a few attribute
+checks per field.
+
+Supports the draft-07 subset our schemas use: type, enum, required,
+properties, additionalProperties (boolean), items, minItems, maxItems,
+minLength, maxLength, minimum, maximum, pattern and local $ref
+("#/definitions/..."). Any other keyword is rejected at compile time
+rather than silently ignored.
+"""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+SCHEMA_DIR = Path(__file__).resolve().parent.parent / 'schemas'
+
+# Annotations that do not constrain values
+_ANNOTATIONS = frozenset({'$schema', '$id', '$comment', 'title', 'description', 'default',
+                          'examples', 'definitions'})
+_KEYWORDS = frozenset({'type', 'enum', 'required', 'properties', 'additionalProperties', 'items',
+                       'minItems', 'maxItems', 'minLength', 'maxLength', 'minimum', 'maximum',
+                       'pattern', '$ref'})
+
+_TYPE_CHECKS = {
+    'string': 'isinstance({v}, str)',
+    'integer': '(isinstance({v}, int) and not isinstance({v}, bool))',
+    'number': '(isinstance({v}, (int, float)) and not isinstance({v}, bool))',
+    'boolean': 'isinstance({v}, bool)',
+    'array': 'isinstance({v}, list)',
+    'object': 'isinstance({v}, dict)',
+    'null': '({v} is None)',
+}
+# Fixed-length arrays up to this size get one check per position, not a loop
+_UNROLL_ITEMS = 8
+_JSON_TYPES = {str: 'string', int: 'integer', float: 'number', bool: 'boolean',
+               list: 'array', dict: 'object', type(None): 'null'}
+
+
+class SchemaError:
+    """One schema violation: where (a JSON path) and what"""
+
+    __slots__ = ('path', 'message')
+
+    def __init__(self, path: str, message: str):
+        self.path = path
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}" if self.path else self.message
+
+    def __repr__(self) -> str:
+        return f"SchemaError({self.path!r}, {self.message!r})"
+
+
+def _json_type(value: Any) -> str:
+    return _JSON_TYPES.get(type(value), type(value).__name__)
+
+
+class Validator:
+    """A compiled schema; call it with a value to get its SchemaErrors"""
+
+    __slots__ = ('source', 'is_valid', '_collect')
+
+    def __init__(self, source: str, is_valid: Callable[[Any], bool],
+                 collect: Callable[[Any, str, List[SchemaError]], None]):
+        self.source = source
+        self.is_valid = is_valid
+        self._collect = collect
+
+    def __call__(self, value: Any, path: str = '') -> List[SchemaError]:
+        """
+        Args:
+            value: Decoded JSON/YAML value
+            path: Prefix for error paths (e.g. "questions[3]")
+
+        Returns:
+            Every violation, or an empty list
+        """
+        if self.is_valid(value):
+            return []
+        errors: List[SchemaError] = []
+        self._collect(value, path, errors)
+        return errors
+
+
+class _Expr(str):
+    """Generated-code expression (rather than literal text) in an error message"""
+
+
+class _Generator:
+    """Emits Python source for a schema document"""
+
+    def __init__(self, document: Dict):
+        self.document = document
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {}
+        self.functions: Dict[str, str] = {}
+        self._pending: List[str] = []
+        self._names = 0
+
+    def generate(self, pointer: str) -> str:
+        root = self._function_for(pointer)
+        while self._pending:
+            pointer = self._pending.pop()
+            schema = _resolve(self.document, pointer)
+            suffix = self.functions[pointer]
+            for errors in (False, True):
+                if errors:
+                    self.lines.append(f"def errors{suffix}(v0, path, errors):")
+                else:
+                    self.lines.append(f"def ok{suffix}(v0):")
+                body = self._node(schema, 'v0', 'path', errors)
+                if not errors:
+                    body.append('return True')
+                self.lines.extend('    ' + line for line in body or ['pass'])
+                self.lines.append('')
+        return root
+
+    def _function_for(self, pointer: str) -> str:
+        suffix = self.functions.get(pointer)
+        if suffix is None:
+            suffix = self.functions[pointer] = f"_{len(self.functions)}"
+            self._pending.append(pointer)
+        return suffix
+
+    def _constant(self, value: Any) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def _name(self, prefix: str) -> str:
+        self._names += 1
+        return f"{prefix}{self._names}"
+
+    @staticmethod
+    def _fail(path: str, errors: bool, *parts: str) -> str:
+        """Statement for a violation; parts are literal text or _Expr code"""
+        if not errors:
+            return 'return False'
+        message = ' + '.join(f"str({p})" if isinstance(p, _Expr) else repr(p) for p in parts)
+        return f"errors.append(SchemaError({path}, {message}))"
+
+    def _node(self, schema: Dict, v: str, path: str, errors: bool) -> List[str]:
+        """Lines (unindented) checking value variable v against schema"""
+        unknown = set(schema) - _KEYWORDS - _ANNOTATIONS
+        if unknown:
+            raise ValueError(f"Unsupported schema keywords: {', '.join(sorted(unknown))}")
+
+        if '$ref' in schema:
+            suffix = self._function_for(schema['$ref'])
+            if errors:
+                # Only walk (and build paths) where the fast check fails
+                return [f"if not ok{suffix}({v}):", f"    errors{suffix}({v}, {path}, errors)"]
+            return [f"if not ok{suffix}({v}):", "    return False"]
+
+        lines: List[str] = []
+        types = schema.get('type')
+        if isinstance(types, str):
+            types = [types]
+
+        def enum_check(hashed: bool) -> List[str]:
+            if 'enum' not in schema:
+                return []
+            options = schema['enum']
+            listed = ', '.join(str(o) for o in options)
+            if hashed:
+                options = frozenset(options)
+            return [f"if {v} not in {self._constant(options)}:",
+                    '    ' + self._fail(path, errors, f"must be one of {listed}, found ", _Expr(f"repr({v})"))]
+
+        # Keyword groups, each applying to one JSON type
+        groups = (
+            ('object', self._object_checks(schema, v, path, errors)),
+            ('array', self._array_checks(schema, v, path, errors)),
+            ('string', self._string_checks(schema, v, path, errors)),
+            ('number', self._number_checks(schema, v, path, errors)),
+        )
+
+        if types:
+            check = ' or '.join(_TYPE_CHECKS[t].format(v=v) for t in types)
+            expected = ' or '.join(types)
+            lines += [f"if not ({check}):",
+                      '    ' + self._fail(path, errors, f"expected {expected}, found ", _Expr(f"_json_type({v})"))]
+            # Only scalar types reach a hashed enum lookup
+            if all(t in ('string', 'integer', 'number', 'boolean', 'null') for t in types):
+                rest = enum_check(hashed=True)
+            else:
+                lines[:0] = enum_check(hashed=False)
+                rest = []
+            for group, group_lines in groups:
+                if not group_lines:
+                    continue
+                if len(types) == 1 and (types[0] == group or (group == 'number' and types[0] == 'integer')):
+                    rest += group_lines
+                else:
+                    rest += [f"if {_TYPE_CHECKS[group].format(v=v)}:"] + ['    ' + l for l in group_lines]
+            if rest:
+                lines += ['else:'] + ['    ' + l for l in rest]
+        else:
+            lines += enum_check(hashed=False)
+            for group, group_lines in groups:
+                if group_lines:
+                    lines += [f"if {_TYPE_CHECKS[group].format(v=v)}:"] + ['    ' + l for l in group_lines]
+        return lines
+
+    def _object_checks(self, schema: Dict, v: str, path: str, errors: bool) -> List[str]:
+        lines = []
+        if errors:
+            for field in schema.get('required', ()):
+                lines += [f"if {field!r} not in {v}:",
+                          '    ' + self._fail(path, errors, f"Missing required field: {field}")]
+        elif schema.get('required'):
+            # One subset test instead of a lookup per field
+            lines += [f"if not {v}.keys() >= {self._constant(frozenset(schema['required']))}:",
+                      '    return False']
+
+        required = set(schema.get('required', ()))
+        properties = schema.get('properties', {})
+        for field, subschema in properties.items():
+            child = self._name('v')
+            child_path = self._name('p')
+            body = self._node(subschema, child, child_path, errors)
+            if not body:
+                continue
+            if errors:
+                lines.append(f"if {field!r} in {v}:")
+                lines.append(f"    {child} = {v}[{field!r}]")
+                lines.append(f"    {child_path} = {path} + {'.' + field!r} if {path} else {field!r}")
+                lines += ['    ' + l for l in body]
+            elif field in required:
+                # Presence was checked above (returning early otherwise)
+                lines.append(f"{child} = {v}[{field!r}]")
+                lines += body
+            else:
+                lines.append(f"if {field!r} in {v}:")
+                lines.append(f"    {child} = {v}[{field!r}]")
+                lines += ['    ' + l for l in body]
+
+        if schema.get('additionalProperties') is False:
+            key = self._name('k')
+            allowed = self._constant(frozenset(properties))
+            lines += [f"for {key} in {v}:",
+                      f"    if {key} not in {allowed}:",
+                      '        ' + self._fail(path, errors, "Unexpected field: ", _Expr(key))]
+        elif not isinstance(schema.get('additionalProperties', True), bool):
+            raise ValueError("Only boolean additionalProperties is supported")
+        return lines
+
+    def _array_checks(self, schema: Dict, v: str, path: str, errors: bool) -> List[str]:
+        lines = []
+        low, high = schema.get('minItems'), schema.get('maxItems')
+        if low is not None and low == high:
+            lines += [f"if len({v}) != {low}:",
+                      '    ' + self._fail(path, errors, f"must have exactly {_items(low)}, found ", _Expr(f"len({v})"))]
+        else:
+            if low is not None:
+                lines += [f"if len({v}) < {low}:",
+                          '    ' + self._fail(path, errors, f"must have at least {_items(low)}, found ", _Expr(f"len({v})"))]
+            if high is not None:
+                lines += [f"if len({v}) > {high}:",
+                          '    ' + self._fail(path, errors, f"must have at most {_items(high)}, found ", _Expr(f"len({v})"))]
+
+        if 'items' in schema:
+            item = self._name('v')
+            index = self._name('i')
+            item_path = self._name('p')
+            body = self._node(schema['items'], item, item_path, errors)
+            if body and not errors and low is not None and low == high and low <= _UNROLL_ITEMS:
+                # Length was checked above: unroll the (short, fixed) item loop
+                for position in range(low):
+                    lines.append(f"{item} = {v}[{position}]")
+                    lines += self._node(schema['items'], item, item_path, errors)
+            elif body:
+                if errors:
+                    lines.append(f"for {index}, {item} in enumerate({v}):")
+                    lines.append(f"    {item_path} = f'{{{path}}}[{{{index}}}]'")
+                else:
+                    lines.append(f"for {item} in {v}:")
+                lines += ['    ' + l for l in body]
+        return lines
+
+    def _string_checks(self, schema: Dict, v: str, path: str, errors: bool) -> List[str]:
+        lines = []
+        if 'minLength' in schema:
+            low = schema['minLength']
+            lines += [f"if len({v}) < {low}:",
+                      '    ' + self._fail(path, errors, "too short: ", _Expr(f"len({v})"), f" chars (min {low})")]
+        if 'maxLength' in schema:
+            high = schema['maxLength']
+            lines += [f"if len({v}) > {high}:",
+                      '    ' + self._fail(path, errors, "too long: ", _Expr(f"len({v})"), f" chars (max {high})")]
+        if 'pattern' in schema:
+            pattern = self._constant(re.compile(schema['pattern']))
+            lines += [f"if not {pattern}.search({v}):",
+                      '    ' + self._fail(path, errors, f"does not match {schema['pattern']}: ", _Expr(f"repr({v})"))]
+        return lines
+
+    def _number_checks(self, schema: Dict, v: str, path: str, errors: bool) -> List[str]:
+        low, high = schema.get('minimum'), schema.get('maximum')
+        if low is not None and high is not None:
+            return [f"if not {low} <= {v} <= {high}:",
+                    '    ' + self._fail(path, errors, f"must be {low}-{high}, found ", _Expr(v))]
+        lines = []
+        if low is not None:
+            lines += [f"if {v} < {low}:",
+                      '    ' + self._fail(path, errors, f"must be at least {low}, found ", _Expr(v))]
+        if high is not None:
+            lines += [f"if {v} > {high}:",
+                      '    ' + self._fail(path, errors, f"must be at most {high}, found ", _Expr(v))]
+        return lines
+
+
+def _items(count: int) -> str:
+    return f"{count} item" if count == 1 else f"{count} items"
+
+
+def _resolve(document: Dict, pointer: str) -> Dict:
+    """Follow a local JSON pointer ('#' or '#/definitions/name')"""
+    if not pointer.startswith('#'):
+        raise ValueError(f"Only local $ref is supported, got {pointer}")
+    node = document
+    for part in filter(None, pointer[1:].split('/')):
+        node = node[part.replace('~1', '/').replace('~0', '~')]
+    return node
+
+
+def compile_schema(document: Dict, pointer: str = '#') -> Validator:
+    """
+    Compile a schema (or one of its definitions) into a Validator
+
+    Args:
+        document: Whole schema document ($ref targets are resolved in it)
+        pointer: Part of the document to validate against
+
+    Raises:
+        ValueError: If the schema uses keywords this compiler does not support
+    """
+    generator = _Generator(document)
+    root = generator.generate(pointer)
+    source = '\n'.join(generator.lines)
+    namespace: Dict[str, Any] = {'SchemaError': SchemaError, '_json_type': _json_type}
+    namespace.update(generator.constants)
+    exec(compile(source, f"<schema {pointer}>", 'exec'), namespace)
+    return Validator(source, namespace[f"ok{root}"], namespace[f"errors{root}"])
+
+
+@lru_cache(maxsize=None)
+def load_schema(name: str) -> Dict:
+    """Parsed scripts/schemas/<name>.schema.json"""
+    with open(SCHEMA_DIR / f"{name}.schema.json", 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def load_validator(name: str, pointer: str = '#') -> Validator:
+    """
+    Compiled validator for a schema in scripts/schemas/, built once per process
+
+    Args:
+        name: Schema name, e.g. 'question_draft' or 'question_category'
+        pointer: '#' for whole documents, '#/definitions/question' for one question
+    """
+    return compile_schema(load_schema(name), pointer)
+
+
+def format_errors(errors: List[SchemaError], limit: int = 10) -> List[str]:
+    """Printable lines for errors, at most limit plus a count of the rest"""
+    lines = [str(e) for e in errors[:limit]]
+    if len(errors) > limit:
+        lines.append(f"... and {len(errors) - limit} more")
+    return lines
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) < 3:
+        print("Usage: python3 schema.py <schema name> <file.json|file.yaml> [--source]")
+        sys.exit(1)
+
+    validator = load_validator(sys.argv[1])
+    if '--source' in sys.argv:
+        print(validator.source)
+
+    path = Path(sys.argv[2])
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix in ('.yaml', '.yml'):
+            import yaml
+            value = yaml.safe_load(f)
+        else:
+            value = json.load(f)
+
+    errors = validator(value)
+    for line in format_errors(errors, limit=50):
+        print(f"❌ {line}")
+    print(f"{'✅ Valid' if not errors else f'{len(errors)} errors'}: {path}")
+    sys.exit(1 if errors else 0)
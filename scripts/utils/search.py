@@ -0,0 +1,581 @@
+#!/usr/bin/env python3
+"""
+Question Search - Bilingual full-text index over the question bank
+
+An inverted index over every question's text (question, choices and
+explanations, English and Chinese), ranked with BM25:
+
+- English: lowercase words, stopwords dropped, reduced to their Porter
+  stems, so "floating" finds "floats". A query word ending in * matches any
+  term it starts ("photo*").
+- Chinese: every character of a run of Chinese characters, and its
+  overlapping character bigrams. Longer queries are split into bigrams, so
+  "光合作用" needs 光合, 合作 and 作用; a one-character query matches the
+  character itself.
+
+A term counts FIELD_WEIGHTS times in the field it occurs in, so a match in
+the question itself ranks above one in an explanation.
+
+Postings are kept per category file in SQLite
+(data/cache/search-<dir hash>.sqlite3) as packed arrays of question rowids
+and term counts, and are rewritten for a file when its mtime/size change.
+A term is looked up in each file's postings (keyed by file, then term),
+so re-indexing one file does not touch the others.
+Queries add up BM25 weights over those arrays, with NumPy when available.
+"""
+
+import hashlib
+import math
+import re
+import sqlite3
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .corpus import PROJECT_ROOT, Corpus
+except ImportError:  # Run directly as a script
+    from corpus import PROJECT_ROOT, Corpus
+
+CACHE_DIR = PROJECT_ROOT / 'data' / 'cache'
+SCHEMA_VERSION = 1
+
+# How many times a term counts in each field
+FIELD_WEIGHTS = {'question': 4, 'choices': 2, 'explanations': 1}
+
+# BM25 term-frequency saturation and document-length normalization
+K1 = 1.2
+B = 0.75
+
+LIMIT = 10
+
+# Queries matching at least this many postings are scored with NumPy;
+# below it, importing NumPy costs more than it saves
+BULK_POSTINGS = 20000
+
+_TOKEN = re.compile(r"[a-z0-9]+\*?|[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+STOPWORDS = frozenset(
+    'a an the do does did is are was were be been why how what when which who '
+    'of in on at to for from by with and or it its this that these those some '
+    'we you us they i my our your their them can so than then there'.split()
+)
+
+# Weighted counts are stored in one byte
+_MAX_COUNT = 255
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    rowids BLOB NOT NULL,
+    lengths BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS questions (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    file TEXT NOT NULL,
+    category TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    question_en TEXT NOT NULL,
+    question_zh TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS questions_file ON questions (file);
+
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    file TEXT NOT NULL,
+    rowids BLOB NOT NULL,
+    counts BLOB NOT NULL,
+    PRIMARY KEY (file, term)
+) WITHOUT ROWID;
+'''
+
+
+# ---------------------------------------------------------------------------
+# Porter stemmer (M.F. Porter, 1980)
+# ---------------------------------------------------------------------------
+
+def _is_consonant(word: str, i: int) -> bool:
+    c = word[i]
+    if c in 'aeiou':
+        return False
+    if c == 'y':
+        return i == 0 or not _is_consonant(word, i - 1)
+    return True
+
+
+def _measure(stem: str) -> int:
+    """m in [C](VC)^m[V]: the number of vowel-consonant sequences"""
+    m, i, n = 0, 0, len(stem)
+    while i < n and _is_consonant(stem, i):
+        i += 1
+    while i < n:
+        while i < n and not _is_consonant(stem, i):
+            i += 1
+        if i == n:
+            break
+        while i < n and _is_consonant(stem, i):
+            i += 1
+        m += 1
+    return m
+
+
+def _has_vowel(stem: str) -> bool:
+    return any(not _is_consonant(stem, i) for i in range(len(stem)))
+
+
+def _ends_double_consonant(word: str) -> bool:
+    return len(word) >= 2 and word[-1] == word[-2] and _is_consonant(word, len(word) - 1)
+
+
+def _ends_cvc(word: str) -> bool:
+    """Consonant-vowel-consonant, the last not w, x or y ('hop', not 'snow')"""
+    n = len(word)
+    return (n >= 3 and _is_consonant(word, n - 3) and not _is_consonant(word, n - 2)
+            and _is_consonant(word, n - 1) and word[-1] not in 'wxy')
+
+
+def _replace(word: str, rules, min_measure: int) -> str:
+    """Apply the rule for the longest matching suffix, if its stem is long enough"""
+    for suffix, replacement in rules:
+        if word.endswith(suffix):
+            stem = word[:len(word) - len(suffix)]
+            return stem + replacement if _measure(stem) > min_measure else word
+    return word
+
+
+_STEP2 = sorted([
+    ('ational', 'ate'), ('tional', 'tion'), ('enci', 'ence'), ('anci', 'ance'), ('izer', 'ize'),
+    ('bli', 'ble'), ('alli', 'al'), ('entli', 'ent'), ('eli', 'e'), ('ousli', 'ous'),
+    ('ization', 'ize'), ('ation', 'ate'), ('ator', 'ate'), ('alism', 'al'), ('iveness', 'ive'),
+    ('fulness', 'ful'), ('ousness', 'ous'), ('aliti', 'al'), ('iviti', 'ive'), ('biliti', 'ble'),
+    ('logi', 'log'),
+], key=lambda rule: -len(rule[0]))
+_STEP3 = sorted([
+    ('icate', 'ic'), ('ative', ''), ('alize', 'al'), ('iciti', 'ic'), ('ical', 'ic'),
+    ('ful', ''), ('ness', ''),
+], key=lambda rule: -len(rule[0]))
+_STEP4 = sorted(
+    'al ance ence er ic able ible ant ement ment ent ion ou ism ate iti ous ive ize'.split(),
+    key=lambda suffix: -len(suffix))
+
+_stems: Dict[str, str] = {}
+
+
+def stem(word: str) -> str:
+    """Porter stem of a lowercase English word ('floating' -> 'float')"""
+    cached = _stems.get(word)
+    if cached is not None:
+        return cached
+    result = word if len(word) <= 2 else _stem(word)
+    _stems[word] = result
+    return result
+
+
+def _stem(w: str) -> str:
+    # Step 1a: plurals
+    if w.endswith('sses'):
+        w = w[:-2]
+    elif w.endswith('ies'):
+        w = w[:-2]
+    elif w.endswith('s') and not w.endswith('ss'):
+        w = w[:-1]
+
+    # Step 1b: -ed, -ing
+    if w.endswith('eed'):
+        if _measure(w[:-3]) > 0:
+            w = w[:-1]
+    else:
+        for suffix in ('ed', 'ing'):
+            if w.endswith(suffix) and _has_vowel(w[:-len(suffix)]):
+                w = w[:-len(suffix)]
+                if w.endswith(('at', 'bl', 'iz')):
+                    w += 'e'
+                elif _ends_double_consonant(w) and w[-1] not in 'lsz':
+                    w = w[:-1]
+                elif _measure(w) == 1 and _ends_cvc(w):
+                    w += 'e'
+                break
+
+    # Step 1c: y -> i after a vowel-containing stem
+    if w.endswith('y') and _has_vowel(w[:-1]):
+        w = w[:-1] + 'i'
+
+    # Steps 2-3: double and single suffixes
+    w = _replace(w, _STEP2, 0)
+    w = _replace(w, _STEP3, 0)
+
+    # Step 4: strip a suffix from stems with m > 1
+    for suffix in _STEP4:
+        if w.endswith(suffix):
+            stem_ = w[:-len(suffix)]
+            if _measure(stem_) > 1 and (suffix != 'ion' or stem_.endswith(('s', 't'))):
+                w = stem_
+            break
+
+    # Step 5: final -e and -ll
+    if w.endswith('e'):
+        stem_ = w[:-1]
+        m = _measure(stem_)
+        if m > 1 or (m == 1 and not _ends_cvc(stem_)):
+            w = stem_
+    if w.endswith('ll') and _measure(w) > 1:
+        w = w[:-1]
+    return w
+
+
+
+# ---------------------------------------------------------------------------
+# Tokenization
+# ---------------------------------------------------------------------------
+
+def _is_chinese(token: str) -> bool:
+    return token[0] >= '\u3400'
+
+
+def tokens(text: str) -> List[str]:
+    """Index terms of English and/or Chinese text"""
+    result = []
+    for token in _TOKEN.findall(text.lower()):
+        if not _is_chinese(token):
+            token = token.rstrip('*')
+            if token not in STOPWORDS:
+                result.append(stem(token))
+            continue
+        result.extend(token)
+        result.extend([token[i:i + 2] for i in range(len(token) - 1)])
+    return result
+
+
+def query_terms(query: str) -> List[Tuple[str, bool]]:
+    """
+    (term, is prefix) pairs a query asks for, without repeats
+
+    Words ending in * match every term they start.
+    """
+    terms = []
+    for token in _TOKEN.findall(query.lower()):
+        if _is_chinese(token):
+            if len(token) == 1:
+                terms.append((token, False))
+            else:
+                terms.extend((token[i:i + 2], False) for i in range(len(token) - 1))
+        elif token.endswith('*'):
+            if len(token) > 1:
+                terms.append((token[:-1], True))
+        elif token not in STOPWORDS:
+            terms.append((stem(token), False))
+    return list(dict.fromkeys(terms))
+
+
+def weighted_counts(question: Dict) -> Dict[str, int]:
+    """Term -> count in a question, each field's terms counting FIELD_WEIGHTS times"""
+    counts: Dict[str, int] = {}
+    get = counts.get
+    fields = (
+        ('question', (question.get('question_en', ''), question.get('question_zh', ''))),
+        ('choices', (*question.get('choices_en', []), *question.get('choices_zh', []))),
+        ('explanations', (*question.get('explanations_en', []), *question.get('explanations_zh', []))),
+    )
+    for field, texts in fields:
+        weight = FIELD_WEIGHTS[field]
+        for text in texts:
+            for term in tokens(text):
+                counts[term] = get(term, 0) + weight
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SearchHit:
+    """A question matching a search"""
+    id: str
+    file: str
+    category: str
+    difficulty: str
+    question_en: str
+    question_zh: str
+    score: float
+
+
+class SearchIndex:
+    """
+    Persistent full-text index over the question bank
+
+    Usage:
+        index = SearchIndex()
+        index.refresh()                 # Re-index changed category files
+        index.search('ice floats')      # -> [SearchHit, ...]
+    """
+
+    def __init__(self, corpus: Optional[Corpus] = None, path: Optional[Path] = None):
+        """
+        Args:
+            corpus: Question bank (default: auto-discovered)
+            path: Index database (default: data/cache/search-<dir hash>.sqlite3)
+        """
+        self.corpus = corpus or Corpus()
+        if path is None:
+            # Directory hash keeps indexes of different question trees apart
+            dir_key = hashlib.sha1(str(self.corpus.questions_dir.resolve()).encode('utf-8')).hexdigest()[:8]
+            path = CACHE_DIR / f"search-{dir_key}.sqlite3"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        # Question rowids and lengths of every file, loaded on first search
+        self._lengths = None
+
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            # Tokenization changed; the index is a cache, so rebuild it
+            self.conn.executescript('DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS questions; '
+                                    'DROP TABLE IF EXISTS postings;')
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM questions').fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> int:
+        """
+        Re-index category files that changed since the last refresh
+
+        Returns:
+            Number of questions (re-)indexed
+        """
+        indexed = {name: (mtime_ns, size) for name, mtime_ns, size in
+                   self.conn.execute('SELECT name, mtime_ns, size FROM files')}
+        current = {}
+        for path in self.corpus.files():
+            st = path.stat()
+            current[path.name] = (path, st.st_mtime_ns, st.st_size)
+        changed = {name: entry for name, entry in current.items() if indexed.get(name) != entry[1:]}
+
+        updated = 0
+        with self.conn:
+            # Drop every stale file first, so a question moved between files
+            # is not briefly indexed twice
+            for name in (set(indexed) - set(current)) | set(changed):
+                self._drop_file(name)
+            for name, (path, mtime_ns, size) in changed.items():
+                updated += self._index_file(name, path, mtime_ns, size)
+        if updated or set(indexed) != set(current):
+            self._lengths = None
+        return updated
+
+    def _drop_file(self, name: str):
+        self.conn.execute('DELETE FROM postings WHERE file = ?', (name,))
+        self.conn.execute('DELETE FROM questions WHERE file = ?', (name,))
+        self.conn.execute('DELETE FROM files WHERE name = ?', (name,))
+
+    def _index_file(self, name: str, path: Path, mtime_ns: int, size: int) -> int:
+        category = self.corpus.open(path)
+        category_name = getattr(category, 'category_en', '') or name
+
+        rowids, lengths = array('I'), array('I')
+        # Term -> [rowid, count, rowid, count, ...]
+        postings: Dict[str, List[int]] = {}
+        get = postings.get
+        for question in category.iter_questions():
+            cursor = self.conn.execute(
+                'INSERT INTO questions (id, file, category, difficulty, question_en, question_zh) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (question.get('id', ''), name, category_name, question.get('difficulty', ''),
+                 question.get('question_en', ''), question.get('question_zh', '')))
+            rowid = cursor.lastrowid
+            counts = weighted_counts(question)
+            rowids.append(rowid)
+            lengths.append(sum(counts.values()))
+            for term, count in counts.items():
+                if count > _MAX_COUNT:
+                    count = _MAX_COUNT
+                entry = get(term)
+                if entry is None:
+                    postings[term] = [rowid, count]
+                else:
+                    entry += (rowid, count)
+
+        # In key order, so the rows are appended to the table's b-tree
+        self.conn.executemany(
+            'INSERT INTO postings (file, term, rowids, counts) VALUES (?, ?, ?, ?)',
+            ((name, term, array('I', postings[term][::2]).tobytes(),
+              bytes(postings[term][1::2]))
+             for term in sorted(postings)))
+        self.conn.execute('INSERT INTO files (name, mtime_ns, size, rowids, lengths) VALUES (?, ?, ?, ?, ?)',
+                          (name, mtime_ns, size, rowids.tobytes(), lengths.tobytes()))
+        return len(rowids)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def _postings(self, term: str, prefix: bool) -> List[Tuple[str, bytes, bytes]]:
+        """(file, rowids, counts) rows of a term, or of every term it starts"""
+        files = 'file IN (SELECT name FROM files)'
+        if not prefix:
+            return self.conn.execute(f'SELECT file, rowids, counts FROM postings WHERE {files} AND term = ?',
+                                     (term,)).fetchall()
+        # Terms starting with term sort between it and its last character + 1
+        upper = term[:-1] + chr(ord(term[-1]) + 1)
+        return self.conn.execute(
+            f'SELECT file, rowids, counts FROM postings WHERE {files} AND term >= ? AND term < ?',
+            (term, upper)).fetchall()
+
+    def _file_lengths(self) -> Dict[str, Tuple[bytes, bytes]]:
+        """File name -> (question rowids, lengths), as stored"""
+        if self._lengths is None:
+            self._lengths = {name: (rowids, lengths) for name, rowids, lengths in
+                             self.conn.execute('SELECT name, rowids, lengths FROM files')}
+        return self._lengths
+
+    def search(self, query: str, limit: int = LIMIT, file: Optional[str] = None,
+               any_term: bool = False) -> List[SearchHit]:
+        """
+        Questions matching query (English and/or Chinese), best first
+
+        Args:
+            limit: Maximum number of hits
+            file: Only return questions from this category file (e.g. 'physics.json')
+            any_term: Match questions containing any query term, not all
+
+        Returns:
+            Hits ranked by BM25
+        """
+        terms = query_terms(query)
+        if not terms:
+            return []
+        matches = [self._postings(term, prefix) for term, prefix in terms]
+        required = 1 if any_term else len(terms)
+        postings = sum(len(row[1]) // 4 for rows in matches for row in rows)
+        bulk = postings >= BULK_POSTINGS and _load_numpy() is not None
+        scorer = _top_numpy if bulk else _top_python
+        ranked = scorer(matches, self._file_lengths(), required, limit, file)
+        if not ranked:
+            return []
+
+        placeholders = ', '.join('?' * len(ranked))
+        rows = {row[0]: row[1:] for row in self.conn.execute(
+            f'SELECT rowid, id, file, category, difficulty, question_en, question_zh '
+            f'FROM questions WHERE rowid IN ({placeholders})', [rowid for rowid, _ in ranked])}
+        return [SearchHit(*rows[rowid], score=score) for rowid, score in ranked if rowid in rows]
+
+
+def _idf(documents: int, df: int) -> float:
+    return math.log(1 + (documents - df + 0.5) / (df + 0.5))
+
+
+def _top_numpy(matches, files, required: int, limit: int, file: Optional[str]) -> List[Tuple[int, float]]:
+    """(rowid, score) of the best questions matching at least required terms"""
+    np = _np
+    size = 1 + max((int(np.frombuffer(rowids, dtype=np.uint32).max()) for rowids, _ in files.values()
+                    if rowids), default=0)
+    lengths = np.zeros(size, dtype=np.float64)
+    for rowids, file_lengths in files.values():
+        lengths[np.frombuffer(rowids, dtype=np.uint32)] = np.frombuffer(file_lengths, dtype=np.uint32)
+    documents = sum(len(rowids) // 4 for rowids, _ in files.values())
+    if not documents:
+        return []
+    norm = K1 * (1 - B + B * lengths / (lengths.sum() / documents))
+
+    scores = np.zeros(size, dtype=np.float64)
+    matched = np.zeros(size, dtype=np.int32)
+    for rows in matches:
+        if not rows:
+            continue
+        rowids = np.concatenate([np.frombuffer(r[1], dtype=np.uint32) for r in rows])
+        counts = np.concatenate([np.frombuffer(r[2], dtype=np.uint8) for r in rows])
+        # A prefix matches several terms; their counts add up per question
+        tf = np.bincount(rowids, weights=counts, minlength=size)
+        present = np.flatnonzero(tf)
+        tf = tf[present]
+        scores[present] += _idf(documents, len(present)) * tf * (K1 + 1) / (tf + norm[present])
+        matched[present] += 1
+
+    keep = matched >= required
+    if file is not None:
+        in_file = np.zeros(size, dtype=bool)
+        if file in files:
+            in_file[np.frombuffer(files[file][0], dtype=np.uint32)] = True
+        keep &= in_file
+    candidates = np.flatnonzero(keep)
+    if len(candidates) > limit:
+        best = np.argpartition(-scores[candidates], limit - 1)[:limit]
+        candidates = candidates[best]
+    order = sorted(candidates.tolist(), key=lambda rowid: (-scores[rowid], rowid))
+    return [(rowid, float(scores[rowid])) for rowid in order]
+
+
+def _top_python(matches, files, required: int, limit: int, file: Optional[str]) -> List[Tuple[int, float]]:
+    """Pure-Python _top_numpy"""
+    lengths: Dict[int, int] = {}
+    for rowids, file_lengths in files.values():
+        lengths.update(zip(array('I', rowids), array('I', file_lengths)))
+    if not lengths:
+        return []
+    documents = len(lengths)
+    average = sum(lengths.values()) / documents
+
+    scores: Dict[int, float] = {}
+    matched: Dict[int, int] = {}
+    for rows in matches:
+        tf: Dict[int, int] = {}
+        for _, rowids, counts in rows:
+            for rowid, count in zip(array('I', rowids), counts):
+                tf[rowid] = tf.get(rowid, 0) + count
+        idf = _idf(documents, len(tf))
+        for rowid, count in tf.items():
+            norm = K1 * (1 - B + B * lengths[rowid] / average)
+            scores[rowid] = scores.get(rowid, 0.0) + idf * count * (K1 + 1) / (count + norm)
+            matched[rowid] = matched.get(rowid, 0) + 1
+
+    in_file = set(array('I', files[file][0])) if file in files else set()
+    candidates = [rowid for rowid, n in matched.items()
+                  if n >= required and (file is None or rowid in in_file)]
+    candidates.sort(key=lambda rowid: (-scores[rowid], rowid))
+    return [(rowid, scores[rowid]) for rowid in candidates[:limit]]
+
+
+_np = False  # Not looked up yet
+
+
+def _load_numpy():
+    """NumPy module if installed, else None"""
+    global _np
+    if _np is False:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+    return _np
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import sys
+
+    with SearchIndex() as index:
+        print(f"Indexed {index.refresh()} questions ({len(index)} total)")
+        for hit in index.search(' '.join(sys.argv[1:]) or 'ice float'):
+            print(f"  {hit.score:6.2f}  {hit.id}: {hit.question_en} / {hit.question_zh}")
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Question Selection - Adaptive next-question engine driven by answer history
+
+Picks each session's next question instead of shuffling the static bank:
+
+- Questions are bucketed by category and calibrated difficulty: a question
+  that calibration flags (utils/calibration.py) counts under the band its
+  answers put it in, not its assigned one.
+- Each session has a target difficulty that follows its answers: accuracy
+  over its last WINDOW answers at or above EASY_ABOVE moves it one step
+  harder, below HARD_BELOW one step easier.
+- Within a bucket a question is drawn in O(1) from a Vose alias table.
+  Questions with few answers weigh up to 1 + EXPLORATION times more, so new
+  questions collect enough answers to be calibrated.
+- Each session keeps a bitset of the questions it has been served. A draw
+  that hits one is retried up to MAX_DRAWS times, after which the bucket is
+  scanned for its unseen questions; an exhausted bucket falls back to the
+  nearest difficulty.
+
+Tables are built once from quiz_answers.jsonl (archives included) and the
+bank. Sessions live in memory; the least recently used are dropped past
+MAX_SESSIONS, or earlier on large banks so their bitsets stay within
+SESSION_MEMORY.
+"""
+
+import random
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    from .calibration import DIFFICULTIES, EASY_ABOVE, HARD_BELOW, PRIOR_STRENGTH, calibrate, tally_answers
+    from .corpus import Corpus
+except ImportError:  # Run directly as a script
+    from calibration import DIFFICULTIES, EASY_ABOVE, HARD_BELOW, PRIOR_STRENGTH, calibrate, tally_answers
+    from corpus import Corpus
+
+# Extra weight of unanswered questions, fading as answers come in
+EXPLORATION = 1.0
+
+# Answers a session's target difficulty is judged on
+WINDOW = 5
+START_DIFFICULTY = 'medium'
+
+# Alias-table draws before scanning a bucket for unseen questions
+MAX_DRAWS = 16
+
+# Sessions kept in memory, and the most their seen-bitsets may take
+MAX_SESSIONS = 100_000
+SESSION_MEMORY = 256 << 20
+
+
+def question_weight(answers: int) -> float:
+    """Sampling weight of a question with this many answers"""
+    return 1 + EXPLORATION * PRIOR_STRENGTH / (PRIOR_STRENGTH + answers)
+
+
+def fallback_order(difficulty: str) -> List[str]:
+    """Difficulties to try for a target, nearest first (easier before harder on ties)"""
+    level = DIFFICULTIES.index(difficulty)
+    return sorted(DIFFICULTIES, key=lambda d: (abs(DIFFICULTIES.index(d) - level), DIFFICULTIES.index(d)))
+
+
+class AliasTable:
+    """Vose alias table: O(1) draws of an item with probability proportional to its weight"""
+
+    __slots__ = ('items', 'prob', 'alias')
+
+    def __init__(self, items: Sequence[int], weights: Sequence[float]):
+        n = len(items)
+        total = sum(weights)
+        scaled = [weight * n / total for weight in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+        # Whatever is left is 1 up to rounding
+
+        self.items = array('I', items)
+        self.prob = array('d', prob)
+        self.alias = array('I', alias)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def draw(self, rand: random.Random) -> int:
+        u = rand.random() * len(self.items)
+        slot = int(u)
+        return self.items[slot] if u - slot < self.prob[slot] else self.items[self.alias[slot]]
+
+
+class Session:
+    """Questions served to one quiz session and its recent answers"""
+
+    __slots__ = ('seen', 'served', 'recent', 'target')
+
+    def __init__(self, size: int):
+        self.seen = bytearray((size + 7) >> 3)
+        self.served = 0
+        self.recent: List[bool] = []
+        self.target = START_DIFFICULTY
+
+    def has_seen(self, index: int) -> bool:
+        return bool(self.seen[index >> 3] >> (index & 7) & 1)
+
+    def mark_seen(self, index: int):
+        self.seen[index >> 3] |= 1 << (index & 7)
+
+
+@dataclass
+class Pick:
+    """A served question"""
+    question_id: str
+    category: str
+    difficulty: str
+    target: str
+
+    def to_dict(self) -> Dict:
+        return {'id': self.question_id, 'category': self.category,
+                'difficulty': self.difficulty, 'target': self.target}
+
+
+class SelectionEngine:
+    """
+    Next-question selection over the bank, safe to share between threads
+
+    Usage:
+        engine = SelectionEngine.from_history()
+        pick = engine.next('session-1', category='physics')
+        engine.answer('session-1', pick.question_id, correct=True)
+    """
+
+    def __init__(self, questions: Sequence[Tuple[str, str, str, int]], seed: Optional[int] = None):
+        """
+        Args:
+            questions: (question ID, category, difficulty, answers) per question;
+                category is the category file's stem ('physics')
+            seed: Random seed, for reproducible draws
+        """
+        self.ids: List[str] = []
+        self.categories: List[str] = []
+        self.difficulties: List[str] = []
+        self.weights = array('d')
+        buckets: Dict[Tuple[Optional[str], str], List[int]] = {}
+        for question_id, category, difficulty, answers in questions:
+            if difficulty not in DIFFICULTIES:
+                difficulty = 'medium'
+            index = len(self.ids)
+            self.ids.append(question_id)
+            self.categories.append(category)
+            self.difficulties.append(difficulty)
+            self.weights.append(question_weight(answers))
+            buckets.setdefault((category, difficulty), []).append(index)
+            buckets.setdefault((None, difficulty), []).append(index)
+
+        self.index = {question_id: index for index, question_id in enumerate(self.ids)}
+        self.category_names = sorted(set(self.categories))
+        # (category or None for any, difficulty) -> table
+        self.tables = {key: AliasTable(items, [self.weights[i] for i in items])
+                       for key, items in buckets.items()}
+
+        self.sessions: 'OrderedDict[str, Session]' = OrderedDict()
+        self.max_sessions = min(MAX_SESSIONS, max(1000, SESSION_MEMORY // ((len(self.ids) + 7) >> 3 or 1)))
+        self.rand = random.Random(seed)
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_history(cls, corpus: Optional[Corpus] = None, log_path: Optional[Path] = None,
+                     seed: Optional[int] = None) -> 'SelectionEngine':
+        """Engine over the bank, with difficulties and weights from the answer log"""
+        corpus = corpus or Corpus()
+        tallies, _ = tally_answers(log_path)
+        moved = {result.question_id: result.suggested for result in calibrate(tallies, corpus)
+                 if result.flagged}
+        questions = []
+        for path in corpus.files():
+            for question in corpus.open(path).iter_questions():
+                question_id = question['id']
+                difficulty = moved.get(question_id, question.get('difficulty', 'medium'))
+                questions.append((question_id, path.stem, difficulty, tallies.get(question_id, (0,))[0]))
+        return cls(questions, seed)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _session(self, session_id: str) -> Session:
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = self.sessions[session_id] = Session(len(self.ids))
+            if len(self.sessions) > self.max_sessions:
+                self.sessions.popitem(last=False)
+        else:
+            self.sessions.move_to_end(session_id)
+        return session
+
+    def _draw(self, table: AliasTable, session: Session) -> Optional[int]:
+        """Unseen item of table, or None if the session has seen them all"""
+        for _ in range(MAX_DRAWS):
+            index = table.draw(self.rand)
+            if not session.has_seen(index):
+                return index
+        # Mostly seen: choose among what is left
+        unseen = [index for index in table.items if not session.has_seen(index)]
+        if not unseen:
+            return None
+        return self.rand.choices(unseen, weights=[self.weights[index] for index in unseen])[0]
+
+    def next(self, session_id: str, category: Optional[str] = None,
+             difficulty: Optional[str] = None) -> Optional[Pick]:
+        """
+        Serve a session its next question
+
+        Args:
+            session_id: Quiz session
+            category: Category file stem to pick from (default: any)
+            difficulty: Difficulty to aim for (default: the session's target)
+
+        Returns:
+            The question, or None once the session has seen every question of the category
+
+        Raises:
+            ValueError: Unknown category or difficulty
+        """
+        if category is not None and category not in self.category_names:
+            raise ValueError(f"Unknown category: {category}")
+        if difficulty is not None and difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+
+        with self.lock:
+            session = self._session(session_id)
+            target = difficulty or session.target
+            for level in fallback_order(target):
+                table = self.tables.get((category, level))
+                index = self._draw(table, session) if table else None
+                if index is not None:
+                    session.mark_seen(index)
+                    session.served += 1
+                    return Pick(self.ids[index], self.categories[index], self.difficulties[index], target)
+        return None
+
+    def answer(self, session_id: str, question_id: str, correct: bool) -> str:
+        """
+        Record a session's answer and move its target difficulty
+
+        Returns:
+            The session's target difficulty for its next question
+        """
+        with self.lock:
+            session = self._session(session_id)
+            index = self.index.get(question_id)
+            if index is not None:
+                session.mark_seen(index)
+            recent = session.recent
+            recent.append(bool(correct))
+            del recent[:-WINDOW]
+            if len(recent) == WINDOW:
+                accuracy = sum(recent) / WINDOW
+                level = DIFFICULTIES.index(session.target)
+                step = 1 if accuracy >= EASY_ABOVE else -1 if accuracy < HARD_BELOW else 0
+                if step and 0 <= level + step < len(DIFFICULTIES):
+                    session.target = DIFFICULTIES[level + step]
+                    recent.clear()
+            return session.target
+
+    def stats(self) -> Dict:
+        """Bank and session counts"""
+        with self.lock:
+            served = sum(session.served for session in self.sessions.values())
+            return {
+                'questions': len(self.ids),
+                'categories': len(self.category_names),
+                'by_difficulty': {d: len(self.tables[(None, d)]) if (None, d) in self.tables else 0
+                                  for d in DIFFICULTIES},
+                'sessions': len(self.sessions),
+                'served': served,
+            }
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import sys
+    import time
+
+    start = time.perf_counter()
+    engine = SelectionEngine.from_history(seed=42)
+    print(f"Built {len(engine)} questions in {time.perf_counter() - start:.2f}s: {engine.stats()['by_difficulty']}")
+    category = sys.argv[1] if len(sys.argv) > 1 else None
+    for turn in range(8):
+        pick = engine.next('demo', category=category)
+        if pick is None:
+            print("Session has seen every question")
+            break
+        target = engine.answer('demo', pick.question_id, correct=turn % 4 != 3)
+        print(f"  {pick.question_id:12} {pick.category:20} {pick.difficulty:7} -> next target {target}")
+
+    calls = 100_000
+    start = time.perf_counter()
+    for i in range(calls):
+        engine.next(f"bench-{i % 1000}")
+    print(f"next(): {(time.perf_counter() - start) / calls * 1e6:.1f} µs per call")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Single Flight - Coalesce concurrent identical calls into one
+
+When several threads ask for the same thing at the same time (the same
+Wikipedia URL, the same text to translate), only the first one makes the
+call; the others wait for it and get its result, or its exception. The
+entry is dropped as soon as the call finishes, so this is not a cache: a
+later request for the same key makes a fresh call.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    """One in-flight call and the threads waiting on it"""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """In-flight call table, keyed by request"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.calls = 0      # Underlying calls made
+        self.coalesced = 0  # Requests answered by another thread's call
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        fn(*args, **kwargs), shared with any concurrent do() for the same key
+
+        Callers sharing a call get the same result object, so it should be
+        treated as read-only.
+
+        Raises:
+            Whatever fn raised, in every caller sharing the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = fn(*args, **kwargs)
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def in_flight(self) -> int:
+        """Number of calls currently running"""
+        with self._lock:
+            return len(self._calls)
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    flight = SingleFlight()
+
+    def slow_square(n):
+        time.sleep(0.2)
+        return n * n
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda i: flight.do(i % 2, slow_square, i % 2), range(16)))
+
+    print(f"Results: {results}")
+    print(f"✅ {flight.calls} calls made, {flight.coalesced} requests coalesced")
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Sketches - Constant-memory, mergeable summaries for the quiz logs
+
+HyperLogLog estimates distinct counts (unique sessions) in 2^p bytes with
+~1.04/sqrt(2^p) relative error (1.6% at the default p=12). CountMinSketch
+estimates per-key counts (never under-counting), and TopK pairs one with
+a small candidate set to track the most active sessions.
+
+All three merge by combining their tables (element-wise max for HLL
+registers, sums for Count-Min counters), so per-day or per-shard sketches
+can be combined into any time range. to_bytes()/from_bytes() give a
+compact zlib-compressed form for SQLite BLOBs or checkpoints.
+"""
+
+import hashlib
+import math
+import struct
+import zlib
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+HLL_PRECISION = 12
+CMS_WIDTH = 2048
+CMS_DEPTH = 4
+
+_HLL_HEADER = struct.Struct('<4sB')
+_CMS_HEADER = struct.Struct('<4sII')
+_HLL_MAGIC = b'MWHL'
+_CMS_MAGIC = b'MWCM'
+
+# 2^-rank for every possible register value
+_INVERSE_POWERS = [2.0 ** -rank for rank in range(65)]
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _hash128(value: str) -> Tuple[int, int]:
+    digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+
+class HyperLogLog:
+    """Distinct-count estimator over strings"""
+
+    __slots__ = ('p', 'm', 'registers')
+
+    def __init__(self, p: int = HLL_PRECISION, registers: Optional[bytearray] = None):
+        """
+        Args:
+            p: Precision; uses 2^p one-byte registers (4 <= p <= 16)
+            registers: Existing registers (from from_bytes)
+        """
+        if not 4 <= p <= 16:
+            raise ValueError(f"HyperLogLog precision must be 4-16 (got {p})")
+        self.p = p
+        self.m = 1 << p
+        self.registers = registers if registers is not None else bytearray(self.m)
+
+    def add(self, value: str):
+        x = _hash64(value)
+        index = x & (self.m - 1)
+        rank = (64 - self.p) - (x >> self.p).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, values: Iterable[str]):
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """Fold other into this sketch (union of the underlying sets)"""
+        if other.p != self.p:
+            raise ValueError(f"Cannot merge HyperLogLog p={other.p} into p={self.p}")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def count(self) -> int:
+        """Estimated number of distinct values added"""
+        m = self.m
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        estimate = alpha * m * m / sum(map(_INVERSE_POWERS.__getitem__, self.registers))
+        if estimate <= 2.5 * m:
+            zeros = self.registers.count(0)
+            if zeros:
+                # Linear counting is more accurate for small cardinalities
+                estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def to_bytes(self) -> bytes:
+        return _HLL_HEADER.pack(_HLL_MAGIC, self.p) + zlib.compress(bytes(self.registers))
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> 'HyperLogLog':
+        magic, p = _HLL_HEADER.unpack_from(blob)
+        if magic != _HLL_MAGIC:
+            raise ValueError('Not a HyperLogLog blob')
+        registers = bytearray(zlib.decompress(blob[_HLL_HEADER.size:]))
+        if len(registers) != 1 << p:
+            raise ValueError('Corrupt HyperLogLog blob')
+        return cls(p, registers)
+
+
+class CountMinSketch:
+    """Approximate per-key counters (estimates never under-count)"""
+
+    __slots__ = ('width', 'depth', 'counts')
+
+    def __init__(self, width: int = CMS_WIDTH, depth: int = CMS_DEPTH, counts: Optional[array] = None):
+        """
+        Args:
+            width: Counters per row; over-count is at most ~2N/width w.h.p.
+            depth: Rows (independent hashes); failure probability ~2^-depth
+            counts: Existing counters (from from_bytes)
+        """
+        self.width = width
+        self.depth = depth
+        self.counts = counts if counts is not None else array('Q', bytes(8 * width * depth))
+
+    def _cells(self, key: str) -> List[int]:
+        h1, h2 = _hash128(key)
+        width = self.width
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """Add count to key; returns the key's new estimate"""
+        counts = self.counts
+        estimate = None
+        for cell in self._cells(key):
+            counts[cell] += count
+            if estimate is None or counts[cell] < estimate:
+                estimate = counts[cell]
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        counts = self.counts
+        return min(counts[cell] for cell in self._cells(key))
+
+    def merge(self, other: 'CountMinSketch') -> 'CountMinSketch':
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError('Cannot merge Count-Min sketches of different shapes')
+        self.counts = array('Q', map(int.__add__, self.counts, other.counts))
+        return self
+
+    def to_bytes(self) -> bytes:
+        return _CMS_HEADER.pack(_CMS_MAGIC, self.width, self.depth) + zlib.compress(self.counts.tobytes())
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> 'CountMinSketch':
+        magic, width, depth = _CMS_HEADER.unpack_from(blob)
+        if magic != _CMS_MAGIC:
+            raise ValueError('Not a Count-Min blob')
+        counts = array('Q')
+        counts.frombytes(zlib.decompress(blob[_CMS_HEADER.size:]))
+        if len(counts) != width * depth:
+            raise ValueError('Corrupt Count-Min blob')
+        return cls(width, depth, counts)
+
+
+class TopK:
+    """
+    Most frequent keys: a Count-Min sketch plus a bounded candidate set
+
+    Candidates keep their sketch estimate; when the set is full, a new key
+    replaces the smallest candidate only if its estimate is larger.
+    """
+
+    def __init__(self, k: int = 10, capacity: Optional[int] = None,
+                 sketch: Optional[CountMinSketch] = None):
+        """
+        Args:
+            k: Keys reported by top()
+            capacity: Candidates tracked (default: 5 * k)
+        """
+        self.k = k
+        self.capacity = capacity or 5 * k
+        self.sketch = sketch or CountMinSketch()
+        self.candidates: Dict[str, int] = {}
+        self._floor: Optional[Tuple[int, str]] = None  # Cached smallest candidate
+
+    def add(self, key: str, count: int = 1):
+        estimate = self.sketch.add(key, count)
+        candidates = self.candidates
+        if key in candidates:
+            candidates[key] = estimate
+            if self._floor is not None and self._floor[1] == key:
+                self._floor = None
+            return
+        if len(candidates) < self.capacity:
+            candidates[key] = estimate
+            if self._floor is not None and estimate < self._floor[0]:
+                self._floor = (estimate, key)
+            return
+
+        if self._floor is None:
+            smallest = min(candidates, key=candidates.__getitem__)
+            self._floor = (candidates[smallest], smallest)
+        if estimate > self._floor[0]:
+            del candidates[self._floor[1]]
+            candidates[key] = estimate
+            self._floor = None
+
+    def top(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """(key, estimated count) pairs, most frequent first"""
+        ranked = sorted(self.candidates.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:n or self.k]
+
+    def merge(self, other: 'TopK') -> 'TopK':
+        self.sketch.merge(other.sketch)
+        keys = set(self.candidates) | set(other.candidates)
+        estimates = {key: self.sketch.estimate(key) for key in keys}
+        keep = sorted(estimates, key=estimates.__getitem__, reverse=True)[:self.capacity]
+        self.candidates = {key: estimates[key] for key in keep}
+        self._floor = None
+        return self
+
+    def to_state(self) -> Dict:
+        return {'k': self.k, 'capacity': self.capacity,
+                'sketch': self.sketch.to_bytes().hex(), 'candidates': self.candidates}
+
+    @classmethod
+    def from_state(cls, state: Dict) -> 'TopK':
+        topk = cls(state['k'], state['capacity'], CountMinSketch.from_bytes(bytes.fromhex(state['sketch'])))
+        topk.candidates = dict(state['candidates'])
+        return topk
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import random
+
+    for n in (100, 10_000, 1_000_000):
+        hll = HyperLogLog()
+        hll.update(str(i) for i in range(n))
+        print(f"HLL {n:>9,}: estimate {hll.count():>9,} "
+              f"({(hll.count() - n) / n * 100:+.2f}%), {len(hll.to_bytes()):,} bytes")
+
+    topk = TopK(k=5)
+    rand = random.Random(1)
+    for _ in range(200_000):
+        topk.add(f"s{int(rand.paretovariate(1.2))}")
+    print('Top sessions:', topk.top())
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Question Snapshot - Compact binary mirror of a category JSON file
+
+A snapshot stores one category file in a memory-mappable layout so that
+scripts can answer ID / count / difficulty queries without parsing the
+pretty-printed source JSON, and decode individual questions on demand.
+
+Layout (native byte order, flagged in the header):
+
+    header      MAGIC, version, flags, source mtime_ns, source size,
+                question count, string count, category_en/zh string index,
+                string index of the top-level object (questions as null)
+    created_at  int64[n]   microseconds since epoch (NO_TIMESTAMP if absent)
+    modified_at int64[n]
+    id_idx      uint32[n]  string-table index of the question ID
+    body_idx    uint32[n]  string-table index of the compact question JSON
+    offsets     uint32[s+1] string-table byte offsets
+    correct     int8[n]    correct_answer (-1 if absent/invalid)
+    difficulty  uint8[n]   index into DIFFICULTIES (255 if unknown)
+    strings     UTF-8 blob
+
+Snapshots are regenerated whenever the source file's mtime or size changes.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+MAGIC = b'MWQS'
+VERSION = 2
+FLAG_BIG_ENDIAN = 0x1
+
+# magic, version, flags, src_mtime_ns, src_size, n_questions, n_strings, cat_en, cat_zh, top
+HEADER = struct.Struct('<4sHHqqIIIII')
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+UNKNOWN_DIFFICULTY = 255
+NO_TIMESTAMP = -(2 ** 63)
+
+_DIFFICULTY_CODES = {name: code for code, name in enumerate(DIFFICULTIES)}
+
+
+def _native_flags() -> int:
+    return FLAG_BIG_ENDIAN if sys.byteorder == 'big' else 0
+
+
+def _to_micros(value) -> int:
+    """Convert an ISO-8601 timestamp to epoch microseconds"""
+    if not isinstance(value, str) or not value:
+        return NO_TIMESTAMP
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return NO_TIMESTAMP
+    if dt.tzinfo is None:
+        # Naive timestamps are treated as UTC, matching how the builder writes them
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1_000_000)
+
+
+def build_snapshot(source_path: Path, snapshot_path: Path, data: Optional[Dict] = None) -> None:
+    """
+    Write a snapshot for a category JSON file
+
+    Args:
+        source_path: Category JSON file the snapshot mirrors
+        snapshot_path: Destination file (written atomically)
+        data: Already-parsed contents of source_path, if the caller has them
+
+    Raises:
+        json.JSONDecodeError: If the source file is not valid JSON
+        ValueError: If the source is JSON but not a category file
+    """
+    source_path = Path(source_path)
+    snapshot_path = Path(snapshot_path)
+
+    # Stat before reading so a concurrent edit makes the snapshot stale, not wrong
+    stat = source_path.stat()
+    if data is None:
+        with open(source_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    questions = data.get('questions', [])
+    if not isinstance(questions, list) or not all(isinstance(q, dict) for q in questions):
+        raise ValueError(f"Not a category file (questions must be a list of objects): {source_path}")
+    n = len(questions)
+
+    strings: List[bytes] = []
+
+    def intern(text: str) -> int:
+        strings.append(text.encode('utf-8'))
+        return len(strings) - 1
+
+    cat_en = intern(str(data.get('category_en', '')))
+    cat_zh = intern(str(data.get('category_zh', '')))
+    # Every other top-level key, in file order, so to_dict() round-trips the file
+    top = intern(json.dumps({key: None if key == 'questions' else value for key, value in data.items()},
+                            ensure_ascii=False, separators=(',', ':')))
+
+    created = array('q')
+    modified = array('q')
+    id_idx = array('I')
+    body_idx = array('I')
+    correct = array('b')
+    difficulty = array('B')
+
+    for q in questions:
+        id_idx.append(intern(str(q.get('id', ''))))
+        body_idx.append(intern(json.dumps(q, ensure_ascii=False, separators=(',', ':'))))
+        created.append(_to_micros(q.get('created_at')))
+        modified.append(_to_micros(q.get('last_modified_at')))
+        ca = q.get('correct_answer')
+        correct.append(ca if isinstance(ca, int) and not isinstance(ca, bool) and 0 <= ca <= 127 else -1)
+        difficulty.append(_DIFFICULTY_CODES.get(q.get('difficulty'), UNKNOWN_DIFFICULTY))
+
+    offsets = array('I', [0])
+    for s in strings:
+        offsets.append(offsets[-1] + len(s))
+
+    header = HEADER.pack(
+        MAGIC, VERSION, _native_flags(), stat.st_mtime_ns, stat.st_size,
+        n, len(strings), cat_en, cat_zh, top
+    )
+
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = snapshot_path.with_name(snapshot_path.name + f'.{os.getpid()}.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            for column in (created, modified, id_idx, body_idx, offsets, correct, difficulty):
+                f.write(column.tobytes())
+            for s in strings:
+                f.write(s)
+        os.replace(tmp_path, snapshot_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+class QuestionSnapshot:
+    """Read-only, memory-mapped view of a category snapshot"""
+
+    def __init__(self, snapshot_path: Path):
+        """
+        Open a snapshot file
+
+        Args:
+            snapshot_path: Path to a file written by build_snapshot()
+
+        Raises:
+            ValueError: If the file is not a snapshot this version can read
+        """
+        self.path = Path(snapshot_path)
+        self._file = open(self.path, 'rb')
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"Snapshot truncated: {self.path}")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        (magic, version, flags, self.source_mtime_ns, self.source_size,
+         n, n_strings, cat_en, cat_zh, self._top_idx) = HEADER.unpack_from(self._mm, 0)
+
+        if magic != MAGIC or version != VERSION or flags != _native_flags():
+            self.close()
+            raise ValueError(f"Incompatible snapshot: {self.path}")
+
+        fixed_size = HEADER.size + n * (8 + 8 + 4 + 4 + 1 + 1) + (n_strings + 1) * 4
+        if size < fixed_size:
+            self.close()
+            raise ValueError(f"Snapshot truncated: {self.path}")
+
+        view = self._view = memoryview(self._mm)
+        pos = HEADER.size
+
+        def column(fmt: str, count: int, width: int) -> memoryview:
+            nonlocal pos
+            col = view[pos:pos + count * width].cast(fmt)
+            pos += count * width
+            return col
+
+        self.created_at = column('q', n, 8)
+        self.last_modified_at = column('q', n, 8)
+        self._id_idx = column('I', n, 4)
+        self._body_idx = column('I', n, 4)
+        self._offsets = column('I', n_strings + 1, 4)
+        self.correct_answers = column('b', n, 1)
+        self.difficulty_codes = column('B', n, 1)
+        self._strings_start = pos
+
+        if self._strings_start + self._offsets[n_strings] > size:
+            self.close()
+            raise ValueError(f"Snapshot truncated: {self.path}")
+
+        self._count = n
+        self.category_en = self._string(cat_en)
+        self.category_zh = self._string(cat_zh)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the memory map and file handle"""
+        for name in ('created_at', 'last_modified_at', '_id_idx', '_body_idx',
+                     '_offsets', 'correct_answers', 'difficulty_codes', '_view'):
+            col = self.__dict__.pop(name, None)
+            if col is not None:
+                col.release()
+        mm = self.__dict__.pop('_mm', None)
+        if mm is not None:
+            mm.close()
+        self._file.close()
+
+    def is_fresh_for(self, source_path: Path) -> bool:
+        """Check whether the snapshot still mirrors source_path"""
+        try:
+            stat = Path(source_path).stat()
+        except OSError:
+            return False
+        return stat.st_mtime_ns == self.source_mtime_ns and stat.st_size == self.source_size
+
+    def _string(self, index: int) -> str:
+        start = self._strings_start + self._offsets[index]
+        end = self._strings_start + self._offsets[index + 1]
+        return self._mm[start:end].decode('utf-8')
+
+    def question_id(self, index: int) -> str:
+        """ID of the question at index, without decoding the question"""
+        return self._string(self._id_idx[index])
+
+    def ids(self) -> List[str]:
+        """All question IDs in file order"""
+        return [self._string(i) for i in self._id_idx]
+
+    def difficulty(self, index: int) -> Optional[str]:
+        """Difficulty of the question at index, or None if unrecognised"""
+        code = self.difficulty_codes[index]
+        return DIFFICULTIES[code] if code < len(DIFFICULTIES) else None
+
+    def difficulty_counts(self) -> Dict[str, int]:
+        """Number of questions per difficulty, from the column alone"""
+        counts: Dict[str, int] = {}
+        for code in self.difficulty_codes:
+            difficulty = DIFFICULTIES[code] if code < len(DIFFICULTIES) else 'unknown'
+            counts[difficulty] = counts.get(difficulty, 0) + 1
+        return counts
+
+    def question(self, index: int) -> Dict:
+        """Decode a single question"""
+        if not -self._count <= index < self._count:
+            raise IndexError(index)
+        return json.loads(self._string(self._body_idx[index]))
+
+    def iter_questions(self) -> Iterator[Dict]:
+        """Decode questions one at a time, in file order"""
+        for i in range(self._count):
+            yield json.loads(self._string(self._body_idx[i]))
+
+    def to_dict(self) -> Dict:
+        """Rebuild the full category dict (equivalent to json.load of the source)"""
+        data = json.loads(self._string(self._top_idx))
+        data['questions'] = list(self.iter_questions())
+        return data
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import tempfile
+
+    if len(sys.argv) < 2:
+        print("Usage: python snapshot.py <category.json>")
+        sys.exit(1)
+
+    source = Path(sys.argv[1])
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / (source.stem + '.mwq')
+        build_snapshot(source, target)
+        with QuestionSnapshot(target) as snap:
+            print(f"Category: {snap.category_en} / {snap.category_zh}")
+            print(f"Questions: {len(snap)}")
+            print(f"Snapshot size: {target.stat().st_size} bytes (source {source.stat().st_size})")
+            if len(snap):
+                print(f"First: {snap.question_id(0)} [{snap.difficulty(0)}] -> {snap.question(0)['question_en']}")
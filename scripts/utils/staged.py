@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Staged Questions - What a commit changes, at question-ID granularity
+
+Used by auto_validate.py --staged (the pre-commit hook):
+
+- staged_question_files() lists added/modified category files in the index
+  together with their HEAD and staged blob IDs, without reading contents
+- read_staged() reads staged contents from the working tree when the file
+  there hashes to the staged blob (the usual case), otherwise from git
+- diff_category() digests the raw text of every question and decodes only
+  the ones whose text is not in HEAD; files in the repo's indent=2 layout
+  are split without decoding at all, others go through parse_questions()
+- DigestCache remembers {id: digest} per blob in data/cache. The blob
+  validated for this commit is the next commit's HEAD, so HEAD is
+  normally never read or parsed
+"""
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import zlib
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Question files, relative to the git root
+QUESTIONS_PATH = 'src/data/questions'
+
+# Blobs whose digests are kept (a few commits' worth of every category)
+DIGEST_CACHE_ENTRIES = 128
+
+_NULL_SHA = '0' * 40
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_decoder = json.JSONDecoder()
+
+
+class StagedFile(NamedTuple):
+    path: str  # Relative to the git root
+    head_sha: Optional[str]  # None for files added in this commit
+    staged_sha: str
+
+
+def git(args: List[str], root: str, input: Optional[bytes] = None) -> bytes:
+    return subprocess.run(['git', *args], cwd=root, input=input,
+                          stdout=subprocess.PIPE, check=True).stdout
+
+
+def git_root(cwd: Optional[str] = None) -> str:
+    """
+    Top of the working tree containing cwd
+
+    Raises:
+        subprocess.CalledProcessError: If cwd is not inside a git repository
+    """
+    return git(['rev-parse', '--show-toplevel'], cwd or os.getcwd()).decode('utf-8').strip()
+
+
+def staged_question_files(root: str) -> List[StagedFile]:
+    """Added/modified question files in the index, with HEAD and staged blob IDs"""
+    output = git(['diff', '--cached', '--raw', '--no-abbrev', '--no-renames', '--diff-filter=AM', '-z',
+                  '--', QUESTIONS_PATH], root).decode('utf-8')
+
+    # -z records: ":<mode> <mode> <old sha> <new sha> <status>\0<path>\0"
+    fields = output.split('\0')
+    files = []
+    for header, path in zip(fields[0::2], fields[1::2]):
+        if not path.endswith('.json'):
+            continue
+        _, _, head_sha, staged_sha, _ = header.split()
+        files.append(StagedFile(path, None if head_sha == _NULL_SHA else head_sha, staged_sha))
+    return files
+
+
+def blob_sha(content: bytes) -> str:
+    """Git's object ID for a blob with this content"""
+    sha = hashlib.sha1(b'blob %d\0' % len(content))
+    sha.update(content)
+    return sha.hexdigest()
+
+
+def read_blobs(root: str, shas: List[str]) -> Dict[str, bytes]:
+    """Read many blobs through one git process"""
+    if not shas:
+        return {}
+    output = git(['cat-file', '--batch'], root, input=''.join(f"{sha}\n" for sha in shas).encode('ascii'))
+
+    blobs = {}
+    pos = 0
+    for sha in shas:
+        header_end = output.index(b'\n', pos)
+        size = int(output[pos:header_end].split()[2])
+        pos = header_end + 1
+        blobs[sha] = output[pos:pos + size]
+        pos += size + 1  # Contents are followed by a newline
+    return blobs
+
+
+def read_staged(root: str, files: List[StagedFile]) -> Dict[str, bytes]:
+    """
+    Staged contents of files, keyed by path
+
+    Files whose working-tree contents hash to the staged blob are read from
+    disk; partially staged ones come from the object store.
+    """
+    contents = {}
+    missing = []
+    for f in files:
+        try:
+            content = Path(root, f.path).read_bytes()
+        except OSError:
+            content = None
+        if content is not None and blob_sha(content) == f.staged_sha:
+            contents[f.path] = content
+        else:
+            missing.append(f)
+
+    blobs = read_blobs(root, [f.staged_sha for f in missing])
+    for f in missing:
+        contents[f.path] = blobs[f.staged_sha]
+    return contents
+
+
+def parse_questions(text: str) -> Tuple[Dict, List[str]]:
+    """
+    Decode a category file, digesting each question's raw text on the way
+
+    Returns:
+        (data, digests) where digests[i] belongs to data['questions'][i]
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON
+    """
+    try:
+        data, digests = _parse_with_spans(text)
+    except (json.JSONDecodeError, ValueError, IndexError):
+        # Unexpected layout: plain decode (raises the real error if invalid)
+        data = json.loads(text)
+        questions = data.get('questions') if isinstance(data, dict) else None
+        if not isinstance(questions, list):
+            questions = []
+        digests = [_digest(json.dumps(q, ensure_ascii=False)) for q in questions]
+    return data, digests
+
+
+def _digest(text: str) -> str:
+    return _digest_bytes(text.encode('utf-8'))
+
+
+def _digest_bytes(raw) -> str:
+    # Change detection only: CRC-32 plus length is nearly free next to the encode
+    return f"{zlib.crc32(raw):08x}{len(raw):x}"
+
+
+def _skip(text: str, pos: int) -> int:
+    return _WHITESPACE.match(text, pos).end()
+
+
+def _expect(text: str, pos: int, char: str) -> int:
+    pos = _skip(text, pos)
+    if text[pos] != char:
+        raise ValueError(f"Expected {char!r} at {pos}")
+    return pos + 1
+
+
+def _parse_with_spans(text: str) -> Tuple[Dict, List[str]]:
+    """Walk the top-level object by hand so question array items keep their spans"""
+    data: Dict = {}
+    digests: List[str] = []
+    pos = _expect(text, 0, '{')
+    pos = _skip(text, pos)
+    if text[pos] == '}':
+        pos += 1
+    while text[pos - 1] != '}':
+        key, pos = _decoder.raw_decode(text, _skip(text, pos))
+        pos = _skip(text, _expect(text, pos, ':'))
+
+        if key == 'questions' and text[pos] == '[':
+            questions = []
+            pos = _skip(text, pos + 1)
+            if text[pos] == ']':
+                pos += 1
+            while text[pos - 1] != ']':
+                start = _skip(text, pos)
+                question, pos = _decoder.raw_decode(text, start)
+                questions.append(question)
+                digests.append(_digest(text[start:pos]))
+                pos = _skip(text, pos)
+                if text[pos] not in ',]':
+                    raise ValueError(f"Expected ',' or ']' at {pos}")
+                pos += 1
+            value = questions
+        else:
+            value, pos = _decoder.raw_decode(text, pos)
+
+        data[key] = value
+        pos = _skip(text, pos)
+        if text[pos] not in ',}':
+            raise ValueError(f"Expected ',' or '}}' at {pos}")
+        pos += 1
+
+    if _skip(text, pos) != len(text):
+        raise ValueError("Extra data after the top-level object")
+    return data, digests
+
+
+def question_digests(data: Dict, digests: List[str]) -> Dict[str, str]:
+    """{question id: digest} for a parsed file"""
+    questions = data.get('questions') if isinstance(data, dict) else None
+    if not isinstance(questions, list):
+        return {}
+    return {str(q.get('id')): digest for q, digest in zip(questions, digests) if isinstance(q, dict)}
+
+
+class DigestCache:
+    """{blob sha: {question id: digest}} for recently validated blobs"""
+
+    def __init__(self, root: str):
+        self.path = Path(root) / 'data' / 'cache' / 'question_digests.json'
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self.dirty = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            pass  # Missing or corrupt: start empty
+
+    def get(self, sha: str) -> Optional[Dict[str, str]]:
+        return self.entries.get(sha)
+
+    def put(self, sha: str, digests: Dict[str, str]):
+        self.entries.pop(sha, None)
+        self.entries[sha] = digests  # Most recent last
+        while len(self.entries) > DIGEST_CACHE_ENTRIES:
+            del self.entries[next(iter(self.entries))]
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(self.entries, separators=(',', ':')))  # C encoder, unlike json.dump
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # Cache only; next run recomputes
+        self.dirty = False
+
+
+def head_digests(root: str, files: List[StagedFile], cache: DigestCache) -> Dict[str, Dict[str, str]]:
+    """
+    {path: {question id: digest}} for the HEAD version of each file
+
+    Uses the cache where possible and reads the remaining HEAD blobs through
+    one git process. New files map to {}.
+    """
+    result = {}
+    to_read = []
+    for f in files:
+        if f.head_sha is None:
+            result[f.path] = {}
+        elif cache.get(f.head_sha) is not None:
+            result[f.path] = cache.get(f.head_sha)
+        else:
+            to_read.append(f)
+
+    blobs = read_blobs(root, [f.head_sha for f in to_read])
+    for f in to_read:
+        try:
+            digests = question_digests(*parse_questions(blobs[f.head_sha].decode('utf-8')))
+        except (ValueError, UnicodeDecodeError):
+            digests = {}  # Committed file was broken; everything counts as changed
+        cache.put(f.head_sha, digests)
+        result[f.path] = digests
+    return result
+
+
+class StagedCategory(NamedTuple):
+    header: Dict  # Top-level fields other than 'questions'
+    count: Optional[int]  # Questions in the file, None if 'questions' is not a list
+    added: List[Dict]
+    modified: List[Dict]
+    digests: Dict[str, str]  # {question id: digest} for the whole file
+
+
+# How json.dump(indent=2) lays out the questions array. Strings cannot hold raw
+# newlines, so these byte sequences only occur at these structural positions.
+_QUESTIONS_OPEN = b'\n  "questions": [\n    {'
+_QUESTIONS_SEP = b'\n    },\n    {'
+_QUESTIONS_CLOSE = b'\n    }\n  ]'
+
+
+def _split_questions(content: bytes) -> Optional[Tuple[bytes, List[memoryview]]]:
+    """
+    Split an indent=2 category file into its skeleton and raw question objects
+
+    Returns:
+        (skeleton with "questions": [], [question object views into content]),
+        or None if the file is not laid out the way the repo writes it
+    """
+    start = content.find(_QUESTIONS_OPEN)
+    end = content.rfind(_QUESTIONS_CLOSE)
+    if start < 0 or end < start:
+        return None
+
+    view = memoryview(content)
+    chunks = []
+    pos = start + len(_QUESTIONS_OPEN) - 1  # At the first question's '{'
+    while True:
+        sep = content.find(_QUESTIONS_SEP, pos, end)
+        if sep < 0:
+            chunks.append(view[pos:end + 6])  # Through the last question's '}'
+            break
+        chunks.append(view[pos:sep + 6])
+        pos = sep + len(_QUESTIONS_SEP) - 1
+
+    skeleton = content[:start] + b'\n  "questions": []' + content[end + len(_QUESTIONS_CLOSE):]
+    return skeleton, chunks
+
+
+def diff_category(content: bytes, before: Dict[str, str]) -> StagedCategory:
+    """
+    Staged questions that are new or whose text differs from HEAD
+
+    Questions whose raw text matches a HEAD question are not decoded at all:
+    that exact text was already committed (and validated). Changed ones are
+    decoded, which also checks they are valid JSON.
+
+    Args:
+        content: Staged file contents
+        before: {question id: digest} for the HEAD version
+
+    Raises:
+        ValueError: If content is not valid JSON (json.JSONDecodeError) or UTF-8
+    """
+    known = {digest: question_id for question_id, digest in before.items()}
+    split = _split_questions(content)
+    header = None
+    if split is not None:
+        header = json.loads(split[0])
+        if not isinstance(header, dict) or header.pop('questions', None) != []:
+            header = None  # Matched something nested; take the general path
+
+    if header is None:
+        data, digests = parse_questions(content.decode('utf-8'))
+        if not isinstance(data, dict):
+            return StagedCategory({}, None, [], [], {})
+        questions = data.get('questions')
+        header = {key: value for key, value in data.items() if key != 'questions'}
+        if not isinstance(questions, list):
+            return StagedCategory(header, None, [], [], {})
+        pairs = zip(digests, questions)
+    else:
+        chunks = split[1]
+        pairs = ((_digest_bytes(chunk), chunk) for chunk in chunks)
+
+    added, modified = [], []
+    digests_by_id = {}
+    count = 0
+    for digest, q in pairs:
+        count += 1
+        question_id = known.get(digest)
+        if question_id is not None:
+            digests_by_id[question_id] = digest
+            continue
+        if isinstance(q, memoryview):
+            try:
+                q = json.loads(q.tobytes())
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Question {count}: {e}") from e
+        if not isinstance(q, dict):
+            continue
+        question_id = str(q.get('id'))
+        digests_by_id[question_id] = digest
+        (modified if question_id in before else added).append(q)
+    return StagedCategory(header, count, added, modified, digests_by_id)
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import sys
+    import time
+
+    root = git_root()
+    start = time.perf_counter()
+    files = staged_question_files(root)
+    cache = DigestCache(root)
+    before = head_digests(root, files, cache)
+    for path, content in read_staged(root, files).items():
+        category = diff_category(content, before[path])
+        print(f"{path}: {len(category.added)} added, {len(category.modified)} modified of {category.count}")
+    print(f"{(time.perf_counter() - start) * 1000:.1f}ms")
+    sys.exit(0)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+File Transaction - Write several files so that either all change or none do
+
+Adding questions touches a category file and the master list (and the
+category's binary snapshot, which is derived from it). Each file on its
+own is already written atomically via a temporary file and a rename; this
+groups them: every new content is written to a temporary file next to its
+target first, and only when all of those writes succeeded are they renamed
+into place. If a rename fails part-way, the files already replaced are put
+back from their original contents.
+
+Derived state (snapshots, corpus caches) is refreshed by on_commit callbacks
+once every file is in place.
+"""
+
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+try:
+    from .corpus import dump_category, open_snapshot
+except ImportError:  # Run directly as a script
+    from corpus import dump_category, open_snapshot
+
+
+class FileTransaction:
+    """Staged whole-file writes, committed together"""
+
+    def __init__(self):
+        self._staged: Dict[Path, str] = {}
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def paths(self) -> List[Path]:
+        return list(self._staged)
+
+    def stage(self, path: Union[str, Path], content: str):
+        """Replace path with content on commit (staging a path again overrides it)"""
+        self._staged[Path(path).resolve()] = content
+
+    def stage_category(self, path: Union[str, Path], data: Dict, corpus=None):
+        """
+        Stage a category file in canonical format
+
+        Its snapshot (and the corpus cache, if given) is refreshed from data
+        after commit, so nothing re-parses the file just written.
+        """
+        self.stage(path, dump_category(data))
+
+        def refresh():
+            open_snapshot(path, data=data)
+            if corpus is not None:
+                corpus.remember(path, data)
+
+        self.on_commit(refresh)
+
+    def on_commit(self, callback: Callable[[], None]):
+        """Run callback once every staged file is in place"""
+        self._callbacks.append(callback)
+
+    def commit(self):
+        """
+        Write every staged file
+
+        Raises:
+            OSError: If any file could not be written; all targets are then
+                     left as they were before commit
+        """
+        tmp_paths: Dict[Path, Path] = {}
+        try:
+            # 1. Write everything next to its target (same filesystem, so the
+            #    renames below cannot fail for lack of space)
+            for path, content in self._staged.items():
+                tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+                tmp_paths[path] = tmp_path
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+
+            # 2. Swap them in, remembering what was there
+            originals: Dict[Path, Optional[bytes]] = {
+                path: path.read_bytes() if path.exists() else None for path in self._staged
+            }
+            replaced: List[Path] = []
+            try:
+                for path, tmp_path in tmp_paths.items():
+                    os.replace(tmp_path, path)
+                    replaced.append(path)
+            except OSError:
+                self._restore(replaced, originals)
+                raise
+        finally:
+            for tmp_path in tmp_paths.values():
+                if tmp_path.exists():
+                    tmp_path.unlink()
+
+        self._staged.clear()
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def _restore(self, replaced: List[Path], originals: Dict[Path, Optional[bytes]]):
+        """Best-effort rollback of files already renamed into place"""
+        for path in reversed(replaced):
+            original = originals[path]
+            if original is None:
+                path.unlink()
+                continue
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.rollback")
+            tmp_path.write_bytes(original)
+            os.replace(tmp_path, path)
+
+
+# CLI for testing
+if __name__ == '__main__':
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        a, b = Path(tmp) / 'a.txt', Path(tmp) / 'b.txt'
+        a.write_text('old a')
+
+        txn = FileTransaction()
+        txn.stage(a, 'new a')
+        txn.stage(b, 'new b')
+        txn.on_commit(lambda: print("✅ Committed"))
+        txn.commit()
+        print(f"a: {a.read_text()!r}, b: {b.read_text()!r}")
@@ -9,45 +9,218 @@ This script validates the scientific accuracy of all questions by:
 4. Generating a detailed validation report
 
 Usage:
-    python3 validate_facts.py [--file FILENAME] [--verbose]
+    python3 validate_facts.py [--file FILENAME] [--verbose] [--results-out PATH]
+                              [--profile] [--profile-out PATH]
 
     --file: Check specific file only (e.g., chemistry.json)
     --verbose: Show detailed checking process
+    --results-out: Stream every result as a JSON line to PATH as it is produced
+    --profile: Print per-check time, call counts and issue yield, and per-file parse time
+    --profile-out: Also write a trace; *.json is a speedscope profile, anything else pstats
 """
 
+import contextlib
+import functools
 import json
 import os
 import sys
-import glob
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
 
-@dataclass
+from utils.corpus import JsonCategory, find_questions_dir, open_category
+from utils.profiling import CheckProfiler, run_cprofile
+from utils.schema import load_validator
+
+_no_span = contextlib.nullcontext
+
+# Issue severities and kinds, packed into one small int per issue
+SEVERITIES = ('critical', 'warning', 'info')
+ISSUE_CATEGORIES = ('accuracy', 'clarity', 'format')
+_SEVERITY_CODES = {severity: i for i, severity in enumerate(SEVERITIES)}
+_CATEGORY_CODES = {category: i for i, category in enumerate(ISSUE_CATEGORIES)}
+
+NO_ISSUES: Tuple = ()
+
+# Structure checks: compiled from scripts/schemas/ on first use (utils/schema.py)
+_QUESTION = functools.partial(load_validator, 'question_category', '#/definitions/question')
+_DRAFT_QUESTION = functools.partial(load_validator, 'question_draft', '#/definitions/question')
+
+# Red flags for potential inaccuracy: (phrase, message, suggestion)
+RED_FLAGS = tuple((flag, f"Contains '{flag}': {warning}", "Review for overgeneralization") for flag, warning in {
+    'always': 'Absolute statements like "always" are often oversimplifications',
+    'never': 'Absolute statements like "never" may not be accurate',
+    'all ': 'Be careful with universal claims ("all X do Y")',
+    '100%': 'Absolute percentages are rarely accurate in science',
+    'proven': 'Science uses "evidence supports" rather than "proven"',
+}.items())
+
+# Common misconceptions by topic: (phrase, message, suggestion)
+MISCONCEPTIONS = {
+    category: tuple((phrase.lower(), f"Potential misconception detected: '{phrase}'", warning)
+                    for phrase, warning in checks.items())
+    for category, checks in {
+        'Chemistry': {
+            'soap kills': 'Soap removes germs, but antibacterial soap is needed to kill them',
+            'heavier objects fall faster': 'Common misconception - all objects fall at same rate in vacuum',
+        },
+        'Physics': {
+            'heavier objects fall faster': 'Galileo showed this is wrong - air resistance varies',
+            'cold is a thing': 'Cold is absence of heat, not a substance',
+        },
+        'Astronomy': {
+            'dark side of the moon': 'It\'s the "far side" - it gets sunlight too',
+            'summer because closer to sun': 'Earth\'s tilt causes seasons, not distance',
+        },
+        'Biology': {
+            'we only use 10%': 'Myth - we use all parts of our brain',
+            'sugar makes hyperactive': 'Studies show this is largely a myth',
+        },
+    }.items()
+}
+
+# Category-specific manual verification notes, shared by every result in the category
+VERIFICATION_GUIDES = {
+    'Chemistry': (
+        '✓ Verify chemical reactions and compounds are correct',
+        '✓ Check pH levels, temperatures, or percentages mentioned',
+        '✓ Confirm enzyme/catalyst behavior is accurate'
+    ),
+    'Physics': (
+        '✓ Verify physical laws and formulas',
+        '✓ Check speeds, distances, forces mentioned',
+        '✓ Confirm cause-and-effect relationships'
+    ),
+    'Astronomy': (
+        '✓ Verify orbital periods, distances, and phenomena',
+        '✓ Check against NASA/astronomical databases',
+        '✓ Confirm space science facts are current'
+    ),
+    'Biology': (
+        '✓ Verify biological processes and mechanisms',
+        '✓ Check body systems and functions',
+        '✓ Confirm medical/health information is accurate'
+    ),
+    'Psychology': (
+        '✓ Verify psychological theories are current',
+        '✓ Check if research findings are cited correctly',
+        '✓ Confirm no outdated psychological concepts'
+    )
+}
+
+NUMERICAL_NOTE = '⚠ Contains numerical claims - verify accuracy'
+
+
+# Messages that repeat across questions are built once and shared
+@functools.lru_cache(maxsize=None)
+def _terms_note(terms: Tuple[str, ...]) -> str:
+    return f'⚠ Scientific terms found: {", ".join(terms)} - verify usage'
+
+
+@functools.lru_cache(maxsize=4096)
+def _explanations_length_message(total: int) -> str:
+    return f"Total explanations_en: {total} chars (recommend <500 for mobile)"
+
+# Scientific terms whose usage should be verified: (term, lowercased)
+SCIENTIFIC_TERMS = tuple((term, term.lower()) for term in [
+    'molecule', 'atom', 'reaction', 'orbit', 'gravity', 'enzyme',
+    'DNA', 'protein', 'neuron', 'wavelength', 'frequency'])
+
+
 class ValidationIssue:
-    """Represents a potential issue found during validation"""
-    question_id: str
-    severity: str  # 'critical', 'warning', 'info'
-    category: str  # 'accuracy', 'clarity', 'format'
-    message: str
-    suggestion: str = ""
-
-@dataclass
+    """
+    Represents a potential issue found during validation
+
+    The question ID lives on the owning ValidationResult; severity
+    ('critical', 'warning', 'info') and category ('accuracy', 'clarity',
+    'format') are stored as one code.
+    """
+
+    __slots__ = ('_code', 'message', 'suggestion')
+
+    def __init__(self, severity: str, category: str, message: str, suggestion: str = ""):
+        self._code = _SEVERITY_CODES[severity] * len(ISSUE_CATEGORIES) + _CATEGORY_CODES[category]
+        self.message = message
+        self.suggestion = suggestion
+
+    @property
+    def severity(self) -> str:
+        return SEVERITIES[self._code // len(ISSUE_CATEGORIES)]
+
+    @property
+    def category(self) -> str:
+        return ISSUE_CATEGORIES[self._code % len(ISSUE_CATEGORIES)]
+
+    def to_dict(self) -> Dict:
+        return {'severity': self.severity, 'category': self.category,
+                'message': self.message, 'suggestion': self.suggestion}
+
+    def __repr__(self) -> str:
+        return f"ValidationIssue({self.severity!r}, {self.category!r}, {self.message!r})"
+
+
 class ValidationResult:
-    """Results from validating a single question"""
-    question_id: str
-    question_text: str
-    passed: bool
-    confidence: str  # 'high', 'medium', 'low'
-    issues: List[ValidationIssue]
-    notes: List[str]
+    """
+    Results from validating a single question
+
+    Issues and notes are tuples; category guide notes are a reference to
+    the shared VERIFICATION_GUIDES entry rather than a copy.
+    """
+
+    __slots__ = ('question_id', 'question_text', 'passed', 'confidence', 'issues', '_guide', '_notes')
+
+    def __init__(self, question_id: str, question_text: str, passed: bool, confidence: str,
+                 issues: Sequence[ValidationIssue], notes: Sequence[str] = (), guide: Tuple[str, ...] = ()):
+        self.question_id = question_id
+        self.question_text = question_text
+        self.passed = passed
+        self.confidence = confidence  # 'high', 'medium', 'low'
+        self.issues = tuple(issues) if issues else NO_ISSUES
+        self._guide = guide
+        self._notes = tuple(notes)
+
+    @property
+    def notes(self) -> List[str]:
+        """Category guide notes followed by question-specific ones"""
+        return [*self._guide, *self._notes]
+
+    def to_dict(self) -> Dict:
+        return {
+            'question_id': self.question_id,
+            'question_text': self.question_text,
+            'passed': self.passed,
+            'confidence': self.confidence,
+            'issues': [issue.to_dict() for issue in self.issues],
+            'notes': self.notes,
+        }
+
+    def __repr__(self) -> str:
+        return (f"ValidationResult({self.question_id!r}, confidence={self.confidence!r}, "
+                f"issues={len(self.issues)})")
+
 
 class FactChecker:
     """Validates scientific accuracy of questions"""
 
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, profiler: Optional[CheckProfiler] = None,
+                 retain: bool = True, sink: Optional[Callable[[ValidationResult], None]] = None):
+        """
+        Args:
+            verbose: Print detailed checking output
+            profiler: Record per-check timings (see utils/profiling.py)
+            retain: Keep every result in self.results; with False, results
+                    only reach sink and the summary counters
+            sink: Called with each result as soon as it is produced
+        """
         self.verbose = verbose
+        self.profiler = profiler
+        self.retain = retain
+        self.sink = sink
         self.results: List[ValidationResult] = []
+        # Summary counters, kept whether or not results are retained
+        self.confidence_counts = {'high': 0, 'medium': 0, 'low': 0}
+        self.severity_counts = {severity: 0 for severity in SEVERITIES}
+        self.low_confidence: List[Tuple[str, str]] = []
         # Category name mapping for normalization
         self.category_mapping = {
             'chemistry around us': 'Chemistry',
@@ -89,36 +262,96 @@ class FactChecker:
         if self.verbose:
             print(f"  {message}")
 
-    def validate_file(self, filepath: str) -> List[ValidationResult]:
-        """Validate all questions in a JSON file"""
+    def _run_check(self, name: str, check, *args) -> list:
+        """Run one check, timing it when profiling"""
+        if self.profiler is None:
+            return check(*args)
+        return self.profiler.run(name, check, *args)
+
+    def validate_file(self, filepath: str, data: Optional[Dict] = None) -> List[ValidationResult]:
+        """
+        Validate all questions in a JSON file
+
+        Args:
+            filepath: Category JSON file
+            data: Already-loaded contents of filepath (e.g. from a shared Corpus)
+
+        Returns:
+            The file's results, or an empty list when results are not retained
+        """
+        name = os.path.basename(filepath)
+        profiler = self.profiler
+        span = profiler.span if profiler is not None else _no_span
+
         print(f"\n{'='*70}")
-        print(f"Validating: {os.path.basename(filepath)}")
+        print(f"Validating: {name}")
         print(f"{'='*70}")
 
+        start = time.perf_counter_ns()
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with span('parse'):
+                data = JsonCategory(data) if data is not None else open_category(filepath)
         except json.JSONDecodeError as e:
             print(f"❌ JSON Error: {e}")
             return []
+        parse_ns = time.perf_counter_ns() - start
 
-        category = data.get('category_en', 'Unknown')
-        questions = data.get('questions', [])
+        category = data.category_en or 'Unknown'
 
         print(f"Category: {category}")
-        print(f"Questions: {len(questions)}\n")
+        print(f"Questions: {len(data)}\n")
 
         file_results = []
-        for q in questions:
-            result = self.validate_question(q, category)
-            file_results.append(result)
-            self.results.append(result)
-            self.print_result(result)
-
+        check_ns = report_ns = 0
+        questions_seen = 0
+        questions = data.iter_questions()
+        with span(name):
+            while True:
+                # Snapshots decode lazily, so fetching a question counts as parsing
+                start = time.perf_counter_ns()
+                q = next(questions, None)
+                if q is None:
+                    break
+                fetched = time.perf_counter_ns()
+                parse_ns += fetched - start
+                result = self.validate_question(q, category)
+                self.record(result)
+                if self.retain:
+                    file_results.append(result)
+                questions_seen += 1
+                checked = time.perf_counter_ns()
+                with span('print_result'):
+                    self.print_result(result)
+                check_ns += checked - fetched
+                report_ns += time.perf_counter_ns() - checked
+
+        if profiler is not None:
+            profiler.add_file(name, questions_seen, parse_ns, check_ns, report_ns)
         return file_results
 
-    def validate_question(self, question: Dict, category: str) -> ValidationResult:
-        """Validate a single question"""
+    def record(self, result: ValidationResult):
+        """Update the summary counters, then retain and/or stream the result"""
+        self.confidence_counts[result.confidence] += 1
+        for issue in result.issues:
+            self.severity_counts[issue.severity] += 1
+        if result.confidence == 'low':
+            self.low_confidence.append((result.question_id, result.question_text[:60]))
+        if self.retain:
+            self.results.append(result)
+        if self.sink is not None:
+            self.sink(result)
+
+    def validate_question(self, question: Dict, category: str,
+                          english_only: bool = False) -> ValidationResult:
+        """
+        Validate a single question
+
+        Args:
+            question: Question dict
+            category: Category name (normalized for the accuracy checks)
+            english_only: Don't require the id or Chinese fields, so a draft can
+                          be checked before it is translated and numbered
+        """
         q_id = question.get('id', 'unknown')
         q_text = question.get('question_en', '')
 
@@ -132,19 +365,20 @@ class FactChecker:
         notes = []
 
         # 1. Structure validation
-        issues.extend(self._check_structure(question))
+        issues.extend(self._run_check('structure', self._check_structure, question, english_only))
 
         # 2. Length validation
-        issues.extend(self._check_lengths(question))
+        issues.extend(self._run_check('lengths', self._check_lengths, question))
 
         # 3. Explanation quality
-        issues.extend(self._check_explanations(question))
+        issues.extend(self._run_check('explanations', self._check_explanations, question))
 
         # 4. Answer consistency
-        issues.extend(self._check_answer_consistency(question))
+        issues.extend(self._run_check('answer_consistency', self._check_answer_consistency, question))
 
         # 5. Scientific accuracy markers (automated pre-check)
-        issues.extend(self._check_accuracy_markers(question, normalized_category))
+        issues.extend(self._run_check('accuracy_markers', self._check_accuracy_markers,
+                                      question, normalized_category))
 
         # Determine confidence level
         critical_count = sum(1 for i in issues if i.severity == 'critical')
@@ -160,8 +394,9 @@ class FactChecker:
             confidence = 'high'
             passed = True
 
-        # Add notes about what to manually verify
-        notes.extend(self._get_manual_verification_notes(question, normalized_category))
+        # Add notes about what to manually verify (category guides are attached by reference)
+        notes.extend(self._run_check('manual_notes', self._get_manual_verification_notes,
+                                     question, normalized_category))
 
         return ValidationResult(
             question_id=q_id,
@@ -169,70 +404,27 @@ class FactChecker:
             passed=passed,
             confidence=confidence,
             issues=issues,
-            notes=notes
+            notes=notes,
+            guide=VERIFICATION_GUIDES.get(normalized_category, ())
         )
 
-    def _check_structure(self, q: Dict) -> List[ValidationIssue]:
-        """Check required fields are present"""
-        issues = []
-        q_id = q.get('id', 'unknown')
-
-        required_fields = [
-            'id', 'question_en', 'question_zh',
-            'choices_en', 'choices_zh', 'correct_answer',
-            'explanations_en', 'explanations_zh', 'difficulty'
-        ]
-
-        for field in required_fields:
-            if field not in q:
-                issues.append(ValidationIssue(
-                    question_id=q_id,
-                    severity='critical',
-                    category='format',
-                    message=f"Missing required field: {field}"
-                ))
-
-        # Check arrays have 4 items
-        if 'choices_en' in q and len(q['choices_en']) != 4:
-            issues.append(ValidationIssue(
-                question_id=q_id,
-                severity='critical',
-                category='format',
-                message=f"choices_en must have exactly 4 items, found {len(q['choices_en'])}"
-            ))
-
-        if 'explanations_en' in q and len(q['explanations_en']) != 4:
-            issues.append(ValidationIssue(
-                question_id=q_id,
-                severity='critical',
-                category='format',
-                message=f"explanations_en must have exactly 4 items, found {len(q['explanations_en'])}"
-            ))
-
-        # Check correct_answer is valid index
-        if 'correct_answer' in q:
-            ca = q['correct_answer']
-            if not isinstance(ca, int) or ca < 0 or ca > 3:
-                issues.append(ValidationIssue(
-                    question_id=q_id,
-                    severity='critical',
-                    category='format',
-                    message=f"correct_answer must be 0-3, found {ca}"
-                ))
-
-        return issues
+    def _check_structure(self, q: Dict, english_only: bool = False) -> List[ValidationIssue]:
+        """Check the question against the category-file (or draft) schema"""
+        validator = _DRAFT_QUESTION() if english_only else _QUESTION()
+        if validator.is_valid(q):
+            return NO_ISSUES
+        return [ValidationIssue(severity='critical', category='format', message=str(error))
+                for error in validator(q)]
 
     def _check_lengths(self, q: Dict) -> List[ValidationIssue]:
         """Check character limits for mobile optimization"""
         issues = []
-        q_id = q.get('id', 'unknown')
 
         # Question length limits
         if 'question_en' in q:
             q_en_len = len(q['question_en'])
             if q_en_len > 45:
                 issues.append(ValidationIssue(
-                    question_id=q_id,
                     severity='warning',
                     category='format',
                     message=f"question_en too long: {q_en_len} chars (max 45)",
@@ -243,7 +435,6 @@ class FactChecker:
             q_zh_len = len(q['question_zh'])
             if q_zh_len > 25:
                 issues.append(ValidationIssue(
-                    question_id=q_id,
                     severity='warning',
                     category='format',
                     message=f"question_zh too long: {q_zh_len} chars (max 25)",
@@ -255,7 +446,6 @@ class FactChecker:
             for i, choice in enumerate(q['choices_en']):
                 if len(choice) > 35:
                     issues.append(ValidationIssue(
-                        question_id=q_id,
                         severity='warning',
                         category='format',
                         message=f"choice_en[{i}] too long: {len(choice)} chars (max 35)",
@@ -266,7 +456,6 @@ class FactChecker:
             for i, choice in enumerate(q['choices_zh']):
                 if len(choice) > 15:
                     issues.append(ValidationIssue(
-                        question_id=q_id,
                         severity='warning',
                         category='format',
                         message=f"choice_zh[{i}] too long: {len(choice)} chars (max 15)",
@@ -278,10 +467,9 @@ class FactChecker:
             total_en = sum(len(exp) for exp in q['explanations_en'])
             if total_en > 500:  # Slightly more flexible than single explanation
                 issues.append(ValidationIssue(
-                    question_id=q_id,
                     severity='info',
                     category='format',
-                    message=f"Total explanations_en: {total_en} chars (recommend <500 for mobile)",
+                    message=_explanations_length_message(total_en),
                     suggestion="Consider condensing explanations"
                 ))
 
@@ -290,7 +478,6 @@ class FactChecker:
     def _check_explanations(self, q: Dict) -> List[ValidationIssue]:
         """Check explanation quality and format"""
         issues = []
-        q_id = q.get('id', 'unknown')
         correct_idx = q.get('correct_answer', -1)
 
         if 'explanations_en' not in q or len(q['explanations_en']) != 4:
@@ -303,7 +490,6 @@ class FactChecker:
             correct_exp = explanations[correct_idx]
             if not correct_exp.startswith('Correct!'):
                 issues.append(ValidationIssue(
-                    question_id=q_id,
                     severity='warning',
                     category='clarity',
                     message=f"Correct answer explanation should start with 'Correct!'",
@@ -315,7 +501,6 @@ class FactChecker:
             if i != correct_idx:
                 if not exp.startswith('Wrong.'):
                     issues.append(ValidationIssue(
-                        question_id=q_id,
                         severity='warning',
                         category='clarity',
                         message=f"Wrong answer explanation[{i}] should start with 'Wrong.'",
@@ -326,7 +511,6 @@ class FactChecker:
         for i, exp in enumerate(explanations):
             if not exp or len(exp.strip()) < 20:
                 issues.append(ValidationIssue(
-                    question_id=q_id,
                     severity='critical',
                     category='clarity',
                     message=f"Explanation[{i}] is too short or empty",
@@ -338,7 +522,6 @@ class FactChecker:
     def _check_answer_consistency(self, q: Dict) -> List[ValidationIssue]:
         """Check for logical consistency in answers and explanations"""
         issues = []
-        q_id = q.get('id', 'unknown')
 
         if 'choices_en' not in q or 'explanations_en' not in q:
             return issues
@@ -360,7 +543,6 @@ class FactChecker:
             # Look for negation patterns
             if 'doesn\'t' in choice_lower and 'does' in exp_lower and i == q.get('correct_answer'):
                 issues.append(ValidationIssue(
-                    question_id=q_id,
                     severity='warning',
                     category='accuracy',
                     message=f"Possible contradiction in choice[{i}]: choice has 'doesn\\'t' but may contradict explanation",
@@ -372,7 +554,6 @@ class FactChecker:
     def _check_accuracy_markers(self, q: Dict, category: str) -> List[ValidationIssue]:
         """Check for common accuracy red flags"""
         issues = []
-        q_id = q.get('id', 'unknown')
 
         if 'explanations_en' not in q:
             return issues
@@ -381,108 +562,48 @@ class FactChecker:
         all_text = ' '.join(q.get('explanations_en', []))
         all_text_lower = all_text.lower()
 
-        # Red flags for potential inaccuracy
-        red_flags = {
-            'always': 'Absolute statements like "always" are often oversimplifications',
-            'never': 'Absolute statements like "never" may not be accurate',
-            'all ': 'Be careful with universal claims ("all X do Y")',
-            '100%': 'Absolute percentages are rarely accurate in science',
-            'proven': 'Science uses "evidence supports" rather than "proven"',
-        }
-
-        for flag, warning in red_flags.items():
+        for flag, message, suggestion in RED_FLAGS:
             if flag in all_text_lower:
                 issues.append(ValidationIssue(
-                    question_id=q_id,
                     severity='info',
                     category='accuracy',
-                    message=f"Contains '{flag}': {warning}",
-                    suggestion="Review for overgeneralization"
+                    message=message,
+                    suggestion=suggestion
                 ))
 
         # Check for common misconceptions by topic
-        misconception_checks = {
-            'Chemistry': {
-                'soap kills': 'Soap removes germs, but antibacterial soap is needed to kill them',
-                'heavier objects fall faster': 'Common misconception - all objects fall at same rate in vacuum',
-            },
-            'Physics': {
-                'heavier objects fall faster': 'Galileo showed this is wrong - air resistance varies',
-                'cold is a thing': 'Cold is absence of heat, not a substance',
-            },
-            'Astronomy': {
-                'dark side of the moon': 'It\'s the "far side" - it gets sunlight too',
-                'summer because closer to sun': 'Earth\'s tilt causes seasons, not distance',
-            },
-            'Biology': {
-                'we only use 10%': 'Myth - we use all parts of our brain',
-                'sugar makes hyperactive': 'Studies show this is largely a myth',
-            }
-        }
-
-        if category in misconception_checks:
-            for phrase, warning in misconception_checks[category].items():
-                if phrase.lower() in all_text_lower:
-                    issues.append(ValidationIssue(
-                        question_id=q_id,
-                        severity='warning',
-                        category='accuracy',
-                        message=f"Potential misconception detected: '{phrase}'",
-                        suggestion=warning
-                    ))
+        for phrase, message, suggestion in MISCONCEPTIONS.get(category, ()):
+            if phrase in all_text_lower:
+                issues.append(ValidationIssue(
+                    severity='warning',
+                    category='accuracy',
+                    message=message,
+                    suggestion=suggestion
+                ))
 
         return issues
 
     def _get_manual_verification_notes(self, q: Dict, category: str) -> List[str]:
-        """Generate notes about what should be manually verified"""
-        notes = []
-
-        # Add category-specific verification notes
-        verification_guides = {
-            'Chemistry': [
-                '✓ Verify chemical reactions and compounds are correct',
-                '✓ Check pH levels, temperatures, or percentages mentioned',
-                '✓ Confirm enzyme/catalyst behavior is accurate'
-            ],
-            'Physics': [
-                '✓ Verify physical laws and formulas',
-                '✓ Check speeds, distances, forces mentioned',
-                '✓ Confirm cause-and-effect relationships'
-            ],
-            'Astronomy': [
-                '✓ Verify orbital periods, distances, and phenomena',
-                '✓ Check against NASA/astronomical databases',
-                '✓ Confirm space science facts are current'
-            ],
-            'Biology': [
-                '✓ Verify biological processes and mechanisms',
-                '✓ Check body systems and functions',
-                '✓ Confirm medical/health information is accurate'
-            ],
-            'Psychology': [
-                '✓ Verify psychological theories are current',
-                '✓ Check if research findings are cited correctly',
-                '✓ Confirm no outdated psychological concepts'
-            ]
-        }
+        """
+        Generate notes about what should be manually verified
 
-        if category in verification_guides:
-            notes.extend(verification_guides[category])
+        Only question-specific notes; the category's VERIFICATION_GUIDES
+        entry is attached to the result by reference.
+        """
+        notes = []
 
         # Check for numerical claims that need verification
         all_text = ' '.join(q.get('explanations_en', []))
 
         # Look for numbers, percentages, speeds, etc.
         if any(char.isdigit() for char in all_text):
-            notes.append('⚠ Contains numerical claims - verify accuracy')
+            notes.append(NUMERICAL_NOTE)
 
         # Look for specific scientific terms that should be verified
-        scientific_terms = ['molecule', 'atom', 'reaction', 'orbit', 'gravity', 'enzyme',
-                          'DNA', 'protein', 'neuron', 'wavelength', 'frequency']
-
-        found_terms = [term for term in scientific_terms if term.lower() in all_text.lower()]
+        all_text_lower = all_text.lower()
+        found_terms = [term for term, lowered in SCIENTIFIC_TERMS if lowered in all_text_lower]
         if found_terms:
-            notes.append(f'⚠ Scientific terms found: {", ".join(found_terms[:3])} - verify usage')
+            notes.append(_terms_note(tuple(found_terms[:3])))
 
         return notes
 
@@ -538,10 +659,10 @@ class FactChecker:
         print("VALIDATION SUMMARY")
         print(f"{'='*70}\n")
 
-        total = len(self.results)
-        high_conf = sum(1 for r in self.results if r.confidence == 'high')
-        med_conf = sum(1 for r in self.results if r.confidence == 'medium')
-        low_conf = sum(1 for r in self.results if r.confidence == 'low')
+        total = sum(self.confidence_counts.values())
+        high_conf = self.confidence_counts['high']
+        med_conf = self.confidence_counts['medium']
+        low_conf = self.confidence_counts['low']
 
         print(f"Total Questions: {total}")
         print(f"✅ High Confidence: {high_conf} ({high_conf/total*100:.1f}%)")
@@ -549,9 +670,8 @@ class FactChecker:
         print(f"❌ Low Confidence: {low_conf} ({low_conf/total*100:.1f}%)")
 
         # Count issues by severity
-        all_issues = [issue for r in self.results for issue in r.issues]
-        critical = sum(1 for i in all_issues if i.severity == 'critical')
-        warnings = sum(1 for i in all_issues if i.severity == 'warning')
+        critical = self.severity_counts['critical']
+        warnings = self.severity_counts['warning']
 
         print(f"\n🔴 Critical Issues: {critical}")
         print(f"🟡 Warnings: {warnings}")
@@ -559,9 +679,8 @@ class FactChecker:
         if low_conf > 0:
             print(f"\n⚠️  ATTENTION: {low_conf} questions need review before release!")
             print("Questions with low confidence:")
-            for r in self.results:
-                if r.confidence == 'low':
-                    print(f"  - {r.question_id}: {r.question_text[:60]}...")
+            for question_id, text in self.low_confidence:
+                print(f"  - {question_id}: {text}...")
 
         print(f"\n{'='*70}")
         print("NEXT STEPS:")
@@ -583,23 +702,29 @@ def main():
     parser = argparse.ArgumentParser(description='Validate scientific accuracy of questions')
     parser.add_argument('--file', help='Validate specific file only')
     parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed output')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-check timing, call counts and issue yield')
+    parser.add_argument('--profile-out', type=Path, metavar='PATH',
+                        help='Write a trace: *.json as a speedscope profile, otherwise cProfile pstats')
+    parser.add_argument('--results-out', type=Path, metavar='PATH',
+                        help='Stream every result to PATH as JSON lines')
 
     args = parser.parse_args()
 
-    checker = FactChecker(verbose=args.verbose)
+    profiler = None
+    if args.profile or args.profile_out:
+        speedscope = args.profile_out is not None and args.profile_out.suffix == '.json'
+        profiler = CheckProfiler(trace=speedscope)
+    # The summary only needs counters, so results are streamed rather than retained
+    results_out = open(args.results_out, 'w', encoding='utf-8') if args.results_out else None
+    sink = None
+    if results_out is not None:
+        def sink(result: ValidationResult):
+            results_out.write(json.dumps(result.to_dict(), ensure_ascii=False) + '\n')
+    checker = FactChecker(verbose=args.verbose, profiler=profiler, retain=False, sink=sink)
 
     # Find question files
-    script_dir = Path(__file__).parent
-
-    # Try to find questions directory (support different project structures)
-    # Option 1: src/data/questions (Next.js optimized structure)
-    questions_dir = script_dir.parent / 'src' / 'data' / 'questions'
-    if not questions_dir.exists():
-        # Option 2: data/questions (fallback)
-        questions_dir = script_dir.parent / 'data' / 'questions'
-        if not questions_dir.exists():
-            # Option 3: Same directory as script (legacy)
-            questions_dir = script_dir
+    questions_dir = find_questions_dir(Path(__file__).parent)
 
     if args.file:
         # If absolute path provided, use it; otherwise look in questions_dir
@@ -614,18 +739,36 @@ def main():
         print(f"No JSON files found in {questions_dir}!")
         return 1
 
+    def validate_all():
+        for filepath in files:
+            if filepath.name == 'package.json':  # Skip if any
+                continue
+            checker.validate_file(str(filepath))
+
     # Validate each file
-    for filepath in files:
-        if filepath.name == 'package.json':  # Skip if any
-            continue
-        checker.validate_file(str(filepath))
+    try:
+        if args.profile_out and not profiler.trace:
+            run_cprofile(validate_all, args.profile_out)
+        else:
+            validate_all()
+    finally:
+        if results_out is not None:
+            results_out.close()
 
     # Print summary
     checker.print_summary()
 
+    if profiler is not None:
+        profiler.print_report()
+        if profiler.trace:
+            profiler.write_speedscope(args.profile_out, name='validate_facts')
+            print(f"\n📈 Speedscope trace written to {args.profile_out} (open at https://www.speedscope.app)")
+
+    if results_out is not None:
+        print(f"📝 Results written to {args.results_out}")
+
     # Exit code
-    low_confidence = sum(1 for r in checker.results if r.confidence == 'low')
-    return 1 if low_confidence > 0 else 0
+    return 1 if checker.confidence_counts['low'] > 0 else 0
 
 if __name__ == '__main__':
     sys.exit(main())
@@ -5,13 +5,34 @@ No AI API keys required.
 """
 
 import json
-import glob
+import os
 import re
 import time
 import urllib.parse
 import urllib.request
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 
+from utils.corpus import find_questions_dir, load_category
+from utils.key_terms import KeyTermIndex
+from utils.singleflight import SingleFlight
+
+# Wikipedia host; point at a local stand-in (e.g. benchmarks/wiki_stub.py)
+# to run verification offline
+WIKIPEDIA_URL = os.getenv('MILLIONWHYS_WIKIPEDIA_URL', 'https://en.wikipedia.org').rstrip('/')
+
+# Pause between requests, to stay polite to Wikipedia
+RATE_LIMIT_DELAY = 0.5
+
+# Titles per action=query request: prop=extracts returns at most 20 intro
+# extracts per request (its exlimit)
+QUERY_BATCH = 20
+
+# Requests in progress: concurrent lookups of the same URL (the same search
+# term or article) share one request and its response
+_in_flight = SingleFlight()
+
 # Category to source mapping
 CATEGORY_SOURCES = {
     'Astronomy & Space': ['nasa.gov', 'wikipedia'],
@@ -37,7 +58,11 @@ CATEGORY_SOURCES = {
 
 
 def fetch_url(url: str, timeout: int = 10) -> Optional[str]:
-    """Fetch URL content with error handling."""
+    """Fetch URL content with error handling (shared with concurrent fetches of url)."""
+    return _in_flight.do(url, _fetch_url, url, timeout)
+
+
+def _fetch_url(url: str, timeout: int) -> Optional[str]:
     try:
         headers = {'User-Agent': 'Mozilla/5.0 (educational fact-checker)'}
         req = urllib.request.Request(url, headers=headers)
@@ -49,7 +74,7 @@ def fetch_url(url: str, timeout: int = 10) -> Optional[str]:
 
 def query_wikipedia(topic: str) -> Optional[Dict]:
     """Query Wikipedia API for a topic summary."""
-    base_url = "https://en.wikipedia.org/api/rest_v1/page/summary/"
+    base_url = f"{WIKIPEDIA_URL}/api/rest_v1/page/summary/"
     encoded_topic = urllib.parse.quote(topic.replace(' ', '_'))
     url = base_url + encoded_topic
 
@@ -69,7 +94,7 @@ def query_wikipedia(topic: str) -> Optional[Dict]:
 
 def search_wikipedia(query: str, limit: int = 3) -> List[str]:
     """Search Wikipedia for relevant articles."""
-    base_url = "https://en.wikipedia.org/w/api.php"
+    base_url = f"{WIKIPEDIA_URL}/w/api.php"
     params = {
         'action': 'opensearch',
         'search': query,
@@ -88,29 +113,119 @@ def search_wikipedia(query: str, limit: int = 3) -> List[str]:
     return []
 
 
-def extract_key_terms(question: str, explanation: str) -> List[str]:
-    """Extract key scientific terms from question and explanation."""
-    # Combine question and correct explanation
-    text = f"{question} {explanation}".lower()
+def query_wikipedia_batch(titles: List[str], delay: float = 0) -> Dict[str, Optional[Dict]]:
+    """
+    Summaries for many titles via the action API's multi-title extracts query
+
+    Follows title normalization and redirects, QUERY_BATCH titles per request.
+
+    Args:
+        titles: Titles (or terms) to look up
+        delay: Seconds to wait between requests
+
+    Returns:
+        Requested title -> {'title', 'extract', 'url'}, or None if there is no
+        such article (or its batch could not be fetched)
+    """
+    results: Dict[str, Optional[Dict]] = {}
+    titles = list(dict.fromkeys(titles))
+    for start in range(0, len(titles), QUERY_BATCH):
+        if start and delay:
+            time.sleep(delay)
+        batch = titles[start:start + QUERY_BATCH]
+        params = {
+            'action': 'query',
+            'prop': 'extracts|info',
+            'exintro': 1,
+            'explaintext': 1,
+            'exlimit': 'max',
+            'inprop': 'url',
+            'redirects': 1,
+            'titles': '|'.join(batch),
+            'format': 'json',
+            'formatversion': 2,
+        }
+        content = fetch_url(f"{WIKIPEDIA_URL}/w/api.php?{urllib.parse.urlencode(params)}")
+        try:
+            query = json.loads(content).get('query', {}) if content else {}
+        except json.JSONDecodeError:
+            query = {}
+
+        # requested -> normalized -> redirect target
+        renamed = {}
+        for step in query.get('normalized', []) + query.get('redirects', []):
+            renamed[step.get('from')] = step.get('to')
+        pages = {page.get('title'): page for page in query.get('pages', [])}
+
+        for title in batch:
+            target = renamed.get(title, title)
+            target = renamed.get(target, target)
+            page = pages.get(target)
+            if not page or page.get('missing') or page.get('invalid') or not page.get('extract'):
+                results[title] = None
+                continue
+            results[title] = {
+                'title': page.get('title', ''),
+                'extract': page.get('extract', ''),
+                'url': page.get('fullurl', ''),
+            }
+    return results
+
+
+def lookup_terms(terms, delay: float = 0) -> Dict[str, Optional[Dict]]:
+    """
+    Wikipedia summary for each distinct term, in as few requests as possible
+
+    Terms are first tried as article titles, QUERY_BATCH per request. Only
+    terms without an article of that name are searched (one request each),
+    and the articles found are again fetched in batches.
+
+    Returns:
+        Term -> summary dict (see query_wikipedia_batch), or None if not found
+    """
+    articles = query_wikipedia_batch(list(dict.fromkeys(terms)), delay=delay)
+
+    found = {}
+    for term in [t for t, article in articles.items() if article is None]:
+        if delay:
+            time.sleep(delay)
+        titles = search_wikipedia(term, limit=1)
+        if titles:
+            found[term] = titles[0]
+    if found:
+        by_title = query_wikipedia_batch(list(found.values()), delay=delay)
+        for term, title in found.items():
+            articles[term] = by_title.get(title)
+    return articles
+
 
-    # Remove common words
-    stop_words = {'why', 'do', 'does', 'the', 'a', 'an', 'is', 'are', 'we', 'our',
-                  'when', 'what', 'how', 'this', 'that', 'it', 'its', 'they', 'their',
-                  'because', 'correct', 'wrong', 'actually', 'really', 'just', 'only',
-                  'make', 'makes', 'help', 'helps', 'cause', 'causes', 'called'}
+@lru_cache(maxsize=None)
+def key_term_index(questions_dir: Optional[Path] = None) -> KeyTermIndex:
+    """Bank-wide TF-IDF term table for a question tree (loaded or built once per process)"""
+    return KeyTermIndex.open(questions_dir or find_questions_dir(Path(__file__).parent))
 
-    # Extract potential terms (words and phrases)
-    words = re.findall(r'\b[a-z]{4,}\b', text)
-    terms = [w for w in words if w not in stop_words]
 
-    # Count frequency and return top terms
-    from collections import Counter
-    freq = Counter(terms)
-    return [term for term, _ in freq.most_common(5)]
+def extract_key_terms(question: str, explanation: str, index: Optional[KeyTermIndex] = None) -> List[str]:
+    """
+    Extract key scientific terms from question and explanation
 
+    Terms are ranked by TF-IDF against the whole question bank (see
+    utils/key_terms.py), so words common to many questions are not looked up.
 
-def verify_with_wikipedia(question: str, correct_explanation: str, key_terms: List[str]) -> Dict:
-    """Verify facts using Wikipedia."""
+    Args:
+        index: Term table to rank against (default: the main question bank)
+    """
+    return (index or key_term_index()).terms_for(question, explanation)
+
+
+def verify_with_wikipedia(question: str, correct_explanation: str, key_terms: List[str],
+                          articles: Optional[Dict[str, Optional[Dict]]] = None) -> Dict:
+    """Verify facts using Wikipedia.
+
+    Args:
+        articles: Summaries already looked up for these terms (see
+                  lookup_terms); fetched here if not given
+    """
     results = {
         'verified': False,
         'confidence': 'low',
@@ -121,14 +236,12 @@ def verify_with_wikipedia(question: str, correct_explanation: str, key_terms: Li
     matches = 0
     total_checks = 0
 
-    for term in key_terms[:3]:  # Check top 3 terms
-        # Search Wikipedia
-        articles = search_wikipedia(term)
-        if not articles:
-            continue
+    if articles is None:
+        articles = lookup_terms(key_terms[:3])
 
-        # Get summary of first article
-        wiki_data = query_wikipedia(articles[0])
+    for term in key_terms[:3]:  # Check top 3 terms
+        # Summary of the term's article
+        wiki_data = articles.get(term)
         if not wiki_data or not wiki_data.get('extract'):
             continue
 
@@ -168,29 +281,73 @@ def verify_with_wikipedia(question: str, correct_explanation: str, key_terms: Li
     return results
 
 
-def check_question(question_data: Dict, category: str) -> Dict:
+def check_question(question_data: Dict, category: str, index: Optional[KeyTermIndex] = None,
+                   articles: Optional[Dict[str, Optional[Dict]]] = None) -> Dict:
     """Check a single question's facts."""
     question = question_data['question_en']
     correct_idx = question_data['correct_answer']
     correct_explanation = question_data['explanations_en'][correct_idx]
 
     # Extract key terms
-    key_terms = extract_key_terms(question, correct_explanation)
+    key_terms = extract_key_terms(question, correct_explanation, index)
 
     # Verify with Wikipedia
-    result = verify_with_wikipedia(question, correct_explanation, key_terms)
+    result = verify_with_wikipedia(question, correct_explanation, key_terms, articles)
     result['question'] = question
     result['key_terms'] = key_terms
 
     return result
 
 
-def verify_file(filepath: str, verbose: bool = True) -> Dict:
-    """Verify all questions in a JSON file."""
-    with open(filepath) as f:
-        data = json.load(f)
+def verify_files(filepaths: List[str], verbose: bool = True, datas: Optional[List[Dict]] = None,
+                 delay: float = RATE_LIMIT_DELAY, index: Optional[KeyTermIndex] = None) -> List[Dict]:
+    """Verify several JSON files, looking up the key terms of all of them together.
+
+    Args:
+        datas: Already-loaded data, one per file
+        delay: Seconds to wait between requests (0 for a local stand-in)
+        index: Key-term table (default: built over the first file's directory)
+    """
+    if datas is None:
+        datas = [load_category(filepath) for filepath in filepaths]
+    if index is None and filepaths:
+        index = key_term_index(Path(filepaths[0]).resolve().parent)
+
+    articles = prefetch_articles(
+        [q for data in datas for q in data.get('questions', [])], index, verbose=verbose, delay=delay)
+    return [verify_file(filepath, verbose=verbose, data=data, delay=delay, index=index, articles=articles)
+            for filepath, data in zip(filepaths, datas)]
 
-    filename = filepath.split('/')[-1]
+
+def prefetch_articles(questions: List[Dict], index: KeyTermIndex, verbose: bool = True,
+                      delay: float = RATE_LIMIT_DELAY) -> Dict[str, Optional[Dict]]:
+    """Look up every distinct key term of these questions in one batched pass"""
+    terms = list(dict.fromkeys(term for q in questions for term in index.terms(q)[:3]))
+    if verbose:
+        print(f"\n📚 Looking up {len(terms)} distinct key terms "
+              f"({len(questions)} questions, {QUERY_BATCH} titles per request)...")
+    return lookup_terms(terms, delay=delay)
+
+
+def verify_file(filepath: str, verbose: bool = True, data: Optional[Dict] = None,
+                delay: float = RATE_LIMIT_DELAY, index: Optional[KeyTermIndex] = None,
+                articles: Optional[Dict[str, Optional[Dict]]] = None) -> Dict:
+    """Verify all questions in a JSON file (or its already-loaded data).
+
+    Args:
+        delay: Seconds to wait between requests (0 for a local stand-in)
+        index: Key-term table (default: built over the file's directory)
+        articles: Summaries of the questions' key terms (default: looked up
+                  for this file; see verify_files to share them across files)
+    """
+    if data is None:
+        data = load_category(filepath)
+    if index is None:
+        index = key_term_index(Path(filepath).resolve().parent)
+    if articles is None:
+        articles = prefetch_articles(data.get('questions', []), index, verbose=verbose, delay=delay)
+
+    filename = Path(filepath).name
     category = data.get('category_en', filename)
     questions = data.get('questions', [])
 
@@ -215,7 +372,7 @@ def verify_file(filepath: str, verbose: bool = True) -> Dict:
         if verbose:
             print(f"\n[{i+1}/{len(questions)}] {qid}: {q['question_en'][:40]}...")
 
-        result = check_question(q, category)
+        result = check_question(q, category, index, articles)
         result['id'] = qid
         results['details'].append(result)
 
@@ -234,34 +391,11 @@ def verify_file(filepath: str, verbose: bool = True) -> Dict:
             if result['sources']:
                 print(f"   Sources: {len(result['sources'])} Wikipedia articles")
 
-        time.sleep(0.5)  # Rate limiting
-
     return results
 
 
-def main():
-    import argparse
-    parser = argparse.ArgumentParser(description='Web-based fact verification')
-    parser.add_argument('--file', help='Specific file to verify (e.g., astronomy.json)')
-    parser.add_argument('--category', help='Verify specific category')
-    parser.add_argument('--question', help='Verify single question by ID')
-    parser.add_argument('--summary', action='store_true', help='Show summary only')
-    parser.add_argument('--output', help='Save results to JSON file')
-    args = parser.parse_args()
-
-    all_results = []
-
-    if args.file:
-        filepath = f"src/data/questions/{args.file}"
-        results = verify_file(filepath, verbose=not args.summary)
-        all_results.append(results)
-    else:
-        files = sorted(glob.glob('src/data/questions/*.json'))
-        for filepath in files:
-            results = verify_file(filepath, verbose=not args.summary)
-            all_results.append(results)
-
-    # Print summary
+def print_verification_summary(all_results: List[Dict], output: Optional[str] = None):
+    """Print totals across verified files and optionally save them as JSON."""
     print("\n" + "="*60)
     print("VERIFICATION SUMMARY")
     print("="*60)
@@ -272,9 +406,10 @@ def main():
     total = total_high + total_medium + total_low
 
     print(f"\nTotal questions: {total}")
-    print(f"  ✓ High confidence:   {total_high} ({100*total_high/total:.1f}%)")
-    print(f"  ~ Medium confidence: {total_medium} ({100*total_medium/total:.1f}%)")
-    print(f"  ? Low confidence:    {total_low} ({100*total_low/total:.1f}%)")
+    if total:
+        print(f"  ✓ High confidence:   {total_high} ({100*total_high/total:.1f}%)")
+        print(f"  ~ Medium confidence: {total_medium} ({100*total_medium/total:.1f}%)")
+        print(f"  ? Low confidence:    {total_low} ({100*total_low/total:.1f}%)")
 
     print("\nBy category:")
     for r in all_results:
@@ -283,14 +418,39 @@ def main():
         print(f"  {r['category']}: {r['verified_high']}/{total_cat} high ({high_pct:.0f}%)")
 
     # Save results if requested
-    if args.output:
-        with open(args.output, 'w') as f:
+    if output:
+        with open(output, 'w') as f:
             json.dump(all_results, f, indent=2)
-        print(f"\nResults saved to {args.output}")
+        print(f"\nResults saved to {output}")
 
     print("\nNote: Low confidence doesn't mean incorrect - just that Wikipedia")
     print("coverage was limited. Manual review recommended for low confidence items.")
 
 
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Web-based fact verification')
+    parser.add_argument('--file', help='Specific file to verify (e.g., astronomy.json)')
+    parser.add_argument('--category', help='Verify specific category')
+    parser.add_argument('--question', help='Verify single question by ID')
+    parser.add_argument('--summary', action='store_true', help='Show summary only')
+    parser.add_argument('--output', help='Save results to JSON file')
+    args = parser.parse_args()
+
+    all_results = []
+
+    questions_dir = find_questions_dir(Path(__file__).parent)
+
+    if args.file:
+        filepath = str(questions_dir / args.file)
+        results = verify_file(filepath, verbose=not args.summary)
+        all_results.append(results)
+    else:
+        files = sorted(questions_dir.glob('*.json'))
+        all_results = verify_files([str(filepath) for filepath in files], verbose=not args.summary)
+
+    print_verification_summary(all_results, output=args.output)
+
+
 if __name__ == '__main__':
     main()
@@ -1,11 +1,87 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { readFile } from 'fs/promises';
-import { join } from 'path';
+import { readFile, readdir, stat } from 'fs/promises';
+import { basename, join } from 'path';
 import { existsSync } from 'fs';
+import { gunzipSync } from 'zlib';
 
 const DATA_DIR = join(process.cwd(), 'data', 'logs');
 const ANSWERS_LOG_FILE = join(DATA_DIR, 'quiz_answers.jsonl');
 const SHARES_LOG_FILE = join(DATA_DIR, 'quiz_shares.jsonl');
+// Precomputed by scripts/log_stats.py
+const STATS_SNAPSHOT_FILE = join(DATA_DIR, 'stats_snapshot.json');
+// Where `millionwhys rollup --compact` moves old log lines
+const ARCHIVE_DIR = join(DATA_DIR, 'archive');
+
+async function logSize(file: string): Promise<number> {
+  return existsSync(file) ? (await stat(file)).size : 0;
+}
+
+// Files starting with `${prefix}` and ending with suffix in dir, oldest first
+async function listLogFiles(dir: string, prefix: string, suffix: string): Promise<string[]> {
+  if (!existsSync(dir)) return [];
+  return (await readdir(dir))
+    .filter(name => name.startsWith(prefix) && name.endsWith(suffix))
+    .sort()
+    .map(name => join(dir, name));
+}
+
+// Every event of a log: its compacted history (archive/<log>.<stamp>.gz,
+// then <log>.<stamp>.segment not archived yet), then the live file
+async function readLogEvents(file: string): Promise<any[]> {
+  const prefix = `${basename(file)}.`;
+  const files = [
+    ...(await listLogFiles(ARCHIVE_DIR, prefix, '.gz')),
+    ...(await listLogFiles(DATA_DIR, prefix, '.segment')),
+  ];
+  if (existsSync(file)) files.push(file);
+
+  const events: any[] = [];
+  for (const path of files) {
+    const data = await readFile(path);
+    const content = (path.endsWith('.gz') ? gunzipSync(data) : data).toString('utf-8');
+    for (const line of content.trim().split('\n')) {
+      if (line) events.push(JSON.parse(line));
+    }
+  }
+  return events;
+}
+
+// How far the snapshot may lag behind growing logs; scripts/log_stats.py
+// should run (e.g. from cron) more often than this
+const MAX_SNAPSHOT_AGE_MS = 5 * 60 * 1000;
+
+// Whether the snapshot may stand in for a log that is now size bytes
+function covers(source: any, size: number, age: number): boolean {
+  if (typeof source?.size !== 'number') return false;
+  if (source.size === size) return true;
+  // Lines appended since: serve the slightly stale stats for a while rather
+  // than re-read the whole log on every request. A shorter log was rotated
+  // or truncated, and the snapshot no longer describes it.
+  return source.size < size && age <= MAX_SNAPSHOT_AGE_MS;
+}
+
+// Return the precomputed stats if they are up to date with the logs, or
+// behind them by at most MAX_SNAPSHOT_AGE_MS of appended lines
+async function readFreshSnapshot(): Promise<any | null> {
+  if (!existsSync(STATS_SNAPSHOT_FILE)) return null;
+
+  try {
+    const snapshot = JSON.parse(await readFile(STATS_SNAPSHOT_FILE, 'utf-8'));
+    if (snapshot.version !== 1 || !snapshot.stats) return null;
+
+    const [answersSize, sharesSize] = await Promise.all([
+      logSize(ANSWERS_LOG_FILE),
+      logSize(SHARES_LOG_FILE),
+    ]);
+    const age = Date.now() - Date.parse(snapshot.generatedAt);
+    if (!covers(snapshot.sources?.answers, answersSize, age)) return null;
+    if (!covers(snapshot.sources?.shares, sharesSize, age)) return null;
+
+    return snapshot.stats;
+  } catch {
+    return null;
+  }
+}
 
 export async function GET(request: NextRequest) {
   try {
@@ -17,21 +93,17 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
     }
 
-    // Read answers data
-    let answers: any[] = [];
-    if (existsSync(ANSWERS_LOG_FILE)) {
-      const content = await readFile(ANSWERS_LOG_FILE, 'utf-8');
-      const lines = content.trim().split('\n').filter(Boolean);
-      answers = lines.map(line => JSON.parse(line));
+    // Serve precomputed stats when they are (nearly) up to date with the logs
+    const snapshot = await readFreshSnapshot();
+    if (snapshot) {
+      return NextResponse.json(snapshot);
     }
 
-    // Read shares data
-    let shares: any[] = [];
-    if (existsSync(SHARES_LOG_FILE)) {
-      const content = await readFile(SHARES_LOG_FILE, 'utf-8');
-      const lines = content.trim().split('\n').filter(Boolean);
-      shares = lines.map(line => JSON.parse(line));
-    }
+    // Read answers and shares data, including compacted history
+    const [answers, shares] = await Promise.all([
+      readLogEvents(ANSWERS_LOG_FILE),
+      readLogEvents(SHARES_LOG_FILE),
+    ]);
 
     // If no data at all, return empty stats
     if (answers.length === 0 && shares.length === 0) {
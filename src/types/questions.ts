@@ -56,6 +56,13 @@ export interface Question {
 
   /** Difficulty level */
   difficulty: DifficultyLevel;
+
+  /**
+   * Hash of the English fields (question, choices, explanations, correct
+   * answer) as of the last Chinese translation. Set by the scripts; used by
+   * `retranslate_questions.py --stale` to retranslate only edited questions.
+   */
+  translation_source_hash?: string;
 }
 
 /**